@@ -0,0 +1,110 @@
+"""Micro-benchmark for `AsyncDevboxesResource.create` request param transformation.
+
+Params types with no `base64` file fields are transformed by the sync compiled
+plan even on async clients; this compares that path against the full coroutine
+walk (forced by marking every plan as needing async) for a `devboxes.create`
+call with launch parameters, mounts, gateways and a tunnel. It times both the
+param transform alone and the whole `create` call against an in-process mock
+transport, so the latter includes request building and response parsing.
+
+Usage:
+    uv run python loadtest/async_transform.py
+    ITERATIONS=20000 uv run python loadtest/async_transform.py
+
+No API key is required and no requests leave the process.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import Any, Dict, List, Callable, Awaitable
+
+import httpx
+
+from runloop_api_client import AsyncRunloop
+from runloop_api_client.types import DevboxCreateParams
+from runloop_api_client._utils import async_maybe_transform
+from runloop_api_client._utils._transform import _TRANSFORM_PLANS, _get_transform_plan
+
+ITERATIONS = int(os.environ.get("ITERATIONS", "5000"))
+REPEAT = int(os.environ.get("REPEAT", "5"))
+
+PARAMS: Dict[str, Any] = {
+    "name": "loadtest",
+    "blueprint_id": "bpt_123",
+    "environment_variables": {"FOO": "bar", "DEBUG": "1"},
+    "metadata": {"team": "infra", "run": "42"},
+    "secrets": {"DB_PASS": "DATABASE_PASSWORD"},
+    "launch_parameters": {
+        "architecture": "x86_64",
+        "resource_size_request": "SMALL",
+        "keep_alive_time_seconds": 3600,
+        "launch_commands": ["echo hello", "pip install -r requirements.txt"],
+        "user_parameters": {"username": "user", "uid": 1000},
+    },
+    "mounts": [
+        {"type": "object_mount", "object_id": "obj_1", "object_path": "/home/user/data"},
+        {"type": "code_mount", "repo_name": "api-client-python", "repo_owner": "runloopai"},
+    ],
+    "gateways": {"GWS_ANTHROPIC": {"gateway": "anthropic", "secret": "my_claude_key"}},
+    "tunnel": {"auth_mode": "open"},
+}
+
+DEVBOX: Dict[str, Any] = {
+    "id": "dbx_00000001",
+    "name": "loadtest",
+    "status": "provisioning",
+    "capabilities": [],
+    "create_time_ms": 1_700_000_000_000,
+    "launch_parameters": {},
+    "metadata": {},
+    "state_transitions": [],
+}
+
+
+async def best_time(fn: Callable[[], Awaitable[object]]) -> float:
+    timings: List[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            await fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) / ITERATIONS
+
+
+def force_async_walk(enabled: bool) -> None:
+    _get_transform_plan(DevboxCreateParams)
+    for plan in _TRANSFORM_PLANS.values():
+        plan.needs_async = enabled
+
+
+async def main() -> None:
+    client = AsyncRunloop(
+        bearer_token="loadtest",
+        base_url="http://localhost",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200, json=DEVBOX))),
+    )
+    transform_only = lambda: async_maybe_transform(PARAMS, DevboxCreateParams)  # noqa: E731
+    create = lambda: client.devboxes.create(**PARAMS)  # noqa: E731
+
+    force_async_walk(True)
+    expected = await transform_only()
+    force_async_walk(False)
+    assert await transform_only() == expected
+
+    print(f"best of {REPEAT} x {ITERATIONS} calls\n")
+    print(f"{'case':<30}{'async walk (us)':>18}{'sync plan (us)':>18}")
+    for name, fn in (("async_maybe_transform", transform_only), ("devboxes.create (mock)", create)):
+        force_async_walk(True)
+        walk = await best_time(fn)
+        force_async_walk(False)
+        sync = await best_time(fn)
+        print(f"{name:<30}{walk * 1e6:>18.2f}{sync * 1e6:>18.2f}")
+
+    await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
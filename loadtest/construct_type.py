@@ -0,0 +1,84 @@
+"""Micro-benchmark for building response models with `construct_type`.
+
+Times the non-validating model construction every response goes through for
+a few representative payloads: an execution poll (`executions.retrieve`), a
+devbox status poll (`wait_for_status`) and a 1k-item devbox page. Run it on two
+revisions to compare construction paths.
+
+Usage:
+    uv run python loadtest/construct_type.py
+    ITERATIONS=50000 uv run python loadtest/construct_type.py
+
+No API key is required and no requests are made.
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+from typing import Any, Dict, List, Tuple
+
+from runloop_api_client.types import DevboxView, DevboxListView, DevboxAsyncExecutionDetailView
+from runloop_api_client._models import construct_type
+
+ITERATIONS = int(os.environ.get("ITERATIONS", "20000"))
+REPEAT = int(os.environ.get("REPEAT", "5"))
+
+
+def make_devbox(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"dbx_{i:08d}",
+        "name": f"devbox-{i}",
+        "status": "running",
+        "capabilities": ["docker_in_docker"],
+        "create_time_ms": 1_700_000_000_000 + i,
+        "end_time_ms": None,
+        "blueprint_id": "bpt_123",
+        "initiator_type": "api",
+        "metadata": {"team": "infra", "index": str(i)},
+        "launch_parameters": {
+            "architecture": "x86_64",
+            "resource_size_request": "SMALL",
+            "keep_alive_time_seconds": 3600,
+            "launch_commands": ["echo hello"],
+            "user_parameters": {"username": "user", "uid": 1000},
+        },
+        "state_transitions": [
+            {"status": "provisioning", "transition_time_ms": 1_700_000_000_000 + i},
+            {"status": "running", "transition_time_ms": 1_700_000_002_000 + i},
+        ],
+    }
+
+
+EXECUTION = {
+    "devbox_id": "dbx_00000001",
+    "execution_id": "exn_00000001",
+    "status": "completed",
+    "exit_status": 0,
+    "shell_name": "bash",
+    "stdout": "hello\n",
+    "stderr": "",
+    "stdout_truncated": False,
+    "stderr_truncated": False,
+}
+
+CASES: List[Tuple[str, object, object, int]] = [
+    ("executions.retrieve", DevboxAsyncExecutionDetailView, EXECUTION, 1),
+    ("wait_for_status", DevboxView, make_devbox(1), 1),
+    ("devboxes.list (1k items)", DevboxListView, {"devboxes": [make_devbox(i) for i in range(1000)]}, 1000),
+]
+
+
+def main() -> None:
+    print(f"best of {REPEAT} x {ITERATIONS} items per case\n")
+    print(f"{'case':<28}{'per item (us)':>16}")
+    for name, type_, value, items in CASES:
+        number = max(1, ITERATIONS // items)
+        best = min(
+            timeit.repeat(lambda: construct_type(type_=type_, value=value), number=number, repeat=REPEAT)  # noqa: B023
+        )
+        print(f"{name:<28}{best / (number * items) * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Cold-start import benchmark based on `python -X importtime`.
+
+Runs each scenario in a fresh interpreter and reports the median total import
+time, the number of SDK modules loaded and the slowest SDK modules (by their
+own, non-cumulative, import time). The `devboxes.create` scenario sends one
+request through an in-process mock transport, so it loads exactly the modules a
+real call touches.
+
+Set `MAX_IMPORT_MS` to exit non-zero when the `from runloop_api_client import
+Runloop` scenario regresses past a budget, e.g. in CI.
+
+Usage:
+    uv run python loadtest/import_time.py
+    RUNS=20 TOP=15 uv run python loadtest/import_time.py
+    MAX_IMPORT_MS=400 uv run python loadtest/import_time.py
+
+Bytecode must be cached for the numbers to mean anything: run it once to warm
+`__pycache__`, and unset `PYTHONDONTWRITEBYTECODE` if it is set.
+
+No API key is required and no requests leave the process.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import statistics
+import subprocess
+from typing import Dict, List, Tuple
+
+RUNS = int(os.environ.get("RUNS", "10"))
+TOP = int(os.environ.get("TOP", "10"))
+MAX_IMPORT_MS = os.environ.get("MAX_IMPORT_MS")
+
+CREATE = """
+import httpx
+from runloop_api_client import Runloop
+
+devbox = {"id": "dbx_1", "status": "provisioning", "capabilities": [], "create_time_ms": 0,
+          "launch_parameters": {}, "metadata": {}, "state_transitions": []}
+transport = httpx.MockTransport(lambda request: httpx.Response(200, json=devbox))
+client = Runloop(bearer_token="import-time", base_url="http://localhost", http_client=httpx.Client(transport=transport))
+client.devboxes.create(name="import-time", launch_parameters={"resource_size_request": "SMALL"})
+"""
+
+SCENARIOS: List[Tuple[str, str]] = [
+    ("from runloop_api_client import Runloop", "from runloop_api_client import Runloop"),
+    ("Runloop().devboxes.create(...)", CREATE),
+    ("from runloop_api_client import RunloopSDK", "from runloop_api_client import RunloopSDK"),
+]
+
+
+def run(code: str) -> Tuple[float, Dict[str, int]]:
+    """Returns the total import time in ms and the self time in us of every SDK module."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], check=True, capture_output=True, text=True
+    ).stderr
+
+    total_us = 0
+    modules: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+        if name.strip().startswith("runloop_api_client"):
+            modules[name.strip()] = int(self_us)
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    if os.environ.get("PYTHONDONTWRITEBYTECODE"):
+        print("warning: PYTHONDONTWRITEBYTECODE is set, timings include compiling every module\n")
+
+    failed = False
+    for name, code in SCENARIOS:
+        run(code)  # warm the bytecode cache
+        results = [run(code) for _ in range(RUNS)]
+        median_ms = statistics.median(total for total, _ in results)
+        modules = results[-1][1]
+
+        print(f"{name}\n  median import time: {median_ms:.1f} ms over {RUNS} runs, {len(modules)} SDK modules")
+        for module, self_us in sorted(modules.items(), key=lambda item: -item[1])[:TOP]:
+            print(f"  {self_us / 1000:>8.1f} ms  {module}")
+        print()
+
+        if MAX_IMPORT_MS is not None and code == SCENARIOS[0][1] and median_ms > float(MAX_IMPORT_MS):
+            print(f"FAIL: {name} took {median_ms:.1f} ms, over the {MAX_IMPORT_MS} ms budget")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compare eager and lazy (`lazy_models=True`) construction of a large list page.
+
+Decodes a synthetic 10k-item `GET /v1/devboxes` page into `DevboxListView` both
+ways, then reads only `id` and `status` from every item — the common "scan a
+listing" access pattern. Reports CPU time (best of several runs) and the memory
+still held by the page once it has been scanned (the decoded JSON included).
+
+Usage:
+    uv run python loadtest/lazy_models.py
+    ITEM_COUNT=50000 uv run python loadtest/lazy_models.py
+
+No API key is required and no requests are made.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import functools
+import tracemalloc
+from typing import Any, Dict, List, Callable
+
+from runloop_api_client._models import construct_type
+from runloop_api_client._utils._json import openapi_dumps, openapi_loads
+from runloop_api_client.types.devbox_list_view import DevboxListView
+
+ITEM_COUNT = int(os.environ.get("ITEM_COUNT", "10000"))
+RUNS = int(os.environ.get("RUNS", "5"))
+
+
+def make_devbox(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"dbx_{i:08d}",
+        "name": f"devbox-{i}",
+        "status": "running",
+        "capabilities": ["docker_in_docker"],
+        "create_time_ms": 1_700_000_000_000 + i,
+        "end_time_ms": None,
+        "blueprint_id": "bpt_123",
+        "initiator_type": "api",
+        "metadata": {"team": "infra", "index": str(i)},
+        "launch_parameters": {
+            "architecture": "x86_64",
+            "resource_size_request": "SMALL",
+            "keep_alive_time_seconds": 3600,
+            "launch_commands": ["echo hello", "pip install -r requirements.txt"],
+            "user_parameters": {"username": "user", "uid": 1000},
+        },
+        "state_transitions": [
+            {"status": "provisioning", "transition_time_ms": 1_700_000_000_000 + i},
+            {"status": "initializing", "transition_time_ms": 1_700_000_001_000 + i},
+            {"status": "running", "transition_time_ms": 1_700_000_002_000 + i},
+        ],
+        "tunnel": {"tunnel_key": f"key-{i}", "auth_mode": "open", "create_time_ms": 1_700_000_000_000 + i},
+    }
+
+
+def scan(body: bytes, lazy: bool) -> DevboxListView:
+    page = construct_type(type_=DevboxListView, value=openapi_loads(body), lazy=lazy)
+    assert isinstance(page, DevboxListView)
+    for devbox in page.devboxes:
+        assert devbox.id and devbox.status
+    return page
+
+
+def best_time(fn: Callable[[], object]) -> float:
+    timings: List[float] = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained_memory(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        result = fn()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    body = openapi_dumps(
+        {"devboxes": [make_devbox(i) for i in range(ITEM_COUNT)], "has_more": False, "total_count": ITEM_COUNT}
+    )
+    print(f"Page: {ITEM_COUNT} devboxes, {len(body) / 1e6:.1f} MB of JSON; best of {RUNS} runs\n")
+
+    assert scan(body, lazy=False).to_dict() == scan(body, lazy=True).to_dict()
+
+    results: Dict[str, tuple[float, int]] = {}
+    for mode, lazy in (("eager", False), ("lazy", True)):
+        run = functools.partial(scan, body, lazy)
+        results[mode] = (best_time(run), retained_memory(run))
+
+    print(f"{'mode':<8}{'time (ms)':>12}{'retained (MB)':>16}")
+    for mode, (seconds, retained) in results.items():
+        print(f"{mode:<8}{seconds * 1000:>12.1f}{retained / 1e6:>16.1f}")
+
+    (eager_s, eager_mem), (lazy_s, lazy_mem) = results["eager"], results["lazy"]
+    print(f"\nlazy_models: {eager_s / lazy_s:.1f}x faster, {eager_mem / lazy_mem:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Startup cost of pydantic validator building for a worker that only touches devboxes.
+
+Each run starts a fresh interpreter that imports the SDK, then creates,
+retrieves, lists and executes on a devbox through an in-process mock
+transport. It reports the wall time of that script, the peak RSS of the
+process and how many model classes ended up with a built validator/serializer.
+
+Runs with the default deferred building and with `DEFER_PYDANTIC_BUILD=false`
+(every model built when its class is defined); run it on two revisions to
+compare construction paths.
+
+Usage:
+    uv run python loadtest/model_build.py
+    RUNS=10 uv run python loadtest/model_build.py
+
+No API key is required and no requests leave the process.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+from typing import Any, Dict, List
+
+RUNS = int(os.environ.get("RUNS", "5"))
+
+WORKER = """
+import gc, json, time, resource
+start = time.perf_counter()
+
+import httpx, pydantic
+from runloop_api_client import Runloop
+
+devbox = {
+    "id": "dbx_1", "status": "running", "capabilities": [], "create_time_ms": 0, "metadata": {},
+    "launch_parameters": {"resource_size_request": "SMALL", "user_parameters": {"username": "user", "uid": 1000}},
+    "state_transitions": [{"status": "running", "transition_time_ms": 1}],
+    "tunnel": {"tunnel_key": "key", "auth_mode": "open", "create_time_ms": 1},
+}
+execution = {"devbox_id": "dbx_1", "execution_id": "exn_1", "status": "completed", "exit_status": 0}
+
+def handler(request):
+    if request.method == "GET" and request.url.path == "/v1/devboxes":
+        return httpx.Response(200, json={"devboxes": [devbox], "has_more": False, "total_count": 1})
+    if request.url.path.endswith("/execute_async"):
+        return httpx.Response(200, json=execution)
+    return httpx.Response(200, json=devbox)
+
+client = Runloop(bearer_token="model-build", base_url="http://localhost",
+                 http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+client.devboxes.create(name="model-build", launch_parameters={"resource_size_request": "SMALL"})
+client.devboxes.retrieve("dbx_1")
+list(client.devboxes.list())
+client.devboxes.execute_async("dbx_1", command="ls")
+elapsed = time.perf_counter() - start
+
+built = sum(
+    1 for obj in gc.get_objects()
+    if isinstance(obj, type) and issubclass(obj, pydantic.BaseModel) and obj.__dict__.get("__pydantic_complete__")
+)
+print(json.dumps({"ms": elapsed * 1000, "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, "built": built}))
+"""
+
+
+def run(defer: bool) -> List[Dict[str, Any]]:
+    env = {**os.environ, "DEFER_PYDANTIC_BUILD": "true" if defer else "false"}
+    results: List[Dict[str, Any]] = []
+    for _ in range(RUNS + 1):
+        output = subprocess.run([sys.executable, "-c", WORKER], env=env, check=True, capture_output=True, text=True)
+        results.append(json.loads(output.stdout))
+    return results[1:]  # the first run warms the bytecode cache
+
+
+def main() -> None:
+    print(f"median of {RUNS} fresh interpreters: import + create/retrieve/list/execute_async\n")
+    print(f"{'mode':<22}{'time (ms)':>12}{'peak RSS (MB)':>16}{'built models':>15}")
+    for mode, defer in (("deferred (default)", True), ("DEFER_PYDANTIC_BUILD=0", False)):
+        results = run(defer)
+        print(
+            f"{mode:<22}"
+            f"{statistics.median(r['ms'] for r in results):>12.1f}"
+            f"{statistics.median(r['rss_mb'] for r in results):>16.1f}"
+            f"{results[-1]['built']:>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
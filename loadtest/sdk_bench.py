@@ -0,0 +1,302 @@
+"""SDK-only overhead benchmark suite, run against an in-process stub server.
+
+Every request is answered by an `httpx.MockTransport` with canned, pre-encoded
+bodies, so the numbers are the client-side cost of the SDK alone: building and
+sending requests, parsing responses, SSE decoding and pagination. Measured:
+
+- `import.*`: import time of `runloop_api_client` and `runloop_api_client.sdk`,
+  each in a fresh interpreter (ms)
+- `client.construct`: `Runloop(...)` construction and `close()` with no other
+  client alive, so each one sets up its own connection pool (us)
+- `request.*`: per-call overhead of `devboxes.retrieve` / `devboxes.create`,
+  sync and async (us)
+- `sse.execution_update_chunks`: `stream_stdout_updates` decode throughput
+  (chunks/s)
+- `pagination.devboxes.list`: auto-pagination cost per item over 10 pages (us)
+
+Results are written as JSON (`--output`, stdout by default) together with the
+SDK, Python and dependency versions. Pass `--compare` with an earlier result
+file to print the change per benchmark; the exit status is non-zero when any
+benchmark regresses by more than `--max-regression`.
+
+Usage:
+    uv run python loadtest/sdk_bench.py --output bench.json
+    uv run python loadtest/sdk_bench.py --quick --compare bench.json
+
+No API key is required and no requests leave the process.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+from typing import Any, Dict, List, Callable, Optional, Awaitable
+from datetime import datetime, timezone
+
+import httpx
+import pydantic
+
+import runloop_api_client
+from runloop_api_client import Runloop, AsyncRunloop
+from runloop_api_client._utils._json import json_backend, openapi_dumps
+
+BASE_URL = "http://localhost"
+BEARER_TOKEN = "sdk-bench"
+PAGE_SIZE = 100
+PAGE_COUNT = 10
+SSE_CHUNKS = 5000
+
+
+def make_devbox(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"dbx_{i:08d}",
+        "name": f"devbox-{i}",
+        "status": "running",
+        "capabilities": ["docker_in_docker"],
+        "create_time_ms": 1_700_000_000_000 + i,
+        "blueprint_id": "bpt_123",
+        "initiator_type": "api",
+        "metadata": {"team": "infra"},
+        "launch_parameters": {
+            "architecture": "x86_64",
+            "resource_size_request": "SMALL",
+            "keep_alive_time_seconds": 3600,
+            "launch_commands": ["echo hello"],
+        },
+        "state_transitions": [
+            {"status": "provisioning", "transition_time_ms": 1_700_000_000_000 + i},
+            {"status": "running", "transition_time_ms": 1_700_000_002_000 + i},
+        ],
+    }
+
+
+CREATE_PARAMS: Dict[str, Any] = {
+    "name": "sdk-bench",
+    "blueprint_id": "bpt_123",
+    "environment_variables": {"FOO": "bar"},
+    "metadata": {"team": "infra"},
+    "launch_parameters": {"resource_size_request": "SMALL", "launch_commands": ["echo hello"]},
+}
+
+DEVBOX_BODY = openapi_dumps(make_devbox(0))
+PAGES = [
+    openapi_dumps(
+        {
+            "devboxes": [make_devbox(page * PAGE_SIZE + i) for i in range(PAGE_SIZE)],
+            "has_more": page < PAGE_COUNT - 1,
+            "total_count": PAGE_SIZE * PAGE_COUNT,
+        }
+    )
+    for page in range(PAGE_COUNT)
+]
+SSE_BODY = b"".join(
+    b"data: " + openapi_dumps({"output": f"line {i}\n", "offset": i * 8}) + b"\n\n" for i in range(SSE_CHUNKS)
+)
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def stub(request: httpx.Request) -> httpx.Response:
+    """The stub API: canned bodies for the handful of routes the suite calls."""
+    path = request.url.path
+    if path.endswith("/stream_stdout_updates"):
+        return httpx.Response(200, content=SSE_BODY, headers={"content-type": "text/event-stream"})
+    if request.method == "GET" and path == "/v1/devboxes":
+        after = request.url.params.get("starting_after")
+        page = 0 if after is None else int(after.removeprefix("dbx_")) // PAGE_SIZE + 1
+        return httpx.Response(200, content=PAGES[page], headers=JSON_HEADERS)
+    return httpx.Response(200, content=DEVBOX_BODY, headers=JSON_HEADERS)
+
+
+def sync_client() -> Runloop:
+    return Runloop(
+        bearer_token=BEARER_TOKEN, base_url=BASE_URL, http_client=httpx.Client(transport=httpx.MockTransport(stub))
+    )
+
+
+def async_client() -> AsyncRunloop:
+    return AsyncRunloop(
+        bearer_token=BEARER_TOKEN,
+        base_url=BASE_URL,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(stub)),
+    )
+
+
+def result(name: str, unit: str, samples: List[float], *, lower_is_better: bool = True) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "unit": unit,
+        "median": statistics.median(samples),
+        "best": min(samples) if lower_is_better else max(samples),
+        "runs": len(samples),
+        "lower_is_better": lower_is_better,
+    }
+
+
+def time_sync(fn: Callable[[], object], number: int, repeat: int) -> List[float]:
+    """Per-call time in microseconds for each of `repeat` batches of `number` calls."""
+    fn()
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return samples
+
+
+async def time_async(fn: Callable[[], Awaitable[object]], number: int, repeat: int) -> List[float]:
+    await fn()
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    return samples
+
+
+def bench_imports(repeat: int) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for module in ("runloop_api_client", "runloop_api_client.sdk"):
+        code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+        samples: List[float] = []
+        for _ in range(repeat + 1):
+            output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+            samples.append(float(output.stdout) * 1000)
+        # the first run warms the bytecode cache
+        results.append(result(f"import.{module}", "ms", samples[1:]))
+    return results
+
+
+def bench_client_construction(number: int, repeat: int) -> Dict[str, Any]:
+    def construct() -> None:
+        Runloop(bearer_token=BEARER_TOKEN, base_url=BASE_URL).close()
+
+    return result("client.construct", "us", time_sync(construct, number, repeat))
+
+
+def bench_requests(number: int, repeat: int) -> List[Dict[str, Any]]:
+    client = sync_client()
+    results = [
+        result("request.devboxes.retrieve", "us", time_sync(lambda: client.devboxes.retrieve("dbx_1"), number, repeat)),
+        result(
+            "request.devboxes.create", "us", time_sync(lambda: client.devboxes.create(**CREATE_PARAMS), number, repeat)
+        ),
+    ]
+    client.close()
+
+    async def run_async() -> List[Dict[str, Any]]:
+        aclient = async_client()
+        retrieve = await time_async(lambda: aclient.devboxes.retrieve("dbx_1"), number, repeat)
+        create = await time_async(lambda: aclient.devboxes.create(**CREATE_PARAMS), number, repeat)
+        await aclient.close()
+        return [
+            result("request.async.devboxes.retrieve", "us", retrieve),
+            result("request.async.devboxes.create", "us", create),
+        ]
+
+    return results + asyncio.run(run_async())
+
+
+def bench_sse(repeat: int) -> Dict[str, Any]:
+    client = sync_client()
+
+    def consume() -> None:
+        stream = client.devboxes.executions.stream_stdout_updates("exn_1", devbox_id="dbx_1")
+        assert sum(1 for _ in stream) == SSE_CHUNKS
+
+    samples = [SSE_CHUNKS / (seconds / 1e6) for seconds in time_sync(consume, 1, repeat)]
+    client.close()
+    return result("sse.execution_update_chunks", "chunks/s", samples, lower_is_better=False)
+
+
+def bench_pagination(repeat: int) -> Dict[str, Any]:
+    client = sync_client()
+
+    def iterate() -> None:
+        assert sum(1 for _ in client.devboxes.list(limit=PAGE_SIZE)) == PAGE_SIZE * PAGE_COUNT
+
+    samples = [seconds / (PAGE_SIZE * PAGE_COUNT) for seconds in time_sync(iterate, 1, repeat)]
+    client.close()
+    return result("pagination.devboxes.list", "us", samples)
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        "sdk_version": runloop_api_client.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "httpx": httpx.__version__,
+        "pydantic": pydantic.VERSION,
+        "json_backend": json_backend,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def compare(current: List[Dict[str, Any]], baseline_path: str, max_regression: float) -> bool:
+    """Prints the change against a baseline result file, returns whether everything is within budget."""
+    with open(baseline_path) as f:
+        baseline = {entry["name"]: entry for entry in json.load(f)["results"]}
+
+    ok = True
+    print(f"{'benchmark':<36}{'baseline':>14}{'current':>14}{'change':>10}", file=sys.stderr)
+    for entry in current:
+        before = baseline.get(entry["name"])
+        if before is None:
+            continue
+        # > 1 means slower, whichever direction the metric improves in
+        ratio = entry["median"] / before["median"] if entry["lower_is_better"] else before["median"] / entry["median"]
+        flag = ""
+        if ratio > max_regression:
+            ok = False
+            flag = "  REGRESSION"
+        print(
+            f"{entry['name']:<36}{before['median']:>14.1f}{entry['median']:>14.1f}{(ratio - 1) * 100:>+9.1f}%{flag}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="a previous JSON result file to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=1.2,
+        help="slowdown ratio over the baseline that fails the run (default: 1.2)",
+    )
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a fast sanity check")
+    args = parser.parse_args(argv)
+
+    number, repeat = (200, 3) if args.quick else (2000, 7)
+    results = [
+        *bench_imports(repeat),
+        bench_client_construction(number // 10, repeat),
+        *bench_requests(number, repeat),
+        bench_sse(repeat),
+        bench_pagination(repeat),
+    ]
+
+    report = json.dumps({"meta": metadata(), "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Time to first item and peak memory for a large list page, parsed whole vs streamed.
+
+Serves one `objects.list` page of `ITEMS` storage objects through an in-process
+mock transport, delivered in 64 KiB chunks like a real response body, and
+compares iterating `client.objects.list(...)` (read the body, decode it, build
+the page, then iterate) with `response.iter_items()` on the streaming response
+(decode and build each item as its bytes arrive). Peak memory is measured with
+`tracemalloc` and only counts allocations made while iterating.
+
+Usage:
+    uv run python loadtest/streamed_page.py
+    ITEMS=20000 RUNS=10 uv run python loadtest/streamed_page.py
+
+No API key is required and no requests leave the process.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import statistics
+import tracemalloc
+from typing import Any, List, Tuple, Callable, Iterator
+
+import httpx
+
+from runloop_api_client import Runloop
+
+ITEMS = int(os.environ.get("ITEMS", "5000"))
+RUNS = int(os.environ.get("RUNS", "5"))
+CHUNK_SIZE = 64 * 1024
+
+BODY = json.dumps(
+    {
+        "objects": [
+            {
+                "id": f"obj_{i:08d}",
+                "name": f"artifacts/run-{i}/output.tar.gz",
+                "state": "READ_ONLY",
+                "content_type": "tgz",
+                "create_time_ms": 1_700_000_000_000 + i,
+                "size_bytes": 1024 * i,
+                "metadata": {"team": "infra", "run": str(i)},
+            }
+            for i in range(ITEMS)
+        ],
+        "has_more": False,
+        "total_count": ITEMS,
+    }
+).encode()
+
+
+def handler(_request: httpx.Request) -> httpx.Response:
+    chunks = (BODY[start : start + CHUNK_SIZE] for start in range(0, len(BODY), CHUNK_SIZE))
+    return httpx.Response(200, content=chunks, headers={"content-type": "application/json"})
+
+
+def parsed(client: Runloop) -> Iterator[Any]:
+    yield from client.objects.list(limit=ITEMS)
+
+
+def streamed(client: Runloop) -> Iterator[Any]:
+    with client.objects.with_streaming_response.list(limit=ITEMS) as response:
+        yield from response.iter_items()
+
+
+def measure(iterate: Callable[[Runloop], Iterator[Any]], client: Runloop) -> Tuple[float, float, float]:
+    """Returns the time to the first item and to the last one in ms, and the peak memory in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = iterate(client)
+    next(items)
+    first = time.perf_counter() - start
+    count = 1 + sum(1 for _ in items)
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == ITEMS
+    return first * 1000, total * 1000, peak / 1024 / 1024
+
+
+def main() -> None:
+    client = Runloop(
+        bearer_token="streamed-page",
+        base_url="http://localhost",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    print(f"one page of {ITEMS} storage objects ({len(BODY) / 1024 / 1024:.1f} MB), median of {RUNS} runs\n")
+    print(f"{'mode':<26}{'first item (ms)':>16}{'all items (ms)':>16}{'peak (MB)':>12}")
+    for name, iterate in (("objects.list()", parsed), ("iter_items() (streamed)", streamed)):
+        measure(iterate, client)  # warm up model building
+        results: List[Tuple[float, float, float]] = [measure(iterate, client) for _ in range(RUNS)]
+        print(
+            f"{name:<26}"
+            f"{statistics.median(r[0] for r in results):>16.1f}"
+            f"{statistics.median(r[1] for r in results):>16.1f}"
+            f"{statistics.median(r[2] for r in results):>12.1f}"
+        )
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
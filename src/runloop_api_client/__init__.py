@@ -3,9 +3,8 @@
 import typing as _t
 
 from . import types
-from .sdk import RunloopSDK, AsyncRunloopSDK
 from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes, omit, not_given
-from ._utils import file_from_path
+from ._utils import lazy_exports, file_from_path
 from ._client import Client, Stream, Runloop, Timeout, Transport, AsyncClient, AsyncStream, AsyncRunloop, RequestOptions
 from ._models import BaseModel
 from ._version import __title__, __version__
@@ -20,6 +19,8 @@ from ._exceptions import (
     RateLimitError,
     APITimeoutError,
     BadRequestError,
+    CircuitOpenError,
+    QueueTimeoutError,
     APIConnectionError,
     AuthenticationError,
     InternalServerError,
@@ -27,7 +28,19 @@ from ._exceptions import (
     UnprocessableEntityError,
     APIResponseValidationError,
 )
-from ._base_client import DefaultHttpxClient, DefaultAioHttpClient, DefaultAsyncHttpxClient
+from ._base_client import (
+    PoolRoute,
+    PoolConfig,
+    ShardWarmUp,
+    HedgingStats,
+    BulkheadStats,
+    CoalescingStats,
+    RetryBudgetStats,
+    DefaultHttpxClient,
+    CircuitBreakerState,
+    DefaultAioHttpClient,
+    DefaultAsyncHttpxClient,
+)
 from ._utils._logs import setup_logging as _setup_logging
 
 __all__ = [
@@ -58,6 +71,8 @@ __all__ = [
     "UnprocessableEntityError",
     "RateLimitError",
     "InternalServerError",
+    "CircuitOpenError",
+    "QueueTimeoutError",
     "Timeout",
     "RequestOptions",
     "Client",
@@ -74,11 +89,28 @@ __all__ = [
     "DefaultHttpxClient",
     "DefaultAsyncHttpxClient",
     "DefaultAioHttpClient",
+    "ShardWarmUp",
+    "BulkheadStats",
+    "PoolConfig",
+    "PoolRoute",
+    "CoalescingStats",
+    "RetryBudgetStats",
+    "CircuitBreakerState",
+    "HedgingStats",
 ]
 
-if not _t.TYPE_CHECKING:
+if _t.TYPE_CHECKING:
+    from .sdk import RunloopSDK, AsyncRunloopSDK
+else:
     from ._utils._resources_proxy import resources as resources
 
+    # the SDK wrappers pull in every resource, so they are only imported when used
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {"RunloopSDK": ".sdk", "AsyncRunloopSDK": ".sdk"},
+        module="runloop_api_client",
+    )
+
 _setup_logging()
 
 # Update the __module__ attribute for exported symbols so that
@@ -87,7 +119,7 @@ _setup_logging()
 # runloop_api_client._exceptions.NotFoundError -> runloop_api_client.NotFoundError
 __locals = locals()
 for __name in __all__:
-    if not __name.startswith("__"):
+    if not __name.startswith("__") and __name in __locals:
         try:
             __locals[__name].__module__ = "runloop_api_client"
         except (TypeError, AttributeError):
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+import re
 import sys
 import json
 import time
 import uuid
 import email
+import queue
 import asyncio
 import inspect
 import logging
@@ -12,10 +15,11 @@ import secrets
 import weakref
 import platform
 import warnings
+import functools
 import threading
 import email.utils
 from types import TracebackType
-from random import random
+from random import random, randrange
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -26,15 +30,22 @@ from typing import (
     Mapping,
     TypeVar,
     Callable,
+    Hashable,
     Iterable,
     Iterator,
     Optional,
+    Sequence,
+    Awaitable,
+    Coroutine,
     Generator,
     AsyncIterator,
     cast,
     overload,
 )
-from typing_extensions import Literal, override, get_origin
+from collections import deque
+from dataclasses import field, replace, dataclass
+from typing_extensions import Unpack, Literal, override, get_origin
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
 
 import anyio
 import httpx
@@ -59,13 +70,15 @@ from ._types import (
     BinaryTypes,
     RequestFiles,
     HttpxSendArgs,
+    ShardSelector,
     RequestOptions,
     AsyncBinaryTypes,
     HttpxRequestFiles,
     ModelBuilderProtocol,
+    ShardSelectionPolicy,
     not_given,
 )
-from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
+from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping, get_async_library
 from ._compat import PYDANTIC_V1, model_copy, model_dump
 from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
 from ._response import (
@@ -76,20 +89,39 @@ from ._response import (
 )
 from ._constants import (
     DEFAULT_TIMEOUT,
+    HEDGE_MAX_BURST,
     MAX_RETRY_DELAY,
+    HEDGE_PERCENTILE,
+    HEDGE_MAX_THREADS,
+    HEDGE_MIN_SAMPLES,
     DEFAULT_MAX_RETRIES,
     INITIAL_RETRY_DELAY,
     RAW_RESPONSE_HEADER,
+    HEDGE_LATENCY_SAMPLES,
+    SHARD_SCALE_UP_STREAMS,
+    SHARD_UNHEALTHY_ERRORS,
     DEFAULT_API_POOL_SHARDS,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
+    SHARD_LATENCY_EWMA_WEIGHT,
+    SHARD_IDLE_TIMEOUT_SECONDS,
+    DEFAULT_MAX_API_POOL_SHARDS,
+    RETRY_BUDGET_MIN_PER_SECOND,
+    RETRY_BUDGET_WINDOW_SECONDS,
     DEFAULT_TRANSFER_POOL_SHARDS,
+    DEFAULT_STREAMING_POOL_SHARDS,
     DEFAULT_BACKGROUND_POOL_SHARDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+    DEFAULT_MAX_STREAMING_POOL_SHARDS,
+    DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
 )
 from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
 from ._exceptions import (
     APIStatusError,
     APITimeoutError,
+    CircuitOpenError,
+    QueueTimeoutError,
     APIConnectionError,
     APIResponseValidationError,
 )
@@ -105,23 +137,288 @@ log: logging.Logger = logging.getLogger(__name__)
 # loop that created them and cannot be reused across asyncio.run() calls.
 #
 # httpx/httpcore use a single H2 connection per transport, so each workload
-# category uses a sharded Registry of SharedTransport instances. Per-client
-# round-robin spreads requests across shards.
+# category uses a sharded Registry of SharedTransport instances. Each wrapper
+# counts its in-flight streams (request sent → response body closed); client
+# pools feed those counts to a shard selection policy and open extra shards
+# when every active one nears the server's per-connection stream cap.
+#
+# Wrappers also watch their connection's health. A GOAWAY / protocol error, or
+# SHARD_UNHEALTHY_ERRORS consecutive transport failures (resets, stalls that
+# time out), swaps in a fresh underlying transport. Every client holding a
+# refcount keeps using the same wrapper, and the retired transport is closed
+# once the streams still running on it finish.
+#
+# Each workload pool may also carry a bulkhead: a FIFO semaphore capping how many
+# of its requests are in flight per client, so bulk transfers cannot starve
+# control-plane calls of sockets and CPU, and a token bucket pacing its requests
+# to a fixed rate or to the budget the server advertises in rate-limit headers.
+#
+# After fork() the child must not touch connections inherited from the parent:
+# the registries and `_pool_lock` are reset in the child, and client pools built
+# before the fork notice the bumped `_fork_generation` and rebuild lazily.
 _pool_lock = threading.Lock()
+_fork_generation = 0
+
+
+@dataclass(frozen=True)
+class ShardHealth:
+    """Point-in-time health snapshot of one shared shard transport."""
+
+    in_flight: int
+    consecutive_errors: int
+    latency_ewma: float | None
+    """Smoothed seconds from sending a request to receiving response headers."""
+    recycles: int
+    """How many times the underlying connection has been replaced."""
+
+
+@dataclass(frozen=True)
+class ShardWarmUp:
+    """Outcome of opening one shard's connection during `warm_up()`."""
+
+    pool: str
+    shard: int
+    seconds: float
+    """Wall time of the first request on the shard: TCP, TLS, ALPN and H2 setup plus one round trip."""
+    error: Exception | None = None
+
+
+@dataclass(frozen=True, init=False)
+class PoolConfig:
+    """Shape of one named connection pool: its shards, connection limits and request cap.
+
+    For one of the built-in pools, only the fields passed here replace the
+    built-in values; the others keep them.
+    """
+
+    shards: int = 1
+    """Shards (≈ H2 connections) kept open; each is its own httpx transport."""
+    max_shards: int | None = None
+    """Autoscaling ceiling for extra shards under load; defaults to `shards`."""
+    limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS
+    """Connection limits of every shard's transport."""
+    max_concurrent_requests: int | None = None
+    """Bulkhead cap on this pool's in-flight requests; None means no cap."""
+    requests_per_second: float | None = None
+    """Steady pace at which this pool sends requests; None means unpaced."""
+    _given: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        *,
+        shards: int | NotGiven = not_given,
+        max_shards: int | None | NotGiven = not_given,
+        limits: httpx.Limits | NotGiven = not_given,
+        max_concurrent_requests: int | None | NotGiven = not_given,
+        requests_per_second: float | None | NotGiven = not_given,
+    ) -> None:
+        values: dict[str, object] = {
+            "shards": shards,
+            "max_shards": max_shards,
+            "limits": limits,
+            "max_concurrent_requests": max_concurrent_requests,
+            "requests_per_second": requests_per_second,
+        }
+        # Fields left out read the class-level defaults.
+        given = {name: value for name, value in values.items() if not isinstance(value, NotGiven)}
+        for name, value in given.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_given", frozenset(given))
+
+    def _merged_into(self, base: PoolConfig) -> PoolConfig:
+        """`base` with the fields passed to this config replaced."""
+        return replace(base, **{name: getattr(self, name) for name in self._given})
+
+
+@dataclass(frozen=True)
+class PoolRoute:
+    """Sends matching requests to the named pool.
+
+    `path` is a regular expression searched in the request's URL path; `methods`
+    optionally restricts the route to those HTTP methods.
+    """
+
+    pool: str
+    path: str = ""
+    methods: Sequence[str] | None = None
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """How often identical concurrent GETs shared one HTTP call."""
+
+    hits: int
+    """Calls that joined a request already in flight."""
+    misses: int
+    """Eligible calls that had to send their own request."""
+
+
+@dataclass(frozen=True)
+class BulkheadStats:
+    """Point-in-time counters of one workload class's concurrency limit."""
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    """Requests currently waiting for a free slot."""
+    queued: int
+    """Requests that had to wait for a slot since the client was created."""
+    wait_seconds: float
+    """Total time queued requests spent waiting."""
+    max_wait_seconds: float
+    timeouts: int
+    """Requests that gave up after waiting `max_queue_time`."""
+
+
+@dataclass(frozen=True)
+class RetryBudgetStats:
+    """Counters of the client-wide retry budget over its sliding window."""
+
+    successes: int
+    """Successful (2xx/3xx) responses in the window."""
+    retries: int
+    """Retries sent in the window."""
+    available: int
+    """Retries the budget would still allow right now."""
+    denied: int
+    """Retries skipped because the budget was spent, since the client was created."""
+
+
+@dataclass(frozen=True)
+class CircuitBreakerState:
+    """Point-in-time state of one endpoint's circuit breaker."""
+
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int
+    retry_in: float | None
+    """Seconds until an open circuit lets a probe through; None unless open."""
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Counters of request hedging since the client was created."""
+
+    hedged: int
+    """Requests that outlived their route's delay and got a duplicate."""
+    wins: int
+    """Hedged requests whose duplicate answered first."""
+    denied: int
+    """Slow requests left unhedged because the hedge budget was spent."""
+
+
+class _TrackedByteStream(httpx.SyncByteStream):
+    """Response body wrapper that reports read errors and calls back once closed."""
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream,
+        on_close: Callable[[], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+        self._on_error = on_error
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._stream
+        except httpx.TransportError as err:
+            if self._on_error is not None:
+                self._on_error(err)
+            raise
+
+    @override
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class _TrackedAsyncByteStream(httpx.AsyncByteStream):
+    """Async response body wrapper that reports read errors and calls back once closed."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        on_close: Callable[[], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+        self._on_error = on_error
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except httpx.TransportError as err:
+            if self._on_error is not None:
+                self._on_error(err)
+            raise
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+_TransportT = TypeVar("_TransportT", bound=Union[httpx.BaseTransport, httpx.AsyncBaseTransport])
 
 
-class _SharedTransport(httpx.BaseTransport):
-    """Refcounted wrapper: delegates to a real transport, closes it when refcount hits 0."""
+class _TransportHealth(Generic[_TransportT]):
+    """Stream and health bookkeeping shared by the sync and async wrappers.
 
-    def __init__(self, transport: httpx.BaseTransport) -> None:
+    Tracks in-flight streams per underlying transport so a recycled transport can
+    be closed as soon as the last stream that was started on it is closed.
+    """
+
+    def __init__(
+        self,
+        transport: _TransportT,
+        factory: Callable[[], _TransportT] | None,
+    ) -> None:
         self._transport = transport
+        self._factory = factory
         self._refcount = 1
+        self._in_flight = 0
+        self._streams: dict[int, int] = {}
+        self._retired: dict[int, _TransportT] = {}
+        self._consecutive_errors = 0
+        self._latency_ewma: float | None = None
+        self._recycles = 0
         self._lock = threading.Lock()
 
     @property
     def refcount(self) -> int:
         return self._refcount
 
+    @property
+    def in_flight(self) -> int:
+        """Streams currently open on this transport across every client sharing it."""
+        return self._in_flight
+
+    @property
+    def healthy(self) -> bool:
+        return self._consecutive_errors < SHARD_UNHEALTHY_ERRORS
+
+    def health(self) -> ShardHealth:
+        with self._lock:
+            return ShardHealth(
+                in_flight=self._in_flight,
+                consecutive_errors=self._consecutive_errors,
+                latency_ewma=self._latency_ewma,
+                recycles=self._recycles,
+            )
+
     def acquire(self) -> bool:
         with self._lock:
             if self._refcount <= 0:
@@ -129,37 +426,149 @@ class _SharedTransport(httpx.BaseTransport):
             self._refcount += 1
             return True
 
+    def _release_ref(self) -> list[_TransportT]:
+        """Drop a reference; returns every transport to close once the last one is gone."""
+        with self._lock:
+            self._refcount -= 1
+            if self._refcount > 0:
+                return []
+            to_close = [self._transport, *self._retired.values()]
+            self._retired.clear()
+            return to_close
+
+    def _stream_opened(self) -> _TransportT:
+        with self._lock:
+            transport = self._transport
+            self._in_flight += 1
+            self._streams[id(transport)] = self._streams.get(id(transport), 0) + 1
+            return transport
+
+    def _stream_closed(self, transport: _TransportT) -> _TransportT | None:
+        """Returns a retired transport that has just drained and should be closed."""
+        with self._lock:
+            self._in_flight -= 1
+            key = id(transport)
+            remaining = self._streams[key] - 1
+            if remaining:
+                self._streams[key] = remaining
+                return None
+            del self._streams[key]
+            return self._retired.pop(key, None)
+
+    def _record_latency(self, transport: _TransportT, seconds: float) -> None:
+        with self._lock:
+            if transport is not self._transport:
+                return
+            self._consecutive_errors = 0
+            if self._latency_ewma is None:
+                self._latency_ewma = seconds
+            else:
+                self._latency_ewma += SHARD_LATENCY_EWMA_WEIGHT * (seconds - self._latency_ewma)
+
+    def _record_error(self, transport: _TransportT, err: Exception) -> _TransportT | None:
+        """Returns the replaced transport when it has no streams left and should be closed now."""
+        with self._lock:
+            # Errors from a connection we already replaced say nothing about the new one.
+            if transport is not self._transport:
+                return None
+            self._consecutive_errors += 1
+            if self._factory is None or self._refcount <= 0:
+                return None
+            if not isinstance(err, httpx.RemoteProtocolError) and self.healthy:
+                return None
+            self._transport = self._factory()
+            self._consecutive_errors = 0
+            self._latency_ewma = None
+            self._recycles += 1
+            log.debug("Recycling unhealthy shared transport after %s: %s", type(err).__name__, err)
+            if self._streams.get(id(transport)):
+                self._retired[id(transport)] = transport
+                return None
+            return transport
+
+
+class _SharedTransport(_TransportHealth[httpx.BaseTransport], httpx.BaseTransport):
+    """Refcounted wrapper: delegates to a real transport, closes it when refcount hits 0.
+
+    When built with a `factory`, an unhealthy underlying transport is replaced in place.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        factory: Callable[[], httpx.BaseTransport] | None = None,
+    ) -> None:
+        super().__init__(transport, factory)
+
+    def _on_stream_closed(self, transport: httpx.BaseTransport) -> None:
+        drained = self._stream_closed(transport)
+        if drained is not None:
+            drained.close()
+
+    def _on_error(self, transport: httpx.BaseTransport, err: Exception) -> None:
+        replaced = self._record_error(transport, err)
+        if replaced is not None:
+            replaced.close()
+
     @override
     def handle_request(self, request: httpx.Request) -> httpx.Response:
-        return self._transport.handle_request(request)
+        transport = self._stream_opened()
+        started = time.monotonic()
+        try:
+            response = transport.handle_request(request)
+        except httpx.TransportError as err:
+            self._on_stream_closed(transport)
+            self._on_error(transport, err)
+            raise
+        except BaseException:
+            self._on_stream_closed(transport)
+            raise
+        self._record_latency(transport, time.monotonic() - started)
+        if response.is_closed:
+            # Body was fully buffered by the transport; nothing left to wait for.
+            self._on_stream_closed(transport)
+            return response
+        response.stream = _TrackedByteStream(
+            cast(httpx.SyncByteStream, response.stream),
+            functools.partial(self._on_stream_closed, transport),
+            functools.partial(self._on_error, transport),
+        )
+        return response
 
     @override
     def close(self) -> None:
-        should_close = False
-        with self._lock:
-            self._refcount -= 1
-            if self._refcount <= 0:
-                should_close = True
-        if should_close:
-            self._transport.close()
+        for transport in self._release_ref():
+            transport.close()
 
     class Registry:
         """Process-global map of shard index → shared H2 transport."""
 
-        def __init__(self) -> None:
+        def __init__(self, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS) -> None:
+            self.limits = limits
             self._shards: dict[int, _SharedTransport] = {}
 
+        def _new_transport(self) -> httpx.BaseTransport:
+            return _make_shared_transport(self.limits)
+
         def acquire(self, shard: int) -> _SharedTransport:
             with _pool_lock:
                 existing = self._shards.get(shard)
                 if existing is not None and existing.acquire():
                     return existing
-                transport = _SharedTransport(
-                    httpx.HTTPTransport(limits=DEFAULT_CONNECTION_LIMITS, http2=True),
-                )
+                transport = _SharedTransport(self._new_transport(), factory=self._new_transport)
                 self._shards[shard] = transport
                 return transport
 
+        def in_flight(self) -> dict[int, int]:
+            """In-flight stream count per shard index."""
+            with _pool_lock:
+                return {shard: transport.in_flight for shard, transport in self._shards.items()}
+
+        def health(self) -> dict[int, ShardHealth]:
+            """Health snapshot per shard index."""
+            with _pool_lock:
+                return {shard: transport.health() for shard, transport in self._shards.items()}
+
         def take_all(self) -> list[_SharedTransport]:
             """Test-only: remove and return all transports for fixture cleanup."""
             with _pool_lock:
@@ -172,48 +581,108 @@ class _SharedTransport(httpx.BaseTransport):
             with _pool_lock:
                 return set(self._shards)
 
+        def _reset_after_fork(self) -> None:
+            # The inherited lock may be held by a parent thread that no longer exists.
+            self._shards = {}
 
-class _SharedAsyncTransport(httpx.AsyncBaseTransport):
-    """Async refcounted wrapper: delegates to a real async transport."""
 
-    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
-        self._transport = transport
-        self._refcount = 1
-        self._lock = threading.Lock()
+class _BackgroundCloser:
+    """Closes idle async clients and transports from the sync bookkeeping paths that retire them.
 
-    @property
-    def refcount(self) -> int:
-        return self._refcount
+    On asyncio the close runs as a task, kept referenced until it is done so that it
+    cannot be garbage collected halfway. Other event loops offer no way to start one
+    outside a task group, so there the close is left to the owner's next `aclose()`.
+    """
 
-    def acquire(self) -> bool:
-        with self._lock:
-            if self._refcount <= 0:
-                return False
-            self._refcount += 1
-            return True
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pending: list[Callable[[], Coroutine[Any, Any, None]]] = []
+
+    def close(self, aclose: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        if get_async_library() != "asyncio":
+            self._pending.append(aclose)
+            return
+        task = asyncio.get_running_loop().create_task(aclose())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        pending, self._pending = self._pending, []
+        for aclose in pending:
+            await aclose()
+
+
+class _SharedAsyncTransport(_TransportHealth[httpx.AsyncBaseTransport], httpx.AsyncBaseTransport):
+    """Async refcounted wrapper: delegates to a real async transport.
+
+    When built with a `factory`, an unhealthy underlying transport is replaced in place.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        factory: Callable[[], httpx.AsyncBaseTransport] | None = None,
+    ) -> None:
+        super().__init__(transport, factory)
+        self._closer = _BackgroundCloser()
+
+    def _close_in_background(self, transport: httpx.AsyncBaseTransport) -> None:
+        # Called from sync bookkeeping paths; the transport has no streams left.
+        self._closer.close(transport.aclose)
+
+    def _on_stream_closed(self, transport: httpx.AsyncBaseTransport) -> None:
+        drained = self._stream_closed(transport)
+        if drained is not None:
+            self._close_in_background(drained)
+
+    def _on_error(self, transport: httpx.AsyncBaseTransport, err: Exception) -> None:
+        replaced = self._record_error(transport, err)
+        if replaced is not None:
+            self._close_in_background(replaced)
 
     @override
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
-        return await self._transport.handle_async_request(request)
+        transport = self._stream_opened()
+        started = time.monotonic()
+        try:
+            response = await transport.handle_async_request(request)
+        except httpx.TransportError as err:
+            self._on_stream_closed(transport)
+            self._on_error(transport, err)
+            raise
+        except BaseException:
+            self._on_stream_closed(transport)
+            raise
+        self._record_latency(transport, time.monotonic() - started)
+        if response.is_closed:
+            # Body was fully buffered by the transport; nothing left to wait for.
+            self._on_stream_closed(transport)
+            return response
+        response.stream = _TrackedAsyncByteStream(
+            cast(httpx.AsyncByteStream, response.stream),
+            functools.partial(self._on_stream_closed, transport),
+            functools.partial(self._on_error, transport),
+        )
+        return response
 
     @override
     async def aclose(self) -> None:
-        should_close = False
-        with self._lock:
-            self._refcount -= 1
-            if self._refcount <= 0:
-                should_close = True
-        if should_close:
-            await self._transport.aclose()
+        await self._closer.aclose()
+        for transport in self._release_ref():
+            await transport.aclose()
 
     class Registry:
         """Per-event-loop map of shard index → shared async H2 transport."""
 
-        def __init__(self) -> None:
+        def __init__(self, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS) -> None:
+            self.limits = limits
             self._by_loop: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, _SharedAsyncTransport]] = (
                 weakref.WeakKeyDictionary()
             )
 
+        def _new_transport(self) -> httpx.AsyncBaseTransport:
+            return _make_shared_async_transport(self.limits)
+
         def acquire(self, loop: asyncio.AbstractEventLoop, shard: int) -> _SharedAsyncTransport:
             with _pool_lock:
                 bucket = self._by_loop.get(loop)
@@ -223,28 +692,101 @@ class _SharedAsyncTransport(httpx.AsyncBaseTransport):
                 existing = bucket.get(shard)
                 if existing is not None and existing.acquire():
                     return existing
-                transport = _SharedAsyncTransport(
-                    httpx.AsyncHTTPTransport(limits=DEFAULT_CONNECTION_LIMITS, http2=True),
-                )
+                transport = _SharedAsyncTransport(self._new_transport(), factory=self._new_transport)
                 bucket[shard] = transport
                 return transport
 
+        def in_flight(self, loop: asyncio.AbstractEventLoop) -> dict[int, int]:
+            """In-flight stream count per shard index for the given event loop."""
+            with _pool_lock:
+                bucket = self._by_loop.get(loop) or {}
+                return {shard: transport.in_flight for shard, transport in bucket.items()}
+
+        def health(self, loop: asyncio.AbstractEventLoop) -> dict[int, ShardHealth]:
+            """Health snapshot per shard index for the given event loop."""
+            with _pool_lock:
+                bucket = self._by_loop.get(loop) or {}
+                return {shard: transport.health() for shard, transport in bucket.items()}
+
         def clear(self) -> None:
             """Test-only: drop all per-loop shard maps (does not close transports)."""
             with _pool_lock:
                 self._by_loop.clear()
 
+        def _reset_after_fork(self) -> None:
+            self._by_loop = weakref.WeakKeyDictionary()
+
+
+def _make_shared_transport(limits: httpx.Limits) -> httpx.BaseTransport:
+    return httpx.HTTPTransport(limits=limits, http2=True)
+
 
-# Process-global sharded registries (one ≈ H2 connection per shard index).
-_shared_sync_api_transports = _SharedTransport.Registry()
-_shared_sync_background_transports = _SharedTransport.Registry()
-_shared_sync_transfer_transports = _SharedTransport.Registry()
-_shared_async_api_transports = _SharedAsyncTransport.Registry()
-_shared_async_background_transports = _SharedAsyncTransport.Registry()
-_shared_async_transfer_transports = _SharedAsyncTransport.Registry()
+def _make_shared_async_transport(limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+    return httpx.AsyncHTTPTransport(limits=limits, http2=True)
+
+
+# Process-global sharded registries (one ≈ H2 connection per shard index), one per
+# named pool and connection limits, so clients configuring a pool alike share it.
+_shared_sync_registries: dict[tuple[str, str], _SharedTransport.Registry] = {}
+_shared_async_registries: dict[tuple[str, str], _SharedAsyncTransport.Registry] = {}
+
+
+def _shared_sync_registry(pool: str, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS) -> _SharedTransport.Registry:
+    with _pool_lock:
+        registry = _shared_sync_registries.get((pool, repr(limits)))
+        if registry is None:
+            registry = _SharedTransport.Registry(limits)
+            _shared_sync_registries[(pool, repr(limits))] = registry
+        return registry
+
+
+def _shared_async_registry(
+    pool: str, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS
+) -> _SharedAsyncTransport.Registry:
+    with _pool_lock:
+        registry = _shared_async_registries.get((pool, repr(limits)))
+        if registry is None:
+            registry = _SharedAsyncTransport.Registry(limits)
+            _shared_async_registries[(pool, repr(limits))] = registry
+        return registry
+
+
+_shared_sync_api_transports = _shared_sync_registry("api")
+_shared_sync_background_transports = _shared_sync_registry("background")
+_shared_sync_transfer_transports = _shared_sync_registry("transfer")
+_shared_async_api_transports = _shared_async_registry("api")
+_shared_async_background_transports = _shared_async_registry("background")
+_shared_async_transfer_transports = _shared_async_registry("transfer")
+
+
+def _reset_after_fork() -> None:
+    """Forget every shared transport inherited from the parent process.
+
+    Runs in the child right after fork(). The inherited transports are dropped
+    without being closed: closing them would write to sockets the parent still uses.
+    """
+    global _pool_lock, _fork_generation
+    _pool_lock = threading.Lock()
+    _fork_generation += 1
+    for registry in _shared_sync_registries.values():
+        registry._reset_after_fork()
+    for async_registry in _shared_async_registries.values():
+        async_registry._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 _BACKGROUND_PATH_SUFFIXES = ("/wait_for_status",)
 _TRANSFER_PATH_SUFFIXES = ("/upload_file", "/download_file")
+# Server-sent event tails and log downloads that hold a stream open for minutes.
+_STREAMING_PATH_SUFFIXES = (
+    "/stream_stdout_updates",
+    "/stream_stderr_updates",
+    "/evictions/watch",
+    "/subscribe/sse",
+    "/download_logs",
+)
 
 
 def _is_background_path(path: str) -> bool:
@@ -255,8 +797,547 @@ def _is_transfer_path(path: str) -> bool:
     return path.endswith(_TRANSFER_PATH_SUFFIXES)
 
 
+def _is_streaming_path(path: str) -> bool:
+    return path.endswith(_STREAMING_PATH_SUFFIXES)
+
+
+class _PoolRouter:
+    """Resolves a request's method and URL path to the name of the pool serving it.
+
+    Routes given to the client are tried first, in order; then the built-in suffix
+    rules for background, transfer and streaming endpoints. Anything else uses "api".
+    """
+
+    def __init__(self, routes: Sequence[PoolRoute], pools: Iterable[str]) -> None:
+        known = set(pools)
+        self._routes: list[tuple[re.Pattern[str], frozenset[str] | None, str]] = []
+        for route in routes:
+            if route.pool not in known:
+                raise ValueError(f"pool_routes references unknown pool {route.pool!r}; expected one of {sorted(known)}")
+            methods = frozenset(method.upper() for method in route.methods) if route.methods is not None else None
+            self._routes.append((re.compile(route.path), methods, route.pool))
+
+    def pool_for(self, method: str, path: str) -> str:
+        for pattern, methods, pool in self._routes:
+            if (methods is None or method.upper() in methods) and pattern.search(path):
+                return pool
+        if _is_background_path(path):
+            return "background"
+        if _is_transfer_path(path):
+            return "transfer"
+        if _is_streaming_path(path):
+            return "streaming"
+        return "api"
+
+
+def _resolve_pool_configs(
+    *,
+    api_pool_shards: int,
+    background_pool_shards: int,
+    transfer_pool_shards: int,
+    max_api_pool_shards: int,
+    max_background_pool_shards: int,
+    max_transfer_pool_shards: int,
+    max_concurrent_api_requests: int | None,
+    max_concurrent_background_requests: int | None,
+    max_concurrent_transfer_requests: int | None,
+    pools: Mapping[str, PoolConfig] | None,
+) -> dict[str, PoolConfig]:
+    """Built-in workload pools from the per-class options, overridden field by field or extended by `pools`."""
+    configs = {
+        "api": PoolConfig(
+            shards=api_pool_shards,
+            max_shards=max_api_pool_shards,
+            max_concurrent_requests=max_concurrent_api_requests,
+        ),
+        "background": PoolConfig(
+            shards=background_pool_shards,
+            max_shards=max_background_pool_shards,
+            max_concurrent_requests=max_concurrent_background_requests,
+        ),
+        "transfer": PoolConfig(
+            shards=transfer_pool_shards,
+            max_shards=max_transfer_pool_shards,
+            max_concurrent_requests=max_concurrent_transfer_requests,
+        ),
+        "streaming": PoolConfig(shards=DEFAULT_STREAMING_POOL_SHARDS, max_shards=DEFAULT_MAX_STREAMING_POOL_SHARDS),
+    }
+    for name, override in (pools or {}).items():
+        base = configs.get(name)
+        configs[name] = override if base is None else override._merged_into(base)
+    for name, config in configs.items():
+        if config.shards < 1:
+            raise ValueError(f"pool {name!r} must have shards >= 1")
+        if config.max_concurrent_requests is not None and config.max_concurrent_requests < 1:
+            raise ValueError(f"pool {name!r} must have max_concurrent_requests >= 1")
+    return configs
+
+
+def _select_round_robin(loads: Sequence[int], start: int) -> int:  # noqa: ARG001
+    return start
+
+
+def _select_least_outstanding(loads: Sequence[int], start: int) -> int:
+    shard = start
+    load = loads[start]
+    for offset in range(1, len(loads)):
+        if load == 0:
+            break
+        candidate = (start + offset) % len(loads)
+        if loads[candidate] < load:
+            shard, load = candidate, loads[candidate]
+    return shard
+
+
+def _select_power_of_two_choices(loads: Sequence[int], start: int) -> int:  # noqa: ARG001
+    if len(loads) == 1:
+        return 0
+    first = randrange(len(loads))
+    second = randrange(len(loads) - 1)
+    if second >= first:
+        second += 1
+    return second if loads[second] < loads[first] else first
+
+
+_SHARD_SELECTORS: dict[str, ShardSelector] = {
+    "round_robin": _select_round_robin,
+    "least_outstanding": _select_least_outstanding,
+    "power_of_two_choices": _select_power_of_two_choices,
+}
+
+
+def _resolve_shard_selector(policy: ShardSelectionPolicy | ShardSelector) -> ShardSelector:
+    if callable(policy):
+        return policy
+    try:
+        return _SHARD_SELECTORS[policy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown shard_selection policy {policy!r}; expected one of {sorted(_SHARD_SELECTORS)} or a callable"
+        ) from None
+
+
+class _TokenBucket:
+    """Paces a pool's requests to a steady rate, with up to one second's worth of burst.
+
+    The rate is the configured `rate` and, when `adaptive`, whatever budget the
+    server last advertised in its rate-limit headers, whichever is lower. Callers
+    reserve a token before sending and sleep for the returned delay, so a backlog
+    drains at the allowed rate in arrival order instead of bursting into 429s.
+    """
+
+    def __init__(self, rate: float | None, *, adaptive: bool) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("requests_per_second must be > 0")
+        self.static_rate = rate
+        self.adaptive = adaptive
+        self._learned_rate: float | None = None
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float | None:
+        """Current pace in requests per second, or None while unlimited."""
+        rates = [rate for rate in (self.static_rate, self._learned_rate) if rate is not None]
+        return min(rates) if rates else None
+
+    @property
+    def burst(self) -> float:
+        return max(1.0, self.rate or 1.0)
+
+    def _refill(self, now: float) -> None:
+        rate = self.rate
+        if rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token; returns how many seconds the caller must wait before sending."""
+        with self._lock:
+            rate = self.rate
+            if rate is None:
+                return 0.0
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+    def observe(self, remaining: float, reset_seconds: float) -> None:
+        """Adopt the server's budget: `remaining` requests until the window resets."""
+        if not self.adaptive or reset_seconds <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            # Spread what is left evenly over the rest of the window; once it is spent,
+            # the next request waits for the reset.
+            self._learned_rate = max(remaining, 1.0) / reset_seconds
+            self._tokens = min(self._tokens, self.burst, max(remaining, 0.0))
+
+
+class _RetryBudget:
+    """Caps retries at a fraction of recent successful traffic.
+
+    Successes and retries are counted in one-second buckets over a sliding
+    window. A retry is allowed while the window holds fewer than
+    `RETRY_BUDGET_MIN_PER_SECOND` per second plus `ratio` times its successes,
+    so a healthy client retries freely but an outage cannot amplify load by
+    more than `ratio`.
+    """
+
+    def __init__(self, ratio: float) -> None:
+        if ratio < 0:
+            raise ValueError("retry_budget_ratio must be >= 0")
+        self.ratio = ratio
+        # [second, successes, retries], oldest first.
+        self._buckets: deque[list[int]] = deque()
+        self._denied = 0
+        self._lock = threading.Lock()
+
+    def _current(self) -> list[int]:
+        second = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= second - RETRY_BUDGET_WINDOW_SECONDS:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+    def _available(self) -> int:
+        successes = sum(bucket[1] for bucket in self._buckets)
+        retries = sum(bucket[2] for bucket in self._buckets)
+        allowed = RETRY_BUDGET_MIN_PER_SECOND * RETRY_BUDGET_WINDOW_SECONDS + self.ratio * successes
+        return max(0, int(allowed) - retries)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._current()[1] += 1
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; False (and counted as denied) once the budget is spent."""
+        with self._lock:
+            bucket = self._current()
+            if self._available() < 1:
+                self._denied += 1
+                return False
+            bucket[2] += 1
+            return True
+
+    def stats(self) -> RetryBudgetStats:
+        with self._lock:
+            self._current()
+            return RetryBudgetStats(
+                successes=sum(bucket[1] for bucket in self._buckets),
+                retries=sum(bucket[2] for bucket in self._buckets),
+                available=self._available(),
+                denied=self._denied,
+            )
+
+
+_ID_SEGMENT = re.compile(r"^(?!v\d+$)[^/]*\d[^/]*$")
+
+
+def _endpoint_key(request: httpx.Request) -> str:
+    """Groups requests by endpoint: method plus path, with ID-like segments collapsed.
+
+    Resource IDs (`dbx_2xA9...`) and other segments containing digits become
+    `{id}` so every devbox shares its endpoint's breaker and latency history;
+    `v1` is kept.
+    """
+    segments = request.url.path.split("/")
+    path = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments)
+    return f"{request.method} {path}"
+
+
+class _EndpointCircuit:
+    def __init__(self) -> None:
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started: float | None = None
+
+
+class _CircuitBreakers:
+    """Per-endpoint circuit breakers shared by the sync and async clients.
+
+    `threshold` consecutive failures (connection errors, timeouts, 5xx) open an
+    endpoint's circuit; requests then fail fast with `CircuitOpenError` for
+    `cooldown` seconds. After that a single half-open probe is let through: its
+    success closes the circuit, its failure re-opens it. A probe that never
+    reports back frees its slot after another `cooldown`.
+    """
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        if threshold < 1:
+            raise ValueError("circuit_breaker_threshold must be >= 1")
+        if cooldown <= 0:
+            raise ValueError("circuit_breaker_cooldown must be > 0")
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._circuits: dict[str, _EndpointCircuit] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> float | None:
+        """Admit a request to `key`; returns seconds until the next probe when the circuit rejects it."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == "closed":
+                return None
+            now = time.monotonic()
+            if circuit.state == "open":
+                elapsed = now - circuit.opened_at
+                if elapsed < self.cooldown:
+                    return self.cooldown - elapsed
+                circuit.state = "half_open"
+            elif circuit.probe_started is not None and now - circuit.probe_started < self.cooldown:
+                return self.cooldown - (now - circuit.probe_started)
+            circuit.probe_started = now
+            return None
+
+    def record(self, key: str, *, failed: bool) -> None:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if not failed:
+                if circuit is not None:
+                    circuit.state = "closed"
+                    circuit.failures = 0
+                    circuit.probe_started = None
+                return
+            if circuit is None:
+                circuit = self._circuits[key] = _EndpointCircuit()
+            circuit.failures += 1
+            if circuit.state == "half_open" or circuit.failures >= self.threshold:
+                if circuit.state != "open":
+                    log.warning("Circuit opened for %s after %i consecutive failures", key, circuit.failures)
+                circuit.state = "open"
+                circuit.opened_at = time.monotonic()
+                circuit.probe_started = None
+
+    def states(self) -> dict[str, CircuitBreakerState]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                key: CircuitBreakerState(
+                    state=circuit.state,
+                    consecutive_failures=circuit.failures,
+                    retry_in=max(0.0, self.cooldown - (now - circuit.opened_at)) if circuit.state == "open" else None,
+                )
+                for key, circuit in self._circuits.items()
+            }
+
+
+class _Hedging:
+    """Adaptive hedge delays and the hedge budget, shared by the sync and async clients.
+
+    Each route keeps its recent latencies; once it has enough of them, a request
+    still outstanding after the route's p95 is duplicated. Every eligible request
+    deposits `ratio` of a hedge into the budget and every duplicate spends one, so
+    hedging adds at most `ratio` extra load.
+    """
+
+    def __init__(self, ratio: float) -> None:
+        if not 0 < ratio <= 1:
+            raise ValueError("hedge_budget must be > 0 and <= 1")
+        self.ratio = ratio
+        self._latencies: dict[str, deque[float]] = {}
+        self._tokens = 0.0
+        self._hedged = 0
+        self._wins = 0
+        self._denied = 0
+        self._lock = threading.Lock()
+
+    def delay(self, key: str) -> float | None:
+        """Fund one request to `key`; returns how long to wait before hedging it, or None while unmeasured."""
+        with self._lock:
+            self._tokens = min(float(HEDGE_MAX_BURST), self._tokens + self.ratio)
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(samples)
+            return ordered[min(len(ordered) - 1, int(len(ordered) * HEDGE_PERCENTILE))]
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+            samples.append(seconds)
+
+    def try_hedge(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                self._denied += 1
+                return False
+            self._tokens -= 1
+            self._hedged += 1
+            return True
+
+    def record_win(self) -> None:
+        with self._lock:
+            self._wins += 1
+
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            return HedgingStats(hedged=self._hedged, wins=self._wins, denied=self._denied)
+
+
+def _clone_request(request: httpx.Request) -> httpx.Request:
+    """A body-less copy of `request` that can be sent concurrently with it."""
+    return httpx.Request(request.method, request.url, headers=request.headers, extensions=dict(request.extensions))
+
+
+def _close_response(future: Future[httpx.Response]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class _BulkheadCounters:
+    """Shared bookkeeping for the sync and async bulkheads."""
+
+    def __init__(self, limit: int, queue_timeout: float | None) -> None:
+        if limit < 1:
+            raise ValueError("concurrency limit must be >= 1")
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._queued = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._timeouts = 0
+
+    def _record_wait(self, seconds: float, granted: bool) -> None:
+        self._queued += 1
+        self._wait_seconds += seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+        if not granted:
+            self._timeouts += 1
+
+    def _stats(self, queue_depth: int) -> BulkheadStats:
+        return BulkheadStats(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queue_depth=queue_depth,
+            queued=self._queued,
+            wait_seconds=self._wait_seconds,
+            max_wait_seconds=self._max_wait_seconds,
+            timeouts=self._timeouts,
+        )
+
+
+class _Bulkhead(_BulkheadCounters):
+    """FIFO counting semaphore capping how many requests of one workload class run at once.
+
+    A released slot is handed straight to the longest-waiting request, so a steady
+    stream of new arrivals can never overtake requests that are already queued.
+    """
+
+    def __init__(self, limit: int, queue_timeout: float | None) -> None:
+        super().__init__(limit, queue_timeout)
+        self._waiters: deque[threading.Event] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Take a slot, waiting at most `queue_timeout` seconds; returns False on timeout."""
+        with self._lock:
+            if self._in_flight < self.limit and not self._waiters:
+                self._in_flight += 1
+                return True
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+        started = time.monotonic()
+        waiter.wait(self.queue_timeout)
+        with self._lock:
+            # Checked under the lock: a slot may have been handed over right after the wait timed out.
+            granted = waiter.is_set()
+            if not granted:
+                self._waiters.remove(waiter)
+            self._record_wait(time.monotonic() - started, granted)
+        return granted
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._in_flight -= 1
+
+    def stats(self) -> BulkheadStats:
+        with self._lock:
+            return self._stats(len(self._waiters))
+
+
+class _AsyncBulkhead(_BulkheadCounters):
+    """Event-loop counterpart of `_Bulkhead`."""
+
+    def __init__(self, limit: int, queue_timeout: float | None) -> None:
+        super().__init__(limit, queue_timeout)
+        self._waiters: deque[anyio.Event] = deque()
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting at most `queue_timeout` seconds; returns False on timeout."""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+        waiter = anyio.Event()
+        self._waiters.append(waiter)
+        started = time.monotonic()
+        try:
+            with anyio.fail_after(self.queue_timeout):
+                await waiter.wait()
+        except TimeoutError:
+            pass
+        except BaseException:
+            # Cancelled while queued: pass on a slot we were handed, or leave the queue.
+            if waiter.is_set():
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        # A slot may have been handed over right as the timeout fired.
+        granted = waiter.is_set()
+        if not granted:
+            self._waiters.remove(waiter)
+        self._record_wait(time.monotonic() - started, granted)
+        return granted
+
+    def release(self) -> None:
+        if self._waiters:
+            self._waiters.popleft().set()
+        else:
+            self._in_flight -= 1
+
+    def stats(self) -> BulkheadStats:
+        return self._stats(len(self._waiters))
+
+
+def _validate_concurrency_limits(
+    *,
+    max_concurrent_api_requests: int | None,
+    max_concurrent_background_requests: int | None,
+    max_concurrent_transfer_requests: int | None,
+    max_queue_time: float | None,
+) -> None:
+    for name, limit in (
+        ("max_concurrent_api_requests", max_concurrent_api_requests),
+        ("max_concurrent_background_requests", max_concurrent_background_requests),
+        ("max_concurrent_transfer_requests", max_concurrent_transfer_requests),
+    ):
+        if limit is not None and limit < 1:
+            raise ValueError(f"{name} must be >= 1")
+    if max_queue_time is not None and max_queue_time < 0:
+        raise ValueError("max_queue_time must be >= 0")
+
+
 class _SyncClientPool:
-    """Per-SDK-client round-robin over sharded httpx.Client wrappers."""
+    """Per-SDK-client shard routing over sharded httpx.Client wrappers.
+
+    Each request goes to the shard chosen by `selector` from the current per-shard
+    loads: the shared transport's process-wide stream count when the shard is
+    shared, otherwise the pool's own count of requests it has in flight there.
+
+    The pool starts with `shards` active shards and grows one shard at a time, up
+    to `max_shards`, when every active shard carries `SHARD_SCALE_UP_STREAMS`
+    in-flight streams. Grown shards that stay idle for `SHARD_IDLE_TIMEOUT_SECONDS`
+    are released again.
+    """
 
     def __init__(
         self,
@@ -265,18 +1346,52 @@ class _SyncClientPool:
         shared: bool,
         registry: _SharedTransport.Registry | None,
         make_client: Callable[[httpx.BaseTransport | None], httpx.Client],
+        max_shards: int | None = None,
+        selector: ShardSelector = _select_least_outstanding,
+        bulkhead: _Bulkhead | None = None,
+        limiter: _TokenBucket | None = None,
     ) -> None:
         if shards < 1:
             raise ValueError("shards must be >= 1")
+        self.min_shards = shards
+        self.max_shards = max(shards, max_shards or shards)
         self.shards = shards
         self._shared = shared
         self._registry = registry
         self._make_client = make_client
+        self._selector = selector
+        self._bulkhead = bulkhead
+        self.limiter = limiter
         self._clients: dict[int, httpx.Client] = {}
+        self._transports: dict[int, _SharedTransport] = {}
+        self._in_flight: dict[int, int] = {}
+        self._last_used: dict[int, float] = {}
         self._lock = threading.Lock()
         self._next = secrets.randbelow(shards)
+        self._generation = _fork_generation
+
+    def _check_fork(self) -> None:
+        """Start over with fresh clients when running in a child forked after this pool was built."""
+        if self._generation == _fork_generation:
+            return
+        with _pool_lock:
+            if self._generation == _fork_generation:
+                return
+            # Inherited clients talk over the parent's sockets: abandon them unclosed.
+            self._lock = threading.Lock()
+            self._clients = {}
+            self._transports = {}
+            self._in_flight = {}
+            self._last_used = {}
+            self.shards = self.min_shards
+            if self._bulkhead is not None:
+                self._bulkhead = _Bulkhead(self._bulkhead.limit, self._bulkhead.queue_timeout)
+            if self.limiter is not None:
+                self.limiter = _TokenBucket(self.limiter.static_rate, adaptive=self.limiter.adaptive)
+            self._generation = _fork_generation
 
     def ensure(self, shard: int) -> httpx.Client:
+        self._check_fork()
         existing = self._clients.get(shard)
         if existing is not None:
             return existing
@@ -284,27 +1399,127 @@ class _SyncClientPool:
             existing = self._clients.get(shard)
             if existing is not None:
                 return existing
-            transport: httpx.BaseTransport | None = None
+            transport: _SharedTransport | None = None
             if self._shared and self._registry is not None:
                 transport = self._registry.acquire(shard)
+                self._transports[shard] = transport
             client = self._make_client(transport)
             self._clients[shard] = client
             return client
 
+    def in_flight(self, shard: int) -> int:
+        transport = self._transports.get(shard)
+        if transport is not None:
+            return transport.in_flight
+        return self._in_flight.get(shard, 0)
+
+    def loads(self) -> list[int]:
+        """Current load of every active shard, as seen by the selection policy."""
+        return [self.in_flight(shard) for shard in range(self.shards)]
+
+    def _select(self, exclude: int | None = None) -> int:
+        now = time.monotonic()
+        self._maybe_shrink(now)
+        start = self._next % self.shards
+        self._next += 1
+        loads = self.loads()
+        shard = self._selector(loads, start)
+        if min(loads) >= SHARD_SCALE_UP_STREAMS and self.shards < self.max_shards:
+            shard = self.shards
+            self.shards += 1
+            log.debug("Scaling shard pool up to %i shards", self.shards)
+        elif shard == exclude and self.shards > 1:
+            shard = (shard + 1) % self.shards
+        self._last_used[shard] = now
+        return shard
+
+    def _maybe_shrink(self, now: float) -> None:
+        while self.shards > self.min_shards:
+            shard = self.shards - 1
+            if (
+                self._in_flight.get(shard, 0) > 0
+                or self.in_flight(shard) > 0
+                or now - self._last_used.get(shard, now) < SHARD_IDLE_TIMEOUT_SECONDS
+            ):
+                return
+            self.shards -= 1
+            self._last_used.pop(shard, None)
+            self._transports.pop(shard, None)
+            client = self._clients.pop(shard, None)
+            if client is not None:
+                client.close()
+            log.debug("Scaling shard pool down to %i shards", self.shards)
+
+    def _release(self, shard: int, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._in_flight[shard] -= 1
+        if self._bulkhead is not None:
+            self._bulkhead.release()
+
+    def bulkhead_stats(self) -> BulkheadStats | None:
+        self._check_fork()
+        return self._bulkhead.stats() if self._bulkhead is not None else None
+
+    def pick_shard(self, exclude: int | None = None) -> int:
+        """Select a shard for a request; any other active shard is preferred over `exclude`."""
+        self._check_fork()
+        with self._lock:
+            return self._select(exclude)
+
     def next_client(self) -> httpx.Client:
+        return self.ensure(self.pick_shard())
+
+    def send(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        shard: int | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        """Send on the selected (or given) shard, counting the request until its response body is closed.
+
+        A rate limiter first paces the request; then, with a bulkhead, it waits in line
+        for one of the pool's request slots.
+        """
+        self._check_fork()
+        if self.limiter is not None:
+            delay = self.limiter.reserve()
+            if delay > 0:
+                time.sleep(delay)
+        if self._bulkhead is not None and not self._bulkhead.acquire():
+            raise QueueTimeoutError(request=request, queue_timeout=self._bulkhead.queue_timeout)
         with self._lock:
-            shard = self._next % self.shards
-            self._next += 1
-        return self.ensure(shard)
+            if shard is None:
+                shard = self._select()
+            self._in_flight[shard] = self._in_flight.get(shard, 0) + 1
+        release = functools.partial(self._release, shard, self._generation)
+        try:
+            response = self.ensure(shard).send(request, stream=stream, **kwargs)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:
+            release()
+        else:
+            response.stream = _TrackedByteStream(cast(httpx.SyncByteStream, response.stream), release)
+        return response
 
     def close(self) -> None:
+        self._check_fork()
         for client in self._clients.values():
             client.close()
         self._clients.clear()
+        self._transports.clear()
 
 
 class _AsyncClientPool:
-    """Per-SDK-client round-robin over sharded httpx.AsyncClient wrappers."""
+    """Per-SDK-client shard routing over sharded httpx.AsyncClient wrappers.
+
+    Selects and scales shards the same way as `_SyncClientPool`.
+    """
 
     def __init__(
         self,
@@ -313,21 +1528,53 @@ class _AsyncClientPool:
         shared: bool,
         registry: _SharedAsyncTransport.Registry | None,
         make_client: Callable[[httpx.AsyncBaseTransport | None], httpx.AsyncClient],
+        max_shards: int | None = None,
+        selector: ShardSelector = _select_least_outstanding,
+        bulkhead: _AsyncBulkhead | None = None,
+        limiter: _TokenBucket | None = None,
     ) -> None:
         if shards < 1:
             raise ValueError("shards must be >= 1")
+        self.min_shards = shards
+        self.max_shards = max(shards, max_shards or shards)
         self.shards = shards
         self._shared = shared
         self._registry = registry
         self._make_client = make_client
+        self._selector = selector
+        self._bulkhead = bulkhead
+        self.limiter = limiter
         self._clients: dict[int, httpx.AsyncClient] = {}
+        self._transports: dict[int, _SharedAsyncTransport] = {}
+        self._in_flight: dict[int, int] = {}
+        self._last_used: dict[int, float] = {}
         self._next = secrets.randbelow(shards)
+        self._generation = _fork_generation
+        self._closer = _BackgroundCloser()
+
+    def _check_fork(self) -> None:
+        """Start over with fresh clients when running in a child forked after this pool was built."""
+        if self._generation == _fork_generation:
+            return
+        # Inherited clients talk over the parent's sockets: abandon them unclosed.
+        self._clients = {}
+        self._transports = {}
+        self._in_flight = {}
+        self._last_used = {}
+        self._closer = _BackgroundCloser()
+        self.shards = self.min_shards
+        if self._bulkhead is not None:
+            self._bulkhead = _AsyncBulkhead(self._bulkhead.limit, self._bulkhead.queue_timeout)
+        if self.limiter is not None:
+            self.limiter = _TokenBucket(self.limiter.static_rate, adaptive=self.limiter.adaptive)
+        self._generation = _fork_generation
 
     def ensure(self, shard: int) -> httpx.AsyncClient:
+        self._check_fork()
         existing = self._clients.get(shard)
         if existing is not None:
             return existing
-        transport: httpx.AsyncBaseTransport | None = None
+        transport: _SharedAsyncTransport | None = None
         if self._shared and self._registry is not None:
             try:
                 loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
@@ -335,20 +1582,117 @@ class _AsyncClientPool:
                 loop = None
             if loop is not None:
                 transport = self._registry.acquire(loop, shard)
+                self._transports[shard] = transport
         client = self._make_client(transport)
         self._clients[shard] = client
         return client
 
-    def next_client(self) -> httpx.AsyncClient:
-        # Single-threaded event loop: counter bump needs no lock when there is no await.
-        shard = self._next % self.shards
+    def in_flight(self, shard: int) -> int:
+        transport = self._transports.get(shard)
+        if transport is not None:
+            return transport.in_flight
+        return self._in_flight.get(shard, 0)
+
+    def loads(self) -> list[int]:
+        """Current load of every active shard, as seen by the selection policy."""
+        return [self.in_flight(shard) for shard in range(self.shards)]
+
+    def _select(self, exclude: int | None = None) -> int:
+        now = time.monotonic()
+        self._maybe_shrink(now)
+        start = self._next % self.shards
         self._next += 1
-        return self.ensure(shard)
+        loads = self.loads()
+        shard = self._selector(loads, start)
+        if min(loads) >= SHARD_SCALE_UP_STREAMS and self.shards < self.max_shards:
+            shard = self.shards
+            self.shards += 1
+            log.debug("Scaling shard pool up to %i shards", self.shards)
+        elif shard == exclude and self.shards > 1:
+            shard = (shard + 1) % self.shards
+        self._last_used[shard] = now
+        return shard
+
+    def _maybe_shrink(self, now: float) -> None:
+        while self.shards > self.min_shards:
+            shard = self.shards - 1
+            if (
+                self._in_flight.get(shard, 0) > 0
+                or self.in_flight(shard) > 0
+                or now - self._last_used.get(shard, now) < SHARD_IDLE_TIMEOUT_SECONDS
+            ):
+                return
+            self.shards -= 1
+            self._last_used.pop(shard, None)
+            self._transports.pop(shard, None)
+            client = self._clients.pop(shard, None)
+            if client is not None:
+                # Idle by construction, so closing in the background cannot cut off a request.
+                self._closer.close(client.aclose)
+            log.debug("Scaling shard pool down to %i shards", self.shards)
+
+    def _release(self, shard: int, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._in_flight[shard] -= 1
+        if self._bulkhead is not None:
+            self._bulkhead.release()
+
+    def bulkhead_stats(self) -> BulkheadStats | None:
+        self._check_fork()
+        return self._bulkhead.stats() if self._bulkhead is not None else None
+
+    def pick_shard(self, exclude: int | None = None) -> int:
+        """Select a shard for a request; any other active shard is preferred over `exclude`."""
+        # Single-threaded event loop: selection needs no lock when there is no await.
+        self._check_fork()
+        return self._select(exclude)
+
+    def next_client(self) -> httpx.AsyncClient:
+        return self.ensure(self.pick_shard())
+
+    async def send(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        shard: int | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        """Send on the selected (or given) shard, counting the request until its response body is closed.
+
+        A rate limiter first paces the request; then, with a bulkhead, it waits in line
+        for one of the pool's request slots.
+        """
+        self._check_fork()
+        if self.limiter is not None:
+            delay = self.limiter.reserve()
+            if delay > 0:
+                await anyio.sleep(delay)
+        if self._bulkhead is not None and not await self._bulkhead.acquire():
+            raise QueueTimeoutError(request=request, queue_timeout=self._bulkhead.queue_timeout)
+        if shard is None:
+            shard = self._select()
+        self._in_flight[shard] = self._in_flight.get(shard, 0) + 1
+        release = functools.partial(self._release, shard, self._generation)
+        try:
+            response = await self.ensure(shard).send(request, stream=stream, **kwargs)
+        except BaseException:
+            release()
+            raise
+        if response.is_closed:
+            release()
+        else:
+            response.stream = _TrackedAsyncByteStream(cast(httpx.AsyncByteStream, response.stream), release)
+        return response
 
     async def aclose(self) -> None:
+        self._check_fork()
+        await self._closer.aclose()
         for client in self._clients.values():
             await client.aclose()
         self._clients.clear()
+        self._transports.clear()
 
 
 # TODO: make base page type vars covariant
@@ -376,6 +1720,116 @@ else:
         HTTPX_DEFAULT_TIMEOUT = Timeout(5.0)
 
 
+def _coalescing_key(cast_to: type[object], options: FinalRequestOptions, stream: bool) -> Hashable | None:
+    """Identity of a request for singleflight purposes, or None when it must not be shared.
+
+    Only plain, parsed GETs qualify: streamed, raw-response and paginated calls each
+    return an object their caller consumes, so they always get a request of their own.
+    """
+    if stream or options.method.lower() != "get" or is_given(options.post_parser):
+        return None
+    origin = get_origin(cast_to) or cast_to
+    if cast_to is httpx.Response or (inspect.isclass(origin) and issubclass(origin, BaseAPIResponse)):
+        return None
+    headers: Headers = options.headers if is_given(options.headers) else {}
+    if headers.get(RAW_RESPONSE_HEADER):
+        return None
+    return (
+        cast_to,
+        options.url,
+        json.dumps(options.params, sort_keys=True, default=str),
+        json.dumps(headers, sort_keys=True, default=str),
+    )
+
+
+class _SingleflightBase:
+    def __init__(self, exclude: Sequence[str]) -> None:
+        self._exclude = [re.compile(pattern) for pattern in exclude]
+        self.hits = 0
+        self.misses = 0
+
+    def covers(self, path: str) -> bool:
+        return not any(pattern.search(path) for pattern in self._exclude)
+
+    def stats(self) -> CoalescingStats:
+        return CoalescingStats(hits=self.hits, misses=self.misses)
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _Singleflight(_SingleflightBase):
+    """Lets concurrent identical requests share the first caller's HTTP call and result."""
+
+    def __init__(self, exclude: Sequence[str]) -> None:
+        super().__init__(exclude)
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return cast(_T, flight.result)
+        try:
+            flight.result = fn()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return cast(_T, flight.result)
+
+
+class _AsyncSingleflight(_SingleflightBase):
+    """Event-loop counterpart of `_Singleflight`.
+
+    The shared call runs as its own task, so one caller being cancelled does not
+    cancel the request for everyone else waiting on it. That needs asyncio; on
+    other event loops every call goes out on its own.
+    """
+
+    def __init__(self, exclude: Sequence[str]) -> None:
+        super().__init__(exclude)
+        self._flights: dict[Hashable, asyncio.Task[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[_T]]) -> _T:
+        if get_async_library() != "asyncio":
+            self.misses += 1
+            return await fn()
+        task = self._flights.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(functools.partial(self._finish, key))
+            self._flights[key] = task
+            self.misses += 1
+        else:
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every waiter was cancelled meanwhile.
+            task.exception()
+
+
 class PageInfo:
     """Stores the necessary information to build the request to retrieve the next page.
 
@@ -517,7 +1971,18 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+    def iter_pages(self: SyncPageT, *, prefetch: int | None = None) -> Iterator[SyncPageT]:
+        """Iterate over this page and every page after it.
+
+        Args:
+            prefetch: How many pages to fetch ahead on a background thread while the current one is consumed.
+                Defaults to the client's `page_prefetch`; 0 fetches each page once the previous one is used up.
+        """
+        depth = self._client._page_prefetch if prefetch is None else prefetch
+        if depth > 0:
+            yield from _prefetch_pages(self, depth)
+            return
+
         page = self
         while True:
             yield page
@@ -597,7 +2062,20 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
+    async def iter_pages(self: AsyncPageT, *, prefetch: int | None = None) -> AsyncIterator[AsyncPageT]:
+        """Iterate over this page and every page after it.
+
+        Args:
+            prefetch: How many pages to fetch ahead in a background task while the current one is consumed.
+                Defaults to the client's `page_prefetch`; 0 fetches each page once the previous one is used up.
+                Only supported under asyncio, other event loops always fetch one page at a time.
+        """
+        depth = self._client._page_prefetch if prefetch is None else prefetch
+        if depth > 0 and get_async_library() == "asyncio":
+            async for page in _async_prefetch_pages(self, depth):
+                yield page
+            return
+
         page = self
         while True:
             yield page
@@ -617,6 +2095,90 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
         return await self._client._request_api_list(self._model, page=self.__class__, options=options)
 
 
+class _PrefetchFailed:
+    """An error raised while prefetching a page, re-raised where the pages are consumed."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch_pages(first: SyncPageT, depth: int) -> Iterator[SyncPageT]:
+    """Yield `first` and the pages after it, fetching up to `depth` pages ahead on a background thread.
+
+    Cursor pages can only be requested once the page before them has arrived, so a single
+    thread walks the chain; it stops once `depth` pages are waiting to be consumed.
+    """
+    buffer: queue.SimpleQueue[object] = queue.SimpleQueue()
+    # one slot per page that has been, or is being, fetched but not handed out yet
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def fetch() -> None:
+        page = first
+        try:
+            while page.has_next_page():
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                page = page.get_next_page()
+                buffer.put(page)
+        except BaseException as error:
+            buffer.put(_PrefetchFailed(error))
+        else:
+            buffer.put(_PREFETCH_DONE)
+
+    threading.Thread(target=fetch, name="runloop-page-prefetch", daemon=True).start()
+    try:
+        yield first
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchFailed):
+                raise item.error
+            slots.release()
+            yield cast(SyncPageT, item)
+    finally:
+        # wakes the fetching thread if it is waiting for a slot, e.g. when iteration stops early
+        stopped.set()
+        slots.release()
+
+
+async def _async_prefetch_pages(first: AsyncPageT, depth: int) -> AsyncIterator[AsyncPageT]:
+    """Yield `first` and the pages after it, fetching up to `depth` pages ahead in a background task."""
+    buffer: asyncio.Queue[object] = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def fetch() -> None:
+        page = first
+        try:
+            while page.has_next_page():
+                await slots.acquire()
+                page = await page.get_next_page()
+                buffer.put_nowait(page)
+        except Exception as error:
+            buffer.put_nowait(_PrefetchFailed(error))
+        else:
+            buffer.put_nowait(_PREFETCH_DONE)
+
+    task = asyncio.ensure_future(fetch())
+    try:
+        yield first
+        while True:
+            item = await buffer.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchFailed):
+                raise item.error
+            slots.release()
+            yield cast(AsyncPageT, item)
+    finally:
+        task.cancel()
+
+
 _HttpxClientT = TypeVar("_HttpxClientT", bound=Union[httpx.Client, httpx.AsyncClient])
 _DefaultStreamT = TypeVar("_DefaultStreamT", bound=Union[Stream[Any], AsyncStream[Any]])
 
@@ -630,6 +2192,11 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _strict_response_validation: bool
     _idempotency_header: str | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
+    _retry_budget: _RetryBudget | None = None
+    _circuit_breakers: _CircuitBreakers | None = None
+    _hedging: _Hedging | None = None
+    _lazy_models: bool = False
+    _page_prefetch: int = 0
 
     def __init__(
         self,
@@ -843,6 +2410,31 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             **kwargs,
         )
 
+    def _rebuild_request_for_retry(
+        self,
+        request: httpx.Request,
+        options: FinalRequestOptions,
+        *,
+        retries_taken: int,
+    ) -> httpx.Request | None:
+        """Reuse an already encoded request for a retry, changing only its retry-count header.
+
+        Returns None when the body cannot be replayed as-is (multipart uploads, file or
+        iterator content); the request must then be built from `options` again.
+        """
+        if not isinstance(request.stream, httpx.ByteStream):
+            return None
+        headers = request.headers.copy()
+        if not any(header.lower() == "x-stainless-retry-count" for header in options.headers or {}):
+            headers["x-stainless-retry-count"] = str(retries_taken)
+        return httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            stream=request.stream,
+            extensions=dict(request.extensions),
+        )
+
     def _serialize_multipartform(self, data: Mapping[object, object]) -> dict[str, object]:
         items = self.qs.stringify_items(
             # TODO: type ignore is required as stringify_items is well typed but we can't be
@@ -913,7 +2505,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             if self._strict_response_validation:
                 return cast(ResponseT, validate_type(type_=cast_to, value=data))
 
-            return cast(ResponseT, construct_type(type_=cast_to, value=data))
+            return cast(ResponseT, construct_type(type_=cast_to, value=data, lazy=self._lazy_models))
         except pydantic.ValidationError as err:
             raise APIResponseValidationError(response=response, body=data) from err
 
@@ -1009,6 +2601,28 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         retry_date = email.utils.mktime_tz(retry_date_tuple)
         return float(retry_date - time.time())
 
+    def _parse_rate_limit_budget(self, response: httpx.Response) -> tuple[float, float] | None:
+        """Returns `(remaining requests, seconds until the window resets)` from a response, if advertised.
+
+        Understands the IETF `RateLimit-Remaining` / `RateLimit-Reset` fields and their
+        common `X-RateLimit-*` spelling; a 429 with `Retry-After` means no budget is left
+        until then.
+        """
+        headers = response.headers
+        if response.status_code == 429:
+            retry_after = self._parse_retry_after_header(headers)
+            if retry_after is not None and retry_after > 0:
+                return 0.0, retry_after
+        try:
+            remaining = float(headers.get("ratelimit-remaining") or headers["x-ratelimit-remaining"])
+            reset = float(headers.get("ratelimit-reset") or headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return None
+        if reset > time.time() - 60:
+            # Some servers send the reset as a Unix timestamp rather than delta seconds.
+            reset -= time.time()
+        return remaining, reset
+
     def _calculate_retry_timeout(
         self,
         remaining_retries: int,
@@ -1068,6 +2682,46 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         log.debug("Not retrying")
         return False
 
+    def _check_circuit(self, request: httpx.Request) -> None:
+        if self._circuit_breakers is None:
+            return
+        retry_in = self._circuit_breakers.acquire(_endpoint_key(request))
+        if retry_in is not None:
+            log.debug("Circuit open for %s %s; failing fast", request.method, request.url)
+            raise CircuitOpenError(request=request, retry_in=retry_in)
+
+    def _record_attempt(self, request: httpx.Request, response: httpx.Response | None) -> None:
+        """Feeds one attempt's outcome to the circuit breaker and the retry budget; `None` means no response."""
+        if self._circuit_breakers is not None:
+            failed = response is None or response.status_code >= 500
+            self._circuit_breakers.record(_endpoint_key(request), failed=failed)
+        if self._retry_budget is not None and response is not None and response.status_code < 400:
+            self._retry_budget.record_success()
+
+    def _spend_retry(self) -> bool:
+        if self._retry_budget is None or self._retry_budget.try_spend():
+            return True
+        log.debug("Not retrying as the retry budget is spent")
+        return False
+
+    def retry_budget_stats(self) -> RetryBudgetStats | None:
+        """Counters of the retry budget; None unless `retry_budget_ratio` is set."""
+        if self._retry_budget is None:
+            return None
+        return self._retry_budget.stats()
+
+    def hedging_stats(self) -> HedgingStats | None:
+        """Counters of request hedging; None unless `hedge_budget` is set."""
+        if self._hedging is None:
+            return None
+        return self._hedging.stats()
+
+    def circuit_breakers(self) -> dict[str, CircuitBreakerState]:
+        """State of each endpoint's circuit breaker that has seen a failure, keyed by `"METHOD /path"`."""
+        if self._circuit_breakers is None:
+            return {}
+        return self._circuit_breakers.states()
+
     def _idempotency_key(self) -> str:
         return f"stainless-python-retry-{uuid.uuid4()}"
 
@@ -1106,15 +2760,32 @@ class SyncHttpxClientWrapper(DefaultHttpxClient):
 
 class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
     _client: httpx.Client
+    _hedge_threads: ThreadPoolExecutor | None = None
+    _hedge_threads_generation: int = 0
     _api_pool: _SyncClientPool | None
     _background_pool: _SyncClientPool | None
     _transfer_pool: _SyncClientPool | None
+    _pools: dict[str, _SyncClientPool]
+    _singleflight: _Singleflight | None
+    _coalesce_exclude: Sequence[str]
+    _adaptive_rate_limit: bool
+    _router: _PoolRouter | None
+    _pool_overrides: Mapping[str, PoolConfig] | None
+    _pool_routes: Sequence[PoolRoute]
     _default_stream_cls: type[Stream[Any]] | None = None
     _uses_shared_pool: bool
     _isolate_workload_pools: bool
     _api_pool_shards: int
     _background_pool_shards: int
     _transfer_pool_shards: int
+    _shard_selection: ShardSelectionPolicy | ShardSelector
+    _max_api_pool_shards: int
+    _max_background_pool_shards: int
+    _max_transfer_pool_shards: int
+    _max_concurrent_api_requests: int | None
+    _max_concurrent_background_requests: int | None
+    _max_concurrent_transfer_requests: int | None
+    _max_queue_time: float | None
     _closed: bool
 
     def __init__(
@@ -1132,6 +2803,25 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool = False,
+        retry_budget_ratio: float | None = None,
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        hedge_budget: float | None = None,
+        lazy_models: bool = False,
+        page_prefetch: int = 0,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1157,6 +2847,26 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             raise ValueError("background_pool_shards must be >= 1")
         if transfer_pool_shards < 1:
             raise ValueError("transfer_pool_shards must be >= 1")
+        selector = _resolve_shard_selector(shard_selection)
+        _validate_concurrency_limits(
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+        )
+        pool_configs = _resolve_pool_configs(
+            api_pool_shards=api_pool_shards,
+            background_pool_shards=background_pool_shards,
+            transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            pools=pools,
+        )
+        router = _PoolRouter(pool_routes or (), pool_configs)
 
         super().__init__(
             version=version,
@@ -1173,6 +2883,31 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         self._api_pool_shards = api_pool_shards
         self._background_pool_shards = background_pool_shards
         self._transfer_pool_shards = transfer_pool_shards
+        # Autoscaling ceilings never sit below the configured base shard counts.
+        self._max_api_pool_shards = max(api_pool_shards, max_api_pool_shards)
+        self._max_background_pool_shards = max(background_pool_shards, max_background_pool_shards)
+        self._max_transfer_pool_shards = max(transfer_pool_shards, max_transfer_pool_shards)
+        self._shard_selection = shard_selection
+        self._max_concurrent_api_requests = max_concurrent_api_requests
+        self._max_concurrent_background_requests = max_concurrent_background_requests
+        self._max_concurrent_transfer_requests = max_concurrent_transfer_requests
+        self._max_queue_time = max_queue_time
+        self._pool_overrides = pools
+        self._pool_routes = tuple(pool_routes or ())
+        self._coalesce_exclude = tuple(coalesce_exclude or ())
+        self._adaptive_rate_limit = adaptive_rate_limit
+        self._retry_budget = _RetryBudget(retry_budget_ratio) if retry_budget_ratio is not None else None
+        self._circuit_breakers = (
+            _CircuitBreakers(circuit_breaker_threshold, circuit_breaker_cooldown)
+            if circuit_breaker_threshold is not None
+            else None
+        )
+        self._hedging = _Hedging(hedge_budget) if hedge_budget is not None else None
+        self._lazy_models = lazy_models
+        if page_prefetch < 0:
+            raise ValueError("page_prefetch must be >= 0")
+        self._page_prefetch = page_prefetch
+        self._singleflight = _Singleflight(self._coalesce_exclude) if coalesce_requests else None
         # Custom http_client owns the full transport stack; don't invent sibling pools.
         self._isolate_workload_pools = http_client is None
 
@@ -1182,11 +2917,13 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             self._api_pool = None
             self._background_pool = None
             self._transfer_pool = None
+            self._pools = {}
+            self._router = None
             return
 
         self._uses_shared_pool = shared_http_pool
 
-        def make_client(transport: httpx.BaseTransport | None) -> httpx.Client:
+        def make_client(limits: httpx.Limits, transport: httpx.BaseTransport | None) -> httpx.Client:
             timeout_ = cast(Timeout, self.timeout)
             if transport is not None:
                 return SyncHttpxClientWrapper(
@@ -1197,45 +2934,160 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             return SyncHttpxClientWrapper(
                 base_url=self._base_url,
                 timeout=timeout_,
+                limits=limits,
             )
 
-        api_registry = _shared_sync_api_transports if shared_http_pool else None
-        bg_registry = _shared_sync_background_transports if shared_http_pool else None
-        xfer_registry = _shared_sync_transfer_transports if shared_http_pool else None
-
-        self._api_pool = _SyncClientPool(
-            shards=api_pool_shards,
-            shared=shared_http_pool,
-            registry=api_registry,
-            make_client=make_client,
-        )
-        self._background_pool = _SyncClientPool(
-            shards=background_pool_shards,
-            shared=shared_http_pool,
-            registry=bg_registry,
-            make_client=make_client,
-        )
-        self._transfer_pool = _SyncClientPool(
-            shards=transfer_pool_shards,
-            shared=shared_http_pool,
-            registry=xfer_registry,
-            make_client=make_client,
-        )
+        self._pools = {
+            name: _SyncClientPool(
+                shards=config.shards,
+                max_shards=config.max_shards,
+                selector=selector,
+                bulkhead=_Bulkhead(config.max_concurrent_requests, max_queue_time)
+                if config.max_concurrent_requests is not None
+                else None,
+                limiter=_TokenBucket(config.requests_per_second, adaptive=adaptive_rate_limit)
+                if config.requests_per_second is not None or adaptive_rate_limit
+                else None,
+                shared=shared_http_pool,
+                registry=_shared_sync_registry(name, config.limits) if shared_http_pool else None,
+                make_client=functools.partial(make_client, config.limits),
+            )
+            for name, config in pool_configs.items()
+        }
+        self._router = router
+        self._api_pool = self._pools["api"]
+        self._background_pool = self._pools["background"]
+        self._transfer_pool = self._pools["transfer"]
         # Eager primary client (shard 0) for lifecycle / cookie-jar compatibility.
         self._client = self._api_pool.ensure(0)
 
-    def _get_client_for_path(self, path: str) -> httpx.Client:
-        if not self._isolate_workload_pools or self._api_pool is None:
+    def _pool_for(self, method: str, path: str) -> _SyncClientPool | None:
+        if self._router is None:
+            return None
+        return self._pools[self._router.pool_for(method, path)]
+
+    def _get_client_for_path(self, path: str, method: str = "GET") -> httpx.Client:
+        pool = self._pool_for(method, path)
+        if pool is None:
             return self._client
-        assert self._background_pool is not None and self._transfer_pool is not None
-        if _is_background_path(path):
-            return self._background_pool.next_client()
-        if _is_transfer_path(path):
-            return self._transfer_pool.next_client()
-        return self._api_pool.next_client()
+        return pool.next_client()
+
+    def _send_request(self, request: httpx.Request, *, stream: bool, **kwargs: Unpack[HttpxSendArgs]) -> httpx.Response:
+        pool = self._pool_for(request.method, request.url.path)
+        if pool is None:
+            return self._client.send(request, stream=stream, **kwargs)
+        # Only plain reads on the API pool: long polls, transfers and streams are never duplicated.
+        if self._hedging is not None and pool is self._api_pool and request.method == "GET" and not stream:
+            response = self._send_hedged(pool, request, **kwargs)
+        else:
+            response = pool.send(request, stream=stream, **kwargs)
+        if pool.limiter is not None and pool.limiter.adaptive:
+            budget = self._parse_rate_limit_budget(response)
+            if budget is not None:
+                pool.limiter.observe(*budget)
+        return response
+
+    def _send_hedged(
+        self, pool: _SyncClientPool, request: httpx.Request, **kwargs: Unpack[HttpxSendArgs]
+    ) -> httpx.Response:
+        """Send an idempotent GET, duplicating it on another shard if it outlives its route's p95 latency.
+
+        The first successful response wins; the other is discarded when it lands,
+        since a blocking request cannot be interrupted.
+        """
+        hedging = cast(_Hedging, self._hedging)
+        key = _endpoint_key(request)
+        delay = hedging.delay(key)
+        started = time.monotonic()
+        if delay is None or pool.shards < 2:
+            response = pool.send(request, stream=False, **kwargs)
+            hedging.record(key, time.monotonic() - started)
+            return response
+
+        executor = self._hedge_executor()
+        shard = pool.pick_shard()
+        primary = executor.submit(pool.send, request, stream=False, shard=shard, **kwargs)
+        wait_futures([primary], timeout=delay)
+        if primary.done() or not hedging.try_hedge():
+            response = primary.result()
+            hedging.record(key, time.monotonic() - started)
+            return response
+
+        log.debug("Hedging %s %s after %.3fs", request.method, request.url, delay)
+        hedge = executor.submit(
+            pool.send, _clone_request(request), stream=False, shard=pool.pick_shard(exclude=shard), **kwargs
+        )
+        pending: set[Future[httpx.Response]] = {primary, hedge}
+        winner: Future[httpx.Response] | None = None
+        while pending and winner is None:
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            winner = next(
+                (future for future in (primary, hedge) if future in done and future.exception() is None), None
+            )
+        for future in (primary, hedge):
+            if future is not winner:
+                future.add_done_callback(_close_response)
+        if winner is None:
+            return primary.result()
+        if winner is hedge:
+            hedging.record_win()
+        hedging.record(key, time.monotonic() - started)
+        return winner.result()
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        executor = self._hedge_threads
+        if executor is not None and self._hedge_threads_generation == _fork_generation:
+            return executor
+        with _pool_lock:
+            if self._closed:
+                raise RuntimeError("Cannot send a request, as the client has been closed.")
+            if self._hedge_threads is None or self._hedge_threads_generation != _fork_generation:
+                # Worker threads do not survive a fork: a child starts its own executor and drops the
+                # inherited one unclosed, since a parent thread may have held its shutdown lock.
+                self._hedge_threads = ThreadPoolExecutor(
+                    max_workers=HEDGE_MAX_THREADS, thread_name_prefix="runloop-hedge"
+                )
+                self._hedge_threads_generation = _fork_generation
+            return self._hedge_threads
 
-    def _send_client_for_request(self, request: httpx.Request) -> httpx.Client:
-        return self._get_client_for_path(request.url.path)
+    def _workload_pools(self) -> dict[str, _SyncClientPool]:
+        return self._pools
+
+    def coalescing_stats(self) -> CoalescingStats:
+        """Hit/miss counters of request coalescing; all zero unless `coalesce_requests` is on."""
+        if self._singleflight is None:
+            return CoalescingStats(hits=0, misses=0)
+        return self._singleflight.stats()
+
+    def bulkhead_stats(self) -> dict[str, BulkheadStats]:
+        """Queue depth and wait-time counters of each workload class with a concurrency limit."""
+        stats = {name: pool.bulkhead_stats() for name, pool in self._workload_pools().items()}
+        return {name: value for name, value in stats.items() if value is not None}
+
+    def warm_up(self) -> list[ShardWarmUp]:
+        """Open the connection behind every shard of every workload pool at once.
+
+        Each shard sends one lightweight `HEAD` request to the base URL so the first
+        real requests after start-up skip connection setup. Failures are reported per
+        shard rather than raised.
+        """
+        targets = [
+            (name, shard, pool.ensure(shard))
+            for name, pool in self._workload_pools().items()
+            for shard in range(pool.shards)
+        ] or [("api", 0, self._client)]
+        with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="runloop-warm-up") as executor:
+            futures = [executor.submit(self._warm_up_shard, *target) for target in targets]
+            return [future.result() for future in futures]
+
+    def _warm_up_shard(self, pool: str, shard: int, client: httpx.Client) -> ShardWarmUp:
+        started = time.monotonic()
+        try:
+            client.head(self.base_url)
+        except Exception as err:
+            log.debug("Failed to warm up %s shard %i", pool, shard, exc_info=True)
+            return ShardWarmUp(pool=pool, shard=shard, seconds=time.monotonic() - started, error=err)
+        return ShardWarmUp(pool=pool, shard=shard, seconds=time.monotonic() - started)
 
     def is_closed(self) -> bool:
         return self._closed or self._client.is_closed
@@ -1250,12 +3102,14 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         if self._closed:
             return
         self._closed = True
-        if self._api_pool is not None:
-            # Closes _client (api shard 0) along with any other API shards.
-            self._api_pool.close()
-            assert self._background_pool is not None and self._transfer_pool is not None
-            self._background_pool.close()
-            self._transfer_pool.close()
+        with _pool_lock:
+            hedge_threads, self._hedge_threads = self._hedge_threads, None
+        if hedge_threads is not None and self._hedge_threads_generation == _fork_generation:
+            hedge_threads.shutdown(wait=False)
+        if self._pools:
+            # Closes _client (api shard 0) along with every other shard.
+            for pool in self._pools.values():
+                pool.close()
         else:
             self._client.close()
 
@@ -1327,6 +3181,22 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
     ) -> ResponseT | _StreamT:
         cast_to = self._maybe_override_cast_to(cast_to, options)
 
+        if self._singleflight is not None and self._singleflight.covers(options.url):
+            key = _coalescing_key(cast_to, options, stream)
+            if key is not None:
+                return self._singleflight.do(
+                    key, functools.partial(self._request_with_retries, cast_to, options, stream=False, stream_cls=None)
+                )
+        return self._request_with_retries(cast_to, options, stream=stream, stream_cls=stream_cls)
+
+    def _request_with_retries(
+        self,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        stream: bool,
+        stream_cls: type[_StreamT] | None,
+    ) -> ResponseT | _StreamT:
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
         # given the original options
@@ -1338,13 +3208,20 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
+        # Unless a subclass hooks `_prepare_options`, options are prepared and the body
+        # encoded once; retries resend that request with only the retry count bumped.
+        fresh_options = type(self)._prepare_options is not SyncAPIClient._prepare_options
+        request: httpx.Request | None = None
         retries_taken = 0
         for retries_taken in range(max_retries + 1):
-            options = model_copy(input_options)
-            options = self._prepare_options(options)
-
             remaining_retries = max_retries - retries_taken
-            request = self._build_request(options, retries_taken=retries_taken)
+            if request is None or fresh_options:
+                options = self._prepare_options(model_copy(input_options) if fresh_options else input_options)
+                request = self._build_request(options, retries_taken=retries_taken)
+            else:
+                request = self._rebuild_request_for_retry(
+                    request, options, retries_taken=retries_taken
+                ) or self._build_request(options, retries_taken=retries_taken)
             self._prepare_request(request)
 
             kwargs: HttpxSendArgs = {}
@@ -1356,17 +3233,23 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
+            self._check_circuit(request)
             response = None
             try:
-                response = self._send_client_for_request(request).send(
+                response = self._send_request(
                     request,
                     stream=stream or self._should_stream_response_body(request=request),
                     **kwargs,
                 )
+            except QueueTimeoutError:
+                # The client's own concurrency limit, not the endpoint, turned the request away:
+                # it is no breaker failure, and a retry would only line up in the same queue.
+                raise
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._spend_retry():
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -1380,8 +3263,9 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 raise APITimeoutError(request=request) from err
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._spend_retry():
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -1394,6 +3278,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 log.debug("Raising connection error")
                 raise APIConnectionError(request=request) from err
 
+            self._record_attempt(request, response)
             log.debug(
                 'HTTP Response: %s %s "%i %s" %s',
                 request.method,
@@ -1408,7 +3293,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if remaining_retries > 0 and self._should_retry(err.response) and self._spend_retry():
                     err.response.close()
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
@@ -1808,12 +3693,27 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
     _api_pool: _AsyncClientPool | None
     _background_pool: _AsyncClientPool | None
     _transfer_pool: _AsyncClientPool | None
+    _pools: dict[str, _AsyncClientPool]
+    _singleflight: _AsyncSingleflight | None
+    _coalesce_exclude: Sequence[str]
+    _adaptive_rate_limit: bool
+    _router: _PoolRouter | None
+    _pool_overrides: Mapping[str, PoolConfig] | None
+    _pool_routes: Sequence[PoolRoute]
     _default_stream_cls: type[AsyncStream[Any]] | None = None
     _uses_shared_pool: bool
     _isolate_workload_pools: bool
     _api_pool_shards: int
     _background_pool_shards: int
     _transfer_pool_shards: int
+    _shard_selection: ShardSelectionPolicy | ShardSelector
+    _max_api_pool_shards: int
+    _max_background_pool_shards: int
+    _max_transfer_pool_shards: int
+    _max_concurrent_api_requests: int | None
+    _max_concurrent_background_requests: int | None
+    _max_concurrent_transfer_requests: int | None
+    _max_queue_time: float | None
     _closed: bool
 
     def __init__(
@@ -1831,6 +3731,25 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool = False,
+        retry_budget_ratio: float | None = None,
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        hedge_budget: float | None = None,
+        lazy_models: bool = False,
+        page_prefetch: int = 0,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1856,6 +3775,26 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             raise ValueError("background_pool_shards must be >= 1")
         if transfer_pool_shards < 1:
             raise ValueError("transfer_pool_shards must be >= 1")
+        selector = _resolve_shard_selector(shard_selection)
+        _validate_concurrency_limits(
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+        )
+        pool_configs = _resolve_pool_configs(
+            api_pool_shards=api_pool_shards,
+            background_pool_shards=background_pool_shards,
+            transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            pools=pools,
+        )
+        router = _PoolRouter(pool_routes or (), pool_configs)
 
         super().__init__(
             version=version,
@@ -1872,6 +3811,31 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         self._api_pool_shards = api_pool_shards
         self._background_pool_shards = background_pool_shards
         self._transfer_pool_shards = transfer_pool_shards
+        # Autoscaling ceilings never sit below the configured base shard counts.
+        self._max_api_pool_shards = max(api_pool_shards, max_api_pool_shards)
+        self._max_background_pool_shards = max(background_pool_shards, max_background_pool_shards)
+        self._max_transfer_pool_shards = max(transfer_pool_shards, max_transfer_pool_shards)
+        self._shard_selection = shard_selection
+        self._max_concurrent_api_requests = max_concurrent_api_requests
+        self._max_concurrent_background_requests = max_concurrent_background_requests
+        self._max_concurrent_transfer_requests = max_concurrent_transfer_requests
+        self._max_queue_time = max_queue_time
+        self._pool_overrides = pools
+        self._pool_routes = tuple(pool_routes or ())
+        self._coalesce_exclude = tuple(coalesce_exclude or ())
+        self._adaptive_rate_limit = adaptive_rate_limit
+        self._retry_budget = _RetryBudget(retry_budget_ratio) if retry_budget_ratio is not None else None
+        self._circuit_breakers = (
+            _CircuitBreakers(circuit_breaker_threshold, circuit_breaker_cooldown)
+            if circuit_breaker_threshold is not None
+            else None
+        )
+        self._hedging = _Hedging(hedge_budget) if hedge_budget is not None else None
+        self._lazy_models = lazy_models
+        if page_prefetch < 0:
+            raise ValueError("page_prefetch must be >= 0")
+        self._page_prefetch = page_prefetch
+        self._singleflight = _AsyncSingleflight(self._coalesce_exclude) if coalesce_requests else None
         # Custom http_client owns the full transport stack; don't invent sibling pools.
         self._isolate_workload_pools = http_client is None
 
@@ -1881,6 +3845,8 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             self._api_pool = None
             self._background_pool = None
             self._transfer_pool = None
+            self._pools = {}
+            self._router = None
             return
 
         # Async shared transports require a running loop; without one, fall back to private.
@@ -1893,7 +3859,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
         self._uses_shared_pool = can_share
 
-        def make_client(transport: httpx.AsyncBaseTransport | None) -> httpx.AsyncClient:
+        def make_client(limits: httpx.Limits, transport: httpx.AsyncBaseTransport | None) -> httpx.AsyncClient:
             timeout_ = cast(Timeout, self.timeout)
             if transport is not None:
                 return AsyncHttpxClientWrapper(
@@ -1904,44 +3870,156 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             return AsyncHttpxClientWrapper(
                 base_url=self._base_url,
                 timeout=timeout_,
+                limits=limits,
             )
 
-        api_registry = _shared_async_api_transports if can_share else None
-        bg_registry = _shared_async_background_transports if can_share else None
-        xfer_registry = _shared_async_transfer_transports if can_share else None
-
-        self._api_pool = _AsyncClientPool(
-            shards=api_pool_shards,
-            shared=can_share,
-            registry=api_registry,
-            make_client=make_client,
-        )
-        self._background_pool = _AsyncClientPool(
-            shards=background_pool_shards,
-            shared=can_share,
-            registry=bg_registry,
-            make_client=make_client,
-        )
-        self._transfer_pool = _AsyncClientPool(
-            shards=transfer_pool_shards,
-            shared=can_share,
-            registry=xfer_registry,
-            make_client=make_client,
-        )
+        self._pools = {
+            name: _AsyncClientPool(
+                shards=config.shards,
+                max_shards=config.max_shards,
+                selector=selector,
+                bulkhead=_AsyncBulkhead(config.max_concurrent_requests, max_queue_time)
+                if config.max_concurrent_requests is not None
+                else None,
+                limiter=_TokenBucket(config.requests_per_second, adaptive=adaptive_rate_limit)
+                if config.requests_per_second is not None or adaptive_rate_limit
+                else None,
+                shared=can_share,
+                registry=_shared_async_registry(name, config.limits) if can_share else None,
+                make_client=functools.partial(make_client, config.limits),
+            )
+            for name, config in pool_configs.items()
+        }
+        self._router = router
+        self._api_pool = self._pools["api"]
+        self._background_pool = self._pools["background"]
+        self._transfer_pool = self._pools["transfer"]
         self._client = self._api_pool.ensure(0)
 
-    def _get_client_for_path(self, path: str) -> httpx.AsyncClient:
-        if not self._isolate_workload_pools or self._api_pool is None:
-            return self._client
-        assert self._background_pool is not None and self._transfer_pool is not None
-        if _is_background_path(path):
-            return self._background_pool.next_client()
-        if _is_transfer_path(path):
-            return self._transfer_pool.next_client()
-        return self._api_pool.next_client()
+    def _pool_for(self, method: str, path: str) -> _AsyncClientPool | None:
+        if self._router is None:
+            return None
+        return self._pools[self._router.pool_for(method, path)]
 
-    def _send_client_for_request(self, request: httpx.Request) -> httpx.AsyncClient:
-        return self._get_client_for_path(request.url.path)
+    def _get_client_for_path(self, path: str, method: str = "GET") -> httpx.AsyncClient:
+        pool = self._pool_for(method, path)
+        if pool is None:
+            return self._client
+        return pool.next_client()
+
+    async def _send_request(
+        self, request: httpx.Request, *, stream: bool, **kwargs: Unpack[HttpxSendArgs]
+    ) -> httpx.Response:
+        pool = self._pool_for(request.method, request.url.path)
+        if pool is None:
+            return await self._client.send(request, stream=stream, **kwargs)
+        # Only plain reads on the API pool: long polls, transfers and streams are never duplicated.
+        if self._hedging is not None and pool is self._api_pool and request.method == "GET" and not stream:
+            response = await self._send_hedged(pool, request, **kwargs)
+        else:
+            response = await pool.send(request, stream=stream, **kwargs)
+        if pool.limiter is not None and pool.limiter.adaptive:
+            budget = self._parse_rate_limit_budget(response)
+            if budget is not None:
+                pool.limiter.observe(*budget)
+        return response
+
+    async def _send_hedged(
+        self, pool: _AsyncClientPool, request: httpx.Request, **kwargs: Unpack[HttpxSendArgs]
+    ) -> httpx.Response:
+        """Send an idempotent GET, duplicating it on another shard if it outlives its route's p95 latency.
+
+        The first successful response wins and the other request is cancelled. Racing
+        the two needs asyncio tasks, so on other event loops the request is sent once.
+        """
+        hedging = cast(_Hedging, self._hedging)
+        key = _endpoint_key(request)
+        delay = hedging.delay(key)
+        started = time.monotonic()
+        if delay is None or pool.shards < 2 or get_async_library() != "asyncio":
+            response = await pool.send(request, stream=False, **kwargs)
+            hedging.record(key, time.monotonic() - started)
+            return response
+
+        shard = pool.pick_shard()
+        primary = asyncio.ensure_future(pool.send(request, stream=False, shard=shard, **kwargs))
+        tasks = [primary]
+        winner: asyncio.Future[httpx.Response] | None = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not hedging.try_hedge():
+                winner = primary
+                response = await primary
+                hedging.record(key, time.monotonic() - started)
+                return response
+
+            log.debug("Hedging %s %s after %.3fs", request.method, request.url, delay)
+            hedge = asyncio.ensure_future(
+                pool.send(_clone_request(request), stream=False, shard=pool.pick_shard(exclude=shard), **kwargs)
+            )
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in tasks if task in done and task.exception() is None), None)
+            if winner is None:
+                winner = primary
+                return await primary
+            if winner is hedge:
+                hedging.record_win()
+            hedging.record(key, time.monotonic() - started)
+            return winner.result()
+        finally:
+            for task in tasks:
+                if task is not winner:
+                    task.cancel()
+                    # A loser that already failed must not be logged as an unretrieved error.
+                    task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def _workload_pools(self) -> dict[str, _AsyncClientPool]:
+        return self._pools
+
+    def coalescing_stats(self) -> CoalescingStats:
+        """Hit/miss counters of request coalescing; all zero unless `coalesce_requests` is on."""
+        if self._singleflight is None:
+            return CoalescingStats(hits=0, misses=0)
+        return self._singleflight.stats()
+
+    def bulkhead_stats(self) -> dict[str, BulkheadStats]:
+        """Queue depth and wait-time counters of each workload class with a concurrency limit."""
+        stats = {name: pool.bulkhead_stats() for name, pool in self._workload_pools().items()}
+        return {name: value for name, value in stats.items() if value is not None}
+
+    async def warm_up(self) -> list[ShardWarmUp]:
+        """Open the connection behind every shard of every workload pool at once.
+
+        Each shard sends one lightweight `HEAD` request to the base URL so the first
+        real requests after start-up skip connection setup. Failures are reported per
+        shard rather than raised.
+        """
+        targets = [
+            (name, shard, pool.ensure(shard))
+            for name, pool in self._workload_pools().items()
+            for shard in range(pool.shards)
+        ] or [("api", 0, self._client)]
+        results: list[ShardWarmUp | None] = [None] * len(targets)
+
+        async def warm_up(index: int, pool: str, shard: int, client: httpx.AsyncClient) -> None:
+            results[index] = await self._warm_up_shard(pool, shard, client)
+
+        async with anyio.create_task_group() as tg:
+            for index, target in enumerate(targets):
+                tg.start_soon(warm_up, index, *target)
+        return cast("list[ShardWarmUp]", results)
+
+    async def _warm_up_shard(self, pool: str, shard: int, client: httpx.AsyncClient) -> ShardWarmUp:
+        started = time.monotonic()
+        try:
+            await client.head(self.base_url)
+        except Exception as err:
+            log.debug("Failed to warm up %s shard %i", pool, shard, exc_info=True)
+            return ShardWarmUp(pool=pool, shard=shard, seconds=time.monotonic() - started, error=err)
+        return ShardWarmUp(pool=pool, shard=shard, seconds=time.monotonic() - started)
 
     def is_closed(self) -> bool:
         return self._closed or self._client.is_closed
@@ -1956,11 +4034,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         if self._closed:
             return
         self._closed = True
-        if self._api_pool is not None:
-            await self._api_pool.aclose()
-            assert self._background_pool is not None and self._transfer_pool is not None
-            await self._background_pool.aclose()
-            await self._transfer_pool.aclose()
+        if self._pools:
+            for pool in self._pools.values():
+                await pool.aclose()
         else:
             await self._client.aclose()
 
@@ -2037,6 +4113,22 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
         cast_to = self._maybe_override_cast_to(cast_to, options)
 
+        if self._singleflight is not None and self._singleflight.covers(options.url):
+            key = _coalescing_key(cast_to, options, stream)
+            if key is not None:
+                return await self._singleflight.do(
+                    key, functools.partial(self._request_with_retries, cast_to, options, stream=False, stream_cls=None)
+                )
+        return await self._request_with_retries(cast_to, options, stream=stream, stream_cls=stream_cls)
+
+    async def _request_with_retries(
+        self,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        stream: bool,
+        stream_cls: type[_AsyncStreamT] | None,
+    ) -> ResponseT | _AsyncStreamT:
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
         # given the original options
@@ -2048,13 +4140,20 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
+        # Unless a subclass hooks `_prepare_options`, options are prepared and the body
+        # encoded once; retries resend that request with only the retry count bumped.
+        fresh_options = type(self)._prepare_options is not AsyncAPIClient._prepare_options
+        request: httpx.Request | None = None
         retries_taken = 0
         for retries_taken in range(max_retries + 1):
-            options = model_copy(input_options)
-            options = await self._prepare_options(options)
-
             remaining_retries = max_retries - retries_taken
-            request = self._build_request(options, retries_taken=retries_taken)
+            if request is None or fresh_options:
+                options = await self._prepare_options(model_copy(input_options) if fresh_options else input_options)
+                request = self._build_request(options, retries_taken=retries_taken)
+            else:
+                request = self._rebuild_request_for_retry(
+                    request, options, retries_taken=retries_taken
+                ) or self._build_request(options, retries_taken=retries_taken)
             await self._prepare_request(request)
 
             kwargs: HttpxSendArgs = {}
@@ -2066,17 +4165,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
+            self._check_circuit(request)
             response = None
             try:
-                response = await self._send_client_for_request(request).send(
+                response = await self._send_request(
                     request,
                     stream=stream or self._should_stream_response_body(request=request),
                     **kwargs,
                 )
+            except QueueTimeoutError:
+                # The client's own concurrency limit, not the endpoint, turned the request away:
+                # it is no breaker failure, and a retry would only line up in the same queue.
+                raise
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._spend_retry():
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -2090,8 +4195,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 raise APITimeoutError(request=request) from err
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._spend_retry():
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
@@ -2104,6 +4210,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 log.debug("Raising connection error")
                 raise APIConnectionError(request=request) from err
 
+            self._record_attempt(request, response)
             log.debug(
                 'HTTP Response: %s %s "%i %s" %s',
                 request.method,
@@ -2118,7 +4225,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if remaining_retries > 0 and self._should_retry(err.response) and self._spend_retry():
                     await err.response.aclose()
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 from typing_extensions import Self, override
 
 import httpx
@@ -16,7 +16,9 @@ from ._types import (
     NotGiven,
     Transport,
     ProxiesTypes,
+    ShardSelector,
     RequestOptions,
+    ShardSelectionPolicy,
     not_given,
 )
 from ._utils import (
@@ -26,11 +28,21 @@ from ._utils import (
 )
 from ._compat import cached_property
 from ._version import __version__
-from ._constants import DEFAULT_API_POOL_SHARDS, DEFAULT_TRANSFER_POOL_SHARDS, DEFAULT_BACKGROUND_POOL_SHARDS
+from ._constants import (
+    DEFAULT_API_POOL_SHARDS,
+    DEFAULT_MAX_API_POOL_SHARDS,
+    DEFAULT_TRANSFER_POOL_SHARDS,
+    DEFAULT_BACKGROUND_POOL_SHARDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+    DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+)
 from ._streaming import Stream as Stream, AsyncStream as AsyncStream
 from ._exceptions import RunloopError, APIStatusError
 from ._base_client import (
     DEFAULT_MAX_RETRIES,
+    PoolRoute,
+    PoolConfig,
     SyncAPIClient,
     AsyncAPIClient,
 )
@@ -98,10 +110,68 @@ class Runloop(SyncAPIClient):
         # Set to False to create a private connection pool (old behavior).
         shared_http_pool: bool = True,
         # Sharded H2 pools by workload (API / long-polls / transfers). Each shard ≈
-        # one H2 connection; requests round-robin per client from a random offset.
+        # one H2 connection; `shard_selection` decides which shard serves a request.
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        # Ceilings for on-demand shard growth when every shard nears the server's
+        # per-connection stream limit. Pass the base shard count to disable scaling.
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        # "least_outstanding" (default) sends each request to the shard with the fewest
+        # in-flight streams, "power_of_two_choices" to the less loaded of two random
+        # shards, and "round_robin" rotates regardless of load. A callable receives the
+        # per-shard in-flight counts and a rotating start index and returns a shard index.
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        # Bulkheads: cap how many requests of each workload class are in flight at once.
+        # Extra requests wait in FIFO order for a free slot; after `max_queue_time`
+        # seconds they fail with a pool timeout (and are retried like one). None = no cap.
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        # Extra named pools, or overrides of the built-in "api", "background", "transfer"
+        # and "streaming" pools, each with its own shards, `httpx.Limits` and request cap.
+        # An override only replaces the fields it sets.
+        pools: Mapping[str, PoolConfig] | None = None,
+        # Routes tried in order before the built-in ones; each sends requests matching a
+        # URL path regex (and optionally HTTP methods) to a named pool. Unmatched → "api".
+        pool_routes: Sequence[PoolRoute] | None = None,
+        # Let concurrent identical GETs (same URL, query, headers and response type)
+        # share one HTTP call and its parsed result. Paths matching a regex in
+        # `coalesce_exclude` always get a request of their own.
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        # Pace each pool's requests to the budget the server advertises in its
+        # RateLimit-* / X-RateLimit-* headers (and 429 Retry-After) instead of bursting
+        # into 429s. Fixed paces can be set per pool with `PoolConfig.requests_per_second`.
+        adaptive_rate_limit: bool = False,
+        # Cap retries client-wide at this fraction of recent successful responses
+        # (plus a small per-second floor) so an outage is not multiplied into a
+        # retry storm. None retries up to `max_retries` unconditionally.
+        retry_budget_ratio: float | None = None,
+        # Open an endpoint's circuit after this many consecutive connection
+        # errors, timeouts or 5xx responses: calls then raise CircuitOpenError
+        # without being sent until a probe succeeds `circuit_breaker_cooldown`
+        # seconds later. None disables circuit breaking.
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        # Hedge plain GETs on the API pool: once a request outlives its route's
+        # recent p95 latency, send a duplicate on another shard and take whichever
+        # answers first. The value caps the extra load, e.g. 0.05 adds at most 5%
+        # more requests. None disables hedging.
+        hedge_budget: float | None = None,
+        # Build response models lazily: each model wraps the decoded JSON and only
+        # constructs a field, and anything nested in it, the first time it is read.
+        # Cuts the cost of large list pages when few fields are used. Ignored when
+        # `_strict_response_validation` is enabled.
+        lazy_models: bool = False,
+        # Fetch up to this many pages ahead in the background while iterating a
+        # paginated list, so each page's round trip overlaps with consuming the
+        # one before it. At most this many unconsumed pages are held in memory.
+        # 0 fetches each page only once the previous one is used up.
+        page_prefetch: int = 0,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -151,6 +221,25 @@ class Runloop(SyncAPIClient):
             api_pool_shards=api_pool_shards,
             background_pool_shards=background_pool_shards,
             transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            shard_selection=shard_selection,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+            pools=pools,
+            pool_routes=pool_routes,
+            coalesce_requests=coalesce_requests,
+            coalesce_exclude=coalesce_exclude,
+            adaptive_rate_limit=adaptive_rate_limit,
+            retry_budget_ratio=retry_budget_ratio,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_cooldown=circuit_breaker_cooldown,
+            hedge_budget=hedge_budget,
+            lazy_models=lazy_models,
+            page_prefetch=page_prefetch,
         )
 
         self._idempotency_header = "x-request-id"
@@ -296,6 +385,25 @@ class Runloop(SyncAPIClient):
         api_pool_shards: int | None = None,
         background_pool_shards: int | None = None,
         transfer_pool_shards: int | None = None,
+        max_api_pool_shards: int | None = None,
+        max_background_pool_shards: int | None = None,
+        max_transfer_pool_shards: int | None = None,
+        shard_selection: ShardSelectionPolicy | ShardSelector | None = None,
+        max_concurrent_api_requests: int | None | NotGiven = not_given,
+        max_concurrent_background_requests: int | None | NotGiven = not_given,
+        max_concurrent_transfer_requests: int | None | NotGiven = not_given,
+        max_queue_time: float | None | NotGiven = not_given,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool | None = None,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool | None = None,
+        retry_budget_ratio: float | None | NotGiven = not_given,
+        circuit_breaker_threshold: int | None | NotGiven = not_given,
+        circuit_breaker_cooldown: float | None = None,
+        hedge_budget: float | None | NotGiven = not_given,
+        lazy_models: bool | None = None,
+        page_prefetch: int | None = None,
         max_retries: int | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -344,6 +452,55 @@ class Runloop(SyncAPIClient):
             transfer_pool_shards=(
                 transfer_pool_shards if transfer_pool_shards is not None else self._transfer_pool_shards
             ),
+            max_api_pool_shards=(max_api_pool_shards if max_api_pool_shards is not None else self._max_api_pool_shards),
+            max_background_pool_shards=(
+                max_background_pool_shards
+                if max_background_pool_shards is not None
+                else self._max_background_pool_shards
+            ),
+            max_transfer_pool_shards=(
+                max_transfer_pool_shards if max_transfer_pool_shards is not None else self._max_transfer_pool_shards
+            ),
+            shard_selection=shard_selection if shard_selection is not None else self._shard_selection,
+            max_concurrent_api_requests=(
+                max_concurrent_api_requests
+                if is_given(max_concurrent_api_requests)
+                else self._max_concurrent_api_requests
+            ),
+            max_concurrent_background_requests=(
+                max_concurrent_background_requests
+                if is_given(max_concurrent_background_requests)
+                else self._max_concurrent_background_requests
+            ),
+            max_concurrent_transfer_requests=(
+                max_concurrent_transfer_requests
+                if is_given(max_concurrent_transfer_requests)
+                else self._max_concurrent_transfer_requests
+            ),
+            max_queue_time=max_queue_time if is_given(max_queue_time) else self._max_queue_time,
+            pools=pools if pools is not None else self._pool_overrides,
+            pool_routes=pool_routes if pool_routes is not None else self._pool_routes,
+            coalesce_requests=(coalesce_requests if coalesce_requests is not None else self._singleflight is not None),
+            coalesce_exclude=coalesce_exclude if coalesce_exclude is not None else self._coalesce_exclude,
+            adaptive_rate_limit=(adaptive_rate_limit if adaptive_rate_limit is not None else self._adaptive_rate_limit),
+            retry_budget_ratio=retry_budget_ratio
+            if is_given(retry_budget_ratio)
+            else (self._retry_budget.ratio if self._retry_budget is not None else None),
+            circuit_breaker_threshold=circuit_breaker_threshold
+            if is_given(circuit_breaker_threshold)
+            else (self._circuit_breakers.threshold if self._circuit_breakers is not None else None),
+            circuit_breaker_cooldown=circuit_breaker_cooldown
+            if circuit_breaker_cooldown is not None
+            else (
+                self._circuit_breakers.cooldown
+                if self._circuit_breakers is not None
+                else CIRCUIT_BREAKER_COOLDOWN_SECONDS
+            ),
+            hedge_budget=hedge_budget
+            if is_given(hedge_budget)
+            else (self._hedging.ratio if self._hedging is not None else None),
+            lazy_models=lazy_models if lazy_models is not None else self._lazy_models,
+            page_prefetch=page_prefetch if page_prefetch is not None else self._page_prefetch,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
@@ -410,10 +567,68 @@ class AsyncRunloop(AsyncAPIClient):
         # Set to False to create a private connection pool (old behavior).
         shared_http_pool: bool = True,
         # Sharded H2 pools by workload (API / long-polls / transfers). Each shard ≈
-        # one H2 connection; requests round-robin per client from a random offset.
+        # one H2 connection; `shard_selection` decides which shard serves a request.
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        # Ceilings for on-demand shard growth when every shard nears the server's
+        # per-connection stream limit. Pass the base shard count to disable scaling.
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        # "least_outstanding" (default) sends each request to the shard with the fewest
+        # in-flight streams, "power_of_two_choices" to the less loaded of two random
+        # shards, and "round_robin" rotates regardless of load. A callable receives the
+        # per-shard in-flight counts and a rotating start index and returns a shard index.
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        # Bulkheads: cap how many requests of each workload class are in flight at once.
+        # Extra requests wait in FIFO order for a free slot; after `max_queue_time`
+        # seconds they fail with a pool timeout (and are retried like one). None = no cap.
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        # Extra named pools, or overrides of the built-in "api", "background", "transfer"
+        # and "streaming" pools, each with its own shards, `httpx.Limits` and request cap.
+        # An override only replaces the fields it sets.
+        pools: Mapping[str, PoolConfig] | None = None,
+        # Routes tried in order before the built-in ones; each sends requests matching a
+        # URL path regex (and optionally HTTP methods) to a named pool. Unmatched → "api".
+        pool_routes: Sequence[PoolRoute] | None = None,
+        # Let concurrent identical GETs (same URL, query, headers and response type)
+        # share one HTTP call and its parsed result. Paths matching a regex in
+        # `coalesce_exclude` always get a request of their own.
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        # Pace each pool's requests to the budget the server advertises in its
+        # RateLimit-* / X-RateLimit-* headers (and 429 Retry-After) instead of bursting
+        # into 429s. Fixed paces can be set per pool with `PoolConfig.requests_per_second`.
+        adaptive_rate_limit: bool = False,
+        # Cap retries client-wide at this fraction of recent successful responses
+        # (plus a small per-second floor) so an outage is not multiplied into a
+        # retry storm. None retries up to `max_retries` unconditionally.
+        retry_budget_ratio: float | None = None,
+        # Open an endpoint's circuit after this many consecutive connection
+        # errors, timeouts or 5xx responses: calls then raise CircuitOpenError
+        # without being sent until a probe succeeds `circuit_breaker_cooldown`
+        # seconds later. None disables circuit breaking.
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        # Hedge plain GETs on the API pool: once a request outlives its route's
+        # recent p95 latency, send a duplicate on another shard and take whichever
+        # answers first. The value caps the extra load, e.g. 0.05 adds at most 5%
+        # more requests. None disables hedging.
+        hedge_budget: float | None = None,
+        # Build response models lazily: each model wraps the decoded JSON and only
+        # constructs a field, and anything nested in it, the first time it is read.
+        # Cuts the cost of large list pages when few fields are used. Ignored when
+        # `_strict_response_validation` is enabled.
+        lazy_models: bool = False,
+        # Fetch up to this many pages ahead in the background while iterating a
+        # paginated list, so each page's round trip overlaps with consuming the
+        # one before it. At most this many unconsumed pages are held in memory.
+        # 0 fetches each page only once the previous one is used up.
+        page_prefetch: int = 0,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -463,6 +678,25 @@ class AsyncRunloop(AsyncAPIClient):
             api_pool_shards=api_pool_shards,
             background_pool_shards=background_pool_shards,
             transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            shard_selection=shard_selection,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+            pools=pools,
+            pool_routes=pool_routes,
+            coalesce_requests=coalesce_requests,
+            coalesce_exclude=coalesce_exclude,
+            adaptive_rate_limit=adaptive_rate_limit,
+            retry_budget_ratio=retry_budget_ratio,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_cooldown=circuit_breaker_cooldown,
+            hedge_budget=hedge_budget,
+            lazy_models=lazy_models,
+            page_prefetch=page_prefetch,
         )
 
         self._idempotency_header = "x-request-id"
@@ -608,6 +842,25 @@ class AsyncRunloop(AsyncAPIClient):
         api_pool_shards: int | None = None,
         background_pool_shards: int | None = None,
         transfer_pool_shards: int | None = None,
+        max_api_pool_shards: int | None = None,
+        max_background_pool_shards: int | None = None,
+        max_transfer_pool_shards: int | None = None,
+        shard_selection: ShardSelectionPolicy | ShardSelector | None = None,
+        max_concurrent_api_requests: int | None | NotGiven = not_given,
+        max_concurrent_background_requests: int | None | NotGiven = not_given,
+        max_concurrent_transfer_requests: int | None | NotGiven = not_given,
+        max_queue_time: float | None | NotGiven = not_given,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool | None = None,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool | None = None,
+        retry_budget_ratio: float | None | NotGiven = not_given,
+        circuit_breaker_threshold: int | None | NotGiven = not_given,
+        circuit_breaker_cooldown: float | None = None,
+        hedge_budget: float | None | NotGiven = not_given,
+        lazy_models: bool | None = None,
+        page_prefetch: int | None = None,
         max_retries: int | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -656,6 +909,55 @@ class AsyncRunloop(AsyncAPIClient):
             transfer_pool_shards=(
                 transfer_pool_shards if transfer_pool_shards is not None else self._transfer_pool_shards
             ),
+            max_api_pool_shards=(max_api_pool_shards if max_api_pool_shards is not None else self._max_api_pool_shards),
+            max_background_pool_shards=(
+                max_background_pool_shards
+                if max_background_pool_shards is not None
+                else self._max_background_pool_shards
+            ),
+            max_transfer_pool_shards=(
+                max_transfer_pool_shards if max_transfer_pool_shards is not None else self._max_transfer_pool_shards
+            ),
+            shard_selection=shard_selection if shard_selection is not None else self._shard_selection,
+            max_concurrent_api_requests=(
+                max_concurrent_api_requests
+                if is_given(max_concurrent_api_requests)
+                else self._max_concurrent_api_requests
+            ),
+            max_concurrent_background_requests=(
+                max_concurrent_background_requests
+                if is_given(max_concurrent_background_requests)
+                else self._max_concurrent_background_requests
+            ),
+            max_concurrent_transfer_requests=(
+                max_concurrent_transfer_requests
+                if is_given(max_concurrent_transfer_requests)
+                else self._max_concurrent_transfer_requests
+            ),
+            max_queue_time=max_queue_time if is_given(max_queue_time) else self._max_queue_time,
+            pools=pools if pools is not None else self._pool_overrides,
+            pool_routes=pool_routes if pool_routes is not None else self._pool_routes,
+            coalesce_requests=(coalesce_requests if coalesce_requests is not None else self._singleflight is not None),
+            coalesce_exclude=coalesce_exclude if coalesce_exclude is not None else self._coalesce_exclude,
+            adaptive_rate_limit=(adaptive_rate_limit if adaptive_rate_limit is not None else self._adaptive_rate_limit),
+            retry_budget_ratio=retry_budget_ratio
+            if is_given(retry_budget_ratio)
+            else (self._retry_budget.ratio if self._retry_budget is not None else None),
+            circuit_breaker_threshold=circuit_breaker_threshold
+            if is_given(circuit_breaker_threshold)
+            else (self._circuit_breakers.threshold if self._circuit_breakers is not None else None),
+            circuit_breaker_cooldown=circuit_breaker_cooldown
+            if circuit_breaker_cooldown is not None
+            else (
+                self._circuit_breakers.cooldown
+                if self._circuit_breakers is not None
+                else CIRCUIT_BREAKER_COOLDOWN_SECONDS
+            ),
+            hedge_budget=hedge_budget
+            if is_given(hedge_budget)
+            else (self._hedging.ratio if self._hedging is not None else None),
+            lazy_models=lazy_models if lazy_models is not None else self._lazy_models,
+            page_prefetch=page_prefetch if page_prefetch is not None else self._page_prefetch,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
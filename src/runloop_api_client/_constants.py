@@ -16,10 +16,51 @@ DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=20, max_keepalive_conne
 DEFAULT_API_POOL_SHARDS = 8
 DEFAULT_BACKGROUND_POOL_SHARDS = 16
 DEFAULT_TRANSFER_POOL_SHARDS = 2
+# SSE tails and log downloads (stream_stdout_updates, evictions/watch, ...) hold
+# their streams for minutes; keep them off the API connections.
+DEFAULT_STREAMING_POOL_SHARDS = 2
+
+# Shard pools start at the counts above and add shards on demand once every
+# active shard carries this many in-flight streams (kept under Jetty's ~128
+# stream cap so new requests never queue behind MAX_CONCURRENT_STREAMS). Extra
+# shards are released again after sitting idle for SHARD_IDLE_TIMEOUT_SECONDS.
+DEFAULT_MAX_API_POOL_SHARDS = 32
+DEFAULT_MAX_BACKGROUND_POOL_SHARDS = 64
+DEFAULT_MAX_TRANSFER_POOL_SHARDS = 4
+DEFAULT_MAX_STREAMING_POOL_SHARDS = 8
+SHARD_SCALE_UP_STREAMS = 96
+SHARD_IDLE_TIMEOUT_SECONDS = 60.0
+
+# A shared shard replaces its H2 connection after a GOAWAY / protocol error or
+# after this many consecutive transport failures (resets, stalled reads).
+SHARD_UNHEALTHY_ERRORS = 3
+# Smoothing weight of the newest sample in each shard's header-latency EWMA.
+SHARD_LATENCY_EWMA_WEIGHT = 0.2
 
 INITIAL_RETRY_DELAY = 1.0
 MAX_RETRY_DELAY = 60.0
 
+# Retry budget: retries within the sliding window may not exceed a floor of
+# RETRY_BUDGET_MIN_PER_SECOND per second plus `retry_budget_ratio` of the
+# successful responses seen in that window, so a degraded backend is not
+# multiplied into a retry storm.
+RETRY_BUDGET_WINDOW_SECONDS = 10
+RETRY_BUDGET_MIN_PER_SECOND = 10
+# An open circuit fails fast for this long before letting one probe through.
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 30.0
+
+# Request hedging: an idempotent GET still outstanding after its route's recent
+# HEDGE_PERCENTILE latency gets one duplicate on another shard. Latencies are
+# kept for the last HEDGE_LATENCY_SAMPLES responses per route, and a route is
+# not hedged before it has HEDGE_MIN_SAMPLES. Unspent hedge budget carries over
+# up to HEDGE_MAX_BURST hedges.
+HEDGE_PERCENTILE = 0.95
+HEDGE_LATENCY_SAMPLES = 200
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MAX_BURST = 10
+# Sync hedged requests race on worker threads; this caps how many at once.
+HEDGE_MAX_THREADS = 256
+
 # Long-poll endpoints tell the server how long to hold the connection and expect a
 # graceful 408 when that hold elapses. The per-request client read timeout must
 # exceed the server hold so the server returns 408 first instead of the client
@@ -15,6 +15,8 @@ __all__ = [
     "UnprocessableEntityError",
     "RateLimitError",
     "InternalServerError",
+    "CircuitOpenError",
+    "QueueTimeoutError",
 ]
 
 
@@ -76,6 +78,35 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message="Request timed out.", request=request)
 
 
+class CircuitOpenError(APIConnectionError):
+    """Raised without sending the request while the endpoint's circuit breaker is open."""
+
+    retry_in: float
+    """Seconds until the breaker lets a probe request through."""
+
+    def __init__(self, *, request: httpx.Request, retry_in: float) -> None:
+        super().__init__(
+            message=f"Circuit open for {request.method} {request.url.path}; retry in {retry_in:.1f}s.",
+            request=request,
+        )
+        self.retry_in = retry_in
+
+
+class QueueTimeoutError(APITimeoutError):
+    """Raised without sending the request when no request slot of its pool frees up within `max_queue_time`."""
+
+    queue_timeout: float | None
+    """Seconds the request waited for a slot."""
+
+    def __init__(self, *, request: httpx.Request, queue_timeout: float | None) -> None:
+        APIConnectionError.__init__(
+            self,
+            message=f"Timed out after {queue_timeout}s waiting for a free request slot.",
+            request=request,
+        )
+        self.queue_timeout = queue_timeout
+
+
 class BadRequestError(APIStatusError):
     status_code: Literal[400] = 400  # pyright: ignore[reportIncompatibleVariableOverride]
 
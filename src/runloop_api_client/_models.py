@@ -3,17 +3,20 @@ from __future__ import annotations
 import os
 import inspect
 import weakref
+import threading
 from typing import (
     IO,
     TYPE_CHECKING,
     Any,
     Type,
+    Tuple,
     Union,
     Generic,
     TypeVar,
     Callable,
     Iterable,
     Optional,
+    ForwardRef,
     AsyncIterable,
     cast,
 )
@@ -30,9 +33,11 @@ from typing_extensions import (
     TypeAlias,
     TypedDict,
     TypeGuard,
+    NamedTuple,
     final,
     override,
     runtime_checkable,
+    evaluate_forward_ref,
 )
 
 import pydantic
@@ -120,6 +125,10 @@ class BaseModel(pydantic.BaseModel):
             extra="allow", defer_build=coerce_boolean(os.environ.get("DEFER_PYDANTIC_BUILD", "true"))
         )
 
+        # Lazily constructed models (see `construct_type(lazy=True)`) keep the raw
+        # response mapping here and only build a field the first time it is read.
+        __slots__ = ("__lazy_values__",)
+
     def to_dict(
         self,
         *,
@@ -210,34 +219,30 @@ class BaseModel(pydantic.BaseModel):
         m = __cls.__new__(__cls)
         fields_values: dict[str, object] = {}
 
-        config = get_model_config(__cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
+        plan = _model_plan(__cls)
+        populate_by_name = plan.populate_by_name
 
         if _fields_set is None:
             _fields_set = set()
 
-        model_fields = get_model_fields(__cls)
-        for name, field in model_fields.items():
-            key = field.alias
+        for name, alias, default, construct_field in plan.fields.values():
+            key = alias
             if key is None or (key not in values and populate_by_name):
                 key = name
 
             if key in values:
-                fields_values[name] = _construct_field(value=values[key], field=field, key=key)
+                fields_values[name] = construct_field(values[key])
                 _fields_set.add(name)
             else:
-                fields_values[name] = field_get_default(field)
+                fields_values[name] = default()
 
-        extra_field_type = _get_extra_fields_type(__cls)
+        model_fields = plan.model_fields
+        construct_extra = plan.construct_extra
 
         _extra = {}
         for key, value in values.items():
             if key not in model_fields:
-                parsed = construct_type(value=value, type_=extra_field_type) if extra_field_type is not None else value
+                parsed = construct_extra(value) if construct_extra is not None else value
 
                 if PYDANTIC_V1:
                     _fields_set.add(key)
@@ -267,6 +272,67 @@ class BaseModel(pydantic.BaseModel):
         # although not in practice
         model_construct = construct
 
+    if not PYDANTIC_V1 and not TYPE_CHECKING:
+        # Hooks for lazily constructed models: unread fields are built on attribute
+        # access, and anything that needs every field (serialization, equality,
+        # repr, copies, pickling) builds the whole tree first.
+
+        def __getattr__(self, name: str) -> Any:
+            try:
+                private = object.__getattribute__(self, "__pydantic_private__")
+            except AttributeError:
+                private = None
+            if private is not None and name in private:
+                # pydantic's own lookup first probes the attribute for a descriptor, which fails slowly;
+                # private values never come from the lazily held JSON either
+                return private[name]
+            pending = _lazy_values(self)
+            if pending is not None:
+                field = _model_plan(type(self), lazy=True).fields.get(name)
+                if field is not None:
+                    return _build_lazy_field(self, field, pending)
+                _materialize(self)
+            return super().__getattr__(name)
+
+        @property
+        def model_fields_set(self) -> set[str]:
+            _materialize(self)
+            return self.__pydantic_fields_set__
+
+        def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+            _materialize(self)
+            return super().model_dump(**kwargs)
+
+        def model_dump_json(self, **kwargs: Any) -> str:
+            _materialize(self)
+            return super().model_dump_json(**kwargs)
+
+        def __eq__(self, other: Any) -> bool:
+            _materialize(self)
+            if isinstance(other, BaseModel):
+                _materialize(other)
+            return super().__eq__(other)
+
+        def __repr_args__(self) -> Any:
+            _materialize(self)
+            return super().__repr_args__()
+
+        def __iter__(self) -> Any:
+            _materialize(self)
+            return super().__iter__()
+
+        def __getstate__(self) -> dict[Any, Any]:
+            _materialize(self)
+            return super().__getstate__()
+
+        def __copy__(self) -> Any:
+            _materialize(self)
+            return super().__copy__()
+
+        def __deepcopy__(self, memo: Any = None) -> Any:
+            _materialize(self)
+            return super().__deepcopy__(memo)
+
     if PYDANTIC_V1:
         # we define aliases for some of the new pydantic v2 methods so
         # that we can just document these methods without having to specify
@@ -476,19 +542,156 @@ class _EagerIterable(list[_T], Generic[_T]):
 EagerIterable: TypeAlias = Annotated[Iterable[_T], _EagerIterable]
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
+_Constructor: TypeAlias = Callable[[object], object]
+
+
+class _FieldPlan(NamedTuple):
+    name: str
+    alias: Optional[str]
+    default: Callable[[], object]
+    construct: _Constructor
+
+
+class _ModelPlan:
+    """How to construct one model class: its fields with their compiled constructors, and its extra fields."""
+
+    def __init__(self, cls: type[pydantic.BaseModel], *, lazy: bool) -> None:
+        # building the core schema may resolve forward references, so it goes before reading the fields
+        extra_field_type = _get_extra_fields_type(cls)
+        self.construct_extra = _get_constructor(extra_field_type, lazy=lazy) if extra_field_type is not None else None
+
+        self.model_fields = get_model_fields(cls)
+        self.populate_by_name = _populate_by_name(cls)
+        self.fields: dict[str, _FieldPlan] = {}
+        for name, field in self.model_fields.items():
+            default = _compile_default(field)
+            self.fields[name] = _FieldPlan(name, field.alias, default, _compile_field(field, name, default, lazy=lazy))
+
+
+_MODEL_PLANS: dict[bool, weakref.WeakKeyDictionary[type, _ModelPlan]] = {
+    False: weakref.WeakKeyDictionary(),
+    True: weakref.WeakKeyDictionary(),
+}
 
+
+def _model_plan(cls: type[pydantic.BaseModel], *, lazy: bool = False) -> _ModelPlan:
+    plans = _MODEL_PLANS[lazy]
+    plan = plans.get(cls)
+    # `model_rebuild()` replaces the fields when it resolves forward references
+    if plan is None or plan.model_fields is not get_model_fields(cls):
+        plan = plans[cls] = _ModelPlan(cls, lazy=lazy)
+    return plan
+
+
+def _compile_default(field: FieldInfo) -> Callable[[], object]:
+    if getattr(field, "default_factory", None) is None:
+        default = field_get_default(field)
+        # immutable defaults don't need the copy `field_get_default()` makes
+        if default is None or isinstance(default, (str, int, float, bool)):
+            return lambda: default
+
+    return lambda: field_get_default(field)
+
+
+def _compile_field(field: FieldInfo, key: str, default: Callable[[], object], *, lazy: bool) -> _Constructor:
     if PYDANTIC_V1:
         type_ = cast(type, field.outer_type_)  # type: ignore
     else:
         type_ = field.annotation  # type: ignore
 
-    if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
+    metadata = tuple(getattr(field, "metadata", None) or ())
+    construct = _get_constructor(type_, metadata, lazy=lazy) if type_ is not None else None
+
+    def construct_field(value: object) -> object:
+        if value is None:
+            return default()
+
+        if construct is None:
+            raise RuntimeError(f"Unexpected field type is None for {key}")
+
+        return construct(value)
+
+    return construct_field
+
+
+def _populate_by_name(cls: type[pydantic.BaseModel]) -> bool:
+    config = get_model_config(cls)
+    return bool(
+        config.allow_population_by_field_name if isinstance(config, _ConfigProtocol) else config.get("populate_by_name")
+    )
+
+
+def _construct_lazy(cls: type[BaseModel], values: AnyMapping) -> BaseModel:
+    """Like `BaseModel.construct()`, but fields are only built when they are first read.
+
+    The model wraps `values` as-is; on Pydantic v1 this is a plain `construct()`.
+    """
+    if PYDANTIC_V1:
+        return cls.construct(**values)  # type: ignore[arg-type]
+
+    m = cls.__new__(cls)
+    object.__setattr__(m, "__dict__", {})
+    object.__setattr__(m, "__pydantic_private__", None)
+    object.__setattr__(m, "__pydantic_extra__", {})
+    object.__setattr__(m, "__pydantic_fields_set__", set())
+    object.__setattr__(m, "__lazy_values__", values)
+    return m
+
+
+def _lazy_values(model: pydantic.BaseModel) -> AnyMapping | None:
+    try:
+        return cast("AnyMapping | None", object.__getattribute__(model, "__lazy_values__"))
+    except AttributeError:
+        return None
 
-    return construct_type(value=value, type_=type_, metadata=getattr(field, "metadata", None))
+
+def _build_lazy_field(model: BaseModel, field: _FieldPlan, values: AnyMapping) -> object:
+    key = field.alias
+    if key is None or (key not in values and _model_plan(type(model), lazy=True).populate_by_name):
+        key = field.name
+
+    if key in values:
+        value = field.construct(values[key])
+        model.__pydantic_fields_set__.add(field.name)
+    else:
+        value = field.default()
+
+    model.__dict__[field.name] = value
+    return value
+
+
+def _materialize(value: object) -> None:
+    """Build every pending field of the lazily constructed models in `value`, recursively."""
+    if isinstance(value, (list, tuple)):
+        for item in cast("Iterable[object]", value):
+            _materialize(item)
+        return
+
+    if isinstance(value, dict):
+        for item in cast("dict[object, object]", value).values():
+            _materialize(item)
+        return
+
+    if not isinstance(value, BaseModel):
+        return
+
+    values = _lazy_values(value)
+    if values is None:
+        return
+    object.__setattr__(value, "__lazy_values__", None)
+
+    plan = _model_plan(type(value), lazy=True)
+    for field in plan.fields.values():
+        if field.name not in value.__dict__:
+            _build_lazy_field(value, field, values)
+
+    extra = cast("dict[str, object]", value.__pydantic_extra__)
+    for key, item in values.items():
+        if key not in plan.model_fields and key not in extra:
+            extra[key] = plan.construct_extra(item) if plan.construct_extra is not None else item
+
+    for item in (*value.__dict__.values(), *extra.values()):
+        _materialize(item)
 
 
 def _get_extra_fields_type(cls: type[pydantic.BaseModel]) -> type | None:
@@ -496,6 +699,30 @@ def _get_extra_fields_type(cls: type[pydantic.BaseModel]) -> type | None:
         # TODO
         return None
 
+    # Read the `__pydantic_extra__` annotation where we can: `__pydantic_core_schema__` would build the
+    # validator and serializer that `defer_build` otherwise holds off on until a model is actually validated.
+    for base in cls.__mro__:
+        if base is pydantic.BaseModel:
+            return None
+
+        annotation = base.__dict__.get("__annotations__", {}).get("__pydantic_extra__")
+        if annotation is None:
+            continue
+
+        try:
+            if isinstance(annotation, str):
+                annotation = evaluate_forward_ref(ForwardRef(annotation), owner=base)
+        except Exception:
+            # e.g. a forward reference to a class local to a function, which pydantic resolves from the caller's frame
+            break
+
+        args = get_args(strip_annotated_type(annotation))
+        if get_origin(strip_annotated_type(annotation)) is dict and len(args) == 2:
+            item_type = cast(object, strip_annotated_type(args[1]))
+            if isinstance(item_type, type) and issubclass(item_type, pydantic.BaseModel):
+                return item_type
+        return None
+
     schema = cls.__pydantic_core_schema__
     if schema["type"] == "model":
         fields = schema["schema"]
@@ -559,10 +786,82 @@ def construct_type_unchecked(*, value: object, type_: type[_T]) -> _T:
     return cast(_T, construct_type(value=value, type_=type_))
 
 
-def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]] = None) -> object:
+def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]] = None, lazy: bool = False) -> object:
     """Loose coercion to the expected type with construction of nested values.
 
     If the given value does not match the expected type then it is returned as-is.
+
+    With `lazy=True` models wrap the given mapping and only build a field, again
+    lazily, the first time it is read.
+    """
+    return _get_constructor(type_, tuple(metadata) if metadata else (), lazy=lazy)(value)
+
+
+_ConstructorKey = Tuple[object, Tuple[Any, ...], bool]
+
+_CONSTRUCTORS: dict[_ConstructorKey, _Constructor] = {}
+# constructors being compiled, `None` while in progress; they are only published once the outermost one is complete
+_compiling: dict[_ConstructorKey, Optional[_Constructor]] = {}
+_compile_lock = threading.RLock()
+
+
+def _get_constructor(type_: object, metadata: Tuple[Any, ...] = (), *, lazy: bool = False) -> _Constructor:
+    """Returns the constructor for the given type, compiling it the first time the type is seen."""
+    key = (type_, metadata, lazy)
+    try:
+        constructor = _CONSTRUCTORS.get(key)
+    except TypeError:
+        # unhashable annotation metadata, nothing to cache it by
+        return _compile_constructor(type_, metadata, lazy=lazy)
+
+    if constructor is None:
+        with _compile_lock:
+            constructor = _compile_pending(key)
+    return constructor
+
+
+def _compile_pending(key: _ConstructorKey) -> _Constructor:
+    """Must be called with `_compile_lock` held."""
+    constructor = _CONSTRUCTORS.get(key)
+    if constructor is not None:
+        return constructor
+    if key in _compiling:
+        # a recursive type alias refers to itself, resolve it once it has been published
+        return _compiling[key] or _deferred_constructor(key)
+
+    type_, metadata, lazy = key
+    outermost = not _compiling
+    _compiling[key] = None
+    try:
+        constructor = _compiling[key] = _compile_constructor(type_, metadata, lazy=lazy)
+    except BaseException:
+        if outermost:
+            _compiling.clear()
+        else:
+            _compiling.pop(key, None)
+        raise
+
+    if outermost:
+        _CONSTRUCTORS.update({compiled_key: compiled for compiled_key, compiled in _compiling.items() if compiled})
+        _compiling.clear()
+    return constructor
+
+
+def _deferred_constructor(key: _ConstructorKey) -> _Constructor:
+    def construct(value: object) -> object:
+        return _CONSTRUCTORS[key](value)
+
+    return construct
+
+
+def _identity(value: object) -> object:
+    return value
+
+
+def _compile_constructor(type_: object, metadata: Tuple[Any, ...], *, lazy: bool) -> _Constructor:
+    """Builds a function that coerces values to `type_` the way `construct_type()` documents.
+
+    All the type introspection happens here, once per type, instead of for every value.
     """
 
     # store a reference to the original type we were given before we extract any inner
@@ -577,8 +876,9 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
         type_ = type_.__value__  # type: ignore[unreachable]
 
     # unwrap `Annotated[T, ...]` -> `T`
-    if metadata is not None and len(metadata) > 0:
-        meta: tuple[Any, ...] = tuple(metadata)
+    meta: Tuple[Any, ...]
+    if metadata:
+        meta = metadata
     elif is_annotated_type(type_):
         meta = get_args(type_)[1:]
         type_ = extract_type_arg(type_, 0)
@@ -591,8 +891,147 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
     args = get_args(type_)
 
     if is_union(origin):
+        return _compile_union(type_, cast("type[object]", original_type or type_), meta, lazy=lazy)
+
+    if origin == dict:
+        construct_item = _get_constructor(args[1], lazy=lazy) if len(args) == 2 else _identity
+
+        def construct_dict(value: object) -> object:
+            if not is_mapping(value):
+                return value
+
+            if construct_item is _identity:
+                return dict(value)
+            return {key: construct_item(item) for key, item in value.items()}
+
+        return construct_dict
+
+    if (
+        not is_literal_type(type_)
+        and inspect.isclass(origin)
+        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
+    ):
+        model_type = cast("type[BaseModel]", type_)
+        if lazy:
+
+            def construct_lazy_model(value: object) -> object:
+                if is_list(value):
+                    return [_construct_lazy(model_type, entry) if is_mapping(entry) else entry for entry in value]
+
+                if is_mapping(value):
+                    return _construct_lazy(model_type, value)
+
+                return value
+
+            return construct_lazy_model
+
+        construct = cast(Any, model_type).construct
+
+        def construct_model(value: object) -> object:
+            if is_list(value):
+                return [construct(**entry) if is_mapping(entry) else entry for entry in value]
+
+            if is_mapping(value):
+                return construct(**value)
+
+            return value
+
+        return construct_model
+
+    if origin == list:
+        construct_entry = _get_constructor(args[0], lazy=lazy) if args else _identity
+
+        def construct_list(value: object) -> object:
+            if not is_list(value):
+                return value
+
+            if construct_entry is _identity:
+                return list(value)
+            return [construct_entry(entry) for entry in value]
+
+        return construct_list
+
+    if origin == float:
+        return _construct_float
+
+    if type_ == datetime:
+        return _construct_datetime
+
+    if type_ == date:
+        return _construct_date
+
+    return _identity
+
+
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
+            return value
+        return coerced
+
+    return value
+
+
+def _construct_datetime(value: object) -> object:
+    try:
+        return parse_datetime(value)  # type: ignore
+    except Exception:
+        return value
+
+
+def _construct_date(value: object) -> object:
+    try:
+        return parse_date(value)  # type: ignore
+    except Exception:
+        return value
+
+
+# Variants that validation hands back unchanged when the value is exactly of that type
+_PASSTHROUGH_TYPES = (str, int, bool, float, type(None))
+
+
+def _compile_union(
+    type_: type[object], validate_as: type[object], meta: Tuple[Any, ...], *, lazy: bool
+) -> _Constructor:
+    args = get_args(type_)
+    variants = [variant for variant in args if variant is not type(None)]
+
+    # `Optional[Model]` and `Optional[List[...]]` don't need the validation
+    # round-trip below to pick a variant, which would build the whole value
+    if lazy and len(variants) == 1 and (is_basemodel_type(variants[0]) or get_origin(variants[0]) in (list, dict)):
+        construct_variant = _get_constructor(variants[0], lazy=lazy)
+
+        def construct_optional(value: object) -> object:
+            return None if value is None else construct_variant(value)
+
+        return construct_optional
+
+    if len(variants) == 1 and variants[0] in (object, Any):
+        return _identity
+
+    # Values that exactly match a plain variant, e.g. a `str` for `Optional[str]`, are
+    # what validation would return, so they skip it. Only smart-mode unions qualify;
+    # annotations such as a `left_to_right` union mode change which variant wins.
+    exact_types: set[type] = set()
+    literals: set[tuple[type, object]] = set()
+    if not meta:
+        for variant in args:
+            if variant in _PASSTHROUGH_TYPES:
+                exact_types.add(variant)
+            elif is_literal_type(variant):
+                literals.update((type(literal), literal) for literal in cast("tuple[object, ...]", get_args(variant)))
+    literal_types = {literal_type for literal_type, _ in literals}
+
+    construct_variants = [_get_constructor(variant, lazy=lazy) for variant in args]
+
+    def construct_union(value: object) -> object:
+        value_type = type(value)
+        if value_type in exact_types or (value_type in literal_types and (value_type, value) in literals):
+            return value
+
         try:
-            return validate_type(type_=cast("type[object]", original_type or type_), value=value)
+            return validate_type(type_=validate_as, value=value)
         except Exception:
             pass
 
@@ -616,67 +1055,18 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
             if variant_value and isinstance(variant_value, str):
                 variant_type = discriminator.mapping.get(variant_value)
                 if variant_type:
-                    return construct_type(type_=variant_type, value=value)
+                    return _get_constructor(variant_type, lazy=lazy)(value)
 
         # if the data is not valid, use the first variant that doesn't fail while deserializing
-        for variant in args:
+        for construct_variant in construct_variants:
             try:
-                return construct_type(value=value, type_=variant)
+                return construct_variant(value)
             except Exception:
                 continue
 
         raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
 
-    if origin == dict:
-        if not is_mapping(value):
-            return value
-
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {key: construct_type(value=item, type_=items_type) for key, item in value.items()}
-
-    if (
-        not is_literal_type(type_)
-        and inspect.isclass(origin)
-        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
-    ):
-        if is_list(value):
-            return [cast(Any, type_).construct(**entry) if is_mapping(entry) else entry for entry in value]
-
-        if is_mapping(value):
-            if issubclass(type_, BaseModel):
-                return type_.construct(**value)  # type: ignore[arg-type]
-
-            return cast(Any, type_).construct(**value)
-
-    if origin == list:
-        if not is_list(value):
-            return value
-
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
-
-    if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
-
-        return value
-
-    if type_ == datetime:
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
-            return value
-
-    if type_ == date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
-
-    return value
+    return construct_union
 
 
 @runtime_checkable
@@ -9,6 +9,7 @@ from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    List,
     Union,
     Generic,
     TypeVar,
@@ -25,15 +26,24 @@ import httpx
 import pydantic
 
 from ._types import NoneType
-from ._utils import is_given, extract_type_arg, is_annotated_type, is_type_alias_type, extract_type_var_from_base
+from ._utils import (
+    is_given,
+    is_list_type,
+    extract_type_arg,
+    is_annotated_type,
+    is_type_alias_type,
+    extract_type_var_from_base,
+)
+from ._compat import get_model_fields
 from ._models import BaseModel, is_basemodel
 from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import RunloopError, APIResponseValidationError
+from ._utils._json import IncrementalArrayDecoder, openapi_loads
 
 if TYPE_CHECKING:
     from ._models import FinalRequestOptions
-    from ._base_client import BaseClient
+    from ._base_client import BasePage, BaseClient
 
 
 P = ParamSpec("P")
@@ -125,6 +135,51 @@ class BaseAPIResponse(Generic[R]):
             f"<{self.__class__.__name__} [{self.status_code} {self.http_response.reason_phrase}] type={self._cast_to}>"
         )
 
+    def _page_items_field(self) -> tuple[str, type[Any]]:
+        """The name and item type of the list field holding the items of a page response."""
+        from ._base_client import BasePage
+
+        page_cls = cast("type[Any]", self._cast_to)
+        if not (inspect.isclass(page_cls) and issubclass(page_cls, BasePage)):
+            raise TypeError(f"Expected a paginated list response, got {page_cls}")
+
+        for name, field in get_model_fields(cast("type[BasePage[Any]]", page_cls)).items():
+            if field.annotation is not None and is_list_type(field.annotation):
+                return name, extract_type_arg(field.annotation, 0)
+        raise TypeError(f"Could not find the list of items in {page_cls}")
+
+    def _parse_page_items(self, item_type: type[Any], data: list[Any]) -> list[Any]:
+        # every item completed by a chunk is built in one go, so per-call overhead is paid per chunk
+        if not data:
+            return data
+        return self._client._process_response_data(
+            data=data,
+            cast_to=cast("type[list[Any]]", List[item_type]),  # type: ignore[valid-type]
+            response=self.http_response,
+        )
+
+    def _next_page_options(
+        self, key: str, item_type: type[Any], fields: dict[str, Any], last: object
+    ) -> FinalRequestOptions | None:
+        """Options for streaming the page following this one, built from its cursor and the last item received."""
+        if last is None:
+            return None
+        page = cast(
+            "BasePage[Any]",
+            self._client._process_response_data(
+                data={**fields, key: [last]}, cast_to=self._cast_to, response=self.http_response
+            ),
+        )
+        page._set_private_attributes(client=self._client, model=item_type, options=self._options)  # type: ignore[attr-defined]
+        if not page.has_next_page():
+            return None
+        info = page.next_page_info()
+        if info is None:
+            return None
+        options = page._info_to_options(info)
+        options.headers = {**(options.headers if is_given(options.headers) else {}), RAW_RESPONSE_HEADER: "stream"}
+        return options
+
     def _parse(self, *, to: type[_T] | None = None) -> R | _T:
         cast_to = to if to is not None else self._cast_to
 
@@ -241,7 +296,7 @@ class BaseAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = openapi_loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -263,7 +318,7 @@ class BaseAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = openapi_loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -373,6 +428,47 @@ class APIResponse(BaseAPIResponse[R]):
         for chunk in self.http_response.iter_lines():
             yield chunk
 
+    def iter_items(self) -> Iterator[Any]:
+        """Yields the items of a paginated list response as each one is decoded from the response body.
+
+        Instead of reading and decoding the whole page before iterating, items are
+        parsed straight from the response stream, which lowers the time to the first
+        item and the memory held for large pages. Items are the page's item models,
+        e.g. `ObjectView`, and following pages are streamed the same way until the
+        last one. Use it with `.with_streaming_response`:
+
+        ```py
+        with client.objects.with_streaming_response.list(limit=5000) as response:
+            for obj in response.iter_items():
+                print(obj.id)
+        ```
+        """
+        key, item_type = self._page_items_field()
+        response: APIResponse[Any] = self
+        while True:
+            decoder = IncrementalArrayDecoder(key)
+            last: object = None
+            try:
+                for chunk in response.iter_bytes():
+                    items = decoder.feed(chunk)
+                    if items:
+                        last = items[-1]
+                    for item in response._parse_page_items(item_type, items):
+                        yield item
+                items = decoder.close()
+                if items:
+                    last = items[-1]
+                for item in response._parse_page_items(item_type, items):
+                    yield item
+            finally:
+                if response is not self:
+                    response.close()
+
+            options = response._next_page_options(key, item_type, decoder.fields, last)
+            if options is None:
+                return
+            response = cast(Any, self._client).request(self._cast_to, options)
+
 
 class AsyncAPIResponse(BaseAPIResponse[R]):
     @overload
@@ -473,6 +569,47 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
         async for chunk in self.http_response.aiter_lines():
             yield chunk
 
+    async def iter_items(self) -> AsyncIterator[Any]:
+        """Yields the items of a paginated list response as each one is decoded from the response body.
+
+        Instead of reading and decoding the whole page before iterating, items are
+        parsed straight from the response stream, which lowers the time to the first
+        item and the memory held for large pages. Items are the page's item models,
+        e.g. `ObjectView`, and following pages are streamed the same way until the
+        last one. Use it with `.with_streaming_response`:
+
+        ```py
+        async with client.objects.with_streaming_response.list(limit=5000) as response:
+            async for obj in response.iter_items():
+                print(obj.id)
+        ```
+        """
+        key, item_type = self._page_items_field()
+        response: AsyncAPIResponse[Any] = self
+        while True:
+            decoder = IncrementalArrayDecoder(key)
+            last: object = None
+            try:
+                async for chunk in response.iter_bytes():
+                    items = decoder.feed(chunk)
+                    if items:
+                        last = items[-1]
+                    for item in response._parse_page_items(item_type, items):
+                        yield item
+                items = decoder.close()
+                if items:
+                    last = items[-1]
+                for item in response._parse_page_items(item_type, items):
+                    yield item
+            finally:
+                if response is not self:
+                    await response.close()
+
+            options = response._next_page_options(key, item_type, decoder.fields, last)
+            if options is None:
+                return
+            response = await cast(Any, self._client).request(self._cast_to, options)
+
 
 class BinaryAPIResponse(APIResponse[bytes]):
     """Subclass of APIResponse providing helpers for dealing with binary data.
@@ -29,6 +29,7 @@ import httpx
 
 from ._utils import extract_type_var_from_base
 from ._exceptions import APIStatusError, APITimeoutError
+from ._utils._json import openapi_loads
 
 if TYPE_CHECKING:
     from ._client import Runloop, AsyncRunloop
@@ -223,7 +224,7 @@ class ServerSentEvent:
         return self._data
 
     def json(self) -> Any:
-        return json.loads(self.data)
+        return openapi_loads(self.data)
 
     @override
     def __repr__(self) -> str:
@@ -249,6 +249,12 @@ class HttpxSendArgs(TypedDict, total=False):
     follow_redirects: bool
 
 
+# How a client pool picks a shard (≈ H2 connection) for the next request.
+ShardSelectionPolicy = Literal["round_robin", "least_outstanding", "power_of_two_choices"]
+# Custom policy: given per-shard in-flight counts and a rotating start offset, return a shard index.
+ShardSelector = Callable[[Sequence[int], int], int]
+
+
 _T_co = TypeVar("_T_co", covariant=True)
 
 
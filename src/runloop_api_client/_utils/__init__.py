@@ -1,4 +1,5 @@
 # isort: skip_file
+from ._lazy import lazy_exports as lazy_exports
 from ._path import path_template as path_template
 from ._sync import asyncify as asyncify
 from ._proxy import LazyProxy as LazyProxy
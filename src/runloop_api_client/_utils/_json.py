@@ -1,20 +1,129 @@
+import re
 import json
-from typing import Any
+import math
+import codecs
+import functools
+from typing import Any, Dict, List, Type, Tuple, Union, Callable, Iterable, Optional, cast
 from datetime import datetime
-from typing_extensions import override
+from typing_extensions import Literal, override
 
 import pydantic
 
 from .._compat import model_dump
 
 
+def _default(o: Any) -> Any:
+    if isinstance(o, datetime):
+        return o.isoformat()
+    if isinstance(o, pydantic.BaseModel):
+        return model_dump(o, exclude_unset=True, mode="json", by_alias=True)
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+# Optional fast JSON backends, used automatically when installed. orjson handles
+# both directions; msgspec only decodes, since its native datetime encoding
+# ("Z" suffix) differs from the `isoformat()` output of the stdlib path.
+json_backend: Literal["orjson", "msgspec", "json"] = "json"
+_fast_dumps: Optional[Callable[[Any], bytes]] = None
+_fast_loads: Optional[Callable[[Union[str, bytes]], Any]] = None
+_decode_errors: Tuple[Type[Exception], ...] = (ValueError,)
+
+# orjson writes NaN and infinity as `null` where the stdlib encoder raises, and
+# formats the floats the stdlib writes with an exponent (`1e+16`, `1e-05`) as
+# `1e16` and `0.00001`. Encoded bodies that may hold one of those are encoded
+# again by the stdlib; a string that happens to match only costs the re-encode.
+_exponent = re.compile(rb"e[-+]?\d")  # orjson only writes a lowercase `e`
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether `obj` may hold a NaN or infinite float, looking inside containers and model fields."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            values: Iterable[Any] = cast("Dict[Any, Any]", value).values()
+        elif isinstance(value, (list, tuple)):
+            values = cast("List[Any]", value)
+        elif isinstance(value, pydantic.BaseModel):
+            values = value.__dict__.values()
+        elif isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+            continue
+        else:
+            continue
+        for item in values:
+            # exact type checks first: this runs for every value of every body holding a `None`
+            kind = type(item)  # pyright: ignore[reportUnknownVariableType]
+            if kind is float:
+                if not math.isfinite(item):
+                    return True
+            elif kind is not str and kind is not int and item is not None:
+                stack.append(item)
+    return False
+
+
+def _is_portable(obj: Any, data: bytes) -> bool:
+    # separate searches with literal prefixes, a single alternation is tried at every position
+    if _exponent.search(data) or b"0.0000" in data:
+        return False
+    # `null` is mostly `None`: only then look for the floats orjson also writes that way
+    return b"null" not in data or not _has_non_finite(obj)
+
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import msgspec  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        json_backend = "msgspec"
+        _fast_loads = msgspec.json.Decoder().decode
+        _decode_errors = (ValueError, msgspec.DecodeError)
+else:
+    json_backend = "orjson"
+    # Datetimes and dataclasses go through `_default` like they do with the stdlib
+    # encoder, so both paths emit identical bytes for them.
+    _fast_dumps = functools.partial(
+        orjson.dumps,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
+    # orjson silently turns integers wider than 64 bits into floats; documents with
+    # 20+ digit runs (rare, but cheap to spot) are left to the stdlib decoder.
+    _long_number = re.compile(r"\d{20}")
+    _long_number_bytes = re.compile(rb"\d{20}")
+
+    def _orjson_loads(data: Union[str, bytes]) -> Any:
+        pattern = _long_number if isinstance(data, str) else _long_number_bytes
+        if pattern.search(data):  # type: ignore[arg-type]
+            return json.loads(data)
+        return orjson.loads(data)
+
+    _fast_loads = _orjson_loads
+
+
 def openapi_dumps(obj: Any) -> bytes:
     """
     Serialize an object to UTF-8 encoded JSON bytes.
 
     Extends the standard json.dumps with support for additional types
     commonly used in the SDK, such as `datetime`, `pydantic.BaseModel`, etc.
+
+    Uses orjson when it is installed. Anything orjson cannot encode exactly like
+    the stdlib encoder, such as integers wider than 64 bits, non-finite floats or
+    floats written with an exponent, falls back to the stdlib encoder.
     """
+    if _fast_dumps is not None:
+        try:
+            data = _fast_dumps(obj)
+        except TypeError:
+            pass
+        else:
+            if _is_portable(obj, data):
+                return data
     return json.dumps(
         obj,
         cls=_CustomEncoder,
@@ -25,11 +134,154 @@ def openapi_dumps(obj: Any) -> bytes:
     ).encode()
 
 
+def openapi_loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON document, with orjson or msgspec when installed.
+
+    Documents the fast backend cannot decode exactly as `json.loads` does (UTF-16
+    bodies, `NaN` literals, integers wider than 64 bits) are decoded by the stdlib.
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except _decode_errors:
+            pass
+    return json.loads(data)
+
+
 class _CustomEncoder(json.JSONEncoder):
     @override
     def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, pydantic.BaseModel):
-            return model_dump(o, exclude_unset=True, mode="json", by_alias=True)
+        if isinstance(o, (datetime, pydantic.BaseModel)):
+            return _default(o)
         return super().default(o)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*")
+_raw_decode = json.JSONDecoder().raw_decode
+
+
+class IncrementalArrayDecoder:
+    """
+    Decodes a JSON object fed in chunks, returning the elements of one of its
+    top-level arrays as soon as each element has been received in full.
+
+    The other top-level members are decoded into `fields` as they arrive. Only
+    the element being received is buffered, so a large array never has to be
+    held as text. Elements are decoded with the stdlib decoder.
+    """
+
+    fields: Dict[str, Any]
+
+    def __init__(self, key: str) -> None:
+        self.fields = {}
+        self._key = key
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._member = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next chunk of the body, returning the array elements it completed."""
+        return self._consume(self._text.decode(chunk))
+
+    def close(self) -> List[Any]:
+        """Ends the body, returning any remaining elements and checking that the whole document was received."""
+        items = self._consume(self._text.decode(b"", final=True))
+        if self._state != "done":
+            raise ValueError(f"Incomplete JSON document, expected the `{self._key}` array inside an object")
+        return items
+
+    def _consume(self, text: str) -> List[Any]:
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        items: List[Any] = []
+        while self._step(items):
+            pass
+        return items
+
+    def _next(self) -> Optional[str]:
+        """Skips whitespace, returning the next character or `None` when more data is needed."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else None
+
+    def _decode(self, terminators: str) -> Tuple[bool, Any]:
+        """Decodes the value at the current position, once the character following it has arrived too."""
+        try:
+            value, end = _raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            return False, None
+        # a number at the end of the buffer may still be missing digits, a fraction or an exponent
+        if (
+            isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and _NUMBER_TAIL.match(self._buffer, end).end() >= len(self._buffer)  # type: ignore[union-attr]
+        ):
+            return False, None
+        follow = _WHITESPACE.match(self._buffer, end).end()  # type: ignore[union-attr]
+        if follow >= len(self._buffer):
+            return False, None
+        if self._buffer[follow] not in terminators:
+            raise ValueError(f"Invalid JSON document, unexpected {self._buffer[follow]!r} at member `{self._member}`")
+        self._pos = end
+        return True, value
+
+    def _step(self, items: List[Any]) -> bool:
+        char = self._next()
+        if char is None or self._state == "done":
+            return False
+
+        if self._state == "start":
+            if char != "{":
+                raise ValueError(f"Invalid JSON document, expected an object but got {char!r}")
+            self._pos += 1
+            self._state = "first_member"
+        elif self._state in ("first_member", "member"):
+            if char == "}" and self._state == "first_member":
+                self._pos += 1
+                self._state = "done"
+                return False
+            complete, name = self._decode(":")
+            if not complete:
+                return False
+            if not isinstance(name, str):
+                raise ValueError("Invalid JSON document, expected a member name")
+            self._member = name
+            self._next()
+            self._pos += 1  # the `:` checked by `_decode`
+            self._state = "value"
+        elif self._state == "value":
+            if char == "[" and self._member == self._key:
+                self._pos += 1
+                self._state = "first_item"
+                return True
+            complete, value = self._decode(",}")
+            if not complete:
+                return False
+            self.fields[self._member] = value
+            self._state = "after_member"
+        elif self._state == "after_member":
+            self._pos += 1
+            if char == ",":
+                self._state = "member"
+            elif char == "}":
+                self._state = "done"
+                return False
+            else:
+                raise ValueError(f"Invalid JSON document, unexpected {char!r} after member `{self._member}`")
+        elif self._state in ("first_item", "item"):
+            if char == "]" and self._state == "first_item":
+                self._pos += 1
+                self._state = "after_member"
+                return True
+            complete, value = self._decode(",]")
+            if not complete:
+                return False
+            items.append(value)
+            self._state = "after_item"
+        else:  # after_item
+            self._pos += 1
+            self._state = "item" if char == "," else "after_member"
+        return True
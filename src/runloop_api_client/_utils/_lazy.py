@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sys
+import importlib
+from typing import Any, List, Tuple, Mapping, Callable, Optional
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+    *,
+    module: Optional[str] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module level `__getattr__` and `__dir__` for a package whose re-exports are imported on first access.
+
+    Args:
+        package: The `__name__` of the package re-exporting the names.
+
+        exports: Maps each exported name to the module, relative to `package`, that defines it, e.g.
+            `{"DevboxView": ".devbox_view"}`.
+
+        module: If given, the `__module__` of exported classes and functions is set to this value once they are
+            loaded, so that error messages point at the public module instead of the defining one.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        source = exports.get(name)
+        if source is None:
+            # submodules are resolved by the import system once this raises
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(source, package), name)
+        if module is not None:
+            try:
+                value.__module__ = module
+            except (TypeError, AttributeError):
+                pass
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
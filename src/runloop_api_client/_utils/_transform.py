@@ -3,7 +3,8 @@ from __future__ import annotations
 import io
 import base64
 import pathlib
-from typing import Any, Mapping, TypeVar, cast
+import threading
+from typing import Any, Dict, Tuple, Mapping, TypeVar, Iterable, Optional, cast
 from datetime import date, datetime
 from typing_extensions import Literal, get_args, override, get_type_hints as _get_type_hints
 
@@ -88,7 +89,7 @@ def maybe_transform(
     return transform(data, expected_type)
 
 
-# Wrapper over _transform_recursive providing fake types
+# Wrapper over _TransformPlan providing fake types
 def transform(
     data: _T,
     expected_type: object,
@@ -108,7 +109,7 @@ def transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = _transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = _get_transform_plan(cast(type, expected_type)).apply(data)
     return cast(_T, transformed)
 
 
@@ -151,86 +152,271 @@ def _no_transform_needed(annotation: type) -> bool:
     return annotation == float or annotation == int
 
 
-def _transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
+class _TransformPlan:
+    """The transformation for one `(annotation, inner_type)` pair, worked out from the type once.
 
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
+    Applying a plan only inspects the data; the checks run in the same order the
+    type-driven walk used, so the output is the same.
     """
-    from .._compat import model_dump
 
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
+    # TypedDict: key -> (renamed key, plan for the value)
+    typeddict_fields: Optional[Dict[str, Tuple[str, _TransformPlan]]] = None
+    # Dict[str, T]: plan for the values
+    dict_items: Optional[_TransformPlan] = None
+    # List[T], Iterable[T] and Sequence[T]
+    list_type: bool = False
+    iterable_type: bool = False
+    sequence_type: bool = False
+    # plan for each entry, `None` when entries are passed through as-is
+    entries: Optional[_TransformPlan] = None
+    # Union[...]: plans for each variant, applied in turn
+    variants: Optional[Tuple[_TransformPlan, ...]] = None
+    # format from the first `PropertyInfo` with one
+    format: Optional[Tuple[PropertyFormat, Optional[str]]] = None
+    # nothing to do beyond dumping pydantic models, set once compiled
+    leaf: bool = False
+    # whether a reachable plan reads files (`base64`) and so has to be applied with `async_apply()`,
+    # set once the outermost plan has been compiled
+    needs_async: bool = True
+
+    def compile(self, annotation: type, inner_type: type) -> None:
+        stripped_type = strip_annotated_type(inner_type)
+        origin = get_origin(stripped_type) or stripped_type
+
+        if is_typeddict(stripped_type):
+            self.typeddict_fields = {
+                key: (_maybe_transform_key(key, type_), _compile_transform_plan(type_, type_))
+                for key, type_ in get_type_hints(stripped_type, include_extras=True).items()
+            }
+
+        if origin == dict:
+            args = get_args(stripped_type)
+            items_type = args[1] if len(args) == 2 else object
+            self.dict_items = _compile_transform_plan(items_type, items_type)
+
+        self.list_type = is_list_type(stripped_type)
+        self.iterable_type = is_iterable_type(stripped_type)
+        self.sequence_type = is_sequence_type(stripped_type)
+        if self.list_type or self.iterable_type or self.sequence_type:
+            entry_type = extract_type_arg(stripped_type, 0)
             # for some types there is no need to transform anything, so we can get a small
             # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
+            if not _no_transform_needed(entry_type):
+                self.entries = _compile_transform_plan(annotation, entry_type)
 
+        if is_union_type(stripped_type):
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+            #
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            variants = tuple(_compile_transform_plan(annotation, subtype) for subtype in get_args(stripped_type))
+            # e.g. `Optional[str]`, where every variant only dumps pydantic models
+            if not all(variant.leaf for variant in variants):
+                self.variants = variants
+
+        annotated_type = _get_annotated_type(annotation)
+        if annotated_type is not None:
+            # ignore the first argument as it is the actual type
+            for property_info in get_args(annotated_type)[1:]:
+                if isinstance(property_info, PropertyInfo) and property_info.format is not None:
+                    self.format = (property_info.format, property_info.format_template)
+                    break
+
+        self.leaf = (
+            self.typeddict_fields is None
+            and self.dict_items is None
+            and not (self.list_type or self.iterable_type or self.sequence_type)
+            and self.variants is None
+            and self.format is None
+        )
+
+    def children(self) -> list[_TransformPlan]:
+        children = [plan for _, plan in (self.typeddict_fields or {}).values()]
+        children.extend(plan for plan in (self.dict_items, self.entries) if plan is not None)
+        children.extend(self.variants or ())
+        return children
+
+    def _is_container(self, data: object) -> bool:
+        return (
+            # List[T]
+            (self.list_type and is_list(data))
+            # Iterable[T]
+            or (self.iterable_type and is_iterable(data) and not isinstance(data, str))
+            # Sequence[T]
+            or (self.sequence_type and is_sequence(data) and not isinstance(data, str))
+        )
+
+    def apply(self, data: object) -> object:
+        if self.leaf:
+            return _dump_model(data)
+
+        if self.typeddict_fields is not None and is_mapping(data):
+            result: dict[str, object] = {}
+            for key, value in data.items():
+                if not is_given(value):
+                    # we don't need to include omitted values here as they'll
+                    # be stripped out before the request is sent anyway
+                    continue
+
+                field = self.typeddict_fields.get(key)
+                if field is None:
+                    # we do not have a type annotation for this field, leave it as is
+                    result[key] = value
+                else:
+                    result[field[0]] = field[1].apply(value)
+            return result
+
+        if self.dict_items is not None and is_mapping(data):
+            return {key: self.dict_items.apply(value) for key, value in data.items()}
+
+        if self._is_container(data):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            if self.entries is None:
+                # we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(cast("Iterable[object]", data))
+
+            return [self.entries.apply(d) for d in cast("Iterable[object]", data)]
+
+        if self.variants is not None:
+            for variant in self.variants:
+                data = variant.apply(data)
+            return data
+
+        if self.format is not None and not isinstance(data, pydantic.BaseModel):
+            return _format_data(data, *self.format)
+
+        return _dump_model(data)
+
+    async def async_apply(self, data: object) -> object:
+        if not self.needs_async:
+            # the only difference between the two paths is how files are read
+            return self.apply(data)
+
+        if self.typeddict_fields is not None and is_mapping(data):
+            result: dict[str, object] = {}
+            for key, value in data.items():
+                if not is_given(value):
+                    # we don't need to include omitted values here as they'll
+                    # be stripped out before the request is sent anyway
+                    continue
+
+                field = self.typeddict_fields.get(key)
+                if field is None:
+                    # we do not have a type annotation for this field, leave it as is
+                    result[key] = value
+                else:
+                    result[field[0]] = await field[1].async_apply(value)
+            return result
+
+        if self.dict_items is not None and is_mapping(data):
+            return {key: self.dict_items.apply(value) for key, value in data.items()}
+
+        if self._is_container(data):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            if self.entries is None:
+                # we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(cast("Iterable[object]", data))
+
+            return [await self.entries.async_apply(d) for d in cast("Iterable[object]", data)]
+
+        if self.variants is not None:
+            for variant in self.variants:
+                data = await variant.async_apply(data)
+            return data
+
+        if self.format is not None and not isinstance(data, pydantic.BaseModel):
+            return await _async_format_data(data, *self.format)
+
+        return _dump_model(data)
+
+
+def _dump_model(data: object) -> object:
     if isinstance(data, pydantic.BaseModel):
+        from .._compat import model_dump
+
         return model_dump(data, exclude_unset=True, mode="json")
 
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
+    return data
 
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
 
-    return data
+_TRANSFORM_PLANS: dict[tuple[type, type], _TransformPlan] = {}
+# plans being compiled; they are only published once the outermost plan is complete
+_compiling: dict[tuple[type, type], _TransformPlan] = {}
+_compile_lock = threading.RLock()
+
+
+def _get_transform_plan(annotation: type, inner_type: type | None = None) -> _TransformPlan:
+    if inner_type is None:
+        inner_type = annotation
+
+    try:
+        plan = _TRANSFORM_PLANS.get((annotation, inner_type))
+    except TypeError:
+        # unhashable annotation metadata, nothing to cache it by
+        plan = None
+
+    if plan is None:
+        with _compile_lock:
+            plan = _compile_transform_plan(annotation, inner_type)
+    return plan
+
+
+def _compile_transform_plan(annotation: type, inner_type: type) -> _TransformPlan:
+    """Must be called with `_compile_lock` held."""
+    key = (annotation, inner_type)
+    try:
+        plan = _TRANSFORM_PLANS.get(key) or _compiling.get(key)
+    except TypeError:
+        plan = _TransformPlan()
+        plan.compile(annotation, inner_type)
+        return plan
+
+    if plan is not None:
+        return plan
+
+    outermost = not _compiling
+    # registered before compiling so that recursive TypedDicts refer back to it
+    plan = _compiling[key] = _TransformPlan()
+    try:
+        plan.compile(annotation, inner_type)
+    except BaseException:
+        if outermost:
+            _compiling.clear()
+        raise
+
+    if outermost:
+        for compiled in _compiling.values():
+            compiled.needs_async = _reads_files(compiled)
+        _TRANSFORM_PLANS.update(_compiling)
+        _compiling.clear()
+    return plan
+
+
+def _reads_files(plan: _TransformPlan) -> bool:
+    """Whether `plan`, or any plan reachable from it, can read a file for a `base64` format."""
+    seen: set[int] = set()
+    stack = [plan]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if current.format is not None and current.format[0] == "base64":
+            return True
+        stack.extend(current.children())
+    return False
 
 
 def _format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
@@ -260,27 +446,6 @@ def _format_data(data: object, format_: PropertyFormat, format_template: str | N
     return data
 
 
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
-
-
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -313,92 +478,10 @@ async def async_transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = await _async_transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = await _get_transform_plan(cast(type, expected_type)).async_apply(data)
     return cast(_T, transformed)
 
 
-async def _async_transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
-
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
-    """
-    from .._compat import model_dump
-
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return await _async_transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-        # Sequence[T]
-        or (is_sequence_type(stripped_type) and is_sequence(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [await _async_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = await _async_transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json")
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return await _async_format_data(data, annotation.format, annotation.format_template)
-
-    return data
-
-
 async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
     if isinstance(data, (date, datetime)):
         if format_ == "iso8601":
@@ -426,27 +509,6 @@ async def _async_format_data(data: object, format_: PropertyFormat, format_templ
     return data
 
 
-async def _async_transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include omitted values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = await _async_transform_recursive(value, annotation=type_)
-    return result
-
-
 @lru_cache(maxsize=8096)
 def get_type_hints(
     obj: Any,
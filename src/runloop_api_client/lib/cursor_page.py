@@ -0,0 +1,71 @@
+"""Cursor pagination shared by every `*CursorIDPage` class in `runloop_api_client.pagination`.
+
+The list endpoints differ only in the field their items are returned in, so the
+page classes there only name that field and inherit the paging logic from here.
+"""
+
+from typing import Any, List, Generic, TypeVar, ClassVar, Optional
+from typing_extensions import Protocol, override, runtime_checkable
+
+from .._base_client import BasePage, PageInfo, BaseSyncPage, BaseAsyncPage
+
+__all__ = ["CursorIDPageItem", "SyncCursorIDPage", "AsyncCursorIDPage"]
+
+_T = TypeVar("_T")
+
+
+@runtime_checkable
+class CursorIDPageItem(Protocol):
+    id: str
+
+
+class _CursorIDPage(BasePage[_T], Generic[_T]):
+    """A page of items addressed by the `starting_after` cursor, the `id` of the last item of the previous page.
+
+    Subclasses declare the list field the API returns the items in and name it in `_items_field`.
+    """
+
+    _items_field: ClassVar[str]
+
+    has_more: Optional[bool] = None
+    total_count: Optional[int] = None
+
+    @override
+    def _get_page_items(self) -> List[_T]:
+        items: Optional[List[_T]] = getattr(self, self._items_field)
+        if not items:
+            return []
+        return items
+
+    def _cursor(self) -> Optional[str]:
+        items: Optional[List[Any]] = getattr(self, self._items_field)
+        if not items:
+            return None
+        # the same check as `isinstance(item, CursorIDPageItem) and item.id is not None`, without the protocol's
+        # structural `isinstance` check, which is by far the slowest part of stepping to the next page
+        cursor: Optional[str] = getattr(items[-1], "id", None)
+        return cursor
+
+    @override
+    def has_next_page(self) -> bool:
+        if self.has_more is False:
+            return False
+
+        return self._cursor() is not None
+
+    @override
+    def next_page_info(self) -> Optional[PageInfo]:
+        cursor = self._cursor()
+        if cursor is None:
+            # TODO emit warning log
+            return None
+
+        return PageInfo(params={"starting_after": cursor})
+
+
+class SyncCursorIDPage(BaseSyncPage[_T], _CursorIDPage[_T], Generic[_T]):
+    """Base class of the synchronous `*CursorIDPage` pages."""
+
+
+class AsyncCursorIDPage(BaseAsyncPage[_T], _CursorIDPage[_T], Generic[_T]):
+    """Base class of the asynchronous `*CursorIDPage` pages."""
@@ -0,0 +1,168 @@
+"""Parallel listing of cursor-paginated resources.
+
+Cursor pagination has to walk one page at a time, so listing a large account
+is bounded by the round trip per page. When the listing can be split into
+disjoint server-side filters (devboxes by status, storage objects and
+benchmark runs by state), each partition can be paged through on its own and
+the partitions walked concurrently, with the requests spread over the client's
+connection pool shards.
+
+Example:
+    >>> client = AsyncRunloop()
+    >>> async for devbox in async_scan(client.devboxes.list, DEVBOX_STATUS_PARTITIONS, limit=500):
+    ...     print(devbox.id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Union, Mapping, TypeVar, Callable, Hashable, Optional, Sequence
+from typing_extensions import AsyncIterable, AsyncIterator
+
+from .._utils import get_async_library
+
+__all__ = [
+    "async_scan",
+    "DEVBOX_STATUS_PARTITIONS",
+    "OBJECT_STATE_PARTITIONS",
+    "BENCHMARK_RUN_STATE_PARTITIONS",
+]
+
+T = TypeVar("T")
+
+DEVBOX_STATUS_PARTITIONS: List[Dict[str, Any]] = [
+    {"status": status}
+    for status in (
+        "scheduled",
+        "queued",
+        "provisioning",
+        "initializing",
+        "running",
+        "suspending",
+        "suspended",
+        "resuming",
+        "failure",
+        "shutdown",
+    )
+]
+"""Every devbox status, for `client.devboxes.list`."""
+
+OBJECT_STATE_PARTITIONS: List[Dict[str, Any]] = [
+    {"state": state} for state in ("UPLOADING", "READ_ONLY", "DELETED", "ERROR")
+]
+"""Every storage object state, for `client.objects.list`."""
+
+BENCHMARK_RUN_STATE_PARTITIONS: List[Dict[str, Any]] = [
+    {"state": state} for state in ("running", "canceled", "completed", "failed")
+]
+"""Every benchmark run state, for `client.benchmark_runs.list`."""
+
+
+class _PartitionDone:
+    pass
+
+
+class _PartitionFailed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_PARTITION_DONE = _PartitionDone()
+
+
+def _item_id(item: Any) -> Hashable:
+    return item.id  # type: ignore[no-any-return]
+
+
+async def async_scan(
+    list_fn: Callable[..., AsyncIterable[T]],
+    partitions: Sequence[Mapping[str, Any]],
+    *,
+    key: Callable[[T], Hashable] = _item_id,
+    max_concurrency: Optional[int] = None,
+    buffer_size: int = 1000,
+    **params: Any,
+) -> AsyncIterator[T]:
+    """
+    Iterate every item of a paginated list method by walking disjoint partitions concurrently.
+
+    Items of one partition are yielded in page order, partitions are interleaved
+    as their pages arrive. Items are deduplicated by `key`, since an item whose
+    status changes mid-scan can show up in two partitions. Like any listing of
+    changing data the result is not a snapshot: an item that moves into a
+    partition that was already walked is not seen.
+
+    Args:
+        list_fn: An async client list method, e.g. `client.devboxes.list`
+        partitions: Filters that together cover the listing without overlap,
+            each one merged into `params` for its own walk
+        key: Identity of an item used for deduplication, defaults to its `id`
+        max_concurrency: Partitions walked at the same time, defaults to all of them
+        buffer_size: Items fetched ahead of the consumer before the walks pause
+        **params: Parameters passed to every `list_fn` call, e.g. `limit`
+
+    Returns:
+        An async iterator over the merged, deduplicated items
+
+    Raises:
+        ValueError: When a partition filter is also given in `params`
+    """
+    if not partitions:
+        raise ValueError("partitions must not be empty")
+    overlapping = sorted({name for partition in partitions for name in partition if name in params})
+    if overlapping:
+        raise ValueError(f"{', '.join(overlapping)} cannot be passed alongside partitions filtering on it")
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    seen: set[Hashable] = set()
+    async for item in _merge(list_fn, partitions, params, max_concurrency or len(partitions), buffer_size):
+        item_key = key(item)
+        if item_key in seen:
+            continue
+        seen.add(item_key)
+        yield item
+
+
+async def _merge(
+    list_fn: Callable[..., AsyncIterable[T]],
+    partitions: Sequence[Mapping[str, Any]],
+    params: Dict[str, Any],
+    concurrency: int,
+    buffer_size: int,
+) -> AsyncIterator[T]:
+    if get_async_library() != "asyncio":
+        # the walks below run as asyncio tasks; other event loops walk one partition at a time
+        for partition in partitions:
+            async for item in list_fn(**params, **partition):
+                yield item
+        return
+
+    remaining = list(reversed(partitions))
+    queue: asyncio.Queue[Union[T, _PartitionDone, _PartitionFailed]] = asyncio.Queue(maxsize=buffer_size)
+
+    async def walk() -> None:
+        try:
+            while remaining:
+                partition = remaining.pop()
+                async for item in list_fn(**params, **partition):
+                    await queue.put(item)
+        except Exception as error:
+            await queue.put(_PartitionFailed(error))
+        else:
+            await queue.put(_PARTITION_DONE)
+
+    workers = [asyncio.ensure_future(walk()) for _ in range(min(concurrency, len(partitions)))]
+    try:
+        running = len(workers)
+        while running:
+            entry = await queue.get()
+            if isinstance(entry, _PartitionDone):
+                running -= 1
+            elif isinstance(entry, _PartitionFailed):
+                raise entry.error
+            else:
+                yield entry
+    finally:
+        for worker in workers:
+            worker.cancel()
@@ -1,141 +1,256 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .pty import (
-    PtyResource,
-    AsyncPtyResource,
-    PtyResourceWithRawResponse,
-    AsyncPtyResourceWithRawResponse,
-    PtyResourceWithStreamingResponse,
-    AsyncPtyResourceWithStreamingResponse,
-)
-from .axons import (
-    AxonsResource,
-    AsyncAxonsResource,
-    AxonsResourceWithRawResponse,
-    AsyncAxonsResourceWithRawResponse,
-    AxonsResourceWithStreamingResponse,
-    AsyncAxonsResourceWithStreamingResponse,
-)
-from .agents import (
-    AgentsResource,
-    AsyncAgentsResource,
-    AgentsResourceWithRawResponse,
-    AsyncAgentsResourceWithRawResponse,
-    AgentsResourceWithStreamingResponse,
-    AsyncAgentsResourceWithStreamingResponse,
-)
-from .apikeys import (
-    ApikeysResource,
-    AsyncApikeysResource,
-    ApikeysResourceWithRawResponse,
-    AsyncApikeysResourceWithRawResponse,
-    ApikeysResourceWithStreamingResponse,
-    AsyncApikeysResourceWithStreamingResponse,
-)
-from .objects import (
-    ObjectsResource,
-    AsyncObjectsResource,
-    ObjectsResourceWithRawResponse,
-    AsyncObjectsResourceWithRawResponse,
-    ObjectsResourceWithStreamingResponse,
-    AsyncObjectsResourceWithStreamingResponse,
-)
-from .secrets import (
-    SecretsResource,
-    AsyncSecretsResource,
-    SecretsResourceWithRawResponse,
-    AsyncSecretsResourceWithRawResponse,
-    SecretsResourceWithStreamingResponse,
-    AsyncSecretsResourceWithStreamingResponse,
-)
-from .accounts import (
-    AccountsResource,
-    AsyncAccountsResource,
-    AccountsResourceWithRawResponse,
-    AsyncAccountsResourceWithRawResponse,
-    AccountsResourceWithStreamingResponse,
-    AsyncAccountsResourceWithStreamingResponse,
-)
-from .devboxes import (
-    DevboxesResource,
-    AsyncDevboxesResource,
-    DevboxesResourceWithRawResponse,
-    AsyncDevboxesResourceWithRawResponse,
-    DevboxesResourceWithStreamingResponse,
-    AsyncDevboxesResourceWithStreamingResponse,
-)
-from .scenarios import (
-    ScenariosResource,
-    AsyncScenariosResource,
-    ScenariosResourceWithRawResponse,
-    AsyncScenariosResourceWithRawResponse,
-    ScenariosResourceWithStreamingResponse,
-    AsyncScenariosResourceWithStreamingResponse,
-)
-from .benchmarks import (
-    BenchmarksResource,
-    AsyncBenchmarksResource,
-    BenchmarksResourceWithRawResponse,
-    AsyncBenchmarksResourceWithRawResponse,
-    BenchmarksResourceWithStreamingResponse,
-    AsyncBenchmarksResourceWithStreamingResponse,
-)
-from .blueprints import (
-    BlueprintsResource,
-    AsyncBlueprintsResource,
-    BlueprintsResourceWithRawResponse,
-    AsyncBlueprintsResourceWithRawResponse,
-    BlueprintsResourceWithStreamingResponse,
-    AsyncBlueprintsResourceWithStreamingResponse,
-)
-from .mcp_configs import (
-    McpConfigsResource,
-    AsyncMcpConfigsResource,
-    McpConfigsResourceWithRawResponse,
-    AsyncMcpConfigsResourceWithRawResponse,
-    McpConfigsResourceWithStreamingResponse,
-    AsyncMcpConfigsResourceWithStreamingResponse,
-)
-from .benchmark_jobs import (
-    BenchmarkJobsResource,
-    AsyncBenchmarkJobsResource,
-    BenchmarkJobsResourceWithRawResponse,
-    AsyncBenchmarkJobsResourceWithRawResponse,
-    BenchmarkJobsResourceWithStreamingResponse,
-    AsyncBenchmarkJobsResourceWithStreamingResponse,
-)
-from .benchmark_runs import (
-    BenchmarkRunsResource,
-    AsyncBenchmarkRunsResource,
-    BenchmarkRunsResourceWithRawResponse,
-    AsyncBenchmarkRunsResourceWithRawResponse,
-    BenchmarkRunsResourceWithStreamingResponse,
-    AsyncBenchmarkRunsResourceWithStreamingResponse,
-)
-from .gateway_configs import (
-    GatewayConfigsResource,
-    AsyncGatewayConfigsResource,
-    GatewayConfigsResourceWithRawResponse,
-    AsyncGatewayConfigsResourceWithRawResponse,
-    GatewayConfigsResourceWithStreamingResponse,
-    AsyncGatewayConfigsResourceWithStreamingResponse,
-)
-from .restricted_keys import (
-    RestrictedKeysResource,
-    AsyncRestrictedKeysResource,
-    RestrictedKeysResourceWithRawResponse,
-    AsyncRestrictedKeysResourceWithRawResponse,
-    RestrictedKeysResourceWithStreamingResponse,
-    AsyncRestrictedKeysResourceWithStreamingResponse,
-)
-from .network_policies import (
-    NetworkPoliciesResource,
-    AsyncNetworkPoliciesResource,
-    NetworkPoliciesResourceWithRawResponse,
-    AsyncNetworkPoliciesResourceWithRawResponse,
-    NetworkPoliciesResourceWithStreamingResponse,
-    AsyncNetworkPoliciesResourceWithStreamingResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .pty import (
+        PtyResource,
+        AsyncPtyResource,
+        PtyResourceWithRawResponse,
+        AsyncPtyResourceWithRawResponse,
+        PtyResourceWithStreamingResponse,
+        AsyncPtyResourceWithStreamingResponse,
+    )
+    from .axons import (
+        AxonsResource,
+        AsyncAxonsResource,
+        AxonsResourceWithRawResponse,
+        AsyncAxonsResourceWithRawResponse,
+        AxonsResourceWithStreamingResponse,
+        AsyncAxonsResourceWithStreamingResponse,
+    )
+    from .agents import (
+        AgentsResource,
+        AsyncAgentsResource,
+        AgentsResourceWithRawResponse,
+        AsyncAgentsResourceWithRawResponse,
+        AgentsResourceWithStreamingResponse,
+        AsyncAgentsResourceWithStreamingResponse,
+    )
+    from .apikeys import (
+        ApikeysResource,
+        AsyncApikeysResource,
+        ApikeysResourceWithRawResponse,
+        AsyncApikeysResourceWithRawResponse,
+        ApikeysResourceWithStreamingResponse,
+        AsyncApikeysResourceWithStreamingResponse,
+    )
+    from .objects import (
+        ObjectsResource,
+        AsyncObjectsResource,
+        ObjectsResourceWithRawResponse,
+        AsyncObjectsResourceWithRawResponse,
+        ObjectsResourceWithStreamingResponse,
+        AsyncObjectsResourceWithStreamingResponse,
+    )
+    from .secrets import (
+        SecretsResource,
+        AsyncSecretsResource,
+        SecretsResourceWithRawResponse,
+        AsyncSecretsResourceWithRawResponse,
+        SecretsResourceWithStreamingResponse,
+        AsyncSecretsResourceWithStreamingResponse,
+    )
+    from .accounts import (
+        AccountsResource,
+        AsyncAccountsResource,
+        AccountsResourceWithRawResponse,
+        AsyncAccountsResourceWithRawResponse,
+        AccountsResourceWithStreamingResponse,
+        AsyncAccountsResourceWithStreamingResponse,
+    )
+    from .devboxes import (
+        DevboxesResource,
+        AsyncDevboxesResource,
+        DevboxesResourceWithRawResponse,
+        AsyncDevboxesResourceWithRawResponse,
+        DevboxesResourceWithStreamingResponse,
+        AsyncDevboxesResourceWithStreamingResponse,
+    )
+    from .scenarios import (
+        ScenariosResource,
+        AsyncScenariosResource,
+        ScenariosResourceWithRawResponse,
+        AsyncScenariosResourceWithRawResponse,
+        ScenariosResourceWithStreamingResponse,
+        AsyncScenariosResourceWithStreamingResponse,
+    )
+    from .benchmarks import (
+        BenchmarksResource,
+        AsyncBenchmarksResource,
+        BenchmarksResourceWithRawResponse,
+        AsyncBenchmarksResourceWithRawResponse,
+        BenchmarksResourceWithStreamingResponse,
+        AsyncBenchmarksResourceWithStreamingResponse,
+    )
+    from .blueprints import (
+        BlueprintsResource,
+        AsyncBlueprintsResource,
+        BlueprintsResourceWithRawResponse,
+        AsyncBlueprintsResourceWithRawResponse,
+        BlueprintsResourceWithStreamingResponse,
+        AsyncBlueprintsResourceWithStreamingResponse,
+    )
+    from .mcp_configs import (
+        McpConfigsResource,
+        AsyncMcpConfigsResource,
+        McpConfigsResourceWithRawResponse,
+        AsyncMcpConfigsResourceWithRawResponse,
+        McpConfigsResourceWithStreamingResponse,
+        AsyncMcpConfigsResourceWithStreamingResponse,
+    )
+    from .benchmark_jobs import (
+        BenchmarkJobsResource,
+        AsyncBenchmarkJobsResource,
+        BenchmarkJobsResourceWithRawResponse,
+        AsyncBenchmarkJobsResourceWithRawResponse,
+        BenchmarkJobsResourceWithStreamingResponse,
+        AsyncBenchmarkJobsResourceWithStreamingResponse,
+    )
+    from .benchmark_runs import (
+        BenchmarkRunsResource,
+        AsyncBenchmarkRunsResource,
+        BenchmarkRunsResourceWithRawResponse,
+        AsyncBenchmarkRunsResourceWithRawResponse,
+        BenchmarkRunsResourceWithStreamingResponse,
+        AsyncBenchmarkRunsResourceWithStreamingResponse,
+    )
+    from .gateway_configs import (
+        GatewayConfigsResource,
+        AsyncGatewayConfigsResource,
+        GatewayConfigsResourceWithRawResponse,
+        AsyncGatewayConfigsResourceWithRawResponse,
+        GatewayConfigsResourceWithStreamingResponse,
+        AsyncGatewayConfigsResourceWithStreamingResponse,
+    )
+    from .restricted_keys import (
+        RestrictedKeysResource,
+        AsyncRestrictedKeysResource,
+        RestrictedKeysResourceWithRawResponse,
+        AsyncRestrictedKeysResourceWithRawResponse,
+        RestrictedKeysResourceWithStreamingResponse,
+        AsyncRestrictedKeysResourceWithStreamingResponse,
+    )
+    from .network_policies import (
+        NetworkPoliciesResource,
+        AsyncNetworkPoliciesResource,
+        NetworkPoliciesResourceWithRawResponse,
+        AsyncNetworkPoliciesResourceWithRawResponse,
+        NetworkPoliciesResourceWithStreamingResponse,
+        AsyncNetworkPoliciesResourceWithStreamingResponse,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "PtyResource": ".pty",
+            "AsyncPtyResource": ".pty",
+            "PtyResourceWithRawResponse": ".pty",
+            "AsyncPtyResourceWithRawResponse": ".pty",
+            "PtyResourceWithStreamingResponse": ".pty",
+            "AsyncPtyResourceWithStreamingResponse": ".pty",
+            "AxonsResource": ".axons",
+            "AsyncAxonsResource": ".axons",
+            "AxonsResourceWithRawResponse": ".axons",
+            "AsyncAxonsResourceWithRawResponse": ".axons",
+            "AxonsResourceWithStreamingResponse": ".axons",
+            "AsyncAxonsResourceWithStreamingResponse": ".axons",
+            "AgentsResource": ".agents",
+            "AsyncAgentsResource": ".agents",
+            "AgentsResourceWithRawResponse": ".agents",
+            "AsyncAgentsResourceWithRawResponse": ".agents",
+            "AgentsResourceWithStreamingResponse": ".agents",
+            "AsyncAgentsResourceWithStreamingResponse": ".agents",
+            "ApikeysResource": ".apikeys",
+            "AsyncApikeysResource": ".apikeys",
+            "ApikeysResourceWithRawResponse": ".apikeys",
+            "AsyncApikeysResourceWithRawResponse": ".apikeys",
+            "ApikeysResourceWithStreamingResponse": ".apikeys",
+            "AsyncApikeysResourceWithStreamingResponse": ".apikeys",
+            "ObjectsResource": ".objects",
+            "AsyncObjectsResource": ".objects",
+            "ObjectsResourceWithRawResponse": ".objects",
+            "AsyncObjectsResourceWithRawResponse": ".objects",
+            "ObjectsResourceWithStreamingResponse": ".objects",
+            "AsyncObjectsResourceWithStreamingResponse": ".objects",
+            "SecretsResource": ".secrets",
+            "AsyncSecretsResource": ".secrets",
+            "SecretsResourceWithRawResponse": ".secrets",
+            "AsyncSecretsResourceWithRawResponse": ".secrets",
+            "SecretsResourceWithStreamingResponse": ".secrets",
+            "AsyncSecretsResourceWithStreamingResponse": ".secrets",
+            "AccountsResource": ".accounts",
+            "AsyncAccountsResource": ".accounts",
+            "AccountsResourceWithRawResponse": ".accounts",
+            "AsyncAccountsResourceWithRawResponse": ".accounts",
+            "AccountsResourceWithStreamingResponse": ".accounts",
+            "AsyncAccountsResourceWithStreamingResponse": ".accounts",
+            "DevboxesResource": ".devboxes",
+            "AsyncDevboxesResource": ".devboxes",
+            "DevboxesResourceWithRawResponse": ".devboxes",
+            "AsyncDevboxesResourceWithRawResponse": ".devboxes",
+            "DevboxesResourceWithStreamingResponse": ".devboxes",
+            "AsyncDevboxesResourceWithStreamingResponse": ".devboxes",
+            "ScenariosResource": ".scenarios",
+            "AsyncScenariosResource": ".scenarios",
+            "ScenariosResourceWithRawResponse": ".scenarios",
+            "AsyncScenariosResourceWithRawResponse": ".scenarios",
+            "ScenariosResourceWithStreamingResponse": ".scenarios",
+            "AsyncScenariosResourceWithStreamingResponse": ".scenarios",
+            "BenchmarksResource": ".benchmarks",
+            "AsyncBenchmarksResource": ".benchmarks",
+            "BenchmarksResourceWithRawResponse": ".benchmarks",
+            "AsyncBenchmarksResourceWithRawResponse": ".benchmarks",
+            "BenchmarksResourceWithStreamingResponse": ".benchmarks",
+            "AsyncBenchmarksResourceWithStreamingResponse": ".benchmarks",
+            "BlueprintsResource": ".blueprints",
+            "AsyncBlueprintsResource": ".blueprints",
+            "BlueprintsResourceWithRawResponse": ".blueprints",
+            "AsyncBlueprintsResourceWithRawResponse": ".blueprints",
+            "BlueprintsResourceWithStreamingResponse": ".blueprints",
+            "AsyncBlueprintsResourceWithStreamingResponse": ".blueprints",
+            "McpConfigsResource": ".mcp_configs",
+            "AsyncMcpConfigsResource": ".mcp_configs",
+            "McpConfigsResourceWithRawResponse": ".mcp_configs",
+            "AsyncMcpConfigsResourceWithRawResponse": ".mcp_configs",
+            "McpConfigsResourceWithStreamingResponse": ".mcp_configs",
+            "AsyncMcpConfigsResourceWithStreamingResponse": ".mcp_configs",
+            "BenchmarkJobsResource": ".benchmark_jobs",
+            "AsyncBenchmarkJobsResource": ".benchmark_jobs",
+            "BenchmarkJobsResourceWithRawResponse": ".benchmark_jobs",
+            "AsyncBenchmarkJobsResourceWithRawResponse": ".benchmark_jobs",
+            "BenchmarkJobsResourceWithStreamingResponse": ".benchmark_jobs",
+            "AsyncBenchmarkJobsResourceWithStreamingResponse": ".benchmark_jobs",
+            "BenchmarkRunsResource": ".benchmark_runs",
+            "AsyncBenchmarkRunsResource": ".benchmark_runs",
+            "BenchmarkRunsResourceWithRawResponse": ".benchmark_runs",
+            "AsyncBenchmarkRunsResourceWithRawResponse": ".benchmark_runs",
+            "BenchmarkRunsResourceWithStreamingResponse": ".benchmark_runs",
+            "AsyncBenchmarkRunsResourceWithStreamingResponse": ".benchmark_runs",
+            "GatewayConfigsResource": ".gateway_configs",
+            "AsyncGatewayConfigsResource": ".gateway_configs",
+            "GatewayConfigsResourceWithRawResponse": ".gateway_configs",
+            "AsyncGatewayConfigsResourceWithRawResponse": ".gateway_configs",
+            "GatewayConfigsResourceWithStreamingResponse": ".gateway_configs",
+            "AsyncGatewayConfigsResourceWithStreamingResponse": ".gateway_configs",
+            "RestrictedKeysResource": ".restricted_keys",
+            "AsyncRestrictedKeysResource": ".restricted_keys",
+            "RestrictedKeysResourceWithRawResponse": ".restricted_keys",
+            "AsyncRestrictedKeysResourceWithRawResponse": ".restricted_keys",
+            "RestrictedKeysResourceWithStreamingResponse": ".restricted_keys",
+            "AsyncRestrictedKeysResourceWithStreamingResponse": ".restricted_keys",
+            "NetworkPoliciesResource": ".network_policies",
+            "AsyncNetworkPoliciesResource": ".network_policies",
+            "NetworkPoliciesResourceWithRawResponse": ".network_policies",
+            "AsyncNetworkPoliciesResourceWithRawResponse": ".network_policies",
+            "NetworkPoliciesResourceWithStreamingResponse": ".network_policies",
+            "AsyncNetworkPoliciesResourceWithStreamingResponse": ".network_policies",
+        },
+    )
 
 __all__ = [
     "AccountsResource",
@@ -1,29 +1,60 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .sql import (
-    SqlResource,
-    AsyncSqlResource,
-    SqlResourceWithRawResponse,
-    AsyncSqlResourceWithRawResponse,
-    SqlResourceWithStreamingResponse,
-    AsyncSqlResourceWithStreamingResponse,
-)
-from .axons import (
-    AxonsResource,
-    AsyncAxonsResource,
-    AxonsResourceWithRawResponse,
-    AsyncAxonsResourceWithRawResponse,
-    AxonsResourceWithStreamingResponse,
-    AsyncAxonsResourceWithStreamingResponse,
-)
-from .events import (
-    EventsResource,
-    AsyncEventsResource,
-    EventsResourceWithRawResponse,
-    AsyncEventsResourceWithRawResponse,
-    EventsResourceWithStreamingResponse,
-    AsyncEventsResourceWithStreamingResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .sql import (
+        SqlResource,
+        AsyncSqlResource,
+        SqlResourceWithRawResponse,
+        AsyncSqlResourceWithRawResponse,
+        SqlResourceWithStreamingResponse,
+        AsyncSqlResourceWithStreamingResponse,
+    )
+    from .axons import (
+        AxonsResource,
+        AsyncAxonsResource,
+        AxonsResourceWithRawResponse,
+        AsyncAxonsResourceWithRawResponse,
+        AxonsResourceWithStreamingResponse,
+        AsyncAxonsResourceWithStreamingResponse,
+    )
+    from .events import (
+        EventsResource,
+        AsyncEventsResource,
+        EventsResourceWithRawResponse,
+        AsyncEventsResourceWithRawResponse,
+        EventsResourceWithStreamingResponse,
+        AsyncEventsResourceWithStreamingResponse,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "SqlResource": ".sql",
+            "AsyncSqlResource": ".sql",
+            "SqlResourceWithRawResponse": ".sql",
+            "AsyncSqlResourceWithRawResponse": ".sql",
+            "SqlResourceWithStreamingResponse": ".sql",
+            "AsyncSqlResourceWithStreamingResponse": ".sql",
+            "AxonsResource": ".axons",
+            "AsyncAxonsResource": ".axons",
+            "AxonsResourceWithRawResponse": ".axons",
+            "AsyncAxonsResourceWithRawResponse": ".axons",
+            "AxonsResourceWithStreamingResponse": ".axons",
+            "AsyncAxonsResourceWithStreamingResponse": ".axons",
+            "EventsResource": ".events",
+            "AsyncEventsResource": ".events",
+            "EventsResourceWithRawResponse": ".events",
+            "AsyncEventsResourceWithRawResponse": ".events",
+            "EventsResourceWithStreamingResponse": ".events",
+            "AsyncEventsResourceWithStreamingResponse": ".events",
+        },
+    )
 
 __all__ = [
     "EventsResource",
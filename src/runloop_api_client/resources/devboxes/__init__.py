@@ -1,37 +1,74 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .logs import (
-    LogsResource,
-    AsyncLogsResource,
-    LogsResourceWithRawResponse,
-    AsyncLogsResourceWithRawResponse,
-    LogsResourceWithStreamingResponse,
-    AsyncLogsResourceWithStreamingResponse,
-)
-from .devboxes import (
-    DevboxesResource,
-    AsyncDevboxesResource,
-    DevboxesResourceWithRawResponse,
-    AsyncDevboxesResourceWithRawResponse,
-    DevboxesResourceWithStreamingResponse,
-    AsyncDevboxesResourceWithStreamingResponse,
-)
-from .executions import (
-    ExecutionsResource,
-    AsyncExecutionsResource,
-    ExecutionsResourceWithRawResponse,
-    AsyncExecutionsResourceWithRawResponse,
-    ExecutionsResourceWithStreamingResponse,
-    AsyncExecutionsResourceWithStreamingResponse,
-)
-from .disk_snapshots import (
-    DiskSnapshotsResource,
-    AsyncDiskSnapshotsResource,
-    DiskSnapshotsResourceWithRawResponse,
-    AsyncDiskSnapshotsResourceWithRawResponse,
-    DiskSnapshotsResourceWithStreamingResponse,
-    AsyncDiskSnapshotsResourceWithStreamingResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .logs import (
+        LogsResource,
+        AsyncLogsResource,
+        LogsResourceWithRawResponse,
+        AsyncLogsResourceWithRawResponse,
+        LogsResourceWithStreamingResponse,
+        AsyncLogsResourceWithStreamingResponse,
+    )
+    from .devboxes import (
+        DevboxesResource,
+        AsyncDevboxesResource,
+        DevboxesResourceWithRawResponse,
+        AsyncDevboxesResourceWithRawResponse,
+        DevboxesResourceWithStreamingResponse,
+        AsyncDevboxesResourceWithStreamingResponse,
+    )
+    from .executions import (
+        ExecutionsResource,
+        AsyncExecutionsResource,
+        ExecutionsResourceWithRawResponse,
+        AsyncExecutionsResourceWithRawResponse,
+        ExecutionsResourceWithStreamingResponse,
+        AsyncExecutionsResourceWithStreamingResponse,
+    )
+    from .disk_snapshots import (
+        DiskSnapshotsResource,
+        AsyncDiskSnapshotsResource,
+        DiskSnapshotsResourceWithRawResponse,
+        AsyncDiskSnapshotsResourceWithRawResponse,
+        DiskSnapshotsResourceWithStreamingResponse,
+        AsyncDiskSnapshotsResourceWithStreamingResponse,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "LogsResource": ".logs",
+            "AsyncLogsResource": ".logs",
+            "LogsResourceWithRawResponse": ".logs",
+            "AsyncLogsResourceWithRawResponse": ".logs",
+            "LogsResourceWithStreamingResponse": ".logs",
+            "AsyncLogsResourceWithStreamingResponse": ".logs",
+            "DevboxesResource": ".devboxes",
+            "AsyncDevboxesResource": ".devboxes",
+            "DevboxesResourceWithRawResponse": ".devboxes",
+            "AsyncDevboxesResourceWithRawResponse": ".devboxes",
+            "DevboxesResourceWithStreamingResponse": ".devboxes",
+            "AsyncDevboxesResourceWithStreamingResponse": ".devboxes",
+            "ExecutionsResource": ".executions",
+            "AsyncExecutionsResource": ".executions",
+            "ExecutionsResourceWithRawResponse": ".executions",
+            "AsyncExecutionsResourceWithRawResponse": ".executions",
+            "ExecutionsResourceWithStreamingResponse": ".executions",
+            "AsyncExecutionsResourceWithStreamingResponse": ".executions",
+            "DiskSnapshotsResource": ".disk_snapshots",
+            "AsyncDiskSnapshotsResource": ".disk_snapshots",
+            "DiskSnapshotsResourceWithRawResponse": ".disk_snapshots",
+            "AsyncDiskSnapshotsResourceWithRawResponse": ".disk_snapshots",
+            "DiskSnapshotsResourceWithStreamingResponse": ".disk_snapshots",
+            "AsyncDiskSnapshotsResourceWithStreamingResponse": ".disk_snapshots",
+        },
+    )
 
 __all__ = [
     "DiskSnapshotsResource",
@@ -1,29 +1,60 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .runs import (
-    RunsResource,
-    AsyncRunsResource,
-    RunsResourceWithRawResponse,
-    AsyncRunsResourceWithRawResponse,
-    RunsResourceWithStreamingResponse,
-    AsyncRunsResourceWithStreamingResponse,
-)
-from .scorers import (
-    ScorersResource,
-    AsyncScorersResource,
-    ScorersResourceWithRawResponse,
-    AsyncScorersResourceWithRawResponse,
-    ScorersResourceWithStreamingResponse,
-    AsyncScorersResourceWithStreamingResponse,
-)
-from .scenarios import (
-    ScenariosResource,
-    AsyncScenariosResource,
-    ScenariosResourceWithRawResponse,
-    AsyncScenariosResourceWithRawResponse,
-    ScenariosResourceWithStreamingResponse,
-    AsyncScenariosResourceWithStreamingResponse,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .runs import (
+        RunsResource,
+        AsyncRunsResource,
+        RunsResourceWithRawResponse,
+        AsyncRunsResourceWithRawResponse,
+        RunsResourceWithStreamingResponse,
+        AsyncRunsResourceWithStreamingResponse,
+    )
+    from .scorers import (
+        ScorersResource,
+        AsyncScorersResource,
+        ScorersResourceWithRawResponse,
+        AsyncScorersResourceWithRawResponse,
+        ScorersResourceWithStreamingResponse,
+        AsyncScorersResourceWithStreamingResponse,
+    )
+    from .scenarios import (
+        ScenariosResource,
+        AsyncScenariosResource,
+        ScenariosResourceWithRawResponse,
+        AsyncScenariosResourceWithRawResponse,
+        ScenariosResourceWithStreamingResponse,
+        AsyncScenariosResourceWithStreamingResponse,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "RunsResource": ".runs",
+            "AsyncRunsResource": ".runs",
+            "RunsResourceWithRawResponse": ".runs",
+            "AsyncRunsResourceWithRawResponse": ".runs",
+            "RunsResourceWithStreamingResponse": ".runs",
+            "AsyncRunsResourceWithStreamingResponse": ".runs",
+            "ScorersResource": ".scorers",
+            "AsyncScorersResource": ".scorers",
+            "ScorersResourceWithRawResponse": ".scorers",
+            "AsyncScorersResourceWithRawResponse": ".scorers",
+            "ScorersResourceWithStreamingResponse": ".scorers",
+            "AsyncScorersResourceWithStreamingResponse": ".scorers",
+            "ScenariosResource": ".scenarios",
+            "AsyncScenariosResource": ".scenarios",
+            "ScenariosResourceWithRawResponse": ".scenarios",
+            "AsyncScenariosResourceWithRawResponse": ".scenarios",
+            "ScenariosResourceWithStreamingResponse": ".scenarios",
+            "AsyncScenariosResourceWithStreamingResponse": ".scenarios",
+        },
+    )
 
 __all__ = [
     "RunsResource",
@@ -5,75 +5,160 @@ Provides both sync (`RunloopSDK`) and async (`AsyncRunloopSDK`) interfaces.
 
 from __future__ import annotations
 
-from .axon import Axon, AxonSqlOps
-from .sync import (
-    AxonOps,
-    AgentOps,
-    DevboxOps,
-    ScorerOps,
-    SecretOps,
-    RunloopSDK,
-    ScenarioOps,
-    SnapshotOps,
-    BenchmarkOps,
-    BlueprintOps,
-    McpConfigOps,
-    GatewayConfigOps,
-    NetworkPolicyOps,
-    StorageObjectOps,
-)
-from .agent import Agent
-from ._types import ScenarioPreview
-from .async_ import (
-    AsyncAxonOps,
-    AsyncAgentOps,
-    AsyncDevboxOps,
-    AsyncScorerOps,
-    AsyncSecretOps,
-    AsyncRunloopSDK,
-    AsyncScenarioOps,
-    AsyncSnapshotOps,
-    AsyncBenchmarkOps,
-    AsyncBlueprintOps,
-    AsyncMcpConfigOps,
-    AsyncGatewayConfigOps,
-    AsyncNetworkPolicyOps,
-    AsyncStorageObjectOps,
-)
-from .devbox import Devbox, NamedShell
-from .scorer import Scorer
-from .secret import Secret
-from .scenario import Scenario
-from .snapshot import Snapshot
-from .benchmark import Benchmark
-from .blueprint import Blueprint
-from .execution import Execution
-from .async_axon import AsyncAxon, AsyncAxonSqlOps
-from .mcp_config import McpConfig
-from .async_agent import AsyncAgent
-from .async_devbox import AsyncDevbox, AsyncNamedShell
-from .async_scorer import AsyncScorer
-from .async_secret import AsyncSecret
-from .scenario_run import ScenarioRun
-from .benchmark_run import BenchmarkRun
-from .async_scenario import AsyncScenario
-from .async_snapshot import AsyncSnapshot
-from .gateway_config import GatewayConfig
-from .network_policy import NetworkPolicy
-from .storage_object import StorageObject
-from .async_benchmark import AsyncBenchmark
-from .async_blueprint import AsyncBlueprint
-from .async_execution import AsyncExecution
-from .async_mcp_config import AsyncMcpConfig
-from .execution_result import ExecutionResult
-from .scenario_builder import ScenarioBuilder
-from .async_scenario_run import AsyncScenarioRun
-from .async_benchmark_run import AsyncBenchmarkRun
-from .async_gateway_config import AsyncGatewayConfig
-from .async_network_policy import AsyncNetworkPolicy
-from .async_storage_object import AsyncStorageObject
-from .async_execution_result import AsyncExecutionResult
-from .async_scenario_builder import AsyncScenarioBuilder
+from typing import TYPE_CHECKING
+
+from .._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .axon import Axon, AxonSqlOps
+    from .sync import (
+        AxonOps,
+        AgentOps,
+        DevboxOps,
+        ScorerOps,
+        SecretOps,
+        RunloopSDK,
+        ScenarioOps,
+        SnapshotOps,
+        BenchmarkOps,
+        BlueprintOps,
+        McpConfigOps,
+        GatewayConfigOps,
+        NetworkPolicyOps,
+        StorageObjectOps,
+    )
+    from .agent import Agent
+    from ._types import ScenarioPreview
+    from .async_ import (
+        AsyncAxonOps,
+        AsyncAgentOps,
+        AsyncDevboxOps,
+        AsyncScorerOps,
+        AsyncSecretOps,
+        AsyncRunloopSDK,
+        AsyncScenarioOps,
+        AsyncSnapshotOps,
+        AsyncBenchmarkOps,
+        AsyncBlueprintOps,
+        AsyncMcpConfigOps,
+        AsyncGatewayConfigOps,
+        AsyncNetworkPolicyOps,
+        AsyncStorageObjectOps,
+    )
+    from .devbox import Devbox, NamedShell
+    from .scorer import Scorer
+    from .secret import Secret
+    from .scenario import Scenario
+    from .snapshot import Snapshot
+    from .benchmark import Benchmark
+    from .blueprint import Blueprint
+    from .execution import Execution
+    from .async_axon import AsyncAxon, AsyncAxonSqlOps
+    from .mcp_config import McpConfig
+    from .async_agent import AsyncAgent
+    from .async_devbox import AsyncDevbox, AsyncNamedShell
+    from .async_scorer import AsyncScorer
+    from .async_secret import AsyncSecret
+    from .devbox_watch import DevboxWatch, DevboxWatchEvent
+    from .scenario_run import ScenarioRun
+    from .benchmark_run import BenchmarkRun
+    from .async_scenario import AsyncScenario
+    from .async_snapshot import AsyncSnapshot
+    from .gateway_config import GatewayConfig
+    from .network_policy import NetworkPolicy
+    from .storage_object import StorageObject
+    from .async_benchmark import AsyncBenchmark
+    from .async_blueprint import AsyncBlueprint
+    from .async_execution import AsyncExecution
+    from .async_mcp_config import AsyncMcpConfig
+    from .execution_result import ExecutionResult
+    from .scenario_builder import ScenarioBuilder
+    from .async_devbox_watch import AsyncDevboxWatch
+    from .async_scenario_run import AsyncScenarioRun
+    from .async_benchmark_run import AsyncBenchmarkRun
+    from .async_gateway_config import AsyncGatewayConfig
+    from .async_network_policy import AsyncNetworkPolicy
+    from .async_storage_object import AsyncStorageObject
+    from .async_execution_result import AsyncExecutionResult
+    from .async_scenario_builder import AsyncScenarioBuilder
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "Axon": ".axon",
+            "AxonSqlOps": ".axon",
+            "AxonOps": ".sync",
+            "AgentOps": ".sync",
+            "DevboxOps": ".sync",
+            "ScorerOps": ".sync",
+            "SecretOps": ".sync",
+            "RunloopSDK": ".sync",
+            "ScenarioOps": ".sync",
+            "SnapshotOps": ".sync",
+            "BenchmarkOps": ".sync",
+            "BlueprintOps": ".sync",
+            "McpConfigOps": ".sync",
+            "GatewayConfigOps": ".sync",
+            "NetworkPolicyOps": ".sync",
+            "StorageObjectOps": ".sync",
+            "Agent": ".agent",
+            "ScenarioPreview": "._types",
+            "AsyncAxonOps": ".async_",
+            "AsyncAgentOps": ".async_",
+            "AsyncDevboxOps": ".async_",
+            "AsyncScorerOps": ".async_",
+            "AsyncSecretOps": ".async_",
+            "AsyncRunloopSDK": ".async_",
+            "AsyncScenarioOps": ".async_",
+            "AsyncSnapshotOps": ".async_",
+            "AsyncBenchmarkOps": ".async_",
+            "AsyncBlueprintOps": ".async_",
+            "AsyncMcpConfigOps": ".async_",
+            "AsyncGatewayConfigOps": ".async_",
+            "AsyncNetworkPolicyOps": ".async_",
+            "AsyncStorageObjectOps": ".async_",
+            "Devbox": ".devbox",
+            "NamedShell": ".devbox",
+            "Scorer": ".scorer",
+            "Secret": ".secret",
+            "Scenario": ".scenario",
+            "Snapshot": ".snapshot",
+            "Benchmark": ".benchmark",
+            "Blueprint": ".blueprint",
+            "Execution": ".execution",
+            "AsyncAxon": ".async_axon",
+            "AsyncAxonSqlOps": ".async_axon",
+            "McpConfig": ".mcp_config",
+            "DevboxWatch": ".devbox_watch",
+            "DevboxWatchEvent": ".devbox_watch",
+            "AsyncAgent": ".async_agent",
+            "AsyncDevbox": ".async_devbox",
+            "AsyncNamedShell": ".async_devbox",
+            "AsyncScorer": ".async_scorer",
+            "AsyncSecret": ".async_secret",
+            "ScenarioRun": ".scenario_run",
+            "BenchmarkRun": ".benchmark_run",
+            "AsyncScenario": ".async_scenario",
+            "AsyncSnapshot": ".async_snapshot",
+            "GatewayConfig": ".gateway_config",
+            "NetworkPolicy": ".network_policy",
+            "StorageObject": ".storage_object",
+            "AsyncBenchmark": ".async_benchmark",
+            "AsyncBlueprint": ".async_blueprint",
+            "AsyncExecution": ".async_execution",
+            "AsyncMcpConfig": ".async_mcp_config",
+            "AsyncDevboxWatch": ".async_devbox_watch",
+            "ExecutionResult": ".execution_result",
+            "ScenarioBuilder": ".scenario_builder",
+            "AsyncScenarioRun": ".async_scenario_run",
+            "AsyncBenchmarkRun": ".async_benchmark_run",
+            "AsyncGatewayConfig": ".async_gateway_config",
+            "AsyncNetworkPolicy": ".async_network_policy",
+            "AsyncStorageObject": ".async_storage_object",
+            "AsyncExecutionResult": ".async_execution_result",
+            "AsyncScenarioBuilder": ".async_scenario_builder",
+        },
+    )
 
 __all__ = [
     # Main SDK entry points
@@ -120,6 +205,9 @@ __all__ = [
     "AsyncBenchmarkRun",
     "Devbox",
     "AsyncDevbox",
+    "DevboxWatch",
+    "AsyncDevboxWatch",
+    "DevboxWatchEvent",
     "Execution",
     "AsyncExecution",
     "ExecutionResult",
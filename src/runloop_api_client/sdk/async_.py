@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Mapping, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 from pathlib import Path
 from datetime import timedelta
 from typing_extensions import Unpack
@@ -38,21 +38,31 @@ from ._types import (
     SDKNetworkPolicyCreateParams,
     SDKDevboxCreateFromImageParams,
 )
-from .._types import Timeout, NotGiven, not_given
+from .._types import Timeout, NotGiven, ShardSelector, ShardSelectionPolicy, not_given
 from .._client import DEFAULT_MAX_RETRIES, AsyncRunloop
 from ._helpers import detect_content_type
 from .async_axon import AsyncAxon
-from .._constants import DEFAULT_API_POOL_SHARDS, DEFAULT_TRANSFER_POOL_SHARDS, DEFAULT_BACKGROUND_POOL_SHARDS
+from .._constants import (
+    DEFAULT_API_POOL_SHARDS,
+    DEFAULT_MAX_API_POOL_SHARDS,
+    DEFAULT_TRANSFER_POOL_SHARDS,
+    DEFAULT_BACKGROUND_POOL_SHARDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+    DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+)
 from .async_agent import AsyncAgent
 from .async_devbox import AsyncDevbox
 from .async_scorer import AsyncScorer
 from .async_secret import AsyncSecret
+from .._base_client import PoolRoute, PoolConfig, ShardWarmUp
 from .async_scenario import AsyncScenario
 from .async_snapshot import AsyncSnapshot
 from .async_benchmark import AsyncBenchmark
 from .async_blueprint import AsyncBlueprint
 from .async_mcp_config import AsyncMcpConfig
 from ..types.secret_view import SecretView
+from .async_devbox_watch import AsyncDevboxWatch
 from ..lib.context_loader import TarFilter, build_directory_tar
 from .async_gateway_config import AsyncGatewayConfig
 from .async_network_policy import AsyncNetworkPolicy
@@ -185,6 +195,32 @@ class AsyncDevboxOps:
         )
         return [AsyncDevbox(self._client, item.id) for item in page.devboxes]
 
+    def watch(
+        self,
+        *,
+        interval_seconds: float = 5.0,
+        page_size: int = 100,
+        evictions: bool = False,
+    ) -> AsyncDevboxWatch:
+        """Follow the live devboxes of the account as a feed of add/change/remove events.
+
+        The watch keeps a local index of the devboxes by ID, available as
+        ``watch.devboxes``. The first refresh reports every live devbox as
+        ``added``; later refreshes report only what changed.
+
+        :param interval_seconds: Time between the start of two refreshes, defaults to 5.0
+        :type interval_seconds: float, optional
+        :param page_size: Devboxes requested per page while listing, defaults to 100
+        :type page_size: int, optional
+        :param evictions: Also emit ``eviction`` events from the pending eviction stream, defaults to False
+        :type evictions: bool, optional
+        :return: Watch to iterate over; close it, or use it as a context manager, to stop
+        :rtype: AsyncDevboxWatch
+        """
+        return AsyncDevboxWatch(
+            self._client, interval_seconds=interval_seconds, page_size=page_size, evictions=evictions
+        )
+
 
 class AsyncSnapshotOps:
     """High-level async manager for working with disk snapshots.
@@ -1333,6 +1369,25 @@ class AsyncRunloopSDK:
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool = False,
+        retry_budget_ratio: float | None = None,
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        hedge_budget: float | None = None,
+        lazy_models: bool = False,
+        page_prefetch: int = 0,
     ) -> None:
         """Configure the asynchronous SDK wrapper.
 
@@ -1350,12 +1405,50 @@ class AsyncRunloopSDK:
         :type default_query: Mapping[str, object] | None, optional
         :param http_client: Custom ``httpx.AsyncClient`` instance to reuse, defaults to None
         :type http_client: httpx.AsyncClient | None, optional
-        :param api_pool_shards: H2 shards for short RPCs (round-robin), defaults to 8
+        :param api_pool_shards: Base H2 shards for short RPCs, defaults to 8
         :type api_pool_shards: int, optional
-        :param background_pool_shards: H2 shards for long-polls (round-robin), defaults to 16
+        :param background_pool_shards: Base H2 shards for long-polls, defaults to 16
         :type background_pool_shards: int, optional
-        :param transfer_pool_shards: H2 shards for upload/download (round-robin), defaults to 2
+        :param transfer_pool_shards: Base H2 shards for upload/download, defaults to 2
         :type transfer_pool_shards: int, optional
+        :param max_api_pool_shards: Autoscaling ceiling for API shards, defaults to 32
+        :type max_api_pool_shards: int, optional
+        :param max_background_pool_shards: Autoscaling ceiling for long-poll shards, defaults to 64
+        :type max_background_pool_shards: int, optional
+        :param max_transfer_pool_shards: Autoscaling ceiling for transfer shards, defaults to 4
+        :type max_transfer_pool_shards: int, optional
+        :param shard_selection: How requests are spread across shards, defaults to "least_outstanding"
+        :type shard_selection: ShardSelectionPolicy | ShardSelector, optional
+        :param max_concurrent_api_requests: Cap on in-flight API requests, defaults to None (no cap)
+        :type max_concurrent_api_requests: int | None, optional
+        :param max_concurrent_background_requests: Cap on in-flight long-polls, defaults to None (no cap)
+        :type max_concurrent_background_requests: int | None, optional
+        :param max_concurrent_transfer_requests: Cap on in-flight uploads/downloads, defaults to None (no cap)
+        :type max_concurrent_transfer_requests: int | None, optional
+        :param max_queue_time: Seconds a request may wait for a free slot, defaults to None (wait indefinitely)
+        :type max_queue_time: float | None, optional
+        :param pools: Extra named pools or overrides of the built-in ones, defaults to None
+        :type pools: Mapping[str, PoolConfig] | None, optional
+        :param pool_routes: Path/method routes to named pools, tried before the built-in routes, defaults to None
+        :type pool_routes: Sequence[PoolRoute] | None, optional
+        :param coalesce_requests: Share one HTTP call between concurrent identical GETs, defaults to False
+        :type coalesce_requests: bool, optional
+        :param coalesce_exclude: URL path regexes that are never coalesced, defaults to None
+        :type coalesce_exclude: Sequence[str] | None, optional
+        :param adaptive_rate_limit: Pace requests to the server's advertised rate-limit budget, defaults to False
+        :type adaptive_rate_limit: bool, optional
+        :param retry_budget_ratio: Cap retries at this fraction of recent successful responses, defaults to None
+        :type retry_budget_ratio: float | None, optional
+        :param circuit_breaker_threshold: Consecutive failures that open an endpoint's circuit, defaults to None
+        :type circuit_breaker_threshold: int | None, optional
+        :param circuit_breaker_cooldown: Seconds an open circuit fails fast before probing, defaults to 30
+        :type circuit_breaker_cooldown: float, optional
+        :param hedge_budget: Hedge slow GETs on another shard, adding at most this fraction of load, defaults to None
+        :type hedge_budget: float | None, optional
+        :param lazy_models: Build response model fields on first access instead of upfront, defaults to False
+        :type lazy_models: bool, optional
+        :param page_prefetch: Pages to fetch ahead in the background while iterating list results, defaults to 0
+        :type page_prefetch: int, optional
         """
         self.api = AsyncRunloop(
             bearer_token=bearer_token,
@@ -1368,6 +1461,25 @@ class AsyncRunloopSDK:
             api_pool_shards=api_pool_shards,
             background_pool_shards=background_pool_shards,
             transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            shard_selection=shard_selection,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+            pools=pools,
+            pool_routes=pool_routes,
+            coalesce_requests=coalesce_requests,
+            coalesce_exclude=coalesce_exclude,
+            adaptive_rate_limit=adaptive_rate_limit,
+            retry_budget_ratio=retry_budget_ratio,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_cooldown=circuit_breaker_cooldown,
+            hedge_budget=hedge_budget,
+            lazy_models=lazy_models,
+            page_prefetch=page_prefetch,
         )
 
         self.agent = AsyncAgentOps(self.api)
@@ -1384,6 +1496,17 @@ class AsyncRunloopSDK:
         self.snapshot = AsyncSnapshotOps(self.api)
         self.storage_object = AsyncStorageObjectOps(self.api)
 
+    async def warm_up(self) -> List[ShardWarmUp]:
+        """Open every pooled HTTP/2 connection concurrently before the first real request.
+
+        Useful right after start-up so the first burst of calls does not pay for
+        TLS and HTTP/2 setup one shard at a time.
+
+        :return: Per-shard handshake timings; failed shards carry the error instead of raising
+        :rtype: List[ShardWarmUp]
+        """
+        return await self.api.warm_up()
+
     async def aclose(self) -> None:
         """Close the underlying HTTP client and release resources."""
         await self.api.close()
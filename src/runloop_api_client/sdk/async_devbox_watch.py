@@ -0,0 +1,159 @@
+"""Async change feed over the live devboxes of an account."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import TracebackType, MappingProxyType
+from typing import Dict, List, Union, Mapping, Optional
+from typing_extensions import AsyncIterator
+
+from ..types import DevboxView
+from .._client import AsyncRunloop
+from .._streaming import AsyncStream
+from .._exceptions import NotFoundError
+from .devbox_watch import LIVE_STATUSES, DevboxWatchEvent, _DevboxIndex
+from ..lib.scan_async import async_scan
+from ..types.devbox_eviction_event_view import DevboxEvictionEventView
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDevboxWatch:
+    """Async iterator of changes to the live devboxes of the account. Created by ``AsyncDevboxOps.watch()``.
+
+    Each refresh lists the live statuses concurrently, and looks up a tracked
+    devbox that drops out of the listing on its own to tell whether it changed
+    status, finished or was deleted. Devboxes that are created and finish
+    between two refreshes are not reported.
+
+    Example:
+        >>> async with runloop.devbox.watch(interval_seconds=5) as watch:
+        ...     async for event in watch:
+        ...         print(event.type, event.devbox_id)
+    """
+
+    def __init__(self, client: AsyncRunloop, *, interval_seconds: float, page_size: int, evictions: bool) -> None:
+        """Initialize the watch, nothing is requested until it is iterated or polled.
+
+        :param client: Generated AsyncRunloop client to list devboxes with
+        :type client: AsyncRunloop
+        :param interval_seconds: Time between the start of two refreshes
+        :type interval_seconds: float
+        :param page_size: Devboxes requested per page while listing
+        :type page_size: int
+        :param evictions: Whether to also subscribe to pending eviction events
+        :type evictions: bool
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        self._client = client
+        self._interval_seconds = interval_seconds
+        self._page_size = page_size
+        self._evictions = evictions
+        self._index = _DevboxIndex()
+        self._closed = False
+        self._eviction_events: Optional[asyncio.Queue[Union[DevboxEvictionEventView, None]]] = None
+        self._eviction_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def devboxes(self) -> Mapping[str, DevboxView]:
+        """Read-only view of the live devboxes as of the last refresh, by ID."""
+        return MappingProxyType(self._index.devboxes)
+
+    async def poll(self) -> List[DevboxWatchEvent]:
+        """Refresh the index once and return the changes since the previous refresh.
+
+        :return: Events in the order they were detected
+        :rtype: list[DevboxWatchEvent]
+        """
+        listed: Dict[str, DevboxView] = {}
+        async for view in async_scan(
+            self._client.devboxes.list,
+            [{"status": status} for status in LIVE_STATUSES],
+            limit=self._page_size,
+            include_total_count=False,
+        ):
+            listed[view.id] = view
+
+        events, missing = self._index.sync(listed)
+        for devbox_id, current in zip(missing, await asyncio.gather(*(self._retrieve(i) for i in missing))):
+            event = self._index.resolve(devbox_id, current)
+            if event is not None:
+                events.append(event)
+        return events
+
+    async def _retrieve(self, devbox_id: str) -> Optional[DevboxView]:
+        try:
+            return await self._client.devboxes.retrieve(devbox_id)
+        except NotFoundError:
+            return None
+
+    async def __aiter__(self) -> AsyncIterator[DevboxWatchEvent]:
+        loop = asyncio.get_running_loop()
+        if self._evictions and self._eviction_task is None:
+            self._eviction_events = asyncio.Queue()
+            self._eviction_task = asyncio.create_task(self._watch_evictions(self._eviction_events))
+
+        try:
+            while not self._closed:
+                next_refresh = loop.time() + self._interval_seconds
+                for event in await self.poll():
+                    yield event
+                while not self._closed:
+                    remaining = next_refresh - loop.time()
+                    if remaining <= 0:
+                        break
+                    if self._eviction_events is None:
+                        await asyncio.sleep(remaining)
+                        continue
+                    try:
+                        eviction = await asyncio.wait_for(self._eviction_events.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    watch_event = self._index.eviction(eviction) if eviction is not None else None
+                    if watch_event is not None:
+                        yield watch_event
+        finally:
+            await self.close()
+
+    async def _watch_evictions(self, events: asyncio.Queue[Union[DevboxEvictionEventView, None]]) -> None:
+        while not self._closed:
+            try:
+                stream: AsyncStream[DevboxEvictionEventView] = await self._client.devboxes.watch_evictions()
+                async with stream:
+                    async for eviction in stream:
+                        events.put_nowait(eviction)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("devbox eviction stream failed, reconnecting", exc_info=True)
+            await asyncio.sleep(self._interval_seconds)
+
+    async def close(self) -> None:
+        """Stop watching: iteration ends and the eviction stream, if any, is closed."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._eviction_events is not None:
+            self._eviction_events.put_nowait(None)
+        task = self._eviction_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> AsyncDevboxWatch:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -0,0 +1,244 @@
+"""Change feed over the live devboxes of an account."""
+
+from __future__ import annotations
+
+import time
+import queue
+import logging
+import threading
+from types import TracebackType, MappingProxyType
+from typing import Dict, List, Tuple, Union, Mapping, Iterator, Optional
+from dataclasses import dataclass
+from typing_extensions import Literal
+from concurrent.futures import ThreadPoolExecutor
+
+from ..types import DevboxView
+from .._client import Runloop
+from .._streaming import Stream
+from .._exceptions import NotFoundError
+from ..types.devbox_eviction_event_view import DevboxEvictionEventView
+
+logger = logging.getLogger(__name__)
+
+LiveStatus = Literal[
+    "scheduled", "queued", "provisioning", "initializing", "running", "suspending", "suspended", "resuming"
+]
+
+LIVE_STATUSES: Tuple[LiveStatus, ...] = (
+    "scheduled",
+    "queued",
+    "provisioning",
+    "initializing",
+    "running",
+    "suspending",
+    "suspended",
+    "resuming",
+)
+"""Statuses a devbox can still move on from; `failure` and `shutdown` are final."""
+
+
+@dataclass(frozen=True)
+class DevboxWatchEvent:
+    """One change to the live devboxes of the account, emitted by ``DevboxOps.watch()``.
+
+    - ``added``: a devbox entered a live status; the initial listing reports every live devbox this way
+    - ``changed``: a live devbox was updated, ``previous`` holds the view it replaced
+    - ``removed``: a devbox reached ``failure``/``shutdown`` or no longer exists; ``devbox`` is its
+      final view, or the last one seen when it is gone
+    - ``eviction``: the devbox has a pending infrastructure eviction at ``eviction_deadline_ms``
+    """
+
+    type: Literal["added", "changed", "removed", "eviction"]
+    devbox_id: str
+    devbox: Optional[DevboxView] = None
+    """The devbox after the change; for an eviction the last view seen, if any."""
+    previous: Optional[DevboxView] = None
+    eviction_deadline_ms: Optional[int] = None
+
+
+class _DevboxIndex:
+    """The live devboxes by ID, turning listings and lookups into change events."""
+
+    def __init__(self) -> None:
+        self.devboxes: Dict[str, DevboxView] = {}
+        self._evictions: Dict[str, int] = {}
+
+    def sync(self, listed: Mapping[str, DevboxView]) -> Tuple[List[DevboxWatchEvent], List[str]]:
+        """Applies a listing of every live devbox, returning the events and the devboxes missing from it."""
+        events: List[DevboxWatchEvent] = []
+        for devbox_id, view in listed.items():
+            previous = self.devboxes.get(devbox_id)
+            if previous is None:
+                events.append(DevboxWatchEvent("added", devbox_id, view))
+            elif previous != view:
+                events.append(DevboxWatchEvent("changed", devbox_id, view, previous))
+            self.devboxes[devbox_id] = view
+        return events, [devbox_id for devbox_id in self.devboxes if devbox_id not in listed]
+
+    def resolve(self, devbox_id: str, view: Optional[DevboxView]) -> Optional[DevboxWatchEvent]:
+        """Applies the current view of a devbox that dropped out of the listing, `None` when it is gone."""
+        previous = self.devboxes[devbox_id]
+        if view is None or view.status not in LIVE_STATUSES:
+            del self.devboxes[devbox_id]
+            self._evictions.pop(devbox_id, None)
+            return DevboxWatchEvent("removed", devbox_id, view or previous, previous if view else None)
+
+        # it moved between two of the status listings, or back after a brief detour
+        self.devboxes[devbox_id] = view
+        if previous != view:
+            return DevboxWatchEvent("changed", devbox_id, view, previous)
+        return None
+
+    def eviction(self, event: DevboxEvictionEventView) -> Optional[DevboxWatchEvent]:
+        # the stream replays every pending eviction when it reconnects
+        if self._evictions.get(event.devbox_id) == event.eviction_deadline_ms:
+            return None
+        self._evictions[event.devbox_id] = event.eviction_deadline_ms
+        return DevboxWatchEvent(
+            "eviction",
+            event.devbox_id,
+            self.devboxes.get(event.devbox_id),
+            eviction_deadline_ms=event.eviction_deadline_ms,
+        )
+
+
+class DevboxWatch:
+    """Iterator of changes to the live devboxes of the account. Created by ``DevboxOps.watch()``.
+
+    Each refresh lists only the devboxes in a live status, so its cost follows the
+    size of the running fleet rather than every devbox ever created. The statuses
+    are listed concurrently, and a tracked devbox that drops out of the listing is
+    looked up on its own to tell whether it changed status, finished or was deleted. Devboxes that are created and
+    finish between two refreshes are not reported.
+
+    Example:
+        >>> with runloop.devbox.watch(interval_seconds=5) as watch:
+        ...     for event in watch:
+        ...         print(event.type, event.devbox_id)
+    """
+
+    def __init__(self, client: Runloop, *, interval_seconds: float, page_size: int, evictions: bool) -> None:
+        """Initialize the watch, nothing is requested until it is iterated or polled.
+
+        :param client: Generated Runloop client to list devboxes with
+        :type client: Runloop
+        :param interval_seconds: Time between the start of two refreshes
+        :type interval_seconds: float
+        :param page_size: Devboxes requested per page while listing
+        :type page_size: int
+        :param evictions: Whether to also subscribe to pending eviction events
+        :type evictions: bool
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        self._client = client
+        self._interval_seconds = interval_seconds
+        self._page_size = page_size
+        self._evictions = evictions
+        self._index = _DevboxIndex()
+        self._closed = threading.Event()
+        self._eviction_events: queue.SimpleQueue[Union[DevboxEvictionEventView, None]] = queue.SimpleQueue()
+        self._eviction_stream: Optional[Stream[DevboxEvictionEventView]] = None
+        self._eviction_thread: Optional[threading.Thread] = None
+
+    @property
+    def devboxes(self) -> Mapping[str, DevboxView]:
+        """Read-only view of the live devboxes as of the last refresh, by ID."""
+        return MappingProxyType(self._index.devboxes)
+
+    def poll(self) -> List[DevboxWatchEvent]:
+        """Refresh the index once and return the changes since the previous refresh.
+
+        :return: Events in the order they were detected
+        :rtype: list[DevboxWatchEvent]
+        """
+        # one listing per status, since the list endpoint filters on a single one
+        with ThreadPoolExecutor(max_workers=len(LIVE_STATUSES), thread_name_prefix="runloop-devbox-watch") as executor:
+            listed: Dict[str, DevboxView] = {}
+            for views in executor.map(self._list, LIVE_STATUSES):
+                for view in views:
+                    listed[view.id] = view
+
+            events, missing = self._index.sync(listed)
+            for devbox_id, current in zip(missing, executor.map(self._retrieve, missing)):
+                event = self._index.resolve(devbox_id, current)
+                if event is not None:
+                    events.append(event)
+        return events
+
+    def _list(self, status: LiveStatus) -> List[DevboxView]:
+        return list(self._client.devboxes.list(status=status, limit=self._page_size, include_total_count=False))
+
+    def _retrieve(self, devbox_id: str) -> Optional[DevboxView]:
+        try:
+            return self._client.devboxes.retrieve(devbox_id)
+        except NotFoundError:
+            return None
+
+    def __iter__(self) -> Iterator[DevboxWatchEvent]:
+        if self._evictions and self._eviction_thread is None:
+            self._eviction_thread = threading.Thread(
+                target=self._watch_evictions, name="runloop-devbox-watch-evictions", daemon=True
+            )
+            self._eviction_thread.start()
+
+        try:
+            while not self._closed.is_set():
+                next_refresh = time.monotonic() + self._interval_seconds
+                yield from self.poll()
+                while not self._closed.is_set():
+                    remaining = next_refresh - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if not self._evictions:
+                        self._closed.wait(remaining)
+                        continue
+                    try:
+                        eviction = self._eviction_events.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    event = self._index.eviction(eviction) if eviction is not None else None
+                    if event is not None:
+                        yield event
+        finally:
+            self.close()
+
+    def _watch_evictions(self) -> None:
+        while not self._closed.is_set():
+            try:
+                with self._client.devboxes.watch_evictions() as stream:
+                    self._eviction_stream = stream
+                    for eviction in stream:
+                        if self._closed.is_set():
+                            return
+                        self._eviction_events.put(eviction)
+            except Exception:
+                if not self._closed.is_set():
+                    logger.warning("devbox eviction stream failed, reconnecting", exc_info=True)
+            self._closed.wait(self._interval_seconds)
+
+    def close(self) -> None:
+        """Stop watching: iteration ends and the eviction stream, if any, is closed."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._eviction_events.put(None)
+        stream = self._eviction_stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                logger.debug("error closing the devbox eviction stream", exc_info=True)
+
+    def __enter__(self) -> DevboxWatch:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
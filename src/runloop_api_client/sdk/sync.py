@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Optional
+from typing import Dict, List, Mapping, Optional, Sequence
 from pathlib import Path
 from datetime import timedelta
 from typing_extensions import Unpack
@@ -42,7 +42,7 @@ from ._types import (
 from .devbox import Devbox
 from .scorer import Scorer
 from .secret import Secret
-from .._types import Timeout, NotGiven, not_given
+from .._types import Timeout, NotGiven, ShardSelector, ShardSelectionPolicy, not_given
 from .._client import DEFAULT_MAX_RETRIES, Runloop
 from ._helpers import detect_content_type
 from .scenario import Scenario
@@ -50,7 +50,17 @@ from .snapshot import Snapshot
 from .benchmark import Benchmark
 from .blueprint import Blueprint
 from .mcp_config import McpConfig
-from .._constants import DEFAULT_API_POOL_SHARDS, DEFAULT_TRANSFER_POOL_SHARDS, DEFAULT_BACKGROUND_POOL_SHARDS
+from .._constants import (
+    DEFAULT_API_POOL_SHARDS,
+    DEFAULT_MAX_API_POOL_SHARDS,
+    DEFAULT_TRANSFER_POOL_SHARDS,
+    DEFAULT_BACKGROUND_POOL_SHARDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+    DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+)
+from .devbox_watch import DevboxWatch
+from .._base_client import PoolRoute, PoolConfig, ShardWarmUp
 from .gateway_config import GatewayConfig
 from .network_policy import NetworkPolicy
 from .storage_object import StorageObject
@@ -184,6 +194,30 @@ class DevboxOps:
         )
         return [Devbox(self._client, item.id) for item in page.devboxes]
 
+    def watch(
+        self,
+        *,
+        interval_seconds: float = 5.0,
+        page_size: int = 100,
+        evictions: bool = False,
+    ) -> DevboxWatch:
+        """Follow the live devboxes of the account as a feed of add/change/remove events.
+
+        The watch keeps a local index of the devboxes by ID, available as
+        ``watch.devboxes``. The first refresh reports every live devbox as
+        ``added``; later refreshes report only what changed.
+
+        :param interval_seconds: Time between the start of two refreshes, defaults to 5.0
+        :type interval_seconds: float, optional
+        :param page_size: Devboxes requested per page while listing, defaults to 100
+        :type page_size: int, optional
+        :param evictions: Also emit ``eviction`` events from the pending eviction stream, defaults to False
+        :type evictions: bool, optional
+        :return: Watch to iterate over; close it, or use it as a context manager, to stop
+        :rtype: DevboxWatch
+        """
+        return DevboxWatch(self._client, interval_seconds=interval_seconds, page_size=page_size, evictions=evictions)
+
 
 class SnapshotOps:
     """High-level manager for working with disk snapshots.
@@ -1358,6 +1392,25 @@ class RunloopSDK:
         api_pool_shards: int = DEFAULT_API_POOL_SHARDS,
         background_pool_shards: int = DEFAULT_BACKGROUND_POOL_SHARDS,
         transfer_pool_shards: int = DEFAULT_TRANSFER_POOL_SHARDS,
+        max_api_pool_shards: int = DEFAULT_MAX_API_POOL_SHARDS,
+        max_background_pool_shards: int = DEFAULT_MAX_BACKGROUND_POOL_SHARDS,
+        max_transfer_pool_shards: int = DEFAULT_MAX_TRANSFER_POOL_SHARDS,
+        shard_selection: ShardSelectionPolicy | ShardSelector = "least_outstanding",
+        max_concurrent_api_requests: int | None = None,
+        max_concurrent_background_requests: int | None = None,
+        max_concurrent_transfer_requests: int | None = None,
+        max_queue_time: float | None = None,
+        pools: Mapping[str, PoolConfig] | None = None,
+        pool_routes: Sequence[PoolRoute] | None = None,
+        coalesce_requests: bool = False,
+        coalesce_exclude: Sequence[str] | None = None,
+        adaptive_rate_limit: bool = False,
+        retry_budget_ratio: float | None = None,
+        circuit_breaker_threshold: int | None = None,
+        circuit_breaker_cooldown: float = CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+        hedge_budget: float | None = None,
+        lazy_models: bool = False,
+        page_prefetch: int = 0,
     ) -> None:
         """Configure the synchronous SDK wrapper.
 
@@ -1375,12 +1428,50 @@ class RunloopSDK:
         :type default_query: Mapping[str, object] | None, optional
         :param http_client: Custom ``httpx.Client`` instance to reuse, defaults to None
         :type http_client: httpx.Client | None, optional
-        :param api_pool_shards: H2 shards for short RPCs (round-robin), defaults to 8
+        :param api_pool_shards: Base H2 shards for short RPCs, defaults to 8
         :type api_pool_shards: int, optional
-        :param background_pool_shards: H2 shards for long-polls (round-robin), defaults to 16
+        :param background_pool_shards: Base H2 shards for long-polls, defaults to 16
         :type background_pool_shards: int, optional
-        :param transfer_pool_shards: H2 shards for upload/download (round-robin), defaults to 2
+        :param transfer_pool_shards: Base H2 shards for upload/download, defaults to 2
         :type transfer_pool_shards: int, optional
+        :param max_api_pool_shards: Autoscaling ceiling for API shards, defaults to 32
+        :type max_api_pool_shards: int, optional
+        :param max_background_pool_shards: Autoscaling ceiling for long-poll shards, defaults to 64
+        :type max_background_pool_shards: int, optional
+        :param max_transfer_pool_shards: Autoscaling ceiling for transfer shards, defaults to 4
+        :type max_transfer_pool_shards: int, optional
+        :param shard_selection: How requests are spread across shards, defaults to "least_outstanding"
+        :type shard_selection: ShardSelectionPolicy | ShardSelector, optional
+        :param max_concurrent_api_requests: Cap on in-flight API requests, defaults to None (no cap)
+        :type max_concurrent_api_requests: int | None, optional
+        :param max_concurrent_background_requests: Cap on in-flight long-polls, defaults to None (no cap)
+        :type max_concurrent_background_requests: int | None, optional
+        :param max_concurrent_transfer_requests: Cap on in-flight uploads/downloads, defaults to None (no cap)
+        :type max_concurrent_transfer_requests: int | None, optional
+        :param max_queue_time: Seconds a request may wait for a free slot, defaults to None (wait indefinitely)
+        :type max_queue_time: float | None, optional
+        :param pools: Extra named pools or overrides of the built-in ones, defaults to None
+        :type pools: Mapping[str, PoolConfig] | None, optional
+        :param pool_routes: Path/method routes to named pools, tried before the built-in routes, defaults to None
+        :type pool_routes: Sequence[PoolRoute] | None, optional
+        :param coalesce_requests: Share one HTTP call between concurrent identical GETs, defaults to False
+        :type coalesce_requests: bool, optional
+        :param coalesce_exclude: URL path regexes that are never coalesced, defaults to None
+        :type coalesce_exclude: Sequence[str] | None, optional
+        :param adaptive_rate_limit: Pace requests to the server's advertised rate-limit budget, defaults to False
+        :type adaptive_rate_limit: bool, optional
+        :param retry_budget_ratio: Cap retries at this fraction of recent successful responses, defaults to None
+        :type retry_budget_ratio: float | None, optional
+        :param circuit_breaker_threshold: Consecutive failures that open an endpoint's circuit, defaults to None
+        :type circuit_breaker_threshold: int | None, optional
+        :param circuit_breaker_cooldown: Seconds an open circuit fails fast before probing, defaults to 30
+        :type circuit_breaker_cooldown: float, optional
+        :param hedge_budget: Hedge slow GETs on another shard, adding at most this fraction of load, defaults to None
+        :type hedge_budget: float | None, optional
+        :param lazy_models: Build response model fields on first access instead of upfront, defaults to False
+        :type lazy_models: bool, optional
+        :param page_prefetch: Pages to fetch ahead in the background while iterating list results, defaults to 0
+        :type page_prefetch: int, optional
         """
         self.api = Runloop(
             bearer_token=bearer_token,
@@ -1393,6 +1484,25 @@ class RunloopSDK:
             api_pool_shards=api_pool_shards,
             background_pool_shards=background_pool_shards,
             transfer_pool_shards=transfer_pool_shards,
+            max_api_pool_shards=max_api_pool_shards,
+            max_background_pool_shards=max_background_pool_shards,
+            max_transfer_pool_shards=max_transfer_pool_shards,
+            shard_selection=shard_selection,
+            max_concurrent_api_requests=max_concurrent_api_requests,
+            max_concurrent_background_requests=max_concurrent_background_requests,
+            max_concurrent_transfer_requests=max_concurrent_transfer_requests,
+            max_queue_time=max_queue_time,
+            pools=pools,
+            pool_routes=pool_routes,
+            coalesce_requests=coalesce_requests,
+            coalesce_exclude=coalesce_exclude,
+            adaptive_rate_limit=adaptive_rate_limit,
+            retry_budget_ratio=retry_budget_ratio,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_cooldown=circuit_breaker_cooldown,
+            hedge_budget=hedge_budget,
+            lazy_models=lazy_models,
+            page_prefetch=page_prefetch,
         )
 
         self.agent = AgentOps(self.api)
@@ -1409,6 +1519,17 @@ class RunloopSDK:
         self.snapshot = SnapshotOps(self.api)
         self.storage_object = StorageObjectOps(self.api)
 
+    def warm_up(self) -> List[ShardWarmUp]:
+        """Open every pooled HTTP/2 connection concurrently before the first real request.
+
+        Useful right after start-up so the first burst of calls does not pay for
+        TLS and HTTP/2 setup one shard at a time.
+
+        :return: Per-shard handshake timings; failed shards carry the error instead of raising
+        :rtype: List[ShardWarmUp]
+        """
+        return self.api.warm_up()
+
     def close(self) -> None:
         """Close the underlying HTTP client and release resources."""
         self.api.close()
@@ -2,153 +2,310 @@
 
 from __future__ import annotations
 
-from .shared import (
-    Mount as Mount,
-    AfterIdle as AfterIdle,
-    AgentMount as AgentMount,
-    RunProfile as RunProfile,
-    AgentSource as AgentSource,
-    BrokerMount as BrokerMount,
-    ObjectMount as ObjectMount,
-    CustomHeader as CustomHeader,
-    AuthMechanism as AuthMechanism,
-    LifecycleHooks as LifecycleHooks,
-    ResumeTriggers as ResumeTriggers,
-    LaunchParameters as LaunchParameters,
-    CodeMountParameters as CodeMountParameters,
-    LifecycleConfiguration as LifecycleConfiguration,
-)
-from .axon_view import AxonView as AxonView
-from .port_rule import PortRule as PortRule
-from .agent_view import AgentView as AgentView
-from .devbox_view import DevboxView as DevboxView
-from .object_view import ObjectView as ObjectView
-from .secret_view import SecretView as SecretView
-from .tunnel_view import TunnelView as TunnelView
-from .account_view import AccountView as AccountView
-from .allowed_cidr import AllowedCidr as AllowedCidr
-from .input_context import InputContext as InputContext
-from .scenario_view import ScenarioView as ScenarioView
-from .axon_list_view import AxonListView as AxonListView
-from .benchmark_view import BenchmarkView as BenchmarkView
-from .blueprint_view import BlueprintView as BlueprintView
-from .agent_list_view import AgentListView as AgentListView
-from .axon_event_view import AxonEventView as AxonEventView
-from .mcp_config_view import McpConfigView as McpConfigView
-from .port_rule_param import PortRuleParam as PortRuleParam
-from .pty_tunnel_view import PtyTunnelView as PtyTunnelView
-from .axon_list_params import AxonListParams as AxonListParams
-from .devbox_list_view import DevboxListView as DevboxListView
-from .object_list_view import ObjectListView as ObjectListView
-from .pty_connect_view import PtyConnectView as PtyConnectView
-from .scope_entry_view import ScopeEntryView as ScopeEntryView
-from .scoring_contract import ScoringContract as ScoringContract
-from .scoring_function import ScoringFunction as ScoringFunction
-from .secret_list_view import SecretListView as SecretListView
-from .agent_list_params import AgentListParams as AgentListParams
-from .scenario_run_view import ScenarioRunView as ScenarioRunView
-from .allowed_cidr_param import AllowedCidrParam as AllowedCidrParam
-from .axon_create_params import AxonCreateParams as AxonCreateParams
-from .benchmark_job_view import BenchmarkJobView as BenchmarkJobView
-from .benchmark_run_view import BenchmarkRunView as BenchmarkRunView
-from .devbox_list_params import DevboxListParams as DevboxListParams
-from .object_list_params import ObjectListParams as ObjectListParams
-from .pty_connect_params import PtyConnectParams as PtyConnectParams
-from .pty_control_params import PtyControlParams as PtyControlParams
-from .secret_list_params import SecretListParams as SecretListParams
-from .agent_create_params import AgentCreateParams as AgentCreateParams
-from .axon_publish_params import AxonPublishParams as AxonPublishParams
-from .blueprint_build_log import BlueprintBuildLog as BlueprintBuildLog
-from .blueprint_list_view import BlueprintListView as BlueprintListView
-from .gateway_config_view import GatewayConfigView as GatewayConfigView
-from .input_context_param import InputContextParam as InputContextParam
-from .network_policy_view import NetworkPolicyView as NetworkPolicyView
-from .publish_result_view import PublishResultView as PublishResultView
-from .api_key_created_view import APIKeyCreatedView as APIKeyCreatedView
-from .apikey_create_params import ApikeyCreateParams as ApikeyCreateParams
-from .devbox_create_params import DevboxCreateParams as DevboxCreateParams
-from .devbox_snapshot_view import DevboxSnapshotView as DevboxSnapshotView
-from .devbox_update_params import DevboxUpdateParams as DevboxUpdateParams
-from .mcp_config_list_view import McpConfigListView as McpConfigListView
-from .object_create_params import ObjectCreateParams as ObjectCreateParams
-from .scenario_environment import ScenarioEnvironment as ScenarioEnvironment
-from .scenario_list_params import ScenarioListParams as ScenarioListParams
-from .secret_create_params import SecretCreateParams as SecretCreateParams
-from .secret_update_params import SecretUpdateParams as SecretUpdateParams
-from .benchmark_list_params import BenchmarkListParams as BenchmarkListParams
-from .blueprint_list_params import BlueprintListParams as BlueprintListParams
-from .devbox_execute_params import DevboxExecuteParams as DevboxExecuteParams
-from .blueprint_preview_view import BlueprintPreviewView as BlueprintPreviewView
-from .devbox_shutdown_params import DevboxShutdownParams as DevboxShutdownParams
-from .mcp_config_list_params import McpConfigListParams as McpConfigListParams
-from .object_download_params import ObjectDownloadParams as ObjectDownloadParams
-from .scenario_create_params import ScenarioCreateParams as ScenarioCreateParams
-from .scenario_run_list_view import ScenarioRunListView as ScenarioRunListView
-from .scenario_update_params import ScenarioUpdateParams as ScenarioUpdateParams
-from .scope_entry_view_param import ScopeEntryViewParam as ScopeEntryViewParam
-from .scoring_contract_param import ScoringContractParam as ScoringContractParam
-from .scoring_function_param import ScoringFunctionParam as ScoringFunctionParam
-from .benchmark_create_params import BenchmarkCreateParams as BenchmarkCreateParams
-from .benchmark_job_list_view import BenchmarkJobListView as BenchmarkJobListView
-from .benchmark_run_list_view import BenchmarkRunListView as BenchmarkRunListView
-from .benchmark_update_params import BenchmarkUpdateParams as BenchmarkUpdateParams
-from .blueprint_create_params import BlueprintCreateParams as BlueprintCreateParams
-from .pty_control_result_view import PtyControlResultView as PtyControlResultView
-from .agent_devbox_counts_view import AgentDevboxCountsView as AgentDevboxCountsView
-from .agent_list_public_params import AgentListPublicParams as AgentListPublicParams
-from .blueprint_preview_params import BlueprintPreviewParams as BlueprintPreviewParams
-from .gateway_config_list_view import GatewayConfigListView as GatewayConfigListView
-from .mcp_config_create_params import McpConfigCreateParams as McpConfigCreateParams
-from .mcp_config_update_params import McpConfigUpdateParams as McpConfigUpdateParams
-from .network_policy_list_view import NetworkPolicyListView as NetworkPolicyListView
-from .object_download_url_view import ObjectDownloadURLView as ObjectDownloadURLView
-from .axon_subscribe_sse_params import AxonSubscribeSseParams as AxonSubscribeSseParams
-from .benchmark_job_list_params import BenchmarkJobListParams as BenchmarkJobListParams
-from .benchmark_run_list_params import BenchmarkRunListParams as BenchmarkRunListParams
-from .devbox_send_std_in_result import DevboxSendStdInResult as DevboxSendStdInResult
-from .devbox_snapshot_list_view import DevboxSnapshotListView as DevboxSnapshotListView
-from .devbox_upload_file_params import DevboxUploadFileParams as DevboxUploadFileParams
-from .object_list_public_params import ObjectListPublicParams as ObjectListPublicParams
-from .scenario_start_run_params import ScenarioStartRunParams as ScenarioStartRunParams
-from .benchmark_start_run_params import BenchmarkStartRunParams as BenchmarkStartRunParams
-from .blueprint_build_parameters import BlueprintBuildParameters as BlueprintBuildParameters
-from .devbox_eviction_event_view import DevboxEvictionEventView as DevboxEvictionEventView
-from .devbox_execute_sync_params import DevboxExecuteSyncParams as DevboxExecuteSyncParams
-from .devbox_resource_usage_view import DevboxResourceUsageView as DevboxResourceUsageView
-from .gateway_config_list_params import GatewayConfigListParams as GatewayConfigListParams
-from .input_context_update_param import InputContextUpdateParam as InputContextUpdateParam
-from .network_policy_list_params import NetworkPolicyListParams as NetworkPolicyListParams
-from .scenario_environment_param import ScenarioEnvironmentParam as ScenarioEnvironmentParam
-from .benchmark_job_create_params import BenchmarkJobCreateParams as BenchmarkJobCreateParams
-from .devbox_download_file_params import DevboxDownloadFileParams as DevboxDownloadFileParams
-from .devbox_enable_tunnel_params import DevboxEnableTunnelParams as DevboxEnableTunnelParams
-from .devbox_execute_async_params import DevboxExecuteAsyncParams as DevboxExecuteAsyncParams
-from .devbox_snapshot_disk_params import DevboxSnapshotDiskParams as DevboxSnapshotDiskParams
-from .restricted_key_created_view import RestrictedKeyCreatedView as RestrictedKeyCreatedView
-from .scenario_list_public_params import ScenarioListPublicParams as ScenarioListPublicParams
-from .benchmark_definitions_params import BenchmarkDefinitionsParams as BenchmarkDefinitionsParams
-from .benchmark_list_public_params import BenchmarkListPublicParams as BenchmarkListPublicParams
-from .blueprint_list_public_params import BlueprintListPublicParams as BlueprintListPublicParams
-from .devbox_execution_detail_view import DevboxExecutionDetailView as DevboxExecutionDetailView
-from .gateway_config_create_params import GatewayConfigCreateParams as GatewayConfigCreateParams
-from .gateway_config_update_params import GatewayConfigUpdateParams as GatewayConfigUpdateParams
-from .network_policy_create_params import NetworkPolicyCreateParams as NetworkPolicyCreateParams
-from .network_policy_update_params import NetworkPolicyUpdateParams as NetworkPolicyUpdateParams
-from .restricted_key_create_params import RestrictedKeyCreateParams as RestrictedKeyCreateParams
-from .scoring_contract_result_view import ScoringContractResultView as ScoringContractResultView
-from .scoring_function_result_view import ScoringFunctionResultView as ScoringFunctionResultView
-from .scenario_definition_list_view import ScenarioDefinitionListView as ScenarioDefinitionListView
-from .scoring_contract_update_param import ScoringContractUpdateParam as ScoringContractUpdateParam
-from .blueprint_build_logs_list_view import BlueprintBuildLogsListView as BlueprintBuildLogsListView
-from .devbox_create_ssh_key_response import DevboxCreateSSHKeyResponse as DevboxCreateSSHKeyResponse
-from .devbox_wait_for_command_params import DevboxWaitForCommandParams as DevboxWaitForCommandParams
-from .devbox_read_file_contents_params import DevboxReadFileContentsParams as DevboxReadFileContentsParams
-from .benchmark_update_scenarios_params import BenchmarkUpdateScenariosParams as BenchmarkUpdateScenariosParams
-from .devbox_list_disk_snapshots_params import DevboxListDiskSnapshotsParams as DevboxListDiskSnapshotsParams
-from .devbox_snapshot_disk_async_params import DevboxSnapshotDiskAsyncParams as DevboxSnapshotDiskAsyncParams
-from .devbox_write_file_contents_params import DevboxWriteFileContentsParams as DevboxWriteFileContentsParams
-from .devbox_async_execution_detail_view import DevboxAsyncExecutionDetailView as DevboxAsyncExecutionDetailView
-from .devbox_read_file_contents_response import DevboxReadFileContentsResponse as DevboxReadFileContentsResponse
-from .benchmark_run_list_scenario_runs_params import (
-    BenchmarkRunListScenarioRunsParams as BenchmarkRunListScenarioRunsParams,
-)
+from typing import TYPE_CHECKING
+
+from .._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .shared import (
+        Mount as Mount,
+        AfterIdle as AfterIdle,
+        AgentMount as AgentMount,
+        RunProfile as RunProfile,
+        AgentSource as AgentSource,
+        BrokerMount as BrokerMount,
+        ObjectMount as ObjectMount,
+        CustomHeader as CustomHeader,
+        AuthMechanism as AuthMechanism,
+        LifecycleHooks as LifecycleHooks,
+        ResumeTriggers as ResumeTriggers,
+        LaunchParameters as LaunchParameters,
+        CodeMountParameters as CodeMountParameters,
+        LifecycleConfiguration as LifecycleConfiguration,
+    )
+    from .axon_view import AxonView as AxonView
+    from .port_rule import PortRule as PortRule
+    from .agent_view import AgentView as AgentView
+    from .devbox_view import DevboxView as DevboxView
+    from .object_view import ObjectView as ObjectView
+    from .secret_view import SecretView as SecretView
+    from .tunnel_view import TunnelView as TunnelView
+    from .account_view import AccountView as AccountView
+    from .allowed_cidr import AllowedCidr as AllowedCidr
+    from .input_context import InputContext as InputContext
+    from .scenario_view import ScenarioView as ScenarioView
+    from .axon_list_view import AxonListView as AxonListView
+    from .benchmark_view import BenchmarkView as BenchmarkView
+    from .blueprint_view import BlueprintView as BlueprintView
+    from .agent_list_view import AgentListView as AgentListView
+    from .axon_event_view import AxonEventView as AxonEventView
+    from .mcp_config_view import McpConfigView as McpConfigView
+    from .port_rule_param import PortRuleParam as PortRuleParam
+    from .pty_tunnel_view import PtyTunnelView as PtyTunnelView
+    from .axon_list_params import AxonListParams as AxonListParams
+    from .devbox_list_view import DevboxListView as DevboxListView
+    from .object_list_view import ObjectListView as ObjectListView
+    from .pty_connect_view import PtyConnectView as PtyConnectView
+    from .scope_entry_view import ScopeEntryView as ScopeEntryView
+    from .scoring_contract import ScoringContract as ScoringContract
+    from .scoring_function import ScoringFunction as ScoringFunction
+    from .secret_list_view import SecretListView as SecretListView
+    from .agent_list_params import AgentListParams as AgentListParams
+    from .scenario_run_view import ScenarioRunView as ScenarioRunView
+    from .allowed_cidr_param import AllowedCidrParam as AllowedCidrParam
+    from .axon_create_params import AxonCreateParams as AxonCreateParams
+    from .benchmark_job_view import BenchmarkJobView as BenchmarkJobView
+    from .benchmark_run_view import BenchmarkRunView as BenchmarkRunView
+    from .devbox_list_params import DevboxListParams as DevboxListParams
+    from .object_list_params import ObjectListParams as ObjectListParams
+    from .pty_connect_params import PtyConnectParams as PtyConnectParams
+    from .pty_control_params import PtyControlParams as PtyControlParams
+    from .secret_list_params import SecretListParams as SecretListParams
+    from .agent_create_params import AgentCreateParams as AgentCreateParams
+    from .axon_publish_params import AxonPublishParams as AxonPublishParams
+    from .blueprint_build_log import BlueprintBuildLog as BlueprintBuildLog
+    from .blueprint_list_view import BlueprintListView as BlueprintListView
+    from .gateway_config_view import GatewayConfigView as GatewayConfigView
+    from .input_context_param import InputContextParam as InputContextParam
+    from .network_policy_view import NetworkPolicyView as NetworkPolicyView
+    from .publish_result_view import PublishResultView as PublishResultView
+    from .api_key_created_view import APIKeyCreatedView as APIKeyCreatedView
+    from .apikey_create_params import ApikeyCreateParams as ApikeyCreateParams
+    from .devbox_create_params import DevboxCreateParams as DevboxCreateParams
+    from .devbox_snapshot_view import DevboxSnapshotView as DevboxSnapshotView
+    from .devbox_update_params import DevboxUpdateParams as DevboxUpdateParams
+    from .mcp_config_list_view import McpConfigListView as McpConfigListView
+    from .object_create_params import ObjectCreateParams as ObjectCreateParams
+    from .scenario_environment import ScenarioEnvironment as ScenarioEnvironment
+    from .scenario_list_params import ScenarioListParams as ScenarioListParams
+    from .secret_create_params import SecretCreateParams as SecretCreateParams
+    from .secret_update_params import SecretUpdateParams as SecretUpdateParams
+    from .benchmark_list_params import BenchmarkListParams as BenchmarkListParams
+    from .blueprint_list_params import BlueprintListParams as BlueprintListParams
+    from .devbox_execute_params import DevboxExecuteParams as DevboxExecuteParams
+    from .blueprint_preview_view import BlueprintPreviewView as BlueprintPreviewView
+    from .devbox_shutdown_params import DevboxShutdownParams as DevboxShutdownParams
+    from .mcp_config_list_params import McpConfigListParams as McpConfigListParams
+    from .object_download_params import ObjectDownloadParams as ObjectDownloadParams
+    from .scenario_create_params import ScenarioCreateParams as ScenarioCreateParams
+    from .scenario_run_list_view import ScenarioRunListView as ScenarioRunListView
+    from .scenario_update_params import ScenarioUpdateParams as ScenarioUpdateParams
+    from .scope_entry_view_param import ScopeEntryViewParam as ScopeEntryViewParam
+    from .scoring_contract_param import ScoringContractParam as ScoringContractParam
+    from .scoring_function_param import ScoringFunctionParam as ScoringFunctionParam
+    from .benchmark_create_params import BenchmarkCreateParams as BenchmarkCreateParams
+    from .benchmark_job_list_view import BenchmarkJobListView as BenchmarkJobListView
+    from .benchmark_run_list_view import BenchmarkRunListView as BenchmarkRunListView
+    from .benchmark_update_params import BenchmarkUpdateParams as BenchmarkUpdateParams
+    from .blueprint_create_params import BlueprintCreateParams as BlueprintCreateParams
+    from .pty_control_result_view import PtyControlResultView as PtyControlResultView
+    from .agent_devbox_counts_view import AgentDevboxCountsView as AgentDevboxCountsView
+    from .agent_list_public_params import AgentListPublicParams as AgentListPublicParams
+    from .blueprint_preview_params import BlueprintPreviewParams as BlueprintPreviewParams
+    from .gateway_config_list_view import GatewayConfigListView as GatewayConfigListView
+    from .mcp_config_create_params import McpConfigCreateParams as McpConfigCreateParams
+    from .mcp_config_update_params import McpConfigUpdateParams as McpConfigUpdateParams
+    from .network_policy_list_view import NetworkPolicyListView as NetworkPolicyListView
+    from .object_download_url_view import ObjectDownloadURLView as ObjectDownloadURLView
+    from .axon_subscribe_sse_params import AxonSubscribeSseParams as AxonSubscribeSseParams
+    from .benchmark_job_list_params import BenchmarkJobListParams as BenchmarkJobListParams
+    from .benchmark_run_list_params import BenchmarkRunListParams as BenchmarkRunListParams
+    from .devbox_send_std_in_result import DevboxSendStdInResult as DevboxSendStdInResult
+    from .devbox_snapshot_list_view import DevboxSnapshotListView as DevboxSnapshotListView
+    from .devbox_upload_file_params import DevboxUploadFileParams as DevboxUploadFileParams
+    from .object_list_public_params import ObjectListPublicParams as ObjectListPublicParams
+    from .scenario_start_run_params import ScenarioStartRunParams as ScenarioStartRunParams
+    from .benchmark_start_run_params import BenchmarkStartRunParams as BenchmarkStartRunParams
+    from .blueprint_build_parameters import BlueprintBuildParameters as BlueprintBuildParameters
+    from .devbox_eviction_event_view import DevboxEvictionEventView as DevboxEvictionEventView
+    from .devbox_execute_sync_params import DevboxExecuteSyncParams as DevboxExecuteSyncParams
+    from .devbox_resource_usage_view import DevboxResourceUsageView as DevboxResourceUsageView
+    from .gateway_config_list_params import GatewayConfigListParams as GatewayConfigListParams
+    from .input_context_update_param import InputContextUpdateParam as InputContextUpdateParam
+    from .network_policy_list_params import NetworkPolicyListParams as NetworkPolicyListParams
+    from .scenario_environment_param import ScenarioEnvironmentParam as ScenarioEnvironmentParam
+    from .benchmark_job_create_params import BenchmarkJobCreateParams as BenchmarkJobCreateParams
+    from .devbox_download_file_params import DevboxDownloadFileParams as DevboxDownloadFileParams
+    from .devbox_enable_tunnel_params import DevboxEnableTunnelParams as DevboxEnableTunnelParams
+    from .devbox_execute_async_params import DevboxExecuteAsyncParams as DevboxExecuteAsyncParams
+    from .devbox_snapshot_disk_params import DevboxSnapshotDiskParams as DevboxSnapshotDiskParams
+    from .restricted_key_created_view import RestrictedKeyCreatedView as RestrictedKeyCreatedView
+    from .scenario_list_public_params import ScenarioListPublicParams as ScenarioListPublicParams
+    from .benchmark_definitions_params import BenchmarkDefinitionsParams as BenchmarkDefinitionsParams
+    from .benchmark_list_public_params import BenchmarkListPublicParams as BenchmarkListPublicParams
+    from .blueprint_list_public_params import BlueprintListPublicParams as BlueprintListPublicParams
+    from .devbox_execution_detail_view import DevboxExecutionDetailView as DevboxExecutionDetailView
+    from .gateway_config_create_params import GatewayConfigCreateParams as GatewayConfigCreateParams
+    from .gateway_config_update_params import GatewayConfigUpdateParams as GatewayConfigUpdateParams
+    from .network_policy_create_params import NetworkPolicyCreateParams as NetworkPolicyCreateParams
+    from .network_policy_update_params import NetworkPolicyUpdateParams as NetworkPolicyUpdateParams
+    from .restricted_key_create_params import RestrictedKeyCreateParams as RestrictedKeyCreateParams
+    from .scoring_contract_result_view import ScoringContractResultView as ScoringContractResultView
+    from .scoring_function_result_view import ScoringFunctionResultView as ScoringFunctionResultView
+    from .scenario_definition_list_view import ScenarioDefinitionListView as ScenarioDefinitionListView
+    from .scoring_contract_update_param import ScoringContractUpdateParam as ScoringContractUpdateParam
+    from .blueprint_build_logs_list_view import BlueprintBuildLogsListView as BlueprintBuildLogsListView
+    from .devbox_create_ssh_key_response import DevboxCreateSSHKeyResponse as DevboxCreateSSHKeyResponse
+    from .devbox_wait_for_command_params import DevboxWaitForCommandParams as DevboxWaitForCommandParams
+    from .devbox_read_file_contents_params import DevboxReadFileContentsParams as DevboxReadFileContentsParams
+    from .benchmark_update_scenarios_params import BenchmarkUpdateScenariosParams as BenchmarkUpdateScenariosParams
+    from .devbox_list_disk_snapshots_params import DevboxListDiskSnapshotsParams as DevboxListDiskSnapshotsParams
+    from .devbox_snapshot_disk_async_params import DevboxSnapshotDiskAsyncParams as DevboxSnapshotDiskAsyncParams
+    from .devbox_write_file_contents_params import DevboxWriteFileContentsParams as DevboxWriteFileContentsParams
+    from .devbox_async_execution_detail_view import DevboxAsyncExecutionDetailView as DevboxAsyncExecutionDetailView
+    from .devbox_read_file_contents_response import DevboxReadFileContentsResponse as DevboxReadFileContentsResponse
+    from .benchmark_run_list_scenario_runs_params import (
+        BenchmarkRunListScenarioRunsParams as BenchmarkRunListScenarioRunsParams,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "Mount": ".shared",
+            "AfterIdle": ".shared",
+            "AgentMount": ".shared",
+            "RunProfile": ".shared",
+            "AgentSource": ".shared",
+            "BrokerMount": ".shared",
+            "ObjectMount": ".shared",
+            "CustomHeader": ".shared",
+            "AuthMechanism": ".shared",
+            "LifecycleHooks": ".shared",
+            "ResumeTriggers": ".shared",
+            "LaunchParameters": ".shared",
+            "CodeMountParameters": ".shared",
+            "LifecycleConfiguration": ".shared",
+            "AxonView": ".axon_view",
+            "PortRule": ".port_rule",
+            "AgentView": ".agent_view",
+            "DevboxView": ".devbox_view",
+            "ObjectView": ".object_view",
+            "SecretView": ".secret_view",
+            "TunnelView": ".tunnel_view",
+            "AccountView": ".account_view",
+            "AllowedCidr": ".allowed_cidr",
+            "InputContext": ".input_context",
+            "ScenarioView": ".scenario_view",
+            "AxonListView": ".axon_list_view",
+            "BenchmarkView": ".benchmark_view",
+            "BlueprintView": ".blueprint_view",
+            "AgentListView": ".agent_list_view",
+            "AxonEventView": ".axon_event_view",
+            "McpConfigView": ".mcp_config_view",
+            "PortRuleParam": ".port_rule_param",
+            "PtyTunnelView": ".pty_tunnel_view",
+            "AxonListParams": ".axon_list_params",
+            "DevboxListView": ".devbox_list_view",
+            "ObjectListView": ".object_list_view",
+            "PtyConnectView": ".pty_connect_view",
+            "ScopeEntryView": ".scope_entry_view",
+            "ScoringContract": ".scoring_contract",
+            "ScoringFunction": ".scoring_function",
+            "SecretListView": ".secret_list_view",
+            "AgentListParams": ".agent_list_params",
+            "ScenarioRunView": ".scenario_run_view",
+            "AllowedCidrParam": ".allowed_cidr_param",
+            "AxonCreateParams": ".axon_create_params",
+            "BenchmarkJobView": ".benchmark_job_view",
+            "BenchmarkRunView": ".benchmark_run_view",
+            "DevboxListParams": ".devbox_list_params",
+            "ObjectListParams": ".object_list_params",
+            "PtyConnectParams": ".pty_connect_params",
+            "PtyControlParams": ".pty_control_params",
+            "SecretListParams": ".secret_list_params",
+            "AgentCreateParams": ".agent_create_params",
+            "AxonPublishParams": ".axon_publish_params",
+            "BlueprintBuildLog": ".blueprint_build_log",
+            "BlueprintListView": ".blueprint_list_view",
+            "GatewayConfigView": ".gateway_config_view",
+            "InputContextParam": ".input_context_param",
+            "NetworkPolicyView": ".network_policy_view",
+            "PublishResultView": ".publish_result_view",
+            "APIKeyCreatedView": ".api_key_created_view",
+            "ApikeyCreateParams": ".apikey_create_params",
+            "DevboxCreateParams": ".devbox_create_params",
+            "DevboxSnapshotView": ".devbox_snapshot_view",
+            "DevboxUpdateParams": ".devbox_update_params",
+            "McpConfigListView": ".mcp_config_list_view",
+            "ObjectCreateParams": ".object_create_params",
+            "ScenarioEnvironment": ".scenario_environment",
+            "ScenarioListParams": ".scenario_list_params",
+            "SecretCreateParams": ".secret_create_params",
+            "SecretUpdateParams": ".secret_update_params",
+            "BenchmarkListParams": ".benchmark_list_params",
+            "BlueprintListParams": ".blueprint_list_params",
+            "DevboxExecuteParams": ".devbox_execute_params",
+            "BlueprintPreviewView": ".blueprint_preview_view",
+            "DevboxShutdownParams": ".devbox_shutdown_params",
+            "McpConfigListParams": ".mcp_config_list_params",
+            "ObjectDownloadParams": ".object_download_params",
+            "ScenarioCreateParams": ".scenario_create_params",
+            "ScenarioRunListView": ".scenario_run_list_view",
+            "ScenarioUpdateParams": ".scenario_update_params",
+            "ScopeEntryViewParam": ".scope_entry_view_param",
+            "ScoringContractParam": ".scoring_contract_param",
+            "ScoringFunctionParam": ".scoring_function_param",
+            "BenchmarkCreateParams": ".benchmark_create_params",
+            "BenchmarkJobListView": ".benchmark_job_list_view",
+            "BenchmarkRunListView": ".benchmark_run_list_view",
+            "BenchmarkUpdateParams": ".benchmark_update_params",
+            "BlueprintCreateParams": ".blueprint_create_params",
+            "PtyControlResultView": ".pty_control_result_view",
+            "AgentDevboxCountsView": ".agent_devbox_counts_view",
+            "AgentListPublicParams": ".agent_list_public_params",
+            "BlueprintPreviewParams": ".blueprint_preview_params",
+            "GatewayConfigListView": ".gateway_config_list_view",
+            "McpConfigCreateParams": ".mcp_config_create_params",
+            "McpConfigUpdateParams": ".mcp_config_update_params",
+            "NetworkPolicyListView": ".network_policy_list_view",
+            "ObjectDownloadURLView": ".object_download_url_view",
+            "AxonSubscribeSseParams": ".axon_subscribe_sse_params",
+            "BenchmarkJobListParams": ".benchmark_job_list_params",
+            "BenchmarkRunListParams": ".benchmark_run_list_params",
+            "DevboxSendStdInResult": ".devbox_send_std_in_result",
+            "DevboxSnapshotListView": ".devbox_snapshot_list_view",
+            "DevboxUploadFileParams": ".devbox_upload_file_params",
+            "ObjectListPublicParams": ".object_list_public_params",
+            "ScenarioStartRunParams": ".scenario_start_run_params",
+            "BenchmarkStartRunParams": ".benchmark_start_run_params",
+            "BlueprintBuildParameters": ".blueprint_build_parameters",
+            "DevboxEvictionEventView": ".devbox_eviction_event_view",
+            "DevboxExecuteSyncParams": ".devbox_execute_sync_params",
+            "DevboxResourceUsageView": ".devbox_resource_usage_view",
+            "GatewayConfigListParams": ".gateway_config_list_params",
+            "InputContextUpdateParam": ".input_context_update_param",
+            "NetworkPolicyListParams": ".network_policy_list_params",
+            "ScenarioEnvironmentParam": ".scenario_environment_param",
+            "BenchmarkJobCreateParams": ".benchmark_job_create_params",
+            "DevboxDownloadFileParams": ".devbox_download_file_params",
+            "DevboxEnableTunnelParams": ".devbox_enable_tunnel_params",
+            "DevboxExecuteAsyncParams": ".devbox_execute_async_params",
+            "DevboxSnapshotDiskParams": ".devbox_snapshot_disk_params",
+            "RestrictedKeyCreatedView": ".restricted_key_created_view",
+            "ScenarioListPublicParams": ".scenario_list_public_params",
+            "BenchmarkDefinitionsParams": ".benchmark_definitions_params",
+            "BenchmarkListPublicParams": ".benchmark_list_public_params",
+            "BlueprintListPublicParams": ".blueprint_list_public_params",
+            "DevboxExecutionDetailView": ".devbox_execution_detail_view",
+            "GatewayConfigCreateParams": ".gateway_config_create_params",
+            "GatewayConfigUpdateParams": ".gateway_config_update_params",
+            "NetworkPolicyCreateParams": ".network_policy_create_params",
+            "NetworkPolicyUpdateParams": ".network_policy_update_params",
+            "RestrictedKeyCreateParams": ".restricted_key_create_params",
+            "ScoringContractResultView": ".scoring_contract_result_view",
+            "ScoringFunctionResultView": ".scoring_function_result_view",
+            "ScenarioDefinitionListView": ".scenario_definition_list_view",
+            "ScoringContractUpdateParam": ".scoring_contract_update_param",
+            "BlueprintBuildLogsListView": ".blueprint_build_logs_list_view",
+            "DevboxCreateSSHKeyResponse": ".devbox_create_ssh_key_response",
+            "DevboxWaitForCommandParams": ".devbox_wait_for_command_params",
+            "DevboxReadFileContentsParams": ".devbox_read_file_contents_params",
+            "BenchmarkUpdateScenariosParams": ".benchmark_update_scenarios_params",
+            "DevboxListDiskSnapshotsParams": ".devbox_list_disk_snapshots_params",
+            "DevboxSnapshotDiskAsyncParams": ".devbox_snapshot_disk_async_params",
+            "DevboxWriteFileContentsParams": ".devbox_write_file_contents_params",
+            "DevboxAsyncExecutionDetailView": ".devbox_async_execution_detail_view",
+            "DevboxReadFileContentsResponse": ".devbox_read_file_contents_response",
+            "BenchmarkRunListScenarioRunsParams": ".benchmark_run_list_scenario_runs_params",
+        },
+    )
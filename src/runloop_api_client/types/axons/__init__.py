@@ -2,14 +2,36 @@
 
 from __future__ import annotations
 
-from .sql_batch_params import SqlBatchParams as SqlBatchParams
-from .sql_query_params import SqlQueryParams as SqlQueryParams
-from .event_list_params import EventListParams as EventListParams
-from .sql_step_error_view import SqlStepErrorView as SqlStepErrorView
-from .axon_event_list_view import AxonEventListView as AxonEventListView
-from .sql_column_meta_view import SqlColumnMetaView as SqlColumnMetaView
-from .sql_result_meta_view import SqlResultMetaView as SqlResultMetaView
-from .sql_statement_params import SqlStatementParams as SqlStatementParams
-from .sql_step_result_view import SqlStepResultView as SqlStepResultView
-from .sql_batch_result_view import SqlBatchResultView as SqlBatchResultView
-from .sql_query_result_view import SqlQueryResultView as SqlQueryResultView
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .sql_batch_params import SqlBatchParams as SqlBatchParams
+    from .sql_query_params import SqlQueryParams as SqlQueryParams
+    from .event_list_params import EventListParams as EventListParams
+    from .sql_step_error_view import SqlStepErrorView as SqlStepErrorView
+    from .axon_event_list_view import AxonEventListView as AxonEventListView
+    from .sql_column_meta_view import SqlColumnMetaView as SqlColumnMetaView
+    from .sql_result_meta_view import SqlResultMetaView as SqlResultMetaView
+    from .sql_statement_params import SqlStatementParams as SqlStatementParams
+    from .sql_step_result_view import SqlStepResultView as SqlStepResultView
+    from .sql_batch_result_view import SqlBatchResultView as SqlBatchResultView
+    from .sql_query_result_view import SqlQueryResultView as SqlQueryResultView
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "SqlBatchParams": ".sql_batch_params",
+            "SqlQueryParams": ".sql_query_params",
+            "EventListParams": ".event_list_params",
+            "SqlStepErrorView": ".sql_step_error_view",
+            "AxonEventListView": ".axon_event_list_view",
+            "SqlColumnMetaView": ".sql_column_meta_view",
+            "SqlResultMetaView": ".sql_result_meta_view",
+            "SqlStatementParams": ".sql_statement_params",
+            "SqlStepResultView": ".sql_step_result_view",
+            "SqlBatchResultView": ".sql_batch_result_view",
+            "SqlQueryResultView": ".sql_query_result_view",
+        },
+    )
@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
-from .log_list_params import LogListParams as LogListParams
-from .devbox_logs_list_view import DevboxLogsListView as DevboxLogsListView
-from .execution_kill_params import ExecutionKillParams as ExecutionKillParams
-from .execution_update_chunk import ExecutionUpdateChunk as ExecutionUpdateChunk
-from .disk_snapshot_list_params import DiskSnapshotListParams as DiskSnapshotListParams
-from .execution_retrieve_params import ExecutionRetrieveParams as ExecutionRetrieveParams
-from .disk_snapshot_update_params import DiskSnapshotUpdateParams as DiskSnapshotUpdateParams
-from .execution_send_std_in_params import ExecutionSendStdInParams as ExecutionSendStdInParams
-from .execution_execute_sync_params import ExecutionExecuteSyncParams as ExecutionExecuteSyncParams
-from .execution_execute_async_params import ExecutionExecuteAsyncParams as ExecutionExecuteAsyncParams
-from .devbox_snapshot_async_status_view import DevboxSnapshotAsyncStatusView as DevboxSnapshotAsyncStatusView
-from .execution_stream_stderr_updates_params import (
-    ExecutionStreamStderrUpdatesParams as ExecutionStreamStderrUpdatesParams,
-)
-from .execution_stream_stdout_updates_params import (
-    ExecutionStreamStdoutUpdatesParams as ExecutionStreamStdoutUpdatesParams,
-)
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .log_list_params import LogListParams as LogListParams
+    from .devbox_logs_list_view import DevboxLogsListView as DevboxLogsListView
+    from .execution_kill_params import ExecutionKillParams as ExecutionKillParams
+    from .execution_update_chunk import ExecutionUpdateChunk as ExecutionUpdateChunk
+    from .disk_snapshot_list_params import DiskSnapshotListParams as DiskSnapshotListParams
+    from .execution_retrieve_params import ExecutionRetrieveParams as ExecutionRetrieveParams
+    from .disk_snapshot_update_params import DiskSnapshotUpdateParams as DiskSnapshotUpdateParams
+    from .execution_send_std_in_params import ExecutionSendStdInParams as ExecutionSendStdInParams
+    from .execution_execute_sync_params import ExecutionExecuteSyncParams as ExecutionExecuteSyncParams
+    from .execution_execute_async_params import ExecutionExecuteAsyncParams as ExecutionExecuteAsyncParams
+    from .devbox_snapshot_async_status_view import DevboxSnapshotAsyncStatusView as DevboxSnapshotAsyncStatusView
+    from .execution_stream_stderr_updates_params import (
+        ExecutionStreamStderrUpdatesParams as ExecutionStreamStderrUpdatesParams,
+    )
+    from .execution_stream_stdout_updates_params import (
+        ExecutionStreamStdoutUpdatesParams as ExecutionStreamStdoutUpdatesParams,
+    )
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "LogListParams": ".log_list_params",
+            "DevboxLogsListView": ".devbox_logs_list_view",
+            "ExecutionKillParams": ".execution_kill_params",
+            "ExecutionUpdateChunk": ".execution_update_chunk",
+            "DiskSnapshotListParams": ".disk_snapshot_list_params",
+            "ExecutionRetrieveParams": ".execution_retrieve_params",
+            "DiskSnapshotUpdateParams": ".disk_snapshot_update_params",
+            "ExecutionSendStdInParams": ".execution_send_std_in_params",
+            "ExecutionExecuteSyncParams": ".execution_execute_sync_params",
+            "ExecutionExecuteAsyncParams": ".execution_execute_async_params",
+            "DevboxSnapshotAsyncStatusView": ".devbox_snapshot_async_status_view",
+            "ExecutionStreamStderrUpdatesParams": ".execution_stream_stderr_updates_params",
+            "ExecutionStreamStdoutUpdatesParams": ".execution_stream_stdout_updates_params",
+        },
+    )
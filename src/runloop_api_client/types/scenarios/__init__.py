@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
-from .run_list_params import RunListParams as RunListParams
-from .scorer_list_params import ScorerListParams as ScorerListParams
-from .scorer_create_params import ScorerCreateParams as ScorerCreateParams
-from .scorer_list_response import ScorerListResponse as ScorerListResponse
-from .scorer_update_params import ScorerUpdateParams as ScorerUpdateParams
-from .scorer_create_response import ScorerCreateResponse as ScorerCreateResponse
-from .scorer_update_response import ScorerUpdateResponse as ScorerUpdateResponse
-from .scorer_retrieve_response import ScorerRetrieveResponse as ScorerRetrieveResponse
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .run_list_params import RunListParams as RunListParams
+    from .scorer_list_params import ScorerListParams as ScorerListParams
+    from .scorer_create_params import ScorerCreateParams as ScorerCreateParams
+    from .scorer_list_response import ScorerListResponse as ScorerListResponse
+    from .scorer_update_params import ScorerUpdateParams as ScorerUpdateParams
+    from .scorer_create_response import ScorerCreateResponse as ScorerCreateResponse
+    from .scorer_update_response import ScorerUpdateResponse as ScorerUpdateResponse
+    from .scorer_retrieve_response import ScorerRetrieveResponse as ScorerRetrieveResponse
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "RunListParams": ".run_list_params",
+            "ScorerListParams": ".scorer_list_params",
+            "ScorerCreateParams": ".scorer_create_params",
+            "ScorerListResponse": ".scorer_list_response",
+            "ScorerUpdateParams": ".scorer_update_params",
+            "ScorerCreateResponse": ".scorer_create_response",
+            "ScorerUpdateResponse": ".scorer_update_response",
+            "ScorerRetrieveResponse": ".scorer_retrieve_response",
+        },
+    )
@@ -1,16 +1,43 @@
 # File generated from our OpenAPI spec by Stainless. See CONTRIBUTING.md for details.
 
-from .mount import Mount as Mount
-from .after_idle import AfterIdle as AfterIdle
-from .agent_mount import AgentMount as AgentMount
-from .run_profile import RunProfile as RunProfile
-from .agent_source import AgentSource as AgentSource
-from .broker_mount import BrokerMount as BrokerMount
-from .object_mount import ObjectMount as ObjectMount
-from .custom_header import CustomHeader as CustomHeader
-from .auth_mechanism import AuthMechanism as AuthMechanism
-from .lifecycle_hooks import LifecycleHooks as LifecycleHooks
-from .resume_triggers import ResumeTriggers as ResumeTriggers
-from .launch_parameters import LaunchParameters as LaunchParameters
-from .code_mount_parameters import CodeMountParameters as CodeMountParameters
-from .lifecycle_configuration import LifecycleConfiguration as LifecycleConfiguration
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ..._utils import lazy_exports
+
+if TYPE_CHECKING:
+    from .mount import Mount as Mount
+    from .after_idle import AfterIdle as AfterIdle
+    from .agent_mount import AgentMount as AgentMount
+    from .run_profile import RunProfile as RunProfile
+    from .agent_source import AgentSource as AgentSource
+    from .broker_mount import BrokerMount as BrokerMount
+    from .object_mount import ObjectMount as ObjectMount
+    from .custom_header import CustomHeader as CustomHeader
+    from .auth_mechanism import AuthMechanism as AuthMechanism
+    from .lifecycle_hooks import LifecycleHooks as LifecycleHooks
+    from .resume_triggers import ResumeTriggers as ResumeTriggers
+    from .launch_parameters import LaunchParameters as LaunchParameters
+    from .code_mount_parameters import CodeMountParameters as CodeMountParameters
+    from .lifecycle_configuration import LifecycleConfiguration as LifecycleConfiguration
+else:
+    __getattr__, __dir__ = lazy_exports(
+        __name__,
+        {
+            "Mount": ".mount",
+            "AfterIdle": ".after_idle",
+            "AgentMount": ".agent_mount",
+            "RunProfile": ".run_profile",
+            "AgentSource": ".agent_source",
+            "BrokerMount": ".broker_mount",
+            "ObjectMount": ".object_mount",
+            "CustomHeader": ".custom_header",
+            "AuthMechanism": ".auth_mechanism",
+            "LifecycleHooks": ".lifecycle_hooks",
+            "ResumeTriggers": ".resume_triggers",
+            "LaunchParameters": ".launch_parameters",
+            "CodeMountParameters": ".code_mount_parameters",
+            "LifecycleConfiguration": ".lifecycle_configuration",
+        },
+    )
@@ -1486,6 +1486,16 @@ class TestAsyncRunloopSDK:
         # Verify aclose doesn't raise
         await runloop.aclose()
 
+    @pytest.mark.asyncio
+    async def test_warm_up(self) -> None:
+        """Test warm_up delegates to the API client."""
+        runloop = AsyncRunloopSDK(bearer_token="test-token")
+        timings = [SimpleNamespace(pool="api", shard=0, seconds=0.01, error=None)]
+        runloop.api.warm_up = AsyncMock(return_value=timings)  # type: ignore[method-assign]
+
+        assert await runloop.warm_up() is timings
+        runloop.api.warm_up.assert_awaited_once_with()
+
     @pytest.mark.asyncio
     async def test_context_manager(self) -> None:
         """Test context manager behavior."""
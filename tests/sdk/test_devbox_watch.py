@@ -0,0 +1,214 @@
+"""Tests for the devbox change feed."""
+
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from runloop_api_client import Runloop, AsyncRunloop
+from runloop_api_client.sdk import RunloopSDK, DevboxWatch, AsyncRunloopSDK, AsyncDevboxWatch, DevboxWatchEvent
+from runloop_api_client.sdk.devbox_watch import LIVE_STATUSES
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+
+def _devbox(devbox_id: str, status: str, name: str = "") -> Dict[str, Any]:
+    return {
+        "id": devbox_id,
+        "name": name,
+        "status": status,
+        "capabilities": [],
+        "create_time_ms": 0,
+        "launch_parameters": {},
+        "metadata": {},
+        "state_transitions": [],
+    }
+
+
+class _Server:
+    """Serves devboxes from a mutable ID -> (status, name) table; deleted devboxes return 404."""
+
+    def __init__(self) -> None:
+        self.devboxes: Dict[str, List[str]] = {}
+        self.evictions: List[Dict[str, Any]] = []
+        self.list_calls: List[Dict[str, str]] = []
+        self.retrieved: List[str] = []
+
+    def set(self, devbox_id: str, status: str, name: str = "") -> None:
+        self.devboxes[devbox_id] = [status, name]
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v1/devboxes":
+            params = dict(request.url.params)
+            self.list_calls.append(params)
+            devboxes = [
+                _devbox(devbox_id, status, name)
+                for devbox_id, (status, name) in self.devboxes.items()
+                if status == params["status"]
+            ]
+            return httpx.Response(200, json={"devboxes": devboxes, "has_more": False})
+        if path == "/v1/devboxes/evictions/watch":
+            body = "".join(f"data: {json.dumps(event)}\n\n" for event in self.evictions)
+            return httpx.Response(200, content=body.encode(), headers={"content-type": "text/event-stream"})
+
+        devbox_id = path.rsplit("/", 1)[-1]
+        self.retrieved.append(devbox_id)
+        if devbox_id not in self.devboxes:
+            return httpx.Response(404, json={"error": "not found"})
+        status, name = self.devboxes[devbox_id]
+        return httpx.Response(200, json=_devbox(devbox_id, status, name))
+
+    async def _async_respond(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    def client(self) -> Runloop:
+        http_client = httpx.Client(transport=httpx.MockTransport(self._respond))
+        return Runloop(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+
+    def async_client(self) -> AsyncRunloop:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self._async_respond))
+        return AsyncRunloop(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+
+    def sdk(self) -> RunloopSDK:
+        http_client = httpx.Client(transport=httpx.MockTransport(self._respond))
+        return RunloopSDK(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+
+    def async_sdk(self) -> AsyncRunloopSDK:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self._async_respond))
+        return AsyncRunloopSDK(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+
+
+def _summary(events: List[DevboxWatchEvent]) -> List[tuple[str, str]]:
+    return sorted((event.type, event.devbox_id) for event in events)
+
+
+def test_poll_reports_adds_changes_and_removals() -> None:
+    server = _Server()
+    server.set("dbx_a", "running")
+    server.set("dbx_b", "provisioning")
+    server.set("dbx_old", "shutdown")
+    watch = server.sdk().devbox.watch()
+
+    assert _summary(watch.poll()) == [("added", "dbx_a"), ("added", "dbx_b")]
+    assert set(watch.devboxes) == {"dbx_a", "dbx_b"}
+    assert all(call["include_total_count"] == "false" and call["status"] != "shutdown" for call in server.list_calls)
+    assert watch.poll() == []
+    assert server.retrieved == []
+
+    server.set("dbx_a", "running", name="renamed")
+    server.set("dbx_b", "running")
+    server.set("dbx_c", "queued")
+    events = watch.poll()
+    assert _summary(events) == [("added", "dbx_c"), ("changed", "dbx_a"), ("changed", "dbx_b")]
+    changed = next(event for event in events if event.devbox_id == "dbx_a")
+    assert changed.previous is not None and changed.previous.name == ""
+    assert changed.devbox is not None and changed.devbox.name == "renamed"
+
+    server.set("dbx_a", "shutdown")
+    del server.devboxes["dbx_b"]
+    events = watch.poll()
+    assert _summary(events) == [("removed", "dbx_a"), ("removed", "dbx_b")]
+    assert sorted(server.retrieved) == ["dbx_a", "dbx_b"]
+    finished = next(event for event in events if event.devbox_id == "dbx_a")
+    assert finished.devbox is not None and finished.devbox.status == "shutdown"
+    deleted = next(event for event in events if event.devbox_id == "dbx_b")
+    assert deleted.devbox is not None and deleted.devbox.status == "running"
+    assert deleted.previous is None
+    assert set(watch.devboxes) == {"dbx_c"}
+
+
+def test_poll_lists_statuses_and_looks_up_missing_devboxes_concurrently() -> None:
+    server = _Server()
+    server.set("dbx_a", "running")
+    server.set("dbx_b", "queued")
+    lists = threading.Barrier(len(LIVE_STATUSES), timeout=5)
+    lookups = threading.Barrier(2, timeout=5)
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        # each barrier only opens once every request of its batch is in flight at the same time
+        if request.url.path == "/v1/devboxes":
+            lists.wait()
+        else:
+            lookups.wait()
+        return server._respond(request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(respond))
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+    watch = DevboxWatch(client, interval_seconds=1.0, page_size=10, evictions=False)
+
+    assert _summary(watch.poll()) == [("added", "dbx_a"), ("added", "dbx_b")]
+    assert sorted(call["status"] for call in server.list_calls) == sorted(LIVE_STATUSES)
+
+    server.set("dbx_a", "shutdown")
+    del server.devboxes["dbx_b"]
+    assert _summary(watch.poll()) == [("removed", "dbx_a"), ("removed", "dbx_b")]
+
+
+def test_iteration_merges_deduplicated_evictions() -> None:
+    server = _Server()
+    server.set("dbx_a", "running")
+    eviction = {"devbox_id": "dbx_a", "eviction_deadline_ms": 1_000}
+    server.evictions = [eviction, eviction]
+    watch = DevboxWatch(server.client(), interval_seconds=0.2, page_size=10, evictions=True)
+
+    with watch:
+        events = iter(watch)
+        assert next(events).type == "added"
+        event = next(events)
+        assert event.type == "eviction"
+        assert event.eviction_deadline_ms == 1_000
+        assert event.devbox is not None and event.devbox.id == "dbx_a"
+
+        # the stream reconnects and replays the same eviction; the next event is the refresh
+        server.set("dbx_a", "suspending")
+        assert next(events).type == "changed"
+
+    assert list(events) == []
+
+
+@pytest.mark.parametrize("kwargs", [{"interval_seconds": 0}, {"page_size": 0}])
+def test_watch_rejects_invalid_arguments(kwargs: Dict[str, Any]) -> None:
+    params: Dict[str, Any] = {"interval_seconds": 1.0, "page_size": 10, "evictions": False, **kwargs}
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        DevboxWatch(_Server().client(), **params)
+
+
+async def test_async_poll_and_iteration() -> None:
+    server = _Server()
+    server.set("dbx_a", "running")
+    server.set("dbx_b", "suspended")
+    watch = server.async_sdk().devbox.watch(interval_seconds=0.05)
+
+    assert _summary(await watch.poll()) == [("added", "dbx_a"), ("added", "dbx_b")]
+
+    server.set("dbx_a", "failure")
+    del server.devboxes["dbx_b"]
+    server.set("dbx_c", "running")
+    async with watch:
+        events: List[DevboxWatchEvent] = []
+        async for event in watch:
+            events.append(event)
+            if len(events) == 3:
+                break
+    assert _summary(events) == [("added", "dbx_c"), ("removed", "dbx_a"), ("removed", "dbx_b")]
+    assert set(watch.devboxes) == {"dbx_c"}
+
+
+async def test_async_iteration_merges_evictions() -> None:
+    server = _Server()
+    server.evictions = [{"devbox_id": "dbx_gone", "eviction_deadline_ms": 5}]
+    watch = AsyncDevboxWatch(server.async_client(), interval_seconds=0.2, page_size=10, evictions=True)
+
+    async with watch:
+        events = watch.__aiter__()
+        event = await asyncio.wait_for(events.__anext__(), 5)
+        assert (event.type, event.devbox_id, event.devbox) == ("eviction", "dbx_gone", None)
+    assert watch._eviction_task is not None and watch._eviction_task.done()
@@ -1397,6 +1397,15 @@ class TestRunloopSDK:
         # Verify close doesn't raise
         runloop.close()
 
+    def test_warm_up(self) -> None:
+        """Test warm_up delegates to the API client."""
+        runloop = RunloopSDK(bearer_token="test-token")
+        timings = [SimpleNamespace(pool="api", shard=0, seconds=0.01, error=None)]
+        runloop.api.warm_up = Mock(return_value=timings)  # type: ignore[method-assign]
+
+        assert runloop.warm_up() is timings
+        runloop.api.warm_up.assert_called_once_with()
+
     def test_context_manager(self) -> None:
         """Test context manager behavior."""
         with RunloopSDK(bearer_token="test-token") as runloop:
@@ -36,6 +36,7 @@ from runloop_api_client._base_client import (
     make_request_options,
     _SharedAsyncTransport,
 )
+from runloop_api_client._utils._json import openapi_dumps
 
 from .utils import update_env
 
@@ -981,6 +982,46 @@ class TestRunloop:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("runloop_api_client._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_retries_reuse_encoded_request(self, client: Runloop, respx_mock: MockRouter) -> None:
+        client = client.with_options(max_retries=4)
+        attempts: list[httpx.Request] = []
+
+        def retry_handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(500 if len(attempts) < 3 else 200)
+
+        respx_mock.post("/v1/devboxes").mock(side_effect=retry_handler)
+
+        with mock.patch("runloop_api_client._base_client.openapi_dumps", wraps=openapi_dumps) as dumps:
+            client.devboxes.create(name="my-devbox")
+
+        # The body is encoded once; only the retry count differs between attempts.
+        assert dumps.call_count == 1
+        assert [request.headers["x-stainless-retry-count"] for request in attempts] == ["0", "1", "2"]
+        assert len({request.headers["x-request-id"] for request in attempts}) == 1
+        assert all(request.content == attempts[0].content for request in attempts)
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_lazy_models(self, respx_mock: MockRouter) -> None:
+        devbox = {"id": "dbx_1", "status": "running", "launch_parameters": {"architecture": "arm64"}}
+        respx_mock.get("/v1/devboxes").mock(
+            return_value=httpx.Response(200, json={"devboxes": [devbox], "has_more": False, "total_count": 1})
+        )
+
+        # strict validation builds every model upfront, so lazy models need it off
+        eager_client = Runloop(base_url=base_url, bearer_token=bearer_token)
+        lazy_client = eager_client.with_options(lazy_models=True)
+        assert lazy_client.copy()._lazy_models is True
+        item = lazy_client.devboxes.list().devboxes[0]
+        assert item.id == "dbx_1"
+        assert "launch_parameters" not in item.__dict__
+        assert item.launch_parameters.architecture == "arm64"
+        assert item.to_dict() == eager_client.devboxes.list().devboxes[0].to_dict()
+        eager_client.close()
+        lazy_client.close()
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("runloop_api_client._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
@@ -1960,6 +2001,27 @@ class TestAsyncRunloop:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("runloop_api_client._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    async def test_retries_reuse_encoded_request(self, async_client: AsyncRunloop, respx_mock: MockRouter) -> None:
+        client = async_client.with_options(max_retries=4)
+        attempts: list[httpx.Request] = []
+
+        def retry_handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(500 if len(attempts) < 3 else 200)
+
+        respx_mock.post("/v1/devboxes").mock(side_effect=retry_handler)
+
+        with mock.patch("runloop_api_client._base_client.openapi_dumps", wraps=openapi_dumps) as dumps:
+            await client.devboxes.create(name="my-devbox")
+
+        # The body is encoded once; only the retry count differs between attempts.
+        assert dumps.call_count == 1
+        assert [request.headers["x-stainless-retry-count"] for request in attempts] == ["0", "1", "2"]
+        assert len({request.headers["x-request-id"] for request in attempts}) == 1
+        assert all(request.content == attempts[0].content for request in attempts)
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("runloop_api_client._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
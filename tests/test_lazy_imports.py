@@ -0,0 +1,75 @@
+"""Tests for the lazily loaded re-exports of the package namespaces."""
+
+from __future__ import annotations
+
+import ast
+import sys
+import json
+import inspect
+import importlib
+import subprocess
+from typing import List
+
+import pytest
+
+LAZY_PACKAGES = [
+    "runloop_api_client",
+    "runloop_api_client.sdk",
+    "runloop_api_client.types",
+    "runloop_api_client.types.axons",
+    "runloop_api_client.types.shared",
+    "runloop_api_client.types.devboxes",
+    "runloop_api_client.types.scenarios",
+    "runloop_api_client.types.shared_params",
+    "runloop_api_client.resources",
+    "runloop_api_client.resources.axons",
+    "runloop_api_client.resources.devboxes",
+    "runloop_api_client.resources.scenarios",
+]
+
+
+def _type_checking_imports(package: str) -> List[str]:
+    tree = ast.parse(inspect.getsource(importlib.import_module(package)))
+    names: List[str] = []
+    for node in tree.body:
+        if isinstance(node, ast.If) and ast.unparse(node.test).endswith("TYPE_CHECKING"):
+            for stmt in node.body:
+                if isinstance(stmt, ast.ImportFrom) and stmt.level:
+                    names.extend(alias.asname or alias.name for alias in stmt.names)
+    return names
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_every_type_checking_import_is_exported(package: str) -> None:
+    module = importlib.import_module(package)
+    names = _type_checking_imports(package)
+    assert names
+
+    for name in [*names, *getattr(module, "__all__", [])]:
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+    with pytest.raises(AttributeError, match="has no attribute 'DoesNotExist'"):
+        getattr(module, "DoesNotExist")  # noqa: B009
+
+
+def _loaded_modules(code: str) -> List[str]:
+    script = f"import sys, json\n{code}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return [name for name in json.loads(output) if name.startswith("runloop_api_client.")]
+
+
+def test_client_import_only_loads_the_core() -> None:
+    loaded = _loaded_modules("from runloop_api_client import Runloop")
+    assert not [name for name in loaded if name.startswith(("runloop_api_client.resources", "runloop_api_client.sdk"))]
+    assert not [name for name in loaded if name.startswith("runloop_api_client.types.")]
+
+
+def test_resource_access_only_loads_that_resource() -> None:
+    loaded = _loaded_modules(
+        "from runloop_api_client import Runloop\n"
+        "Runloop(bearer_token='My Bearer Token', base_url='http://127.0.0.1:4010').devboxes"
+    )
+    assert "runloop_api_client.resources.devboxes.devboxes" in loaded
+    assert "runloop_api_client.resources.blueprints" not in loaded
+    assert not [name for name in loaded if name.startswith("runloop_api_client.sdk")]
@@ -1,4 +1,8 @@
+import sys
+import copy
 import json
+import pickle
+import threading
 from typing import TYPE_CHECKING, Any, Dict, List, Union, Iterable, Optional, cast
 from datetime import datetime, timezone
 from collections import deque
@@ -10,7 +14,14 @@ from pydantic import Field
 
 from runloop_api_client._utils import PropertyInfo
 from runloop_api_client._compat import PYDANTIC_V1, parse_obj, model_dump, model_json
-from runloop_api_client._models import DISCRIMINATOR_CACHE, BaseModel, EagerIterable, construct_type
+from runloop_api_client._models import (
+    DISCRIMINATOR_CACHE,
+    BaseModel,
+    EagerIterable,
+    validate_type,
+    construct_type,
+    _get_constructor,
+)
 
 
 class BasicModel(BaseModel):
@@ -850,6 +861,78 @@ def test_type_alias_type() -> None:
     assert m.union == "bar"
 
 
+def test_constructors_are_compiled_once() -> None:
+    assert _get_constructor(List[BasicModel]) is _get_constructor(List[BasicModel])
+    assert _get_constructor(List[BasicModel]) is not _get_constructor(List[BasicModel], lazy=True)
+
+    # unhashable metadata can't be cached, but still constructs
+    m = construct_type(value=[{"foo": "bar"}], type_=Annotated[List[BasicModel], {"unhashable": True}])
+    assert m == [BasicModel.construct(foo="bar")]
+
+
+def _construct_concurrently(type_: object, value: object, threads: int = 16) -> List[BaseException]:
+    barrier = threading.Barrier(threads)
+    errors: List[BaseException] = []
+
+    def construct() -> None:
+        barrier.wait()
+        try:
+            construct_type(value=value, type_=type_)
+        except BaseException as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=construct) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return errors
+
+
+def test_constructors_compile_safely_across_threads() -> None:
+    # switch threads as often as possible so that they interleave while compiling
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+
+            class Leaf(BaseModel):
+                value: Optional[int] = None
+
+            class Branch(BaseModel):
+                leaves: List[Optional[Leaf]]
+                by_name: Dict[str, Leaf]
+
+            value = [{"leaves": [{"value": 1}, None], "by_name": {"a": {"value": 2}}}]
+            assert _construct_concurrently(Optional[List[Branch]], value) == []
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (Optional[int], 1),
+        (Optional[int], "1"),
+        (Optional[int], True),
+        (Optional[float], 1),
+        (Optional[str], "foo"),
+        (Union[int, str], "1"),
+        (Optional[Literal["a", "b"]], "a"),
+        (Optional[Literal[1]], True),
+        (Optional[bool], None),
+    ],
+)
+def test_union_fast_path_matches_validation(type_: Any, value: object) -> None:
+    constructed = construct_type(value=value, type_=type_)
+    try:
+        expected = validate_type(type_=type_, value=value)
+    except Exception:
+        expected = value
+    assert constructed == expected
+    assert type(constructed) is type(expected)
+
+
 @pytest.mark.skipif(PYDANTIC_V1, reason="TypeAliasType is not supported in Pydantic v1")
 def test_field_named_cls() -> None:
     class Model(BaseModel):
@@ -964,6 +1047,36 @@ def test_extra_properties() -> None:
     assert model.other == "foo"
 
 
+class DeferredItem(BaseModel):
+    prop: int
+
+
+class DeferredModel(BaseModel):
+    __pydantic_extra__: "Dict[str, DeferredItem]" = Field(init=False)  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    items: List[DeferredItem]
+
+    if TYPE_CHECKING:
+
+        def __getattr__(self, attr: str) -> DeferredItem: ...
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="validators are only deferred in pydantic v2")
+def test_construct_type_does_not_build_deferred_validators() -> None:
+    if not DeferredModel.model_config.get("defer_build"):
+        pytest.skip("DEFER_PYDANTIC_BUILD is disabled")
+
+    model = construct_type(type_=DeferredModel, value={"items": [{"prop": 1}], "extra": {"prop": 2}})
+    assert isinstance(model, DeferredModel)
+    assert isinstance(model.items[0], DeferredItem)
+    assert isinstance(model.extra, DeferredItem)
+    assert not DeferredModel.__pydantic_complete__
+    assert not DeferredItem.__pydantic_complete__
+
+    assert model.to_dict() == {"items": [{"prop": 1}], "extra": {"prop": 2}}
+    assert DeferredModel.__pydantic_complete__
+
+
 # NOTE: Workaround for Pydantic Iterable behavior.
 # Iterable fields are replaced with a ValidatorIterator and may be consumed
 # during serialization, which can cause subsequent dumps to return empty data.
@@ -1015,3 +1128,66 @@ def test_iterable_construction_str_falls_back_to_list() -> None:
     # falls back to list of chars rather than calling str(["h", "e", "l", "l", "o"])
     assert m.data["items"] == ["h", "e", "l", "l", "o"]
     assert m.model_dump()["data"]["items"] == ["h", "e", "l", "l", "o"]
+
+
+class LazyItem(BaseModel):
+    id: str
+    created_at: datetime
+    nested: Optional[BasicModel] = None
+    tags: List[BasicModel] = []
+
+
+class LazyPage(BaseModel):
+    items: List[LazyItem]
+    has_more: bool
+
+
+LAZY_PAGE = {
+    "items": [
+        {"id": "a", "created_at": "2024-03-22T18:11:19Z", "nested": {"foo": "x"}, "tags": [{"foo": "t"}], "extra": 1},
+        {"id": "b", "created_at": "2024-03-22T18:11:19Z"},
+    ],
+    "has_more": False,
+}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="lazy construction is only supported in pydantic v2")
+def test_lazy_fields_are_built_on_access() -> None:
+    page = construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True)
+    assert isinstance(page, LazyPage)
+    assert page.__dict__ == {}
+
+    item = page.items[0]
+    assert isinstance(item, LazyItem)
+    assert item.id == "a"
+    assert item.__dict__ == {"id": "a"}
+
+    # nested values are constructed, and are lazy themselves
+    assert item.created_at == datetime(2024, 3, 22, 18, 11, 19, tzinfo=timezone.utc)
+    assert isinstance(item.nested, BasicModel)
+    assert item.nested.__dict__ == {}
+    assert item.nested.foo == "x"
+    assert cast(Any, item).extra == 1
+
+    assert page.items[1].nested is None
+    assert page.items[1].tags == []
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="lazy construction is only supported in pydantic v2")
+def test_lazy_models_match_eager_models() -> None:
+    eager = construct_type(type_=LazyPage, value=LAZY_PAGE)
+    assert construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True) == eager
+    assert eager == construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True)
+
+    lazy = cast(LazyPage, construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True))
+    assert lazy.to_dict() == cast(LazyPage, eager).to_dict()
+    assert lazy.to_json() == cast(LazyPage, eager).to_json()
+    assert lazy.items[1].model_fields_set == {"id", "created_at"}
+
+    lazy = cast(LazyPage, construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True))
+    assert repr(lazy) == repr(eager)
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+    lazy = cast(LazyPage, construct_type(type_=LazyPage, value=LAZY_PAGE, lazy=True))
+    assert copy.deepcopy(lazy) == eager
+    assert lazy.items[0].model_copy(update={"id": "c"}).nested == BasicModel(foo="x")
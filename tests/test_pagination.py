@@ -0,0 +1,79 @@
+"""Tests for the cursor page classes."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Type
+
+import pytest
+
+from runloop_api_client import BaseModel, pagination
+from runloop_api_client._models import FinalRequestOptions, construct_type
+from runloop_api_client.pagination import SyncCursorIDPage, AsyncCursorIDPage, SyncDevboxesCursorIDPage
+
+PAGE_CLASSES = [
+    getattr(pagination, name) for name in pagination.__all__ if name not in ("SyncCursorIDPage", "AsyncCursorIDPage")
+]
+
+
+class Item(BaseModel):
+    id: str
+
+
+class Unidentified(BaseModel):
+    name: str
+
+
+@pytest.mark.parametrize("page_cls", PAGE_CLASSES, ids=lambda page_cls: page_cls.__name__)
+def test_page_classes_share_the_cursor_implementation(page_cls: Any) -> None:
+    base: Type[Any] = SyncCursorIDPage if page_cls.__name__.startswith("Sync") else AsyncCursorIDPage
+    assert issubclass(page_cls, base)
+    assert list(page_cls.model_fields) == ["has_more", "total_count", page_cls._items_field]
+
+    page: Any = construct_type(
+        type_=page_cls[Item], value={page_cls._items_field: [{"id": "a"}, {"id": "b"}], "has_more": True}
+    )
+    assert [item.id for item in page._get_page_items()] == ["a", "b"]
+    assert page.has_next_page()
+    info = page.next_page_info()
+    assert info is not None and info.params == {"starting_after": "b"}
+
+
+def _page(data: Dict[str, Any], item_type: Type[Any] = Item) -> SyncDevboxesCursorIDPage[Any]:
+    page = construct_type(type_=SyncDevboxesCursorIDPage[item_type], value=data)  # type: ignore[valid-type]
+    assert isinstance(page, SyncDevboxesCursorIDPage)
+    return page  # pyright: ignore[reportUnknownVariableType]
+
+
+@pytest.mark.parametrize(
+    "data, item_type",
+    [
+        ({"devboxes": [{"id": "a"}], "has_more": False}, Item),
+        ({"devboxes": [], "has_more": True}, Item),
+        ({"has_more": True}, Item),
+        ({"devboxes": [{"name": "a"}], "has_more": True}, Unidentified),
+    ],
+    ids=["has_more false", "empty page", "missing items", "item without id"],
+)
+def test_last_page(data: Dict[str, Any], item_type: Type[Any]) -> None:
+    page = _page(data, item_type)
+    assert not page.has_next_page()
+    if data.get("has_more") is not False:
+        assert page.next_page_info() is None
+
+
+def test_has_more_missing_follows_the_cursor() -> None:
+    assert _page({"devboxes": [{"id": "a"}]}).has_next_page()
+
+
+def test_next_page_options_keep_the_request_params() -> None:
+    page = _page({"devboxes": [{"id": "a"}, {"id": "b"}], "has_more": True})
+    page.__pydantic_private__ = {}
+    page._options = FinalRequestOptions.construct(
+        method="get", url="/v1/devboxes", params={"limit": 2, "status": "running", "starting_after": "z"}
+    )
+    info = page.next_page_info()
+    assert info is not None
+
+    options = page._info_to_options(info)
+    assert options.params == {"limit": 2, "status": "running", "starting_after": "b"}
+    assert page._options.params["starting_after"] == "z"
@@ -0,0 +1,137 @@
+"""Tests for reading ahead while auto-paginating cursor pages."""
+
+from __future__ import annotations
+
+import os
+import time
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from runloop_api_client import Runloop, AsyncRunloop, InternalServerError
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+PAGE_SIZE = 2
+PAGE_COUNT = 5
+
+
+def _page(index: int) -> Dict[str, Any]:
+    devboxes: List[Dict[str, Any]] = [
+        {
+            "id": f"dbx_{index * PAGE_SIZE + i}",
+            "status": "running",
+            "capabilities": [],
+            "create_time_ms": 0,
+            "launch_parameters": {},
+            "metadata": {},
+            "state_transitions": [],
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    return {"devboxes": devboxes, "has_more": index < PAGE_COUNT - 1, "total_count": PAGE_SIZE * PAGE_COUNT}
+
+
+def _page_index(request: httpx.Request) -> int:
+    after = request.url.params.get("starting_after")
+    return 0 if after is None else int(after[len("dbx_") :]) // PAGE_SIZE + 1
+
+
+class _Server:
+    """Serves `PAGE_COUNT` pages of devboxes and records which pages were requested."""
+
+    def __init__(self, fail_page: int | None = None) -> None:
+        self.requested: List[int] = []
+        self.fail_page = fail_page
+        self.second_page_requested = threading.Event()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        index = _page_index(request)
+        self.requested.append(index)
+        if index == 1:
+            self.second_page_requested.set()
+        if index == self.fail_page:
+            return httpx.Response(500, json={"error": "boom"})
+        return httpx.Response(200, json=_page(index))
+
+    def client(self, **kwargs: Any) -> Runloop:
+        http_client = httpx.Client(transport=httpx.MockTransport(self.handler))
+        return Runloop(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0, **kwargs)
+
+    def async_client(self, **kwargs: Any) -> AsyncRunloop:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return AsyncRunloop(
+            base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0, **kwargs
+        )
+
+
+EXPECTED_IDS = [f"dbx_{i}" for i in range(PAGE_SIZE * PAGE_COUNT)]
+
+
+@pytest.mark.parametrize("page_prefetch", [0, 1, 3])
+def test_prefetch_yields_the_same_items(page_prefetch: int) -> None:
+    server = _Server()
+    client = server.client(page_prefetch=page_prefetch)
+    assert [devbox.id for devbox in client.devboxes.list(limit=PAGE_SIZE)] == EXPECTED_IDS
+    assert server.requested == list(range(PAGE_COUNT))
+    client.close()
+
+
+def test_next_page_is_fetched_while_the_current_one_is_consumed() -> None:
+    server = _Server()
+    client = server.client()
+    pages = client.devboxes.list(limit=PAGE_SIZE).iter_pages(prefetch=1)
+
+    first = next(pages)
+    assert first.devboxes[0].id == "dbx_0"
+    assert server.second_page_requested.wait(5)
+    # one page ahead at most while the first one is still being consumed
+    time.sleep(0.1)
+    assert server.requested == [0, 1]
+
+    assert [page.devboxes[0].id for page in pages] == ["dbx_2", "dbx_4", "dbx_6", "dbx_8"]
+    client.close()
+
+
+def test_prefetch_errors_surface_in_order() -> None:
+    server = _Server(fail_page=2)
+    client = server.client(page_prefetch=2)
+    seen: List[str] = []
+    with pytest.raises(InternalServerError):
+        for devbox in client.devboxes.list(limit=PAGE_SIZE):
+            seen.append(devbox.id)
+    assert seen == EXPECTED_IDS[: 2 * PAGE_SIZE]
+    client.close()
+
+
+def test_page_prefetch_is_validated_and_copied() -> None:
+    with pytest.raises(ValueError, match="page_prefetch"):
+        Runloop(base_url=base_url, bearer_token=bearer_token, page_prefetch=-1)
+
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, page_prefetch=2)
+    assert client.copy()._page_prefetch == 2
+    assert client.copy(page_prefetch=0)._page_prefetch == 0
+    client.close()
+
+
+@pytest.mark.parametrize("page_prefetch", [0, 2])
+async def test_async_prefetch_yields_the_same_items(page_prefetch: int) -> None:
+    server = _Server()
+    client = server.async_client(page_prefetch=page_prefetch)
+    assert [devbox.id async for devbox in client.devboxes.list(limit=PAGE_SIZE)] == EXPECTED_IDS
+    assert server.requested == list(range(PAGE_COUNT))
+    await client.close()
+
+
+async def test_async_prefetch_errors_surface_in_order() -> None:
+    server = _Server(fail_page=2)
+    client = server.async_client(page_prefetch=2)
+    seen: List[str] = []
+    with pytest.raises(InternalServerError):
+        async for devbox in client.devboxes.list(limit=PAGE_SIZE):
+            seen.append(devbox.id)
+    assert seen == EXPECTED_IDS[: 2 * PAGE_SIZE]
+    await client.close()
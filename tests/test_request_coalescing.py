@@ -0,0 +1,231 @@
+"""Tests for opt-in singleflight coalescing of identical concurrent GETs."""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import Any, Callable
+
+import anyio
+import httpx
+import pytest
+
+from runloop_api_client import Runloop, AsyncRunloop
+from runloop_api_client._models import BaseModel
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+
+class Devbox(BaseModel):
+    id: str
+
+
+def _make_client(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> Runloop:
+    return Runloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        coalesce_requests=True,
+        **kwargs,
+    )
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_identical_gets_share_one_call() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    client = _make_client(handler)
+    results: list[Devbox] = []
+
+    def retrieve() -> None:
+        results.append(client.get("/v1/devboxes/dbx_1", cast_to=Devbox))
+
+    threads = [threading.Thread(target=retrieve) for _ in range(3)]
+    threads[0].start()
+    entered.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    _wait_for(lambda: client.coalescing_stats().hits == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 3 and all(result is results[0] for result in results)
+    assert client.coalescing_stats().misses == 1
+
+    # Once the flight has landed the next call goes to the server again.
+    client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+    assert len(calls) == 2
+    client.close()
+
+
+def test_only_identical_parsed_gets_are_coalesced() -> None:
+    release = threading.Event()
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url}")
+        release.wait(5)
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    client = _make_client(handler, coalesce_exclude=[r"^/v1/blueprints/"])
+    requests: list[Callable[[], object]] = [
+        lambda: client.get("/v1/devboxes/dbx_1", cast_to=Devbox),
+        lambda: client.get("/v1/devboxes/dbx_1", cast_to=Devbox, options={"params": {"view": "full"}}),
+        lambda: client.get("/v1/devboxes/dbx_1", cast_to=Devbox, options={"headers": {"Authorization": "other"}}),
+        lambda: client.get("/v1/devboxes/dbx_1", cast_to=httpx.Response),
+        lambda: client.post("/v1/devboxes/dbx_1", cast_to=Devbox),
+        lambda: client.get("/v1/blueprints/bpt_1", cast_to=Devbox),
+    ]
+    threads = [threading.Thread(target=request) for request in requests]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: len(calls) == len(requests))
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    stats = client.coalescing_stats()
+    assert (stats.hits, stats.misses) == (0, 3)
+    client.close()
+
+
+def test_coalesced_callers_share_errors() -> None:
+    entered = threading.Event()
+    release = threading.Event()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        entered.set()
+        release.wait(5)
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = _make_client(handler, max_retries=0)
+    errors: list[Exception] = []
+
+    def retrieve() -> None:
+        try:
+            client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=retrieve) for _ in range(2)]
+    threads[0].start()
+    entered.wait(5)
+    threads[1].start()
+    _wait_for(lambda: client.coalescing_stats().hits == 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    client.close()
+
+
+def test_coalescing_is_off_by_default_and_copied() -> None:
+    client = Runloop(base_url=base_url, bearer_token=bearer_token)
+    assert client._singleflight is None
+    assert client.coalescing_stats().misses == 0
+
+    enabled = client.copy(coalesce_requests=True, coalesce_exclude=["/executions/"])
+    copied = enabled.copy()
+    assert copied._singleflight is not None
+    assert copied._coalesce_exclude == ("/executions/",)
+    for c in (client, enabled, copied):
+        c.close()
+
+
+async def test_async_concurrent_identical_gets_share_one_call() -> None:
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        coalesce_requests=True,
+    )
+    first, second, other = await asyncio.gather(
+        client.get("/v1/devboxes/dbx_1", cast_to=Devbox),
+        client.get("/v1/devboxes/dbx_1", cast_to=Devbox),
+        client.get("/v1/devboxes/dbx_2", cast_to=Devbox),
+    )
+
+    assert first is second and other is not first
+    assert len(calls) == 2
+    stats = client.coalescing_stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    await client.close()
+
+
+async def test_async_cancelled_caller_does_not_cancel_shared_call() -> None:
+    release = asyncio.Event()
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        coalesce_requests=True,
+    )
+    leader = asyncio.ensure_future(client.get("/v1/devboxes/dbx_1", cast_to=Devbox))
+    follower = asyncio.ensure_future(client.get("/v1/devboxes/dbx_1", cast_to=Devbox))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert (await follower).id == "dbx_1"
+    await client.close()
+
+
+def test_async_gets_are_not_coalesced_under_trio() -> None:
+    pytest.importorskip("trio")
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await anyio.sleep(0.01)
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    async def main() -> None:
+        client = AsyncRunloop(
+            base_url=base_url,
+            bearer_token=bearer_token,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            coalesce_requests=True,
+        )
+        async with anyio.create_task_group() as tg:
+            for _ in range(2):
+                tg.start_soon(lambda: client.get("/v1/devboxes/dbx_1", cast_to=Devbox))
+        stats = client.coalescing_stats()
+        assert (stats.hits, stats.misses) == (0, 2)
+        await client.close()
+
+    anyio.run(main, backend="trio")
+    assert len(calls) == 2
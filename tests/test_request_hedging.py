@@ -0,0 +1,238 @@
+"""Tests for budgeted hedging of slow idempotent GETs."""
+
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import Any, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import httpx
+import pytest
+
+import runloop_api_client._base_client as _base_mod
+from runloop_api_client import Runloop, AsyncRunloop
+from runloop_api_client._models import BaseModel
+from runloop_api_client._constants import HEDGE_MIN_SAMPLES
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+ROUTE = "GET /v1/devboxes/{id}"
+
+
+class Devbox(BaseModel):
+    id: str
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_pool() -> Iterator[None]:  # pyright: ignore[reportUnusedFunction]
+    _clear_pool_state()
+    yield
+    _clear_pool_state()
+
+
+def _clear_pool_state() -> None:
+    for registry in _base_mod._shared_sync_registries.values():
+        for transport in registry.take_all():
+            transport._transport.close()
+    for async_registry in _base_mod._shared_async_registries.values():
+        async_registry.clear()
+
+
+def _mock_transports(handler: Callable[[httpx.Request], Any]) -> Callable[[httpx.Limits], httpx.MockTransport]:
+    """Stand-in for the shared transport factories: every new shard gets a mock transport."""
+
+    def factory(_limits: httpx.Limits) -> httpx.MockTransport:
+        return httpx.MockTransport(handler)
+
+    return factory
+
+
+def _seed_latencies(hedging: _base_mod._Hedging | None, seconds: float = 0.01) -> None:
+    assert hedging is not None
+    for _ in range(HEDGE_MIN_SAMPLES):
+        hedging.record(ROUTE, seconds)
+
+
+def test_hedge_delay_tracks_route_p95_and_budget() -> None:
+    hedging = _base_mod._Hedging(0.5)
+    for i in range(HEDGE_MIN_SAMPLES - 1):
+        hedging.record(ROUTE, i / 100)
+    assert hedging.delay(ROUTE) is None
+    hedging.record(ROUTE, 1.0)
+    assert hedging.delay(ROUTE) == 1.0
+    assert hedging.delay("GET /v1/objects/{id}") is None
+
+    # Three eligible requests at ratio 0.5 fund exactly one hedge.
+    assert hedging.try_hedge() is True
+    assert hedging.try_hedge() is False
+    stats = hedging.stats()
+    assert (stats.hedged, stats.wins, stats.denied) == (1, 0, 1)
+
+    with pytest.raises(ValueError, match="hedge_budget"):
+        _base_mod._Hedging(0)
+
+
+def test_pick_shard_avoids_excluded_shard() -> None:
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, shard_selection="round_robin")
+    pool = client._pools["api"]
+    for _ in range(4):
+        assert pool.pick_shard(exclude=0) == 1
+        assert pool.pick_shard(exclude=1) == 0
+    client.close()
+
+
+def test_slow_get_is_hedged_and_first_response_wins(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = threading.Event()
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            calls.append(request.url.path)
+            first = len(calls) == 1
+        if first:
+            release.wait(5)
+            return httpx.Response(200, json={"id": "primary"})
+        return httpx.Response(200, json={"id": "hedge"})
+
+    monkeypatch.setattr(_base_mod, "_make_shared_transport", _mock_transports(handler))
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, hedge_budget=1.0)
+    _seed_latencies(client._hedging)
+
+    assert client.get("/v1/devboxes/dbx_1", cast_to=Devbox).id == "hedge"
+    release.set()
+    assert len(calls) == 2
+    stats = client.hedging_stats()
+    assert stats is not None and (stats.hedged, stats.wins) == (1, 1)
+    client.close()
+
+
+def test_only_api_pool_gets_are_hedged(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    monkeypatch.setattr(_base_mod, "_make_shared_transport", _mock_transports(handler))
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, hedge_budget=1.0)
+    hedging = client._hedging
+    assert hedging is not None
+    for route in ("POST /v1/devboxes/{id}/shutdown", "GET /v1/devboxes/{id}/download_file"):
+        for _ in range(HEDGE_MIN_SAMPLES):
+            hedging.record(route, 0.0)
+
+    client.post("/v1/devboxes/dbx_1/shutdown", cast_to=Devbox)
+    client.get("/v1/devboxes/dbx_1/download_file", cast_to=httpx.Response)
+    assert len(calls) == 2
+    assert hedging.stats().hedged == 0
+    client.close()
+
+
+def test_hedging_is_off_by_default_and_copied() -> None:
+    client = Runloop(base_url=base_url, bearer_token=bearer_token)
+    assert client.hedging_stats() is None
+
+    enabled = client.copy(hedge_budget=0.05)
+    copied = enabled.copy()
+    assert copied._hedging is not None and copied._hedging.ratio == 0.05
+    assert enabled.copy(hedge_budget=None)._hedging is None
+    for c in (client, enabled, copied):
+        c.close()
+
+
+def test_hedge_executor_is_created_once_and_shut_down_on_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[ThreadPoolExecutor] = []
+
+    def slow_executor(**kwargs: Any) -> ThreadPoolExecutor:
+        time.sleep(0.01)  # widen the window between the check and the assignment
+        created.append(ThreadPoolExecutor(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(_base_mod, "ThreadPoolExecutor", slow_executor)
+    client = Runloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, hedge_budget=1.0)
+    start = threading.Barrier(8)
+    executors: list[ThreadPoolExecutor] = []
+
+    def first_call() -> None:
+        start.wait()
+        executors.append(client._hedge_executor())
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(created) == 1
+    assert all(executor is created[0] for executor in executors)
+
+    # A child process after fork() gets an executor of its own.
+    _base_mod._reset_after_fork()  # what os.register_at_fork runs in the child
+    child = client._hedge_executor()
+    assert child is not created[0] and len(created) == 2
+
+    client.close()
+    assert child._shutdown
+    with pytest.raises(RuntimeError, match="closed"):
+        client._hedge_executor()
+    created[0].shutdown()
+
+
+async def test_async_hedge_cancels_the_slower_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200, json={"id": "primary"})
+        return httpx.Response(200, json={"id": "hedge"})
+
+    monkeypatch.setattr(_base_mod, "_make_shared_async_transport", _mock_transports(handler))
+    client = AsyncRunloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, hedge_budget=1.0)
+    _seed_latencies(client._hedging)
+
+    assert (await client.get("/v1/devboxes/dbx_1", cast_to=Devbox)).id == "hedge"
+    await asyncio.wait_for(cancelled.wait(), 5)
+    assert len(calls) == 2
+    stats = client.hedging_stats()
+    assert stats is not None and (stats.hedged, stats.wins) == (1, 1)
+    await client.close()
+
+
+def test_async_hedging_sends_once_under_trio(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("trio")
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await anyio.sleep(0.05)
+        return httpx.Response(200, json={"id": "dbx_1"})
+
+    wrapper = _base_mod.AsyncHttpxClientWrapper
+
+    def make_client(**kwargs: Any) -> httpx.AsyncClient:
+        kwargs.pop("limits", None)
+        return wrapper(transport=httpx.MockTransport(handler), **kwargs)
+
+    # Without an asyncio loop the pools build private clients rather than shared transports.
+    monkeypatch.setattr(_base_mod, "AsyncHttpxClientWrapper", make_client)
+
+    async def main() -> None:
+        client = AsyncRunloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2, hedge_budget=1.0)
+        _seed_latencies(client._hedging, seconds=0.001)
+        assert (await client.get("/v1/devboxes/dbx_1", cast_to=Devbox)).id == "dbx_1"
+        await client.close()
+
+    anyio.run(main, backend="trio")
+    assert calls == ["/v1/devboxes/dbx_1"]
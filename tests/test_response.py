@@ -1,3 +1,4 @@
+import os
 import json
 from typing import Any, List, Union, cast
 from typing_extensions import Annotated
@@ -7,6 +8,7 @@ import pytest
 import pydantic
 
 from runloop_api_client import Runloop, BaseModel, AsyncRunloop
+from runloop_api_client.types import ObjectView
 from runloop_api_client._response import (
     APIResponse,
     BaseAPIResponse,
@@ -18,6 +20,9 @@ from runloop_api_client._response import (
 from runloop_api_client._streaming import Stream
 from runloop_api_client._base_client import FinalRequestOptions
 
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
 
 class ConcreteBaseAPIResponse(APIResponse[bytes]): ...
 
@@ -275,3 +280,70 @@ async def test_async_response_parse_expect_model_union_non_json_content(async_cl
     obj = await response.parse(to=cast(Any, Union[CustomModel, OtherModel]))
     assert isinstance(obj, str)
     assert obj == "foo"
+
+
+def _objects_page(index: int, page_count: int) -> httpx.Response:
+    objects = [
+        {
+            "id": f"obj_{index * 2 + i}",
+            "name": "file.txt",
+            "state": "READ_ONLY",
+            "content_type": "text",
+            "create_time_ms": 0,
+        }
+        for i in range(2)
+    ]
+    body = {"objects": objects, "has_more": index < page_count - 1, "total_count": page_count * 2}
+    return httpx.Response(200, content=json.dumps(body).encode(), headers={"Content-Type": "application/json"})
+
+
+def _objects_handler(page_count: int, requested: List[str]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        after = request.url.params.get("starting_after")
+        requested.append(str(after))
+        return _objects_page(0 if after is None else int(after[len("obj_") :]) // 2 + 1, page_count)
+
+    return handler
+
+
+def test_response_iter_items_streams_every_page() -> None:
+    requested: List[str] = []
+    client = Runloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.Client(transport=httpx.MockTransport(_objects_handler(3, requested))),
+    )
+    with client.objects.with_streaming_response.list(limit=2) as response:
+        items = list(response.iter_items())
+
+    assert [item.id for item in items] == [f"obj_{i}" for i in range(6)]
+    assert all(isinstance(item, ObjectView) for item in items)
+    assert requested == ["None", "obj_1", "obj_3"]
+
+
+def test_response_iter_items_requires_a_page(client: Runloop) -> None:
+    response = APIResponse(
+        raw=httpx.Response(200, content=b"{}", headers={"Content-Type": "application/json"}),
+        client=client,
+        stream=False,
+        stream_cls=None,
+        cast_to=CustomModel,
+        options=FinalRequestOptions.construct(method="get", url="/foo"),
+    )
+
+    with pytest.raises(TypeError, match="Expected a paginated list response"):
+        list(response.iter_items())
+
+
+async def test_async_response_iter_items_streams_every_page() -> None:
+    requested: List[str] = []
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_objects_handler(3, requested))),
+    )
+    async with client.objects.with_streaming_response.list(limit=2) as response:
+        items = [item async for item in response.iter_items()]
+
+    assert [item.id for item in items] == [f"obj_{i}" for i in range(6)]
+    assert requested == ["None", "obj_1", "obj_3"]
@@ -0,0 +1,179 @@
+"""Tests for the client-wide retry budget and the per-endpoint circuit breaker."""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from runloop_api_client import Runloop, AsyncRunloop, CircuitOpenError, InternalServerError
+from runloop_api_client._models import BaseModel
+from runloop_api_client._base_client import BaseClient, _CircuitBreakers
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+
+class Devbox(BaseModel):
+    id: str
+
+
+def _no_retry_delay(*_args: object, **_kwargs: object) -> float:
+    return 0
+
+
+@pytest.fixture(autouse=True)
+def _instant_retries(monkeypatch: pytest.MonkeyPatch) -> None:  # pyright: ignore[reportUnusedFunction]
+    monkeypatch.setattr(BaseClient, "_calculate_retry_timeout", _no_retry_delay)
+
+
+def _make_client(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> Runloop:
+    return Runloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_retries_stop_once_the_budget_is_spent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("runloop_api_client._base_client.RETRY_BUDGET_MIN_PER_SECOND", 0)
+    statuses = [200, 200, 503, 503, 503, 503]
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(statuses.pop(0), json={"id": "dbx_1"})
+
+    client = _make_client(handler, max_retries=5, retry_budget_ratio=0.5)
+    client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+    client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+
+    # Two successes buy one retry: the failing call is sent twice, not six times.
+    with pytest.raises(InternalServerError):
+        client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+    assert len(calls) == 4
+
+    stats = client.retry_budget_stats()
+    assert stats is not None
+    assert (stats.successes, stats.retries, stats.available, stats.denied) == (2, 1, 0, 1)
+    client.close()
+
+
+def test_retry_budget_is_off_by_default() -> None:
+    client = Runloop(base_url=base_url, bearer_token=bearer_token)
+    assert client.retry_budget_stats() is None
+    assert client.circuit_breakers() == {}
+    client.close()
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast() -> None:
+    healthy = False
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if healthy:
+            return httpx.Response(200, json={"id": "dbx_1"})
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    client = _make_client(handler, max_retries=0, circuit_breaker_threshold=2, circuit_breaker_cooldown=0.05)
+    for _ in range(2):
+        with pytest.raises(InternalServerError):
+            client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+
+    # Every devbox shares the endpoint's breaker; other endpoints are unaffected.
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.get("/v1/devboxes/dbx_2", cast_to=Devbox)
+    assert 0 < exc_info.value.retry_in <= 0.05
+    assert len(calls) == 2
+    with pytest.raises(InternalServerError):
+        client.get("/v1/blueprints/bpt_1", cast_to=Devbox)
+
+    state = client.circuit_breakers()["GET /v1/devboxes/{id}"]
+    assert (state.state, state.consecutive_failures) == ("open", 2)
+    assert state.retry_in is not None
+
+    time.sleep(0.06)
+    healthy = True
+    assert client.get("/v1/devboxes/dbx_1", cast_to=Devbox).id == "dbx_1"
+    state = client.circuit_breakers()["GET /v1/devboxes/{id}"]
+    assert (state.state, state.consecutive_failures, state.retry_in) == ("closed", 0, None)
+    client.close()
+
+
+def test_open_circuit_cuts_the_retry_loop_short() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503, json={"message": "unavailable"})
+
+    client = _make_client(handler, max_retries=5, circuit_breaker_threshold=2)
+    with pytest.raises(CircuitOpenError):
+        client.post("/v1/devboxes/dbx_1/shutdown", cast_to=Devbox)
+    assert len(calls) == 2
+    client.close()
+
+
+def test_half_open_circuit_lets_one_probe_through() -> None:
+    breakers = _CircuitBreakers(threshold=1, cooldown=0.05)
+    breakers.record("GET /v1/devboxes/{id}", failed=True)
+    assert breakers.acquire("GET /v1/devboxes/{id}") is not None
+
+    time.sleep(0.06)
+    assert breakers.acquire("GET /v1/devboxes/{id}") is None
+    assert breakers.states()["GET /v1/devboxes/{id}"].state == "half_open"
+    # Only the probe is admitted while it is outstanding.
+    assert breakers.acquire("GET /v1/devboxes/{id}") is not None
+
+    breakers.record("GET /v1/devboxes/{id}", failed=True)
+    assert breakers.states()["GET /v1/devboxes/{id}"].state == "open"
+
+
+def test_settings_are_validated_and_copied() -> None:
+    with pytest.raises(ValueError, match="circuit_breaker_threshold"):
+        Runloop(base_url=base_url, bearer_token=bearer_token, circuit_breaker_threshold=0)
+    with pytest.raises(ValueError, match="retry_budget_ratio"):
+        Runloop(base_url=base_url, bearer_token=bearer_token, retry_budget_ratio=-1)
+
+    client = Runloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        retry_budget_ratio=0.2,
+        circuit_breaker_threshold=5,
+        circuit_breaker_cooldown=10,
+    )
+    copied = client.copy()
+    assert copied._retry_budget is not None and copied._retry_budget.ratio == 0.2
+    assert copied._circuit_breakers is not None
+    assert (copied._circuit_breakers.threshold, copied._circuit_breakers.cooldown) == (5, 10)
+
+    disabled = client.copy(retry_budget_ratio=None, circuit_breaker_threshold=None)
+    assert disabled._retry_budget is None and disabled._circuit_breakers is None
+    for c in (client, copied, disabled):
+        c.close()
+
+
+async def test_async_circuit_breaker_fails_fast() -> None:
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=5,
+        circuit_breaker_threshold=3,
+    )
+    with pytest.raises(CircuitOpenError):
+        await client.get("/v1/devboxes/dbx_1", cast_to=Devbox)
+    assert len(calls) == 3
+    assert client.circuit_breakers()["GET /v1/devboxes/{id}"].state == "open"
+    await client.close()
@@ -0,0 +1,119 @@
+"""Tests for the parallel partitioned listing helper."""
+
+from __future__ import annotations
+
+import os
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from runloop_api_client import AsyncRunloop, InternalServerError
+from runloop_api_client.lib.scan_async import DEVBOX_STATUS_PARTITIONS, async_scan
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+bearer_token = "My Bearer Token"
+
+PAGE_SIZE = 2
+
+
+def _devbox(devbox_id: str, status: str) -> Dict[str, Any]:
+    return {
+        "id": devbox_id,
+        "status": status,
+        "capabilities": [],
+        "create_time_ms": 0,
+        "launch_parameters": {},
+        "metadata": {},
+        "state_transitions": [],
+    }
+
+
+class _Server:
+    """Lists devboxes filtered by status, with one devbox showing up under two statuses."""
+
+    def __init__(self, fail_status: str | None = None) -> None:
+        self.devboxes: Dict[str, List[str]] = {
+            "running": [f"dbx_running_{i}" for i in range(5)],
+            "suspended": [f"dbx_suspended_{i}" for i in range(3)] + ["dbx_running_0"],
+            "shutdown": [f"dbx_shutdown_{i}" for i in range(4)],
+        }
+        self.fail_status = fail_status
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        status = request.url.params["status"]
+        if status == self.fail_status:
+            return httpx.Response(500, json={"error": "boom"})
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        ids = self.devboxes.get(status, [])
+        after = request.url.params.get("starting_after")
+        start = 0 if after is None else ids.index(after) + 1
+        page = ids[start : start + PAGE_SIZE]
+        return httpx.Response(
+            200,
+            json={
+                "devboxes": [_devbox(devbox_id, status) for devbox_id in page],
+                "has_more": start + PAGE_SIZE < len(ids),
+                "total_count": len(ids),
+            },
+        )
+
+    def client(self) -> AsyncRunloop:
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return AsyncRunloop(base_url=base_url, bearer_token=bearer_token, http_client=http_client, max_retries=0)
+
+
+async def test_scan_merges_and_deduplicates_partitions() -> None:
+    server = _Server()
+    client = server.client()
+    ids = [devbox.id async for devbox in async_scan(client.devboxes.list, DEVBOX_STATUS_PARTITIONS, limit=PAGE_SIZE)]
+
+    expected = {devbox_id for partition in server.devboxes.values() for devbox_id in partition}
+    assert len(ids) == len(expected)
+    assert set(ids) == expected
+    # items of a single partition keep their page order
+    assert [i for i in ids if i.startswith("dbx_shutdown")] == server.devboxes["shutdown"]
+    assert server.max_in_flight > 1
+    await client.close()
+
+
+async def test_scan_respects_max_concurrency() -> None:
+    server = _Server()
+    client = server.client()
+    ids = [
+        devbox.id
+        async for devbox in async_scan(
+            client.devboxes.list, DEVBOX_STATUS_PARTITIONS, max_concurrency=1, limit=PAGE_SIZE
+        )
+    ]
+    assert len(ids) == 12
+    assert server.max_in_flight == 1
+    await client.close()
+
+
+async def test_scan_surfaces_partition_errors() -> None:
+    server = _Server(fail_status="suspended")
+    client = server.client()
+    with pytest.raises(InternalServerError):
+        async for _ in async_scan(client.devboxes.list, DEVBOX_STATUS_PARTITIONS, limit=PAGE_SIZE):
+            pass
+    await client.close()
+
+
+async def test_scan_rejects_conflicting_params() -> None:
+    client = _Server().client()
+    with pytest.raises(ValueError, match="status"):
+        async for _ in async_scan(client.devboxes.list, DEVBOX_STATUS_PARTITIONS, status="running"):
+            pass
+    with pytest.raises(ValueError, match="max_concurrency"):
+        async for _ in async_scan(client.devboxes.list, DEVBOX_STATUS_PARTITIONS, max_concurrency=0):
+            pass
+    await client.close()
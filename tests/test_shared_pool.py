@@ -29,12 +29,10 @@ def _reset_shared_pool() -> Iterator[None]:  # pyright: ignore[reportUnusedFunct
 
 def _clear_pool_state() -> None:
     old: list[_base_mod._SharedTransport] = []
-    old.extend(_base_mod._shared_sync_api_transports.take_all())
-    old.extend(_base_mod._shared_sync_background_transports.take_all())
-    old.extend(_base_mod._shared_sync_transfer_transports.take_all())
-    _base_mod._shared_async_api_transports.clear()
-    _base_mod._shared_async_background_transports.clear()
-    _base_mod._shared_async_transfer_transports.clear()
+    for registry in _base_mod._shared_sync_registries.values():
+        old.extend(registry.take_all())
+    for async_registry in _base_mod._shared_async_registries.values():
+        async_registry.clear()
     for transport in old:
         try:
             transport._transport.close()
@@ -320,3 +318,80 @@ class TestAsyncCrossLoop:
 
         id1, id2 = asyncio.run(create_two())
         assert id1 == id2
+
+
+# ---------------------------------------------------------------------------
+# Fork safety
+# ---------------------------------------------------------------------------
+
+
+class TestForkSafety:
+    def test_child_forgets_inherited_transports(self):
+        c1 = _make_client(shared_http_pool=True)
+        inherited = _get_transport(c1)
+
+        _base_mod._reset_after_fork()  # what os.register_at_fork runs in the child
+
+        assert _base_mod._shared_sync_api_transports.shard_ids() == set()
+        c2 = _make_client(shared_http_pool=True)
+        assert _get_transport(c2) is not inherited
+        # Inherited transports are abandoned, never closed from the child.
+        assert inherited.refcount == 1
+
+        c1.close()
+        c2.close()
+
+    def test_pool_built_before_fork_rebuilds_lazily(self):
+        c1 = _make_client(shared_http_pool=True, api_pool_shards=2)
+        assert c1._api_pool is not None
+        # held rather than compared by `id()`, which a rebuilt client could reuse once these are collected
+        inherited = [c1._api_pool.ensure(shard) for shard in range(2)]
+
+        _base_mod._reset_after_fork()
+
+        rebuilt = c1._api_pool.next_client()
+        assert all(rebuilt is not client for client in inherited)
+        assert list(c1._api_pool._clients.values()) == [rebuilt]
+        assert c1._api_pool.shards == 2
+
+        c1.close()
+
+    def test_async_pool_built_before_fork_rebuilds_lazily(self):
+        async def run() -> None:
+            c1 = _make_async_client(shared_http_pool=True)
+            assert c1._api_pool is not None
+            inherited = c1._api_pool.ensure(0)
+
+            _base_mod._reset_after_fork()
+
+            assert c1._api_pool.ensure(0) is not inherited
+            await c1.close()
+
+        asyncio.run(run())
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_forked_child_starts_with_clean_registries(self):
+        c1 = _make_client(shared_http_pool=True)
+        inherited = _get_transport(c1)
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            os.close(read_fd)
+            ok = (
+                _base_mod._shared_sync_api_transports.shard_ids() == set()
+                and c1._api_pool is not None
+                and c1._api_pool.next_client()._transport is not inherited
+            )
+            os.write(write_fd, b"1" if ok else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as reader:
+            result = reader.read()
+        os.waitpid(pid, 0)
+        assert result == b"1"
+        assert inherited.refcount == 1
+
+        c1.close()
@@ -4,17 +4,23 @@ from __future__ import annotations
 
 import os
 import re
+import time
+import asyncio
 import threading
-from typing import Any, Iterator
+from typing import Any, Callable, Iterator, Sequence
 from pathlib import Path
+from typing_extensions import override
 
+import anyio
 import httpx
 import pytest
 
 import runloop_api_client._base_client as _base_mod
-from runloop_api_client import Runloop, AsyncRunloop
+from runloop_api_client import Runloop, PoolRoute, PoolConfig, AsyncRunloop, QueueTimeoutError
+from runloop_api_client._constants import DEFAULT_MAX_STREAMING_POOL_SHARDS
 from runloop_api_client._base_client import (
     _is_transfer_path,
+    _is_streaming_path,
     _is_background_path,
 )
 
@@ -32,6 +38,13 @@ _KNOWN_TRANSFER_PATHS = (
     "/v1/devboxes/dbx_1/upload_file",
     "/v1/devboxes/dbx_1/download_file",
 )
+_KNOWN_STREAMING_PATHS = (
+    "/v1/devboxes/dbx_1/executions/ex_1/stream_stdout_updates",
+    "/v1/devboxes/dbx_1/executions/ex_1/stream_stderr_updates",
+    "/v1/devboxes/evictions/watch",
+    "/v1/axons/ax_1/subscribe/sse",
+    "/v1/scenarios/runs/run_1/download_logs",
+)
 
 
 @pytest.fixture(autouse=True)
@@ -43,12 +56,10 @@ def _reset_shared_pool() -> Iterator[None]:  # pyright: ignore[reportUnusedFunct
 
 def _clear_pool_state() -> None:
     old: list[_base_mod._SharedTransport] = []
-    old.extend(_base_mod._shared_sync_api_transports.take_all())
-    old.extend(_base_mod._shared_sync_background_transports.take_all())
-    old.extend(_base_mod._shared_sync_transfer_transports.take_all())
-    _base_mod._shared_async_api_transports.clear()
-    _base_mod._shared_async_background_transports.clear()
-    _base_mod._shared_async_transfer_transports.clear()
+    for registry in _base_mod._shared_sync_registries.values():
+        old.extend(registry.take_all())
+    for async_registry in _base_mod._shared_async_registries.values():
+        async_registry.clear()
     for transport in old:
         try:
             transport._transport.close()
@@ -56,6 +67,17 @@ def _clear_pool_state() -> None:
             pass
 
 
+def _mock_transports(
+    handler: Callable[[httpx.Request], httpx.Response],
+) -> Callable[[httpx.Limits], httpx.MockTransport]:
+    """Stand-in for the shared transport factories: every new shard gets a mock transport."""
+
+    def factory(_limits: httpx.Limits) -> httpx.MockTransport:
+        return httpx.MockTransport(handler)
+
+    return factory
+
+
 def _make_client(**kwargs: Any) -> Runloop:
     kwargs.setdefault("base_url", base_url)
     kwargs.setdefault("bearer_token", bearer_token)
@@ -218,6 +240,9 @@ def test_known_long_lived_paths_are_classified() -> None:
     for path in _KNOWN_TRANSFER_PATHS:
         assert _is_transfer_path(path), path
         assert not _is_background_path(path), path
+    for path in _KNOWN_STREAMING_PATHS:
+        assert _is_streaming_path(path), path
+        assert not _is_transfer_path(path) and not _is_background_path(path), path
 
 
 def test_resources_tree_long_lived_ops_match_classifier() -> None:
@@ -241,3 +266,824 @@ def test_resources_tree_long_lived_ops_match_classifier() -> None:
     for path in found_upload | found_download:
         concrete = path.replace("{id}", "dbx_1")
         assert _is_transfer_path(concrete), path
+
+
+class _ChunkStream(httpx.SyncByteStream):
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'{"ok": true}'
+
+
+def test_shared_transport_counts_in_flight_streams_until_body_closed() -> None:
+    transport = _base_mod._SharedTransport(httpx.MockTransport(lambda _req: httpx.Response(200, stream=_ChunkStream())))
+    client = httpx.Client(transport=transport, base_url=base_url)
+    try:
+        with client.stream("GET", "/v1/devboxes") as response:
+            assert transport.in_flight == 1
+            response.read()
+        assert transport.in_flight == 0
+
+        client.get("/v1/devboxes")
+        assert transport.in_flight == 0
+    finally:
+        client.close()
+
+
+def test_next_client_routes_to_least_loaded_shard() -> None:
+    client = _make_client(background_pool_shards=3)
+    pool = client._background_pool
+    assert pool is not None
+    try:
+        for shard in range(3):
+            pool.ensure(shard)
+        pool._transports[0]._in_flight = 5
+        pool._transports[1]._in_flight = 1
+        pool._transports[2]._in_flight = 3
+        pool._next = 0
+        assert pool.next_client() is pool._clients[1]
+        pool._transports[1]._in_flight = 4
+        assert pool.next_client() is pool._clients[2]
+    finally:
+        for transport in pool._transports.values():
+            transport._in_flight = 0
+        client.close()
+
+
+def test_pool_scales_up_when_all_shards_saturated_and_respects_ceiling() -> None:
+    client = _make_client(background_pool_shards=2, max_background_pool_shards=3)
+    pool = client._background_pool
+    assert pool is not None
+    try:
+        for shard in range(2):
+            pool.ensure(shard)
+            pool._transports[shard]._in_flight = _base_mod.SHARD_SCALE_UP_STREAMS
+        grown = pool.next_client()
+        assert pool.shards == 3
+        assert grown is pool._clients[2]
+        assert _base_mod._shared_sync_background_transports.shard_ids() == {0, 1, 2}
+
+        pool._transports[2]._in_flight = _base_mod.SHARD_SCALE_UP_STREAMS
+        pool.next_client()
+        assert pool.shards == 3
+    finally:
+        for transport in pool._transports.values():
+            transport._in_flight = 0
+        client.close()
+
+
+def test_pool_releases_idle_grown_shards() -> None:
+    client = _make_client(background_pool_shards=1, max_background_pool_shards=2)
+    pool = client._background_pool
+    assert pool is not None
+    try:
+        pool.ensure(0)
+        pool._transports[0]._in_flight = _base_mod.SHARD_SCALE_UP_STREAMS
+        pool.next_client()
+        assert pool.shards == 2
+        grown_transport = pool._transports[1]
+        pool._transports[0]._in_flight = 0
+
+        pool.next_client()
+        assert pool.shards == 2, "recently used shard must not be released"
+
+        pool._last_used[1] -= _base_mod.SHARD_IDLE_TIMEOUT_SECONDS + 1
+        pool.next_client()
+        assert pool.shards == 1
+        assert 1 not in pool._clients
+        assert grown_transport.refcount == 0
+    finally:
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_closes_released_shards_in_tracked_tasks() -> None:
+    client = AsyncRunloop(
+        base_url=base_url, bearer_token=bearer_token, background_pool_shards=1, max_background_pool_shards=2
+    )
+    pool = client._background_pool
+    assert pool is not None
+    try:
+        pool.shards = 2
+        grown = pool.ensure(1)
+        pool._last_used[1] = time.monotonic() - _base_mod.SHARD_IDLE_TIMEOUT_SECONDS - 1
+        pool.next_client()
+        assert pool.shards == 1
+        (task,) = pool._closer._tasks
+        await task
+        assert grown.is_closed
+        assert not pool._closer._tasks
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_pool_defers_closing_released_shards_outside_asyncio(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_base_mod, "get_async_library", lambda: "trio")
+    client = AsyncRunloop(
+        base_url=base_url, bearer_token=bearer_token, background_pool_shards=1, max_background_pool_shards=2
+    )
+    pool = client._background_pool
+    assert pool is not None
+    pool.shards = 2
+    grown = pool.ensure(1)
+    pool._last_used[1] = time.monotonic() - _base_mod.SHARD_IDLE_TIMEOUT_SECONDS - 1
+    pool.next_client()
+    assert pool.shards == 1
+    assert not pool._closer._tasks
+    assert not grown.is_closed
+
+    await client.close()
+    assert grown.is_closed
+
+
+def test_autoscaling_ceiling_never_below_base_shards() -> None:
+    client = _make_client(api_pool_shards=4, max_api_pool_shards=2)
+    try:
+        assert client._max_api_pool_shards == 4
+        assert client._api_pool is not None and client._api_pool.max_shards == 4
+        assert client.copy()._max_api_pool_shards == 4
+    finally:
+        client.close()
+
+
+def test_shard_selection_policies() -> None:
+    assert _base_mod._select_round_robin([9, 0, 0], 0) == 0
+    assert _base_mod._select_least_outstanding([3, 1, 1], 0) == 1
+    assert _base_mod._select_least_outstanding([3, 1, 1], 2) == 2
+    assert _base_mod._select_least_outstanding([0, 0, 0], 1) == 1
+    for _ in range(50):
+        assert _base_mod._select_power_of_two_choices([5, 5, 0], 0) in {0, 1, 2}
+        assert _base_mod._select_power_of_two_choices([7, 0], 0) == 1
+    assert _base_mod._select_power_of_two_choices([4], 0) == 0
+
+
+def test_unknown_shard_selection_policy_raises() -> None:
+    with pytest.raises(ValueError, match="shard_selection"):
+        _make_client(shard_selection="random")  # type: ignore[arg-type]
+
+
+def test_custom_shard_selector_and_copy_inherit_policy() -> None:
+    calls: list[tuple[list[int], int]] = []
+
+    def always_last(loads: Sequence[int], start: int) -> int:
+        calls.append((list(loads), start))
+        return len(loads) - 1
+
+    client = _make_client(api_pool_shards=3, shard_selection=always_last)
+    copied = client.copy()
+    try:
+        assert client._api_pool is not None
+        assert client._get_client_for_path("/v1/devboxes") is client._api_pool._clients[2]
+        assert calls and len(calls[0][0]) == 3
+        assert copied._shard_selection is always_last
+
+        rr = client.copy(shard_selection="round_robin")
+        assert rr._api_pool is not None
+        assert rr._api_pool._selector is _base_mod._select_round_robin
+        rr.close()
+    finally:
+        client.close()
+        copied.close()
+
+
+def test_private_pool_counts_outstanding_requests_per_shard() -> None:
+    pool = _base_mod._SyncClientPool(
+        shards=2,
+        shared=False,
+        registry=None,
+        make_client=lambda _t: httpx.Client(
+            transport=httpx.MockTransport(lambda _req: httpx.Response(200, stream=_ChunkStream()))
+        ),
+    )
+    try:
+        pool._next = 0
+        first = pool.send(httpx.Request("GET", f"{base_url}/v1/devboxes"), stream=True)
+        assert pool.loads() == [1, 0]
+        second = pool.send(httpx.Request("GET", f"{base_url}/v1/devboxes"), stream=True)
+        assert pool.loads() == [1, 1]
+        first.close()
+        assert pool.loads() == [0, 1]
+        pool.send(httpx.Request("GET", f"{base_url}/v1/devboxes"), stream=False)
+        assert pool.loads() == [0, 1]
+        second.close()
+        assert pool.loads() == [0, 0]
+    finally:
+        pool.close()
+
+
+class _FlakyTransport(httpx.MockTransport):
+    def __init__(self, fail_with: type[httpx.TransportError] | None = None) -> None:
+        self.fail_with = fail_with
+        self.closed = False
+        super().__init__(self._respond)
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        if self.fail_with is not None:
+            raise self.fail_with("boom", request=request)
+        return httpx.Response(200, stream=_ChunkStream())
+
+    @override
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_shared_transport_recycles_connection_on_goaway() -> None:
+    fresh: list[_FlakyTransport] = []
+
+    def factory() -> httpx.BaseTransport:
+        fresh.append(_FlakyTransport())
+        return fresh[-1]
+
+    original = _FlakyTransport()
+    shared = _base_mod._SharedTransport(original, factory=factory)
+    client = httpx.Client(transport=shared, base_url=base_url)
+    try:
+        held = client.send(client.build_request("GET", "/v1/devboxes"), stream=True)
+        original.fail_with = httpx.RemoteProtocolError
+        with pytest.raises(httpx.RemoteProtocolError):
+            client.get("/v1/devboxes")
+
+        assert shared.health().recycles == 1
+        assert shared._transport is fresh[0]
+        assert not original.closed, "retired transport must stay open while a stream is running on it"
+
+        assert client.get("/v1/devboxes").status_code == 200
+        held.close()
+        assert original.closed
+        assert shared.in_flight == 0
+    finally:
+        client.close()
+    assert fresh[0].closed
+
+
+def test_shared_transport_marks_unhealthy_after_consecutive_errors() -> None:
+    fresh: list[_FlakyTransport] = []
+
+    def factory() -> httpx.BaseTransport:
+        fresh.append(_FlakyTransport())
+        return fresh[-1]
+
+    original = _FlakyTransport(fail_with=httpx.ConnectError)
+    shared = _base_mod._SharedTransport(original, factory=factory)
+    client = httpx.Client(transport=shared, base_url=base_url)
+    try:
+        for _ in range(_base_mod.SHARD_UNHEALTHY_ERRORS - 1):
+            with pytest.raises(httpx.ConnectError):
+                client.get("/v1/devboxes")
+        assert shared.health().consecutive_errors == _base_mod.SHARD_UNHEALTHY_ERRORS - 1
+        assert shared._transport is original
+
+        with pytest.raises(httpx.ConnectError):
+            client.get("/v1/devboxes")
+        assert shared._transport is fresh[0]
+        assert original.closed
+
+        assert client.get("/v1/devboxes").status_code == 200
+        health = shared.health()
+        assert health.consecutive_errors == 0
+        assert health.latency_ewma is not None
+    finally:
+        client.close()
+
+
+def test_registry_reports_shard_health() -> None:
+    client = _make_client(background_pool_shards=2)
+    try:
+        assert client._background_pool is not None
+        client._background_pool.ensure(1)
+        health = _base_mod._shared_sync_background_transports.health()
+        assert set(health) == {1}
+        assert health[1].in_flight == 0
+        assert health[1].recycles == 0
+    finally:
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_shared_transport_recycles_connection_on_goaway() -> None:
+    def failing(request: httpx.Request) -> httpx.Response:
+        raise httpx.RemoteProtocolError("GOAWAY", request=request)
+
+    fresh: list[httpx.AsyncBaseTransport] = []
+
+    def factory() -> httpx.AsyncBaseTransport:
+        fresh.append(httpx.MockTransport(lambda _req: httpx.Response(200, json={"ok": True})))
+        return fresh[-1]
+
+    shared = _base_mod._SharedAsyncTransport(httpx.MockTransport(failing), factory=factory)
+    client = httpx.AsyncClient(transport=shared, base_url=base_url)
+    try:
+        with pytest.raises(httpx.RemoteProtocolError):
+            await client.get("/v1/devboxes")
+        assert shared.health().recycles == 1
+        assert (await client.get("/v1/devboxes")).json() == {"ok": True}
+        assert shared.in_flight == 0
+    finally:
+        await client.aclose()
+
+
+class _ClosableAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fail_with: type[httpx.TransportError] | None = None) -> None:
+        self.fail_with = fail_with
+        self.closed = False
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.fail_with is not None:
+            raise self.fail_with("GOAWAY", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    @override
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("library", ["asyncio", "trio"])
+async def test_async_shared_transport_closes_retired_transport(monkeypatch: pytest.MonkeyPatch, library: str) -> None:
+    monkeypatch.setattr(_base_mod, "get_async_library", lambda: library)
+    original = _ClosableAsyncTransport(fail_with=httpx.RemoteProtocolError)
+    shared = _base_mod._SharedAsyncTransport(original, factory=_ClosableAsyncTransport)
+    client = httpx.AsyncClient(transport=shared, base_url=base_url)
+    try:
+        with pytest.raises(httpx.RemoteProtocolError):
+            await client.get("/v1/devboxes")
+        assert shared.health().recycles == 1
+        if library == "asyncio":
+            (task,) = shared._closer._tasks
+            await task
+            assert original.closed
+            assert not shared._closer._tasks
+        else:
+            assert not shared._closer._tasks
+            assert not original.closed
+    finally:
+        await client.aclose()
+    assert original.closed
+
+
+def test_streaming_endpoints_use_their_own_pool() -> None:
+    client = _make_client(shared_http_pool=True)
+    try:
+        for path in _KNOWN_STREAMING_PATHS:
+            assert client._pool_for("GET", path) is client._pools["streaming"], path
+        assert client._pool_for("GET", "/v1/devboxes/dbx_1/logs") is client._api_pool
+        streaming = client._pools["streaming"]
+        assert streaming.shards == 2
+        assert streaming.max_shards == 8
+        assert streaming.ensure(0) is not client._pools["api"].ensure(0)
+    finally:
+        client.close()
+
+
+def test_pool_routes_send_matching_requests_to_named_pools() -> None:
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+    client = _make_client(
+        shared_http_pool=True,
+        pools={"sse": PoolConfig(shards=3, limits=limits), "writes": PoolConfig(max_concurrent_requests=2)},
+        pool_routes=[
+            PoolRoute(pool="sse", path=r"/executions/[^/]+/stream_"),
+            PoolRoute(pool="writes", path=r"^/v1/devboxes$", methods=["post"]),
+        ],
+    )
+    copied = client.copy()
+    try:
+        sse = client._pools["sse"]
+        assert client._pool_for("GET", "/v1/devboxes/dbx_1/executions/ex_1/stream_stdout_updates") is sse
+        # Client routes win over the built-in suffix rules.
+        assert client._pool_for("GET", "/v1/devboxes/evictions/watch") is client._pools["streaming"]
+        assert client._pool_for("POST", "/v1/devboxes") is client._pools["writes"]
+        assert client._pool_for("GET", "/v1/devboxes") is client._api_pool
+        assert client._pool_for("POST", "/v1/devboxes/dbx_1/wait_for_status") is client._background_pool
+
+        assert sse.shards == sse.max_shards == 3
+        assert sse._registry is not None and sse._registry.limits is limits
+        assert sse._registry is not client._pools["api"]._registry
+        assert list(client.bulkhead_stats()) == ["writes"]
+
+        # Copies keep the pools and routes, and share the pool's connections.
+        assert (
+            copied._pool_for("GET", "/v1/devboxes/dbx_1/executions/ex_1/stream_stderr_updates") is copied._pools["sse"]
+        )
+        assert copied._pools["sse"].ensure(0)._transport is sse.ensure(0)._transport
+    finally:
+        client.close()
+        copied.close()
+
+
+def test_pool_routes_must_name_a_configured_pool() -> None:
+    with pytest.raises(ValueError, match="unknown pool 'sse'"):
+        _make_client(pool_routes=[PoolRoute(pool="sse", path="/subscribe/sse$")])
+    with pytest.raises(ValueError, match="shards >= 1"):
+        _make_client(pools={"sse": PoolConfig(shards=0)})
+
+
+def test_pool_overrides_replace_only_the_fields_they_set() -> None:
+    limits = httpx.Limits(max_connections=4)
+    client = _make_client(
+        shared_http_pool=True,
+        api_pool_shards=3,
+        max_concurrent_api_requests=5,
+        pools={
+            "api": PoolConfig(limits=limits),
+            "streaming": PoolConfig(shards=1, max_concurrent_requests=2),
+            "sse": PoolConfig(requests_per_second=10),
+        },
+    )
+    try:
+        api, streaming, sse = client._pools["api"], client._pools["streaming"], client._pools["sse"]
+        assert (api.shards, client.bulkhead_stats()["api"].limit) == (3, 5)
+        assert api._registry is not None and api._registry.limits is limits
+        # An explicit value equal to the dataclass default still counts as set.
+        assert (streaming.shards, streaming.max_shards) == (1, DEFAULT_MAX_STREAMING_POOL_SHARDS)
+        assert client.bulkhead_stats()["streaming"].limit == 2
+        assert (sse.shards, sse.max_shards, sse.limiter is not None) == (1, 1, True)
+    finally:
+        client.close()
+
+    assert PoolConfig(shards=2) == PoolConfig(shards=2, limits=PoolConfig().limits)
+
+
+@pytest.mark.asyncio
+async def test_async_pool_routes() -> None:
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        pools={"sse": PoolConfig(shards=1)},
+        pool_routes=[PoolRoute(pool="sse", path="/subscribe/sse$", methods=["GET"])],
+    )
+    try:
+        assert client._pool_for("GET", "/v1/axons/ax_1/subscribe/sse") is client._pools["sse"]
+        assert client._pool_for("POST", "/v1/axons/ax_1/subscribe/sse") is client._pools["streaming"]
+        assert client._pool_for("GET", "/v1/devboxes/dbx_1/upload_file") is client._transfer_pool
+    finally:
+        await client.close()
+
+
+def test_warm_up_opens_every_shard_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[tuple[str, str]] = []
+    barrier = threading.Barrier(7, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        barrier.wait()
+        seen.append((request.method, str(request.url)))
+        return httpx.Response(404)
+
+    monkeypatch.setattr(_base_mod, "_make_shared_transport", _mock_transports(handler))
+    client = _make_client(api_pool_shards=2, background_pool_shards=2, transfer_pool_shards=1)
+    try:
+        results = client.warm_up()
+    finally:
+        client.close()
+
+    assert sorted((r.pool, r.shard) for r in results) == [
+        ("api", 0),
+        ("api", 1),
+        ("background", 0),
+        ("background", 1),
+        ("streaming", 0),
+        ("streaming", 1),
+        ("transfer", 0),
+    ]
+    assert all(r.error is None and r.seconds >= 0 for r in results)
+    assert seen == [("HEAD", base_url)] * 7
+
+
+def test_warm_up_reports_failed_shards(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    monkeypatch.setattr(_base_mod, "_make_shared_transport", _mock_transports(handler))
+    client = _make_client(
+        api_pool_shards=1,
+        background_pool_shards=1,
+        transfer_pool_shards=1,
+        pools={"streaming": PoolConfig(shards=1)},
+    )
+    try:
+        results = client.warm_up()
+    finally:
+        client.close()
+
+    assert len(results) == 4
+    assert all(isinstance(r.error, httpx.ConnectError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_warm_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(200)
+
+    monkeypatch.setattr(_base_mod, "_make_shared_async_transport", _mock_transports(handler))
+    client = AsyncRunloop(
+        base_url=base_url,
+        bearer_token=bearer_token,
+        api_pool_shards=3,
+        background_pool_shards=2,
+        transfer_pool_shards=1,
+    )
+    try:
+        results = await client.warm_up()
+    finally:
+        await client.close()
+
+    assert len(results) == 8
+    assert all(r.error is None for r in results)
+    assert seen == ["HEAD"] * 8
+
+
+def test_async_warm_up_under_trio(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("trio")
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.method)
+        return httpx.Response(200)
+
+    wrapper = _base_mod.AsyncHttpxClientWrapper
+
+    def make_client(**kwargs: Any) -> httpx.AsyncClient:
+        kwargs.pop("limits", None)
+        return wrapper(transport=httpx.MockTransport(handler), **kwargs)
+
+    # Without an asyncio loop the pools build private clients rather than shared transports.
+    monkeypatch.setattr(_base_mod, "AsyncHttpxClientWrapper", make_client)
+
+    async def main() -> list[_base_mod.ShardWarmUp]:
+        client = AsyncRunloop(base_url=base_url, bearer_token=bearer_token, api_pool_shards=2)
+        try:
+            return await client.warm_up()
+        finally:
+            await client.close()
+
+    results = anyio.run(main, backend="trio")
+    assert [(r.pool, r.shard, r.error) for r in results[:2]] == [("api", 0, None), ("api", 1, None)]
+    assert all(r.error is None for r in results)
+    assert seen == ["HEAD"] * len(results)
+
+
+def _wait_for_queue_depth(bulkhead: _base_mod._Bulkhead, depth: int) -> None:
+    deadline = time.monotonic() + 5
+    while bulkhead.stats().queue_depth < depth:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_bulkhead_hands_released_slots_to_waiters_in_fifo_order() -> None:
+    bulkhead = _base_mod._Bulkhead(1, queue_timeout=None)
+    assert bulkhead.acquire()
+    order: list[int] = []
+
+    def worker(index: int) -> None:
+        assert bulkhead.acquire()
+        order.append(index)
+        bulkhead.release()
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(3)]
+    for depth, thread in enumerate(threads, start=1):
+        thread.start()
+        _wait_for_queue_depth(bulkhead, depth)
+
+    bulkhead.release()
+    for thread in threads:
+        thread.join(5)
+
+    assert order == [0, 1, 2]
+    stats = bulkhead.stats()
+    assert (stats.in_flight, stats.queue_depth, stats.queued, stats.timeouts) == (0, 0, 3, 0)
+    assert stats.wait_seconds >= stats.max_wait_seconds > 0
+
+
+def test_bulkhead_gives_up_after_max_queue_time() -> None:
+    bulkhead = _base_mod._Bulkhead(1, queue_timeout=0.01)
+    assert bulkhead.acquire()
+    assert not bulkhead.acquire()
+
+    stats = bulkhead.stats()
+    assert (stats.in_flight, stats.queue_depth, stats.queued, stats.timeouts) == (1, 0, 1, 1)
+    bulkhead.release()
+    assert bulkhead.stats().in_flight == 0
+
+
+def test_transfer_bulkhead_caps_in_flight_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        _base_mod,
+        "_make_shared_transport",
+        _mock_transports(lambda _req: httpx.Response(200, stream=_ChunkStream())),
+    )
+    client = _make_client(max_concurrent_transfer_requests=1, max_queue_time=0.01, transfer_pool_shards=2)
+    pool = client._transfer_pool
+    assert pool is not None
+    upload = httpx.Request("POST", f"{base_url}/v1/devboxes/dbx_1/upload_file")
+    try:
+        held = pool.send(upload, stream=True)
+        with pytest.raises(QueueTimeoutError):
+            pool.send(upload, stream=True)
+        # Control-plane traffic is not held back by the saturated transfer class.
+        client._send_request(httpx.Request("GET", f"{base_url}/v1/devboxes"), stream=False)
+
+        stats = client.bulkhead_stats()
+        assert list(stats) == ["transfer"]
+        assert (stats["transfer"].limit, stats["transfer"].in_flight, stats["transfer"].timeouts) == (1, 1, 1)
+
+        held.close()
+        assert client.bulkhead_stats()["transfer"].in_flight == 0
+        pool.send(upload, stream=False)
+    finally:
+        client.close()
+
+
+def test_queue_timeout_is_not_retried_or_counted_against_the_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.path)
+        return httpx.Response(200, stream=_ChunkStream())
+
+    monkeypatch.setattr(_base_mod, "_make_shared_transport", _mock_transports(handler))
+    client = _make_client(
+        max_concurrent_api_requests=1,
+        max_queue_time=0.01,
+        max_retries=2,
+        circuit_breaker_threshold=1,
+        retry_budget_ratio=0.1,
+    )
+    pool = client._api_pool
+    assert pool is not None
+    try:
+        held = pool.send(httpx.Request("GET", f"{base_url}/v1/devboxes"), stream=True)
+        with pytest.raises(QueueTimeoutError):
+            client.get("/v1/devboxes/dbx_1", cast_to=httpx.Response)
+
+        assert sent == ["/v1/devboxes"]
+        assert client.circuit_breakers() == {}
+        budget = client.retry_budget_stats()
+        assert budget is not None and budget.retries == 0
+        assert client.bulkhead_stats()["api"].timeouts == 1
+        held.close()
+    finally:
+        client.close()
+
+
+def test_concurrency_limits_are_validated_and_copied() -> None:
+    with pytest.raises(ValueError, match="max_concurrent_api_requests"):
+        _make_client(max_concurrent_api_requests=0)
+    with pytest.raises(ValueError, match="max_queue_time"):
+        _make_client(max_queue_time=-1)
+
+    client = _make_client(max_concurrent_background_requests=4, max_queue_time=2.0)
+    copied = client.copy()
+    uncapped = client.copy(max_concurrent_background_requests=None)
+    try:
+        assert copied._max_concurrent_background_requests == 4
+        assert copied._max_queue_time == 2.0
+        assert list(copied.bulkhead_stats()) == ["background"]
+        assert uncapped.bulkhead_stats() == {}
+    finally:
+        client.close()
+        copied.close()
+        uncapped.close()
+
+
+@pytest.mark.asyncio
+async def test_async_bulkhead_fifo_timeout_and_cancellation() -> None:
+    bulkhead = _base_mod._AsyncBulkhead(1, queue_timeout=None)
+    assert await bulkhead.acquire()
+    order: list[int] = []
+
+    async def worker(index: int) -> None:
+        assert await bulkhead.acquire()
+        order.append(index)
+        bulkhead.release()
+
+    tasks = [asyncio.ensure_future(worker(index)) for index in range(3)]
+    cancelled = asyncio.ensure_future(bulkhead.acquire())
+    await asyncio.sleep(0)
+    assert bulkhead.stats().queue_depth == 4
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert bulkhead.stats().queue_depth == 3
+
+    bulkhead.release()
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert bulkhead.stats().in_flight == 0
+
+    bulkhead.queue_timeout = 0.01
+    assert await bulkhead.acquire()
+    assert not await bulkhead.acquire()
+    stats = bulkhead.stats()
+    assert (stats.in_flight, stats.queue_depth, stats.timeouts) == (1, 0, 1)
+
+
+def test_async_bulkhead_under_trio() -> None:
+    pytest.importorskip("trio")
+
+    async def main() -> None:
+        bulkhead = _base_mod._AsyncBulkhead(1, queue_timeout=None)
+        assert await bulkhead.acquire()
+        order: list[int] = []
+
+        async def worker(index: int) -> None:
+            assert await bulkhead.acquire()
+            order.append(index)
+            bulkhead.release()
+
+        async with anyio.create_task_group() as tg:
+            for index in range(3):
+                # trio starts tasks in no fixed order: queue them one at a time.
+                tg.start_soon(worker, index)
+                await anyio.wait_all_tasks_blocked()
+            assert bulkhead.stats().queue_depth == 3
+            bulkhead.release()
+        assert order == [0, 1, 2]
+
+        bulkhead.queue_timeout = 0.01
+        assert await bulkhead.acquire()
+        assert not await bulkhead.acquire()
+        stats = bulkhead.stats()
+        assert (stats.in_flight, stats.queue_depth, stats.timeouts) == (1, 0, 1)
+
+    anyio.run(main, backend="trio")
+
+
+def test_token_bucket_paces_after_one_second_burst() -> None:
+    bucket = _base_mod._TokenBucket(10.0, adaptive=False)
+    assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+    bucket.observe(remaining=0, reset_seconds=60)
+    assert bucket.rate == 10.0
+
+
+def test_adaptive_token_bucket_learns_server_budget() -> None:
+    bucket = _base_mod._TokenBucket(None, adaptive=True)
+    assert bucket.rate is None
+    assert bucket.reserve() == 0.0
+
+    bucket.observe(remaining=5, reset_seconds=10)
+    assert bucket.rate == 0.5
+    assert bucket.reserve() == 0.0
+    assert 1.9 < bucket.reserve() <= 2.0
+
+    # Budget spent: the next request waits for the window to reset.
+    bucket.observe(remaining=0, reset_seconds=30)
+    assert 59 < bucket.reserve() <= 90
+
+    # A configured pace is never exceeded, whatever the server allows.
+    capped = _base_mod._TokenBucket(2.0, adaptive=True)
+    capped.observe(remaining=1000, reset_seconds=1)
+    assert capped.rate == 2.0
+
+
+def test_rate_limit_budget_parsing() -> None:
+    client = _make_client()
+
+    def budget(status: int = 200, **headers: str) -> tuple[float, float] | None:
+        response = httpx.Response(status, headers={k.replace("_", "-"): v for k, v in headers.items()})
+        return client._parse_rate_limit_budget(response)
+
+    try:
+        assert budget() is None
+        assert budget(ratelimit_remaining="7", ratelimit_reset="3") == (7.0, 3.0)
+        assert budget(x_ratelimit_remaining="7", x_ratelimit_reset="3") == (7.0, 3.0)
+        remaining, reset = budget(x_ratelimit_remaining="1", x_ratelimit_reset=str(int(time.time()) + 20)) or (0, 0)
+        assert remaining == 1.0 and 18 < reset <= 20
+        assert budget(429, retry_after="12") == (0.0, 12.0)
+    finally:
+        client.close()
+
+
+def test_adaptive_rate_limit_paces_pool_from_response_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+    headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"}
+    monkeypatch.setattr(
+        _base_mod, "_make_shared_transport", _mock_transports(lambda _req: httpx.Response(200, headers=headers))
+    )
+    client = _make_client(adaptive_rate_limit=True, pools={"bulk": PoolConfig(requests_per_second=50)})
+    copied = client.copy()
+    try:
+        client._send_request(httpx.Request("POST", f"{base_url}/v1/devboxes/dbx_1/shutdown"), stream=False)
+        api = client._pools["api"].limiter
+        assert api is not None and api.rate is not None and abs(api.rate - 1 / 30) < 1e-9
+        # Other pools pace independently until they hear from the server themselves.
+        background = client._pools["background"].limiter
+        assert background is not None and background.rate is None
+        bulk = client._pools["bulk"].limiter
+        assert bulk is not None and bulk.rate == 50
+        assert copied._adaptive_rate_limit is True
+    finally:
+        client.close()
+        copied.close()
+
+    plain = _make_client()
+    try:
+        assert all(pool.limiter is None for pool in plain._pools.values())
+        with pytest.raises(ValueError, match="requests_per_second"):
+            _make_client(pools={"bulk": PoolConfig(requests_per_second=0)})
+    finally:
+        plain.close()
@@ -8,6 +8,7 @@ from typing_extensions import Required, Annotated, TypedDict
 
 import pytest
 
+from runloop_api_client.types import DevboxCreateParams
 from runloop_api_client._types import Base64FileInput, omit, not_given
 from runloop_api_client._utils import (
     PropertyInfo,
@@ -17,6 +18,7 @@ from runloop_api_client._utils import (
 )
 from runloop_api_client._compat import PYDANTIC_V1
 from runloop_api_client._models import BaseModel
+from runloop_api_client._utils._transform import _get_transform_plan
 
 _T = TypeVar("_T")
 
@@ -458,3 +460,61 @@ async def test_strips_notgiven(use_async: bool) -> None:
 async def test_strips_omit(use_async: bool) -> None:
     assert await transform({"foo_bar": "bar"}, Foo1, use_async) == {"fooBar": "bar"}
     assert await transform({"foo_bar": omit}, Foo1, use_async) == {}
+
+
+class SelfReferencing(TypedDict, total=False):
+    child_node: Annotated[SelfReferencing, PropertyInfo(alias="childNode")]
+    created_at: Annotated[datetime, PropertyInfo(format="iso8601")]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_self_referencing_typeddict(use_async: bool) -> None:
+    data = {"child_node": {"child_node": {"created_at": datetime(2023, 2, 23)}}}
+    assert await transform(data, SelfReferencing, use_async) == {
+        "childNode": {"childNode": {"created_at": "2023-02-23T00:00:00"}}
+    }
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_transform_plan_is_compiled_once(use_async: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    class Params(TypedDict, total=False):
+        foo_bar: Annotated[str, PropertyInfo(alias="fooBar")]
+        items: List[Foo1]
+
+    data = {"foo_bar": "baz", "items": [{"foo_bar": "x"}]}
+    expected = {"fooBar": "baz", "items": [{"fooBar": "x"}]}
+    assert await transform(data, Params, use_async) == expected
+
+    def fail(*_args: object, **_kwargs: object) -> Dict[str, Any]:
+        raise AssertionError("type hints should not be inspected again")
+
+    monkeypatch.setattr("runloop_api_client._utils._transform.get_type_hints", fail)
+    assert await transform(data, Params, use_async) == expected
+
+
+class NestedBase64Input(TypedDict, total=False):
+    inputs: List[TypedDictBase64Input]
+    child: NestedBase64Input
+
+
+def test_plans_only_read_files_asynchronously_when_needed() -> None:
+    assert not _get_transform_plan(DevboxCreateParams).needs_async
+    assert not _get_transform_plan(SelfReferencing).needs_async
+    assert _get_transform_plan(TypedDictBase64Input).needs_async
+    assert _get_transform_plan(NestedBase64Input).needs_async
+
+
+@pytest.mark.asyncio
+async def test_async_transform_uses_sync_plan_without_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = {"child_node": {"created_at": datetime(2023, 2, 23)}}
+    expected = await _async_transform(data, SelfReferencing)
+
+    async def fail(*_args: object, **_kwargs: object) -> object:
+        raise AssertionError("async formatting should be skipped")
+
+    monkeypatch.setattr("runloop_api_client._utils._transform._async_format_data", fail)
+    assert await _async_transform(data, SelfReferencing) == expected
+    with pytest.raises(AssertionError, match="async formatting"):
+        await _async_transform({"foo": SAMPLE_FILE_PATH}, TypedDictBase64Input)
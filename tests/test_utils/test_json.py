@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import json
 import datetime
-from typing import Union
+from typing import Any, List, Union
 
+import pytest
 import pydantic
 
 from runloop_api_client import _compat
-from runloop_api_client._utils._json import openapi_dumps
+from runloop_api_client._utils import _json
+from runloop_api_client._utils._json import IncrementalArrayDecoder, openapi_dumps, openapi_loads
 
 
 class TestOpenapiDumps:
@@ -124,3 +127,165 @@ class TestOpenapiDumps:
         data = {"model": model_with_values}
         json_bytes = openapi_dumps(data)
         assert json_bytes == b'{"model":{"name":"Frank","email":"frank@example.com","phone":null}}'
+
+
+class TestFastBackend:
+    """The fast backend, when installed, must match the stdlib path byte for byte."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"created": datetime.datetime(2023, 1, 1, 12, 0, 0)},
+            {"created": datetime.datetime(2023, 1, 1, 12, 0, 0, 123, tzinfo=datetime.timezone.utc)},
+            {"created": datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=-5)))},
+            {"name": "dévbox ✓", "tags": ("a", "b"), "size": 2**70, "ratio": 0.1, 1: None},
+            {"floats": [1e16, 1.2345678901234568e17, 1.5e300, 1e-05, 9.999999999999999e-05, 5e-324]},
+            {"floats": [0.0001, 9999999999999998.0, -0.0, 0.0, 1.0, -2.5, 1e15]},
+            {"nested": {"deep": [{"x": 1e22}]}, 1e-7: "key"},
+        ],
+    )
+    def test_matches_stdlib(self, data: object, monkeypatch: pytest.MonkeyPatch) -> None:
+        fast = openapi_dumps(data)
+        monkeypatch.setattr(_json, "_fast_dumps", None)
+        assert fast == openapi_dumps(data)
+
+    def test_pydantic_models_match_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class Launch(pydantic.BaseModel):
+            at: datetime.datetime
+            region: str = "us-east"
+
+        data = {"launch": Launch(at=datetime.datetime(2024, 5, 6, 7, 8, 9, tzinfo=datetime.timezone.utc))}
+        fast = openapi_dumps(data)
+        monkeypatch.setattr(_json, "_fast_dumps", None)
+        assert fast == openapi_dumps(data) == b'{"launch":{"at":"2024-05-06T07:08:09Z"}}'
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    def test_non_finite_floats_raise_like_stdlib(self, value: float) -> None:
+        class Sample(pydantic.BaseModel):
+            value: float
+
+        with pytest.raises(ValueError, match="JSON compliant"):
+            openapi_dumps({"value": value})
+        with pytest.raises(ValueError, match="JSON compliant"):
+            openapi_dumps({"sample": Sample(value=value)})
+
+    def test_nulls_are_encoded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        if _json._fast_dumps is None:
+            pytest.skip("no fast JSON backend installed")
+        stdlib_calls: List[object] = []
+        stdlib_dumps = json.dumps
+
+        def dumps(obj: object, **kwargs: Any) -> str:
+            stdlib_calls.append(obj)
+            return stdlib_dumps(obj, **kwargs)
+
+        monkeypatch.setattr(_json.json, "dumps", dumps)
+
+        assert openapi_dumps({"name": None, "note": "null", "items": [None, 1.5]}) == (
+            b'{"name":null,"note":"null","items":[null,1.5]}'
+        )
+        assert stdlib_calls == []
+
+    def test_pydantic_model_floats_match_stdlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        class Sample(pydantic.BaseModel):
+            value: float
+
+        data = {"sample": Sample(value=1e16)}
+        fast = openapi_dumps(data)
+        monkeypatch.setattr(_json, "_fast_dumps", None)
+        assert fast == openapi_dumps(data) == b'{"sample":{"value":1e+16}}'
+
+    def test_unsupported_types_raise_like_stdlib(self) -> None:
+        with pytest.raises(TypeError):
+            openapi_dumps({"when": datetime.date(2024, 1, 1)})
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"id":"dbx_1","items":[1,2.5,null,true]}',
+            '{"name":"dévbox"}',
+            b'{"big":123456789012345678901234567890}',
+            b'{"score":NaN}',
+            '{"id":"dbx_1"}'.encode("utf-16"),
+        ],
+    )
+    def test_loads_matches_stdlib(self, raw: Union[str, bytes]) -> None:
+        assert repr(openapi_loads(raw)) == repr(json.loads(raw))
+
+    def test_loads_invalid_json_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            openapi_loads(b'{"id":')
+
+
+class TestIncrementalArrayDecoder:
+    DOCUMENT = {
+        "total_count": 4,
+        "objects": [{"id": "obj_1", "tags": ["a", "]}"]}, {"id": "obj_é", "size": 12345}, None, 7],
+        "has_more": True,
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+    def test_decodes_across_chunk_boundaries(self, chunk_size: int) -> None:
+        raw = json.dumps(self.DOCUMENT, indent=1, ensure_ascii=False).encode()
+        decoder = IncrementalArrayDecoder("objects")
+        items: List[Any] = []
+        for start in range(0, len(raw), chunk_size):
+            items.extend(decoder.feed(raw[start : start + chunk_size]))
+        items.extend(decoder.close())
+
+        assert items == self.DOCUMENT["objects"]
+        assert decoder.fields == {"total_count": 4, "has_more": True}
+
+    def test_decodes_when_split_at_every_offset(self) -> None:
+        raw = (
+            b'{"total_count": 1.25e2, "data": [1.5e-3, -0.25, 1E16, 12, -7e+2,'
+            b' {"size": 3.0E+5, "ok": true}, null, "1.5e-3", 0], "has_more": false, "next": -1}'
+        )
+        document = json.loads(raw)
+        for split in range(len(raw) + 1):
+            decoder = IncrementalArrayDecoder("data")
+            items = decoder.feed(raw[:split])
+            items.extend(decoder.feed(raw[split:]))
+            items.extend(decoder.close())
+            assert items == document["data"], split
+            assert decoder.fields == {"total_count": 125.0, "has_more": False, "next": -1}, split
+
+    @pytest.mark.parametrize("first", [b'{"data": [1.', b'{"data": [1.5e', b'{"data": [1.5e-', b'{"data": [1'])
+    def test_waits_for_the_rest_of_a_number(self, first: bytes) -> None:
+        rest = b'{"data": [1.5e-3], "has_more": false}'[len(first) :]
+        decoder = IncrementalArrayDecoder("data")
+        assert decoder.feed(first) == []
+        assert decoder.feed(rest) == [1.5e-3]
+        assert decoder.close() == []
+
+    def test_yields_items_before_the_document_ends(self) -> None:
+        decoder = IncrementalArrayDecoder("objects")
+        assert decoder.feed(b'{"objects": [{"id": "obj_1"}, {"id": "ob') == [{"id": "obj_1"}]
+        assert decoder.feed(b'j_2"}], "has_more": false}') == [{"id": "obj_2"}]
+        assert decoder.close() == []
+        assert decoder.fields == {"has_more": False}
+
+    def test_empty_and_missing_arrays(self) -> None:
+        decoder = IncrementalArrayDecoder("objects")
+        assert decoder.feed(b'{"objects": [], "other": [1, 2]}') == []
+        decoder.close()
+        assert decoder.fields == {"other": [1, 2]}
+
+        decoder = IncrementalArrayDecoder("objects")
+        decoder.feed(b"{}")
+        decoder.close()
+        assert decoder.fields == {}
+
+    def test_truncated_document_raises(self) -> None:
+        decoder = IncrementalArrayDecoder("objects")
+        decoder.feed(b'{"objects": [{"id": "obj_1"}')
+        with pytest.raises(ValueError, match="Incomplete JSON document"):
+            decoder.close()
+
+    def test_invalid_document_raises(self) -> None:
+        with pytest.raises(ValueError, match="expected an object"):
+            IncrementalArrayDecoder("objects").feed(b"[1, 2]")
+        with pytest.raises(ValueError, match="unexpected"):
+            IncrementalArrayDecoder("objects").feed(b'{"objects": [1 2]}')
+        with pytest.raises(ValueError, match="unexpected"):
+            IncrementalArrayDecoder("objects").feed(b'{"objects": [1.]}')